@@ -0,0 +1,179 @@
+"""ベンチマークの登録・計測・保存・比較機能。
+
+pyperfと同様に、1サンプルが最小時間を超えるようにループ数を調整して、複数サンプルの統計値を記録します。
+Windows以外では、Windowsのみのベンチマークを省略して、他は :mod:`_fakecom` の偽のCOMバックエンドで実行します。
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+import _fakecom
+
+IS_WINDOWS = sys.platform == "win32"
+
+
+class Benchmark(NamedTuple):
+    """登録されたベンチマーク。setupは計測対象の関数を返し、setup自体の時間は計測しません。"""
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    windows_only: bool
+    """真の場合、Windowsでのみ実行します。偽の場合、Windows以外では偽のCOMバックエンドで実行します。"""
+    raw: bool
+    """真の場合、計測対象の関数は自身で計測した1回分の秒数を返します。"""
+
+
+class Result(NamedTuple):
+    name: str
+    group: str
+    loops: int
+    values: list[float]
+    """1ループあたりの秒数のサンプル。"""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.values)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.values)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.values) if len(self.values) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group": self.group,
+            "loops": self.loops,
+            "values": self.values,
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": min(self.values),
+        }
+
+
+class SkipBenchmark(Exception):
+    """setupで発生すると、そのベンチマークを省略します。"""
+
+
+_registry: list[Benchmark] = []
+
+
+def benchmark(name: str, group: str, windows_only: bool = True, raw: bool = False) -> Callable:
+    """ベンチマークのsetup関数を登録するデコレータ。"""
+
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        _registry.append(Benchmark(name, group, setup, windows_only, raw))
+        return setup
+
+    return decorator
+
+
+def registered() -> tuple[Benchmark, ...]:
+    return tuple(_registry)
+
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time or loops >= 1 << 24:
+            return loops
+        loops *= 2
+
+
+def run(bench: Benchmark, repeat: int, min_time: float, warmups: int = 1) -> Result:
+    """ベンチマークを実行します。
+
+    Raises:
+        SkipBenchmark: 実行環境で実行できない。
+    """
+    if not IS_WINDOWS:
+        if bench.windows_only:
+            raise SkipBenchmark("Windowsでのみ実行できます。")
+        _fakecom.install()
+    func = bench.setup()
+    if bench.raw:
+        for _ in range(warmups):
+            func()
+        return Result(bench.name, bench.group, 1, [func() for _ in range(repeat)])
+    for _ in range(warmups):
+        func()
+    loops = _calibrate(func, min_time)
+    values = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        values.append((time.perf_counter() - start) / loops)
+    return Result(bench.name, bench.group, loops, values)
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ("git", "rev-parse", "HEAD"), cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def metadata() -> dict[str, Any]:
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "com_backend": "fake" if _fakecom.installed() else "native",
+    }
+
+
+def save(path: str | Path, results: Iterable[Result]) -> None:
+    data = {"metadata": metadata(), "benchmarks": {r.name: r.to_dict() for r in results}}
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load(path: str | Path) -> dict[str, dict[str, Any]]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["benchmarks"]
+
+
+def load_metadata(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["metadata"]
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(current: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> list[Comparison]:
+    """両方に存在するベンチマークの中央値を比較します。"""
+    return [Comparison(name, baseline[name]["median"], c["median"]) for name, c in current.items() if name in baseline]
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
@@ -0,0 +1,622 @@
+"""Windows以外でmicroグループのベンチマークを実行するための偽のCOMバックエンド。
+
+powcwmi/tests/conftest.pyと同様に :data:`sys.modules` のモジュールを差し替えて、
+comtypesとWindowsのDLLの代わりに、libcのメモリ管理とPythonで実装した最小限の関数を使用します。
+Variant・SafeArray・PropertyKey・メモリ上のIStreamのラッパーの処理をLinuxのCIで計測して、
+ラッパー側の性能の変化を検出するためのものです。計測値は実際のCOMを使用したWindowsの結果と比較できません。
+"""
+
+import ctypes
+import importlib.util
+import sys
+import uuid
+from ctypes import (
+    CDLL,
+    CFUNCTYPE,
+    POINTER,
+    Structure,
+    _Pointer,
+    addressof,
+    byref,
+    c_char,
+    c_char_p,
+    c_int32,
+    c_int64,
+    c_size_t,
+    c_ubyte,
+    c_uint16,
+    c_uint32,
+    c_uint64,
+    c_void_p,
+    c_wchar_p,
+    cast,
+    memmove,
+    memset,
+    sizeof,
+    string_at,
+)
+from math import prod
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+_ROOT = Path(__file__).resolve().parents[1]
+PACKAGES = ("powc", "powcpropsys", "powcwmi", "powcshell", "powcd2d", "powccoreaudio")
+
+_libc = CDLL(None)
+_malloc = _libc.malloc
+_malloc.argtypes = (c_size_t,)
+_malloc.restype = c_void_p
+_calloc = _libc.calloc
+_calloc.argtypes = (c_size_t, c_size_t)
+_calloc.restype = c_void_p
+_free = _libc.free
+_free.argtypes = (c_void_p,)
+_free.restype = None
+
+
+def _hr(code: int) -> int:
+    return code - (1 << 32) if code & 0x80000000 else code
+
+
+HRESULTS = {
+    "S_OK": 0,
+    "S_FALSE": 1,
+    "E_NOTIMPL": _hr(0x80004001),
+    "E_NOINTERFACE": _hr(0x80004002),
+    "E_POINTER": _hr(0x80004003),
+    "E_ABORT": _hr(0x80004004),
+    "E_FAIL": _hr(0x80004005),
+    "E_UNEXPECTED": _hr(0x8000FFFF),
+    "E_ACCESSDENIED": _hr(0x80070005),
+    "E_HANDLE": _hr(0x80070006),
+    "E_OUTOFMEMORY": _hr(0x8007000E),
+    "E_INVALIDARG": _hr(0x80070057),
+    "DISP_E_BADVARTYPE": _hr(0x80020008),
+    "DISP_E_BADINDEX": _hr(0x8002000B),
+    "DISP_E_ARRAYISLOCKED": _hr(0x8002000D),
+    "STG_E_INVALIDFUNCTION": _hr(0x80030001),
+}
+S_OK = HRESULTS["S_OK"]
+S_FALSE = HRESULTS["S_FALSE"]
+E_NOTIMPL = HRESULTS["E_NOTIMPL"]
+E_NOINTERFACE = HRESULTS["E_NOINTERFACE"]
+E_UNEXPECTED = HRESULTS["E_UNEXPECTED"]
+E_INVALIDARG = HRESULTS["E_INVALIDARG"]
+
+
+#
+# 偽のcomtypes
+#
+
+
+class COMError(Exception):
+    """comtypes.COMErrorの代わりです。"""
+
+
+class GUID(Structure):
+    """comtypes.GUIDの代わりです。文字列変換はole32の代わりにuuidで行います。"""
+
+    _fields_ = (("Data1", c_uint32), ("Data2", c_uint16), ("Data3", c_uint16), ("Data4", c_ubyte * 8))
+
+    def __init__(self, name: str | None = None) -> None:
+        super().__init__()
+        if name is not None:
+            memmove(byref(self), uuid.UUID(name).bytes_le, 16)
+
+    def __str__(self) -> str:
+        return "{%s}" % str(uuid.UUID(bytes_le=bytes(self))).upper()
+
+    def __repr__(self) -> str:
+        return f'GUID("{self}")'
+
+    def __bool__(self) -> bool:
+        return bytes(self) != bytes(16)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, GUID) and bytes(self) == bytes(other)
+
+    def __hash__(self) -> int:
+        return hash(bytes(self))
+
+    @classmethod
+    def create_new(cls) -> "GUID":
+        return cls(str(uuid.uuid4()))
+
+
+class BSTR(c_wchar_p):
+    """comtypes.BSTRの代わりです。"""
+
+
+def STDMETHOD(restype: Any, name: str, argtypes: tuple = ()) -> tuple[Any, str, tuple]:
+    return (restype, name, tuple(argtypes))
+
+
+def _c_type(t: Any) -> Any:
+    """コールバックの引数・戻り値の型。ポインタはアドレスの整数で受け渡します。"""
+    if isinstance(t, type) and issubclass(t, (_Pointer, c_void_p, c_char_p, c_wchar_p)):
+        return c_void_p
+    return t
+
+
+def _method(index: int, restype: Any, argtypes: tuple) -> Callable[..., Any]:
+    """vtableのindex番目の関数を呼び出すメソッドを作成します。"""
+    proto = CFUNCTYPE(restype, c_void_p, *argtypes)
+    funcs: dict[int, Any] = {}
+
+    def method(self: c_void_p, *args: Any) -> Any:
+        this = self.value
+        if not this:
+            raise ValueError("NULL COM pointer access")
+        address = c_void_p.from_address(c_void_p.from_address(this).value + index * sizeof(c_void_p)).value or 0
+        f = funcs.get(address)
+        if f is None:
+            f = funcs[address] = proto(address)
+        return f(this, *args)
+
+    return method
+
+
+class _InterfacePointer(c_void_p):
+    """POINTER(IUnknown)の基底クラスです。comtypesと同様に、破棄時にReleaseを呼び出します。"""
+
+    def __del__(self) -> None:
+        if self.value:
+            self.Release()
+
+    def QueryInterface(self, interface: type, iid: GUID | None = None) -> Any:
+        p = POINTER(interface)()
+        hr = self._raw_QueryInterface(byref(iid or interface._iid_), byref(p))
+        if hr < 0:
+            raise COMError(hr, None, None)
+        return p
+
+
+class _InterfaceMeta(type):
+    """comtypesのインターフェイスのメタクラスの代わりです。
+
+    POINTER(インターフェイス)を基底インターフェイスのポインタ型の派生クラスとして登録して、
+    _methods_の設定時にvtableを呼び出すメソッドを追加します。
+    """
+
+    _all_methods_: tuple[tuple[Any, str, tuple], ...]
+
+    def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]) -> "_InterfaceMeta":
+        cls = super().__new__(mcls, name, bases, namespace)
+        base = next((b for b in bases if isinstance(b, _InterfaceMeta)), None)
+        ptr_base = _InterfacePointer if base is None else POINTER(base)
+        ptr = type(f"LP_{name}", (ptr_base,), {"__slots__": ()})
+        ctypes._pointer_type_cache[cls] = ptr  # type: ignore
+        type.__setattr__(cls, "__pointer_type__", ptr)
+        cls._build_methods()
+        return cls
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "_methods_":
+            cls._build_methods()
+
+    def _build_methods(cls) -> None:
+        base = next((b for b in cls.__mro__[1:] if isinstance(b, _InterfaceMeta)), None)
+        inherited = base._all_methods_ if base is not None else ()
+        methods = tuple(cls.__dict__.get("_methods_", ()))
+        type.__setattr__(cls, "_all_methods_", inherited + methods)
+        ptr = POINTER(cls)
+        for index, (restype, name, argtypes) in enumerate(methods, len(inherited)):
+            setattr(ptr, name, _method(index, restype, argtypes))
+
+
+class IUnknown(metaclass=_InterfaceMeta):
+    _iid_ = GUID("{00000000-0000-0000-C000-000000000046}")
+    _methods_ = [
+        STDMETHOD(c_int32, "_raw_QueryInterface", (POINTER(GUID), c_void_p)),
+        STDMETHOD(c_uint32, "AddRef"),
+        STDMETHOD(c_uint32, "Release"),
+    ]
+
+    __slots__ = ()
+
+
+class _ComObject:
+    """Pythonで実装したCOMオブジェクトです。インターフェイスのメソッドの順にコールバックを並べたvtableを持ちます。
+
+    参照カウントが0になるまで :data:`_live` で保持します。
+    """
+
+    _live: dict[int, "_ComObject"] = {}
+
+    def __init__(self, interface: _InterfaceMeta) -> None:
+        self.__refs = 1
+        self.__iids = {bytes(c._iid_) for c in interface.__mro__ if isinstance(c, _InterfaceMeta)}
+        self.__callbacks = []
+        for restype, name, argtypes in interface._all_methods_:
+            proto = CFUNCTYPE(_c_type(restype), c_void_p, *map(_c_type, argtypes))
+            impl = getattr(self, name.removeprefix("_raw_"), None)
+            self.__callbacks.append(proto(self.__thunk(impl)))
+        self.__vtbl = (c_void_p * len(self.__callbacks))(*(cast(cb, c_void_p) for cb in self.__callbacks))
+        self.__this = c_void_p(addressof(self.__vtbl))
+        self.address = addressof(self.__this)
+        _ComObject._live[self.address] = self
+
+    @staticmethod
+    def __thunk(impl: Callable[..., Any] | None) -> Callable[..., Any]:
+        if impl is None:
+            return lambda this, *args: E_NOTIMPL
+        return lambda this, *args: impl(*args)
+
+    def QueryInterface(self, riid: int, ppv: int) -> int:
+        if string_at(riid, 16) not in self.__iids:
+            c_void_p.from_address(ppv).value = None
+            return E_NOINTERFACE
+        self.AddRef()
+        c_void_p.from_address(ppv).value = self.address
+        return S_OK
+
+    def AddRef(self) -> int:
+        self.__refs += 1
+        return self.__refs
+
+    def Release(self) -> int:
+        self.__refs -= 1
+        if self.__refs == 0:
+            _ComObject._live.pop(self.address, None)
+        return self.__refs
+
+
+class _MemoryStream(_ComObject):
+    """SHCreateMemStreamが返すIStreamの実装です。Read・Write・Seek・SetSizeのみ実装します。"""
+
+    def __init__(self, interface: _InterfaceMeta, data: bytes) -> None:
+        super().__init__(interface)
+        self.__data = bytearray(data)
+        self.__pos = 0
+
+    def Read(self, pv: int, cb: int, pcbRead: int | None) -> int:
+        n = max(0, min(cb, len(self.__data) - self.__pos))
+        if n:
+            memmove(pv, (c_char * n).from_buffer(self.__data, self.__pos), n)
+            self.__pos += n
+        if pcbRead:
+            c_uint32.from_address(pcbRead).value = n
+        return S_OK if n == cb else S_FALSE
+
+    def Write(self, pv: int, cb: int, pcbWritten: int | None) -> int:
+        end = self.__pos + cb
+        if end > len(self.__data):
+            self.__data.extend(bytes(end - len(self.__data)))
+        self.__data[self.__pos : end] = string_at(pv, cb)
+        self.__pos = end
+        if pcbWritten:
+            c_uint32.from_address(pcbWritten).value = cb
+        return S_OK
+
+    def Seek(self, dlibMove: int, dwOrigin: int, plibNewPosition: int | None) -> int:
+        origins = (0, self.__pos, len(self.__data))
+        if not 0 <= dwOrigin < len(origins) or origins[dwOrigin] + dlibMove < 0:
+            return HRESULTS["STG_E_INVALIDFUNCTION"]
+        self.__pos = origins[dwOrigin] + dlibMove
+        if plibNewPosition:
+            c_uint64.from_address(plibNewPosition).value = self.__pos
+        return S_OK
+
+    def SetSize(self, libNewSize: int) -> int:
+        del self.__data[libNewSize:]
+        self.__data.extend(bytes(libNewSize - len(self.__data)))
+        return S_OK
+
+
+#
+# 偽のDLL
+#
+
+_exports: dict[tuple[str, str], int] = {}
+_callbacks: list[Any] = []
+
+
+def _export(dll: str, restype: Any, *argtypes: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """関数をWindowsと同じ引数のCの関数としてdllに登録します。ポインタ引数はアドレスの整数で受け取ります。"""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        callback = CFUNCTYPE(restype, *argtypes)(func)
+        _callbacks.append(callback)
+        _exports[(dll, func.__name__)] = cast(callback, c_void_p).value or 0
+        return func
+
+    return decorator
+
+
+_exports[("ole32", "CoTaskMemAlloc")] = cast(_malloc, c_void_p).value or 0
+_exports[("ole32", "CoTaskMemFree")] = cast(_free, c_void_p).value or 0
+
+_FuncPtr = CFUNCTYPE(c_int32)
+
+
+class _MissingFunction:
+    """偽のDLLに無い関数です。インポート時のargtypes等の設定は受け付け、呼び出すと例外を発生します。"""
+
+    def __init__(self, name: str) -> None:
+        self.__name = name
+        self.argtypes: Any = None
+        self.restype: Any = c_int32
+        self.errcheck: Any = None
+
+    def __call__(self, *args: Any) -> Any:
+        raise NotImplementedError(f"{self.__name}は偽のCOMバックエンドに実装されていません。")
+
+
+class _FakeDLL:
+    """ctypes.WinDLLの代わりです。実装済みの関数はCの関数ポインタとして返します。"""
+
+    def __init__(self, name: str, *args: Any, **kwargs: Any) -> None:
+        self.__name = Path(name).stem.lower()
+        self.__funcs: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        f = self.__funcs.get(name)
+        if f is None:
+            address = _exports.get((self.__name, name))
+            f = _FuncPtr(address) if address else _MissingFunction(f"{self.__name}.{name}")
+            f = self.__funcs.setdefault(name, f)
+        return f
+
+
+# VARIANT
+
+_VT_BSTR = 8
+_VT_DISPATCH = 9
+_VT_UNKNOWN = 13
+_VT_RECORD = 36
+_VT_LPWSTR = 31
+_VT_ARRAY = 0x2000
+_VT_BYREF = 0x4000
+_VARIANT_DATA_OFFSET = 8
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def VariantClear(pvarg: int) -> int:
+    # 実際のVariantClearはVT_LPWSTRを解放しませんが、繰り返し計測でメモリが増え続けないように解放します。
+    vt = c_uint16.from_address(pvarg).value
+    if vt == _VT_LPWSTR:
+        _free(c_void_p.from_address(pvarg + _VARIANT_DATA_OFFSET).value)
+    elif vt in (_VT_BSTR, _VT_DISPATCH, _VT_UNKNOWN, _VT_RECORD) or (vt & _VT_ARRAY and not vt & _VT_BYREF):
+        return E_NOTIMPL
+    c_uint16.from_address(pvarg).value = 0
+    return S_OK
+
+
+# SAFEARRAY（数値型の要素のみ）
+
+_ELEMENT_SIZES = {
+    **dict.fromkeys((16, 17), 1),  # VT_I1, VT_UI1
+    **dict.fromkeys((2, 11, 18), 2),  # VT_I2, VT_BOOL, VT_UI2
+    **dict.fromkeys((3, 4, 10, 19, 22, 23), 4),  # VT_I4, VT_R4, VT_ERROR, VT_UI4, VT_INT, VT_UINT
+    **dict.fromkeys((5, 6, 7, 20, 21), 8),  # VT_R8, VT_CY, VT_DATE, VT_I8, VT_UI8
+}
+_FADF_HAVEVARTYPE = 0x80
+_SAFEARRAY_PREFIX = 16
+"""SAFEARRAYの前に確保する領域。Windowsと同様に直前の4バイトに要素の型を格納します。"""
+
+
+class _SAFEARRAY(Structure):
+    _fields_ = (
+        ("cDims", c_uint16),
+        ("fFeatures", c_uint16),
+        ("cbElements", c_uint32),
+        ("cLocks", c_uint32),
+        ("pvData", c_void_p),
+    )
+
+
+class _SAFEARRAYBOUND(Structure):
+    _fields_ = (("cElements", c_uint32), ("lLbound", c_int32))
+
+
+def _bounds(psa: int) -> Any:
+    """SAFEARRAYの各次元の範囲。Windowsと同様に右端の次元から順に格納します。"""
+    return (_SAFEARRAYBOUND * _SAFEARRAY.from_address(psa).cDims).from_address(psa + sizeof(_SAFEARRAY))
+
+
+def _create_safearray(vt: int, bounds: list[tuple[int, int]]) -> int | None:
+    size = _ELEMENT_SIZES.get(vt)
+    if size is None or not bounds:
+        return None
+    base = _calloc(1, _SAFEARRAY_PREFIX + sizeof(_SAFEARRAY) + sizeof(_SAFEARRAYBOUND) * len(bounds))
+    if not base:
+        return None
+    psa = base + _SAFEARRAY_PREFIX
+    c_int32.from_address(psa - 4).value = vt
+    sa = _SAFEARRAY.from_address(psa)
+    sa.cDims = len(bounds)
+    sa.fFeatures = _FADF_HAVEVARTYPE
+    sa.cbElements = size
+    for dst, (elements, lbound) in zip(_bounds(psa), reversed(bounds)):
+        dst.cElements = elements
+        dst.lLbound = lbound
+    sa.pvData = _calloc(max(prod(e for e, _ in bounds), 1), size)
+    return psa
+
+
+@_export("oleaut32", c_void_p, c_uint16, c_uint32, c_void_p)
+def SafeArrayCreate(vt: int, cDims: int, rgsabound: int) -> int | None:
+    src = (_SAFEARRAYBOUND * cDims).from_address(rgsabound)
+    return _create_safearray(vt, [(b.cElements, b.lLbound) for b in src])
+
+
+@_export("oleaut32", c_void_p, c_uint16, c_int32, c_uint32)
+def SafeArrayCreateVector(vt: int, lLbound: int, cElements: int) -> int | None:
+    return _create_safearray(vt, [(cElements, lLbound)])
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def SafeArrayDestroy(psa: int | None) -> int:
+    if not psa:
+        return S_OK
+    sa = _SAFEARRAY.from_address(psa)
+    if sa.cLocks:
+        return HRESULTS["DISP_E_ARRAYISLOCKED"]
+    _free(sa.pvData)
+    _free(psa - _SAFEARRAY_PREFIX)
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def SafeArrayDestroyData(psa: int) -> int:
+    sa = _SAFEARRAY.from_address(psa)
+    if sa.cLocks:
+        return HRESULTS["DISP_E_ARRAYISLOCKED"]
+    memset(sa.pvData, 0, sa.cbElements * prod(b.cElements for b in _bounds(psa)))
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def SafeArrayLock(psa: int) -> int:
+    _SAFEARRAY.from_address(psa).cLocks += 1
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def SafeArrayUnlock(psa: int) -> int:
+    sa = _SAFEARRAY.from_address(psa)
+    if not sa.cLocks:
+        return E_UNEXPECTED
+    sa.cLocks -= 1
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p, c_void_p)
+def SafeArrayAccessData(psa: int, ppvData: int) -> int:
+    sa = _SAFEARRAY.from_address(psa)
+    sa.cLocks += 1
+    c_void_p.from_address(ppvData).value = sa.pvData
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p)
+def SafeArrayUnaccessData(psa: int) -> int:
+    return SafeArrayUnlock(psa)
+
+
+@_export("oleaut32", c_uint32, c_void_p)
+def SafeArrayGetDim(psa: int) -> int:
+    return _SAFEARRAY.from_address(psa).cDims
+
+
+@_export("oleaut32", c_uint32, c_void_p)
+def SafeArrayGetElemsize(psa: int) -> int:
+    return _SAFEARRAY.from_address(psa).cbElements
+
+
+def _bound(psa: int, nDim: int) -> _SAFEARRAYBOUND | None:
+    bounds = _bounds(psa)
+    return bounds[len(bounds) - nDim] if 1 <= nDim <= len(bounds) else None
+
+
+@_export("oleaut32", c_int32, c_void_p, c_uint32, c_void_p)
+def SafeArrayGetLBound(psa: int, nDim: int, plLbound: int) -> int:
+    b = _bound(psa, nDim)
+    if b is None:
+        return HRESULTS["DISP_E_BADINDEX"]
+    c_int32.from_address(plLbound).value = b.lLbound
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p, c_uint32, c_void_p)
+def SafeArrayGetUBound(psa: int, nDim: int, plUbound: int) -> int:
+    b = _bound(psa, nDim)
+    if b is None:
+        return HRESULTS["DISP_E_BADINDEX"]
+    c_int32.from_address(plUbound).value = b.lLbound + b.cElements - 1
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p, c_void_p)
+def SafeArrayGetVartype(psa: int, pvt: int) -> int:
+    if not _SAFEARRAY.from_address(psa).fFeatures & _FADF_HAVEVARTYPE:
+        return E_INVALIDARG
+    c_uint16.from_address(pvt).value = c_int32.from_address(psa - 4).value
+    return S_OK
+
+
+@_export("oleaut32", c_int32, c_void_p, c_void_p, c_void_p)
+def SafeArrayGetElement(psa: int, rgIndices: int, pv: int) -> int:
+    sa = _SAFEARRAY.from_address(psa)
+    bounds = _bounds(psa)
+    indices = (c_int32 * len(bounds)).from_address(rgIndices)
+    offset = 0
+    stride = 1
+    for index, b in zip(indices, bounds):
+        if not b.lLbound <= index < b.lLbound + b.cElements:
+            return HRESULTS["DISP_E_BADINDEX"]
+        offset += (index - b.lLbound) * stride
+        stride *= b.cElements
+    memmove(pv, sa.pvData + offset * sa.cbElements, sa.cbElements)
+    return S_OK
+
+
+# IStream
+
+
+@_export("shlwapi", c_void_p, c_void_p, c_uint32)
+def SHCreateMemStream(pInit: int | None, cbInit: int) -> int:
+    # IStreamのvtableの並びはpowc.streamの定義から作成します。
+    from powc.stream import IStream
+
+    return _MemoryStream(IStream, string_at(pInit, cbInit) if pInit else b"").address
+
+
+#
+# 組み込み
+#
+
+_installed = False
+
+
+def _WinError(code: int | None = None, descr: str | None = None) -> OSError:
+    return OSError(code, descr or f"HRESULT {code}")
+
+
+def install() -> None:
+    """偽のcomtypesとDLLを組み込みます。powc系パッケージをインポートする前に呼び出します。
+
+    Raises:
+        RuntimeError: Windowsで呼び出した、またはpowc系パッケージを既にインポートしている。
+    """
+    global _installed
+    if _installed:
+        return
+    if sys.platform == "win32":
+        raise RuntimeError("Windowsでは実際のCOMを使用してください。")
+    if any(name in sys.modules for name in PACKAGES):
+        raise RuntimeError("powc系パッケージのインポート前に呼び出してください。")
+
+    for package in PACKAGES:
+        # インストールされていない場合はリポジトリのソースを使用します（comtypesに依存するためWindows以外では入りません）。
+        if importlib.util.find_spec(package) is None:
+            sys.path.insert(0, str(_ROOT / package / "src"))
+
+    ctypes.WinDLL = ctypes.OleDLL = _FakeDLL  # type: ignore
+    if not hasattr(ctypes, "WinError"):
+        ctypes.WinError = _WinError  # type: ignore
+    if not hasattr(ctypes, "WINFUNCTYPE"):
+        ctypes.WINFUNCTYPE = CFUNCTYPE  # type: ignore
+    if not hasattr(ctypes, "HRESULT"):
+        ctypes.HRESULT = ctypes.c_long  # type: ignore
+
+    comtypes = ModuleType("comtypes")
+    # comtypesと同様に、ctypesの公開名を再公開します。
+    comtypes.__dict__.update({name: getattr(ctypes, name) for name in dir(ctypes) if not name.startswith("_")})
+    comtypes.__dict__.update(
+        {"BSTR": BSTR, "COMError": COMError, "GUID": GUID, "IUnknown": IUnknown, "STDMETHOD": STDMETHOD}
+    )
+    hresult = ModuleType("comtypes.hresult")
+    hresult.__dict__.update(HRESULTS)
+    comtypes.hresult = hresult  # type: ignore
+    sys.modules["comtypes"] = comtypes
+    sys.modules["comtypes.hresult"] = hresult
+    _installed = True
+
+
+def installed() -> bool:
+    return _installed
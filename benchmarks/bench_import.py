@@ -0,0 +1,69 @@
+"""パッケージごとのインポート時間。新しいプロセスで -X importtime の累積時間を計測します。
+
+パッケージの__init__だけでなく、サブパッケージを含む全てのモジュールをインポートした時間を計測します。
+"""
+
+import importlib.util
+import pkgutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterator
+
+from _bench import SkipBenchmark, benchmark
+
+PACKAGES = ("powc", "powcwmi", "powcshell", "powcd2d", "powcpropsys", "powccoreaudio")
+EXCLUDED = frozenset(("powc.incomplete",))
+"""計測から除くモジュール・サブパッケージ（未完成のもの）。"""
+
+
+def _walk(prefix: str, paths: list[str]) -> Iterator[str]:
+    for info in pkgutil.iter_modules(paths, prefix):
+        if info.name in EXCLUDED:
+            continue
+        yield info.name
+        if info.ispkg:
+            yield from _walk(f"{info.name}.", [str(Path(info.module_finder.path) / info.name.rpartition(".")[2])])
+
+
+def _modules(package: str) -> tuple[str, ...]:
+    """パッケージと配下の全モジュールの名前を返します。パッケージ自体はインポートしません。"""
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.submodule_search_locations is None:
+        raise SkipBenchmark(f"{package}が見つかりません。")
+    return (package, *_walk(f"{package}.", list(spec.submodule_search_locations)))
+
+
+def _import_time(package: str, modules: tuple[str, ...]) -> float:
+    out = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    found = False
+    for line in out.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        # 入れ子のインポートは名前が字下げされるため、字下げの無い行（-cで直接インポートしたもの）のみ合計します。
+        parts = line.split("|")
+        if len(parts) != 3:
+            continue
+        name = parts[2][1:]
+        if name == package or name.startswith(f"{package}."):
+            total += int(parts[1])
+            found = True
+    if not found:
+        raise RuntimeError(f"{package}のインポート時間を取得できません。")
+    return total / 1e6
+
+
+def _register(package: str) -> None:
+    @benchmark(f"import_{package}", "import", raw=True)
+    def setup():
+        modules = _modules(package)
+        return lambda: _import_time(package, modules)
+
+
+for _package in PACKAGES:
+    _register(_package)
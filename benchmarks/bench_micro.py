@@ -0,0 +1,124 @@
+"""ラッパーの基本操作。外部のCOMサーバーを使用せず、プロセス内のオブジェクトだけで計測します。
+
+Variant・SafeArray・IStream・PropertyKeyの操作は、Windows以外では偽のCOMバックエンド（:mod:`_fakecom`）で実行します。
+"""
+
+from _bench import benchmark
+
+CHUNK_SIZES = (64, 4096, 65536)
+STREAM_CHUNKS = 16
+
+
+@benchmark("variant_init_int32", "micro", windows_only=False)
+def _():
+    from powc.variant import Variant
+
+    return lambda: Variant.init_int32(12345)
+
+
+@benchmark("variant_get_int32", "micro", windows_only=False)
+def _():
+    from powc.variant import Variant
+
+    v = Variant.init_int32(12345)
+    return v.get_int32
+
+
+# c_wchar_pはWindows以外ではUTF-32のため、UTF-16の文字列を扱うこの操作はWindowsでのみ計測します。
+@benchmark("variant_init_get_wstr", "micro")
+def _():
+    from powc.variant import Variant
+
+    return lambda: Variant.init_wstr("benchmark").get_wstr()
+
+
+@benchmark("safearray_create_int32_1000", "micro", windows_only=False)
+def _():
+    from powc.safearray import SafeArrayPtr
+
+    source = list(range(1000))
+    return lambda: SafeArrayPtr.create_vector_int32(source)
+
+
+@benchmark("safearray_to_int32array_1000", "micro", windows_only=False)
+def _():
+    from powc.safearray import SafeArrayPtr
+
+    p = SafeArrayPtr.create_vector_int32(list(range(1000)))
+    return p.to_int32array
+
+
+@benchmark("safearray_getitem_100", "micro", windows_only=False)
+def _():
+    from powc.safearray import SafeArrayPtr
+
+    p = SafeArrayPtr.create_vector_int32(list(range(100)))
+
+    def func():
+        for i in range(100):
+            p[i]
+
+    return func
+
+
+def _register_stream(size: int) -> None:
+    @benchmark(f"comstream_write_{size}", "micro", windows_only=False)
+    def _():
+        from powc.stream import ComStream
+
+        stream = ComStream.create_on_mem(b"")
+        chunk = bytes(size)
+
+        def func():
+            stream.pos = 0
+            for _ in range(STREAM_CHUNKS):
+                stream.write_bytes(chunk)
+
+        return func
+
+    @benchmark(f"comstream_read_{size}", "micro", windows_only=False)
+    def _():
+        from powc.stream import ComStream
+
+        stream = ComStream.create_on_mem(bytes(size * STREAM_CHUNKS))
+
+        def func():
+            stream.pos = 0
+            for _ in range(STREAM_CHUNKS):
+                stream.read_bytes(size)
+
+        return func
+
+
+for _size in CHUNK_SIZES:
+    _register_stream(_size)
+
+
+@benchmark("propertykey_hash", "micro", windows_only=False)
+def _():
+    from powcpropsys.propkey import PropertyKey
+
+    # PKEY_ItemNameDisplay
+    key = PropertyKey.from_define(0xB725F130, 0x47EF, 0x101A, 0xA5, 0xF1, 0x02, 0x60, 0x8C, 0x9E, 0xEB, 0xAC, 10)
+    return lambda: hash(key)
+
+
+@benchmark("propertykey_dict_lookup", "micro", windows_only=False)
+def _():
+    from powcpropsys.propkey import PropertyKey
+
+    keys = [
+        PropertyKey.from_define(0xB725F130, 0x47EF, 0x101A, 0xA5, 0xF1, 0x02, 0x60, 0x8C, 0x9E, 0xEB, 0xAC, i)
+        for i in range(64)
+    ]
+    d = dict.fromkeys(keys)
+    key = keys[32]
+    return lambda: d[key]
+
+
+@benchmark("enumerator_categories", "micro")
+def _():
+    from powc.comcat import CategoryInformation
+
+    info = CategoryInformation.create()
+    return lambda: sum(1 for _ in info.get_enumcategories())
@@ -0,0 +1,59 @@
+"""Windowsの実際のCOMサーバーを使用する一連の処理。"""
+
+import os
+
+from _bench import SkipBenchmark, benchmark
+
+
+@benchmark("wmi_query_win32_process", "scenario")
+def _():
+    from powcwmi import WBEMLocator
+
+    services = WBEMLocator.create().connect_server("root\\cimv2")
+
+    def func():
+        for obj in services.exec_query("SELECT Name FROM Win32_Process"):
+            obj.get("Name")
+
+    return func
+
+
+@benchmark("shell_list_system32", "scenario")
+def _():
+    from powcshell.shellitem import ShellItem
+
+    folder = ShellItem.create_parsingname(os.path.join(os.environ.get("SystemRoot", "C:\\Windows"), "System32"))
+    return lambda: sum(1 for _ in folder.iter_items())
+
+
+@benchmark("wic_decode_frame", "scenario")
+def _():
+    from powcd2d.wic import FileAccess, WICDecodeOption, WICImagingFactory
+
+    # POWC_BENCH_IMAGEで画像を指定できます。既定値はWindows標準の壁紙です。
+    default = os.path.join(os.environ.get("SystemRoot", "C:\\Windows"), "Web", "Wallpaper", "Windows", "img0.jpg")
+    path = os.environ.get("POWC_BENCH_IMAGE", default)
+    if not os.path.exists(path):
+        raise SkipBenchmark(f"画像がありません: {path}")
+    factory = WICImagingFactory.create()
+
+    def func():
+        decoder = factory.create_decoder_from_filename(
+            path, FileAccess.GENERIC_READ, WICDecodeOption.METADATA_CACHE_ON_DEMAND
+        )
+        return decoder.get_frame(0).size
+
+    return func
+
+
+@benchmark("dwrite_enum_families", "scenario")
+def _():
+    from powcd2d.dwrite import DWriteFactory, DWriteFactoryType
+
+    collection = DWriteFactory.create(DWriteFactoryType.SHARED).systemfontcollection
+
+    def func():
+        for family in collection.fontfamily_iter():
+            family.familynames.strings
+
+    return func
@@ -0,0 +1,89 @@
+"""powcベンチマークの実行スクリプト。
+
+Examples:
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py -k comstream -b baseline.json
+    python benchmarks/run.py --compare baseline.json results.json
+"""
+
+import argparse
+import sys
+
+import _bench
+import bench_import  # noqa: F401
+import bench_micro  # noqa: F401
+import bench_scenarios  # noqa: F401
+
+GROUPS = ("import", "micro", "scenario")
+
+
+def _print_comparison(comparisons: list[_bench.Comparison], threshold: float) -> int:
+    regressions = 0
+    for c in sorted(comparisons, key=lambda c: c.name):
+        mark = ""
+        if c.ratio > 1 + threshold:
+            mark = "  遅延"
+            regressions += 1
+        elif c.ratio < 1 - threshold:
+            mark = "  改善"
+        print(
+            f"{c.name:40} {_bench.format_time(c.baseline):>12} -> {_bench.format_time(c.current):>12}"
+            f" ({c.ratio:.2f}x){mark}"
+        )
+    return regressions
+
+
+def _check_backend(baseline: str, backend: str) -> None:
+    """偽のCOMバックエンドと実際のCOMの結果を比較する場合は警告します。"""
+    other = _bench.load_metadata(baseline).get("com_backend", "native")
+    if other != backend:
+        print(f"警告: COMバックエンドが異なる結果を比較します（{other} -> {backend}）。", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", help="結果を保存するJSONファイル")
+    parser.add_argument("-b", "--baseline", help="比較するベースラインのJSONファイル")
+    parser.add_argument("-k", "--filter", help="名前にこの文字列を含むベンチマークのみ実行します")
+    parser.add_argument("-g", "--group", action="append", choices=GROUPS, help="実行するグループ（複数指定可）")
+    parser.add_argument("--repeat", type=int, default=10, help="サンプル数")
+    parser.add_argument("--min-time", type=float, default=0.01, help="1サンプルの最小秒数")
+    parser.add_argument("--threshold", type=float, default=0.1, help="遅延・改善と判定する中央値の変化率")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="保存済みの結果を比較します")
+    parser.add_argument("--fail-on-regression", action="store_true", help="遅延がある場合は終了コード1で終了します")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        _check_backend(args.compare[0], _bench.load_metadata(args.compare[1]).get("com_backend", "native"))
+        regressions = _print_comparison(
+            _bench.compare(_bench.load(args.compare[1]), _bench.load(args.compare[0])), args.threshold
+        )
+        return 1 if regressions and args.fail_on_regression else 0
+
+    groups = set(args.group or GROUPS)
+    results = []
+    for bench in _bench.registered():
+        if bench.group not in groups or (args.filter and args.filter not in bench.name):
+            continue
+        try:
+            result = _bench.run(bench, args.repeat, args.min_time)
+        except _bench.SkipBenchmark as e:
+            print(f"{bench.name:40} 省略: {e}")
+            continue
+        results.append(result)
+        print(f"{bench.name:40} {_bench.format_time(result.median):>12} +- {_bench.format_time(result.stdev)}")
+
+    if args.output:
+        _bench.save(args.output, results)
+    if args.baseline:
+        print()
+        _check_backend(args.baseline, _bench.metadata()["com_backend"])
+        current = {r.name: r.to_dict() for r in results}
+        regressions = _print_comparison(_bench.compare(current, _bench.load(args.baseline)), args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 
-from .core import ComResult, check_hresult, cotaskmem, cr, query_interface
+from .core import ComResult, ComWrapper, check_hresult, cotaskmem, cr, query_interface
 
 
 class IEnumGUID(IUnknown):
@@ -35,7 +35,7 @@ IEnumGUID._methods_ = [
 ]
 
 
-class GuidEnumerator:
+class GuidEnumerator(ComWrapper):
     """IEnumGUIDインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -91,7 +91,7 @@ IEnumCATEGORYINFO._methods_ = [
 ]
 
 
-class CategoryInfoEnumerator:
+class CategoryInfoEnumerator(ComWrapper):
     """IEnumCATEGORYINFOインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -134,7 +134,7 @@ class ICatRegister(IUnknown):
     ]
 
 
-class CategoryRegister:
+class CategoryRegister(ComWrapper):
     """ICatRegisterインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -214,7 +214,7 @@ class ICatInformation(IUnknown):
     ]
 
 
-class CategoryInformation:
+class CategoryInformation(ComWrapper):
     """ICatInformationインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
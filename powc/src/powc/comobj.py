@@ -1,5 +1,6 @@
 """COMオブジェクトの基本操作クラス。"""
 
+from collections import OrderedDict
 from ctypes import (
     POINTER,
     Structure,
@@ -12,20 +13,23 @@ from ctypes import (
     sizeof,
 )
 from enum import IntEnum, IntFlag
+from threading import RLock
 from types import NotImplementedType
 from typing import Any, Iterator
 
-from comtypes import GUID, STDMETHOD, IUnknown
+from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 from comtypes.hresult import E_FAIL
 
 from . import _ole32
 from .core import (
     ComResult,
+    ComWrapper,
     IUnknownPointer,
     IUnknownWrapper,
     check_hresult,
     cotaskmem,
     cr,
+    detach_from_scope,
     query_interface,
 )
 from .datetime import FILETIME
@@ -46,7 +50,7 @@ IEnumUnknown._methods_ = [
 ]
 
 
-class IUnknownEnumerator:
+class IUnknownEnumerator(ComWrapper):
     """IEnumUnknownインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -92,7 +96,7 @@ IEnumString._methods_ = [
 ]
 
 
-class ComStringEnumerator:
+class ComStringEnumerator(ComWrapper):
     """IEnumStringインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -252,7 +256,7 @@ IEnumMoniker._methods_ = [
 
 
 # TODO
-class Moniker:
+class Moniker(ComWrapper):
     """IMonikerインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IMoniker)
@@ -524,6 +528,22 @@ class Moniker:
     def create_genericcomposite(first: "Moniker", rest: "Moniker") -> "Moniker":
         return Moniker.create_genericcomposite_nothrow(first, rest).value
 
+    @staticmethod
+    def create_from_displayname_nothrow(displayname: str, bc: "BindCtx | None" = None) -> "ComResult[Moniker]":
+        """表示名を解析してモニカーを作成します。MkParseDisplayName関数のラッパーです。
+        bcを省略した場合は一時的なバインドコンテキストを作成します。"""
+        if bc is None:
+            bc = BindCtx.create()
+        eaten = c_uint32()
+        x = POINTER(IMoniker)()
+        return cr(_MkParseDisplayName(bc.wrapped_obj, displayname, byref(eaten), byref(x)), Moniker(x))
+
+    @staticmethod
+    def create_from_displayname(displayname: str, bc: "BindCtx | None" = None) -> "Moniker":
+        """表示名を解析してモニカーを作成します。MkParseDisplayName関数のラッパーです。
+        bcを省略した場合は一時的なバインドコンテキストを作成します。"""
+        return Moniker.create_from_displayname_nothrow(displayname, bc).value
+
 
 _CreateClassMoniker = _ole32.CreateClassMoniker
 _CreateClassMoniker.argtypes = (POINTER(GUID), POINTER(POINTER(IMoniker)))
@@ -543,8 +563,11 @@ _CreateItemMoniker.argtypes = (c_wchar_p, c_wchar_p, POINTER(POINTER(IMoniker)))
 _CreateGenericComposite = _ole32.CreateGenericComposite
 _CreateGenericComposite.argtypes = (POINTER(IMoniker), POINTER(IMoniker), POINTER(POINTER(IMoniker)))
 
+_MkParseDisplayName = _ole32.MkParseDisplayName
+_MkParseDisplayName.argtypes = (POINTER(IBindCtx), c_wchar_p, POINTER(c_uint32), POINTER(POINTER(IMoniker)))
+
 
-class MonikerEnumerator:
+class MonikerEnumerator(ComWrapper):
     """IEnumMonikerインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -563,6 +586,7 @@ class MonikerEnumerator:
         x = POINTER(IMoniker)()
         while (hr := self.__o.Next(1, byref(x), None)) == 0:
             yield Moniker(x)
+            x = POINTER(IMoniker)()
         check_hresult(hr)
 
     def clone_nothrow(self) -> "ComResult[MonikerEnumerator]":
@@ -595,7 +619,7 @@ class RunningObjectTableFlag(IntFlag):
 
 # IRunningObjectTableは循環参照するため、MonikerやMonikerEnumeratorより後で定義します。
 # 詳細はIRunningObjectTableクラスのコメントを参照してください。
-class RunningObjectTable:
+class RunningObjectTable(ComWrapper):
     """IRunningObjectTableインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IRunningObjectTable)
@@ -682,7 +706,7 @@ _GetRunningObjectTable = _ole32.GetRunningObjectTable
 _GetRunningObjectTable.argtypes = (c_uint32, POINTER(POINTER(IRunningObjectTable)))
 
 
-class BindCtx:
+class BindCtx(ComWrapper):
     """IBindCtxインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IBindCtx)
@@ -734,7 +758,8 @@ class BindCtx:
         return self.bindoptions1_nothrow.value
 
     def set_bindoptions1_nothrow(self, options: BindOptions) -> ComResult[None]:
-        return self.__o.SetBindOptions(options)
+        options.cb_struct = sizeof(BindOptions)
+        return cr(self.__o.SetBindOptions(byref(options)), None)
 
     @bindoptions1.setter
     def bindoptions1(self, options: BindOptions) -> None:
@@ -751,7 +776,8 @@ class BindCtx:
         return self.bindoptions2_nothrow.value
 
     def set_bindoptions2_nothrow(self, options: BindOptions2) -> ComResult[None]:
-        return self.__o.SetBindOptions(options)
+        options.cb_struct = sizeof(BindOptions2)
+        return cr(self.__o.SetBindOptions(byref(options)), None)
 
     @bindoptions2.setter
     def bindoptions2(self, options: BindOptions2) -> None:
@@ -768,11 +794,12 @@ class BindCtx:
         return self.bindoptions3_nothrow.value
 
     def set_bindoptions3_nothrow(self, options: BindOptions3) -> ComResult[None]:
-        return self.__o.SetBindOptions(options)
+        options.cb_struct = sizeof(BindOptions3)
+        return cr(self.__o.SetBindOptions(byref(options)), None)
 
     @bindoptions3.setter
     def bindoptions3(self, options: BindOptions3) -> None:
-        return self.set_bindoptions1_nothrow(options).value
+        return self.set_bindoptions3_nothrow(options).value
 
     @property
     def bindoptions_nothrow(self) -> ComResult[BindOptions3]:
@@ -820,3 +847,212 @@ class BindCtx:
 
 _CreateBindCtx = _ole32.CreateBindCtx
 _CreateBindCtx.argtypes = (c_uint32, POINTER(POINTER(IBindCtx)))
+
+
+class MonikerCache:
+    """表示名をキーとするモニカーのLRUキャッシュです。
+
+    同じ表示名には同じ :class:`Moniker` インスタンスを返します。
+    表示名の解析と取得には共有のバインドコンテキストを再利用するため、呼び出し毎のCreateBindCtxを省けます。
+    MTAの複数のスレッドから同時に使用できます。
+
+    Examples:
+        >>> cache = MonikerCache(maxsize=64)
+        >>> moniker = cache.parse_displayname(r"C:\\Windows")
+        >>> cache.get_displayname(moniker)
+        >>> cache.release_boundobjects()
+    """
+
+    __slots__ = ("__maxsize", "__items", "__bc", "__bindoptions", "__lock")
+    __maxsize: int
+    __items: OrderedDict[str, Moniker]
+    __bc: BindCtx | None
+    __bindoptions: BindOptions3 | None
+    __lock: RLock
+
+    def __init__(self, maxsize: int = 128, bindoptions: BindOptions3 | None = None) -> None:
+        """
+        Args:
+            maxsize (int, optional): 保持するモニカーの最大数。超えた場合は最も古く使用されたものから破棄します。
+            bindoptions (BindOptions3 | None, optional): 共有バインドコンテキストに設定するバインドオプション。
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsizeは1以上である必要があります。")
+        self.__maxsize = maxsize
+        self.__items = OrderedDict()
+        self.__bc = None
+        self.__bindoptions = bindoptions
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, displayname: object) -> bool:
+        return displayname in self.__items
+
+    @property
+    def bindctx_nothrow(self) -> ComResult[BindCtx]:
+        """共有バインドコンテキスト。初回アクセス時に作成してバインドオプションを設定します。"""
+        bc = self.__bc
+        if bc is not None:
+            return cr(0, bc)
+        with self.__lock:
+            if self.__bc is not None:
+                return cr(0, self.__bc)
+            x = BindCtx.create_nothrow()
+            if not x:
+                return x
+            bc = x.value_unchecked
+            if self.__bindoptions is not None:
+                x2 = bc.set_bindoptions3_nothrow(self.__bindoptions)
+                if not x2:
+                    return cr(x2.hr, bc)
+            self.__bc = detach_from_scope(bc)
+            return x
+
+    @property
+    def bindctx(self) -> BindCtx:
+        """共有バインドコンテキスト。初回アクセス時に作成してバインドオプションを設定します。"""
+        return self.bindctx_nothrow.value
+
+    @property
+    def bindoptions(self) -> BindOptions3 | None:
+        return self.__bindoptions
+
+    def set_bindoptions_nothrow(self, options: BindOptions3) -> ComResult[None]:
+        """バインドオプションを変更します。共有バインドコンテキストが作成済みの場合は直ちに反映します。"""
+        with self.__lock:
+            self.__bindoptions = options
+            if self.__bc is None:
+                return cr(0, None)
+            return self.__bc.set_bindoptions3_nothrow(options)
+
+    @bindoptions.setter
+    def bindoptions(self, options: BindOptions3) -> None:
+        self.set_bindoptions_nothrow(options).value
+
+    def parse_displayname_nothrow(self, displayname: str) -> ComResult[Moniker]:
+        """表示名に対応するモニカーを返します。キャッシュに無い場合は解析して追加します。"""
+        items = self.__items
+        with self.__lock:
+            moniker = items.get(displayname)
+            if moniker is not None:
+                items.move_to_end(displayname)
+                return cr(0, moniker)
+
+        # 解析はロックの外で行います。同時に解析した場合は先に追加されたモニカーを返します。
+        bc = self.bindctx_nothrow
+        if not bc:
+            return cr(bc.hr, Moniker(POINTER(IMoniker)()))
+        x = Moniker.create_from_displayname_nothrow(displayname, bc.value_unchecked)
+        if not x:
+            return x
+        with self.__lock:
+            moniker = items.setdefault(displayname, detach_from_scope(x.value_unchecked))
+            items.move_to_end(displayname)
+            if len(items) > self.__maxsize:
+                items.popitem(last=False)
+        return cr(x.hr, moniker)
+
+    def parse_displayname(self, displayname: str) -> Moniker:
+        """表示名に対応するモニカーを返します。キャッシュに無い場合は解析して追加します。"""
+        return self.parse_displayname_nothrow(displayname).value
+
+    def get_displayname_nothrow(self, moniker: Moniker, left: Moniker | None = None) -> ComResult[str]:
+        """共有バインドコンテキストを使用してモニカーの表示名を取得します。"""
+        bc = self.bindctx_nothrow
+        if not bc:
+            return cr(bc.hr, "")
+        return moniker.get_displayname_nothrow(bc.value_unchecked, left)
+
+    def get_displayname(self, moniker: Moniker, left: Moniker | None = None) -> str:
+        """共有バインドコンテキストを使用してモニカーの表示名を取得します。"""
+        return self.get_displayname_nothrow(moniker, left).value
+
+    def release_boundobjects_nothrow(self) -> ComResult[None]:
+        """共有バインドコンテキストに登録されたオブジェクトを解放します。キャッシュ済みのモニカーは保持します。"""
+        if self.__bc is None:
+            return cr(0, None)
+        return self.__bc.release_boundobjects_nothrow()
+
+    def release_boundobjects(self) -> None:
+        """共有バインドコンテキストに登録されたオブジェクトを解放します。キャッシュ済みのモニカーは保持します。"""
+        return self.release_boundobjects_nothrow().value
+
+    def discard(self, displayname: str) -> None:
+        """表示名に対応するモニカーをキャッシュから削除します。"""
+        with self.__lock:
+            self.__items.pop(displayname, None)
+
+    def clear(self) -> None:
+        """全てのモニカーを破棄して、共有バインドコンテキストも解放します。"""
+        with self.__lock:
+            self.__items.clear()
+            bc, self.__bc = self.__bc, None
+        if bc is not None:
+            bc.release_boundobjects_nothrow()
+
+
+class IGlobalInterfaceTable(IUnknown):
+    __slots__ = ()
+    _iid_ = GUID("{00000146-0000-0000-C000-000000000046}")
+    _methods_ = [
+        STDMETHOD(c_int32, "RegisterInterfaceInGlobal", (POINTER(IUnknown), POINTER(GUID), POINTER(c_uint32))),
+        STDMETHOD(c_int32, "RevokeInterfaceFromGlobal", (c_uint32,)),
+        STDMETHOD(c_int32, "GetInterfaceFromGlobal", (c_uint32, POINTER(GUID), POINTER(POINTER(IUnknown)))),
+    ]
+
+
+CLSID_StdGlobalInterfaceTable = GUID("{00000323-0000-0000-C000-000000000046}")
+
+
+class GlobalInterfaceTable(ComWrapper):
+    """グローバルインターフェイステーブル。IGlobalInterfaceTableインターフェイスのラッパーです。
+
+    登録したインターフェイスは、他のアパートメントのスレッドから :meth:`get` で取得できます。
+    取得したポインタは呼び出したスレッドのアパートメント用にマーシャリングされています。
+    """
+
+    __o: Any  # POINTER(IGlobalInterfaceTable)
+
+    __slots__ = ("__o",)
+
+    def __init__(self, o: Any) -> None:
+        self.__o = query_interface(o, IGlobalInterfaceTable)
+
+    @property
+    def wrapped_obj(self) -> c_void_p:
+        return self.__o
+
+    @staticmethod
+    def create() -> "GlobalInterfaceTable":
+        """プロセスで共通のグローバルインターフェイステーブルを取得します。"""
+        return GlobalInterfaceTable(CoCreateInstance(CLSID_StdGlobalInterfaceTable, IGlobalInterfaceTable))
+
+    def register_nothrow(self, object: IUnknownPointer, interface: type[IUnknown]) -> ComResult[int]:
+        """インターフェイスを登録して、取得に使用するクッキーを返します。"""
+        x = c_uint32()
+        return cr(self.__o.RegisterInterfaceInGlobal(object, byref(interface._iid_), byref(x)), x.value)
+
+    def register(self, object: IUnknownPointer, interface: type[IUnknown]) -> int:
+        """インターフェイスを登録して、取得に使用するクッキーを返します。"""
+        return self.register_nothrow(object, interface).value
+
+    def revoke_nothrow(self, cookie: int) -> ComResult[None]:
+        return cr(self.__o.RevokeInterfaceFromGlobal(cookie), None)
+
+    def revoke(self, cookie: int) -> None:
+        return self.revoke_nothrow(cookie).value
+
+    def get_nothrow(self, cookie: int, interface: type[IUnknown]) -> ComResult[Any]:
+        """登録したインターフェイスを、呼び出したスレッドのアパートメント用に取得します。"""
+        x = POINTER(interface)()
+        return cr(self.__o.GetInterfaceFromGlobal(cookie, byref(interface._iid_), byref(x)), x)
+
+    def get(self, cookie: int, interface: type[IUnknown]) -> Any:
+        """登録したインターフェイスを、呼び出したスレッドのアパートメント用に取得します。"""
+        return self.get_nothrow(cookie, interface).value
@@ -4,7 +4,7 @@ from ctypes import c_int32, c_uint32, c_void_p, c_wchar_p
 from enum import IntEnum
 from typing import Any
 
-from .core import _ole32, check_hresult
+from .core import _ole32, check_hresult, hr
 
 
 class RpcImpLevel(IntEnum):
@@ -84,6 +84,8 @@ class RpcAuthzService(IntEnum):
     DEFAULT = 0xFFFFFFFF
 
 
+RPC_E_TOO_LATE = hr(0x80010119)
+
 _CoInitializeSecurity = _ole32.CoInitializeSecurity
 _CoInitializeSecurity.argtypes = (
     c_void_p,
@@ -106,14 +108,18 @@ def com_init_security(
     implevel: RpcImpLevel = RpcImpLevel.IMPERSONATE,
     oleauthn: OleAuthnCaps = OleAuthnCaps.NONE,
     allow_toolate: bool = True,
-):
+) -> bool:
+    """プロセスのCOMセキュリティを初期化します。
+
+    Returns:
+        bool: 初期化した場合は真。allow_toolateが真で、既に初期化されていた場合は偽。
+    """
     hr = _CoInitializeSecurity(None, -1, None, None, int(authnlevel), int(implevel), None, int(oleauthn), None)
 
-    RPC_E_TOO_LATE = 0x80010119
     if allow_toolate and hr == RPC_E_TOO_LATE:
-        print("COM security was initialized.")
-        return
+        return False
     check_hresult(hr)
+    return True
 
 
 def com_set_securityblanket(
@@ -1,12 +1,35 @@
 """基本的なCOM機能。他のCOMラッパーから使用される機能を提供します。"""
 
+import gc
+import sys
 from contextlib import contextmanager
-from ctypes import POINTER, WinError, _Pointer, c_int32, c_size_t, c_void_p, memmove
-from typing import TYPE_CHECKING, Any, Iterator, NoReturn, Protocol, runtime_checkable
-
-from comtypes import GUID, IUnknown
-
-from . import _ole32
+from ctypes import (
+    POINTER,
+    WinError,
+    _Pointer,
+    addressof,
+    byref,
+    c_byte,
+    c_int32,
+    c_size_t,
+    c_ssize_t,
+    c_uint32,
+    c_void_p,
+    c_wchar_p,
+    memmove,
+    memset,
+    sizeof,
+)
+from ctypes.wintypes import MSG
+from enum import IntEnum
+from itertools import count
+from threading import RLock, local
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, NoReturn, Protocol, runtime_checkable
+from weakref import ref
+
+from comtypes import GUID, STDMETHOD, IUnknown
+
+from . import _kernel32, _ole32, _user32
 
 
 class ComResult[T]:
@@ -81,6 +104,33 @@ _CoTaskMemAlloc.argtypes = (c_size_t,)
 _CoTaskMemAlloc.restype = c_void_p
 
 
+class IMalloc(IUnknown):
+    """IMallocインターフェイス"""
+
+    __slots__ = ()
+    _iid_ = GUID("{00000002-0000-0000-C000-000000000046}")
+
+
+IMalloc._methods_ = [
+    STDMETHOD(c_void_p, "Alloc", (c_size_t,)),
+    STDMETHOD(c_void_p, "Realloc", (c_void_p, c_size_t)),
+    STDMETHOD(None, "Free", (c_void_p,)),
+    STDMETHOD(c_size_t, "GetSize", (c_void_p,)),
+    STDMETHOD(c_int32, "DidAlloc", (c_void_p,)),
+    STDMETHOD(None, "HeapMinimize", ()),
+]
+
+_CoGetMalloc = _ole32.CoGetMalloc
+_CoGetMalloc.argtypes = (c_uint32, POINTER(POINTER(IMalloc)))
+_CoGetMalloc.restype = c_int32
+
+_MEMCTX_TASK = 1
+_SIZE_T_MAX = c_size_t(-1).value
+
+# CoGetMallocが返すアロケーターはプロセスで1つのため、初回の取得後は使い回します。
+_malloc: Any = None
+
+
 @contextmanager
 def cotaskmem[T](p: T) -> Iterator[T]:
     """comtypes.c_void_p型等のCOMタスクメモリをスコープ脱出時に解放します。
@@ -115,14 +165,63 @@ def cotaskmem_free(p: Any) -> None:
     _CoTaskMemFree(p)
 
 
+def cotaskmem_size(p: Any) -> int:
+    """COMメモリの確保されているサイズを返します。NULLの場合は0です。
+
+    IMalloc::GetSizeを使用するため、CoTaskMemAllocとCoTaskMemReallocで確保したメモリのみ指定できます。
+    """
+    global _malloc
+    address = p.value if isinstance(p, c_void_p) else p
+    if not address:
+        return 0
+    if _malloc is None:
+        m = POINTER(IMalloc)()
+        check_hresult(_CoGetMalloc(_MEMCTX_TASK, byref(m)))
+        _malloc = m
+    size = _malloc.GetSize(address)
+    return 0 if size == _SIZE_T_MAX else size
+
+
+_lock = RLock()
+"""モジュールの共有状態を保護するロック。GILのないPythonでも解放処理やスコープの状態を一貫させます。"""
+
+
+def take_pointer(p: c_void_p) -> int:
+    """ポインタの値を取得してNULLに置き換えます。複数のスレッドから同時に解放しても二重解放になりません。
+
+    Returns:
+        int: 置き換え前のポインタの値。NULLの場合は0です。
+    """
+    with _lock:
+        x = p.value
+        p.value = None
+    return x or 0
+
+
+def take_struct(s: Any) -> Any:
+    """構造体の値を同じサイズのバイト配列へ移して、元の構造体を0で埋めます。
+    VARIANT等の値を複数のスレッドから同時に解放しても二重解放になりません。
+
+    Returns:
+        Any: 置き換え前の値（c_byte * sizeof(s)）。__del__を持たないため、解放は呼び出し側で行います。
+    """
+    with _lock:
+        x = (c_byte * sizeof(s)).from_buffer_copy(s)
+        memset(addressof(s), 0, sizeof(s))
+    return x
+
+
 class CoTaskMem(c_void_p):
     """COMメモリのラッパーです。"""
 
-    __slots__ = ()
+    # release_scopeは弱参照で登録するため、__slots__を定義しません（ctypes型は__weakref__をスロットにできません）。
 
     @staticmethod
     def alloc_bytes(bytes: int) -> "CoTaskMem":
-        return CoTaskMem(_CoTaskMemAlloc(bytes))
+        p = CoTaskMem(_CoTaskMemAlloc(bytes))
+        if _tracking:
+            track_object(p, bytes)
+        return p
 
     @staticmethod
     def alloc_unistr(s: str) -> "CoTaskMem":
@@ -131,13 +230,26 @@ class CoTaskMem(c_void_p):
         memmove(p, b, len(b))
         return p
 
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        if _release_scope_depth:
+            release_on_exit(self)
+
     def __del__(self) -> None:
         cotaskmem_free(self)
 
+    def release(self) -> None:
+        """メモリを解放します。"""
+        _CoTaskMemFree(take_pointer(self))
+
+    def __enter__(self) -> "CoTaskMem":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
     def detatch(self) -> int:
-        x = self.value
-        self.value = None
-        return x or 0
+        return take_pointer(self)
 
 
 def hr(code: int) -> int:
@@ -186,6 +298,7 @@ if TYPE_CHECKING:
 
     def query_interface[TIUnknown: IUnknown](o: Any, interface_type: type[TIUnknown]) -> _Pointer[TIUnknown]:
         """comtypes.IUnknown派生インターフェイスを変換して返します。
+        oが既にPOINTER(interface_type)型の場合はoをそのまま返します。
         Raises:
             TypeError: oがPOINTER(comtypes.IUnknown)またはPOINTER(comtypes.IUnknown派生クラス)ではない
         Returns:
@@ -199,14 +312,29 @@ else:
 
     def query_interface[TIUnknown: IUnknown](o: Any, interface_type: type[TIUnknown]) -> IUnknownPointer:
         """comtypes.IUnknown派生インターフェイスを変換して返します。
+        oが既にPOINTER(interface_type)型の場合はoをそのまま返します。
         Raises:
             TypeError: oがPOINTER(comtypes.IUnknown)またはPOINTER(comtypes.IUnknown派生クラス)ではない
         Returns:
             _type_: 変換後のIUnknown派生インターフェイスインスタンス。
         """
+        if type(o) is POINTER(interface_type):
+            # 同じインターフェイスへの変換はQueryInterfaceとAddRefを省略して、同じポインタを返します。
+            if _tracking:
+                track_object(o)
+            return o
         if not isinstance(o, POINTER(IUnknown)):
             raise TypeError
-        return o.QueryInterface(interface_type) if o else interface_type()
+        if not o:
+            return interface_type()
+        if _identity_map_depth:
+            m = current_identity_map()
+            if m is not None:
+                return m.query_interface(o, interface_type)
+        x = o.QueryInterface(interface_type)
+        if _tracking:
+            track_object(x)
+        return x
 
 
 def guid_from_define(a: int, b: int, c: int, d: int, e: int, f: int, g: int, h: int, i: int, j: int, k: int) -> GUID:
@@ -229,3 +357,663 @@ class IUnknownWrapper(Protocol):
 
     @property
     def wrapped_obj(self) -> c_void_p: ...
+
+
+#
+# 解放スコープ
+#
+
+
+class ReleaseScope:
+    """:func:`release_scope` が返すスコープです。登録されたオブジェクトをスコープ脱出時に作成の逆順で解放します。
+
+    オブジェクトは弱参照で登録するため、スコープ内で参照されなくなったオブジェクトは通常どおり直ちに解放されます。
+    弱参照を作成できないオブジェクトはスコープ脱出まで保持します。
+    """
+
+    __objs: dict[int, Any]
+
+    __slots__ = ("__objs",)
+
+    def __init__(self) -> None:
+        self.__objs = {}
+
+    def __len__(self) -> int:
+        return len(self.__objs)
+
+    def add[T](self, obj: T) -> T:
+        """オブジェクトを登録します。objはrelease()メソッドを持つ必要があります。"""
+        objs = self.__objs
+        oid = id(obj)
+        try:
+            # 解放された時点で登録を解除します。
+            objs[oid] = ref(obj, lambda _, oid=oid: objs.pop(oid, None))
+        except TypeError:
+            objs[oid] = obj
+        return obj
+
+    def detach[T](self, obj: T) -> T:
+        """オブジェクトの登録を解除します。スコープ外で使用するオブジェクトに使用します。"""
+        self.__objs.pop(id(obj), None)
+        return obj
+
+    def release(self) -> None:
+        """登録されたオブジェクトを全て解放して、登録を解除します。"""
+        objs = self.__objs
+        while objs:
+            _, entry = objs.popitem()
+            obj = entry() if type(entry) is ref else entry
+            if obj is not None:
+                obj.release()
+
+    def __enter__(self) -> "ReleaseScope":
+        global _release_scope_depth
+        stack = getattr(_release_scope_local, "stack", None)
+        if stack is None:
+            stack = _release_scope_local.stack = []
+        stack.append(self)
+        with _lock:
+            _release_scope_depth += 1
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        global _release_scope_depth
+        with _lock:
+            _release_scope_depth -= 1
+        _release_scope_local.stack.remove(self)
+        self.release()
+
+
+_release_scope_depth = 0
+_release_scope_local = local()
+
+
+def release_scope() -> ReleaseScope:
+    """スコープ内で作成されたラッパー、Variant、SafeArrayPtr、CoTaskMem等をスコープ脱出時に解放します。
+    スコープはスレッドごとに入れ子にでき、最も内側のスコープに登録されます。
+    スコープ外で使用するオブジェクトは :meth:`ReleaseScope.detach` で登録を解除してください。
+
+    Examples:
+        >>> with release_scope():
+        >>>     for item in folder.iter_items():
+        >>>         print(item.name_normal)
+        >>> # 列挙したShellItemは全て解放済みです。
+    """
+    return ReleaseScope()
+
+
+def release_on_exit[T](obj: T) -> T:
+    """現在のスレッドの最も内側の :func:`release_scope` にオブジェクトを登録します。スコープ外では何もしません。"""
+    if _release_scope_depth:
+        stack = getattr(_release_scope_local, "stack", None)
+        if stack:
+            stack[-1].add(obj)
+    return obj
+
+
+def detach_from_scope[T](obj: T) -> T:
+    """現在のスレッドの全ての :func:`release_scope` からオブジェクトの登録を解除します。
+    キャッシュ等、スコープ脱出後も保持するオブジェクトに使用します。スコープ外では何もしません。"""
+    if _release_scope_depth:
+        for scope in getattr(_release_scope_local, "stack", ()):
+            scope.detach(obj)
+    return obj
+
+
+def _mangle(cls: type, name: str) -> str:
+    if name.startswith("__") and not name.endswith("__"):
+        return f"_{cls.__name__.lstrip('_')}{name}"
+    return name
+
+
+class _ComWrapperMeta(type):
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if _identity_map_depth and args:
+            m = current_identity_map()
+            if m is not None and isinstance(args[0], IUnknownPointer) and args[0]:
+                # 同一性マップに記憶したラッパーは、__init__を呼び出さずにそのまま返して状態を保持します。
+                self = m.get_wrapper(cls, args[0])
+                if self is not None:
+                    if _release_scope_depth:
+                        release_on_exit(self)
+                    return self
+        return super().__call__(*args, **kwargs)
+
+
+class ComWrapper(metaclass=_ComWrapperMeta):
+    """COMインターフェイスのラッパーの基底クラスです。
+
+    :meth:`release` でラップしたインターフェイスを解放して、with文で使用するとスコープ脱出時に解放します。
+    :func:`release_scope` 内で作成されたインスタンスはスコープに登録されます。
+    """
+
+    # release_scopeが弱参照で登録するため、__weakref__を持ちます。
+    __slots__ = ("__weakref__",)
+    _release_slots: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        names: list[str] = []
+        for c in reversed(cls.__mro__):
+            slots = c.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                name = _mangle(c, name)
+                if name != "__weakref__" and name not in names:
+                    names.append(name)
+        cls._release_slots = tuple(names)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        if _identity_map_depth and args:
+            m = current_identity_map()
+            if m is not None and isinstance(args[0], IUnknownPointer) and args[0]:
+                # 記憶済みのラッパーはメタクラスが返すため、ここでは新しいラッパーを記憶します。
+                self = m.set_wrapper(cls, args[0], super().__new__(cls))
+                if _release_scope_depth:
+                    release_on_exit(self)
+                return self
+        self = super().__new__(cls)
+        if _release_scope_depth:
+            release_on_exit(self)
+        return self
+
+    def release(self) -> None:
+        """ラップしたインターフェイスを解放します。解放後のインスタンスはNULLポインタをラップした状態になります。
+        wrapped_objで取得したポインタを他で保持している場合、そのポインタの参照は解放されません。"""
+        for name in self._release_slots:
+            v = getattr(self, name, None)
+            if isinstance(v, ComWrapper):
+                v.release()
+            elif isinstance(v, IUnknownPointer) and v:
+                setattr(self, name, type(v)())
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
+
+#
+# 同一性マップ
+#
+
+
+class IdentityMap:
+    """COMオブジェクトの同一性（IUnknownポインタ）ごとにラッパーとインターフェイスを共有するマップです。
+    :func:`identity_map` で作成します。
+
+    マップ内ではラッパーの作成時に同じCOMオブジェクトの同じラッパー型のインスタンスを返して、
+    :func:`query_interface` で取得したインターフェイスを記憶して再利用します。
+    マップは取得したインターフェイスの参照をスコープ脱出時まで保持します。
+    """
+
+    __canons: dict[int, tuple[Any, int]]
+    __interfaces: dict[tuple[int, type], Any]
+    __wrappers: dict[tuple[int, type], Any]
+
+    __slots__ = ("__canons", "__interfaces", "__wrappers")
+
+    def __init__(self) -> None:
+        self.__canons = {}
+        self.__interfaces = {}
+        self.__wrappers = {}
+
+    def __len__(self) -> int:
+        """記憶しているラッパーの数。"""
+        return len(self.__wrappers)
+
+    def canonical(self, o: Any) -> int:
+        """COMオブジェクトの同一性を表すIUnknownポインタの値を返します。"""
+        p = c_void_p.from_buffer(o).value or 0
+        entry = self.__canons.get(p)
+        if entry is not None:
+            return entry[1]
+        unk = o.QueryInterface(IUnknown)
+        canon = c_void_p.from_buffer(unk).value or 0
+        # ポインタ値の再利用を防ぐため、ポインタの参照を保持します。
+        self.__canons[p] = (o, canon)
+        self.__canons.setdefault(canon, (unk, canon))
+        self.__interfaces.setdefault((canon, IUnknown), unk)
+        return canon
+
+    def query_interface(self, o: Any, interface_type: type) -> Any:
+        """記憶したインターフェイスを返します。未取得の場合はQueryInterfaceで取得して記憶します。"""
+        canon = self.canonical(o)
+        key = (canon, interface_type)
+        x = self.__interfaces.get(key)
+        if x is None:
+            x = self.__interfaces[key] = o.QueryInterface(interface_type)
+            self.__canons.setdefault(c_void_p.from_buffer(x).value or 0, (x, canon))
+            if _tracking:
+                track_object(x)
+        return x
+
+    def get_wrapper(self, cls: type, o: Any) -> Any:
+        """記憶したラッパーを返します。解放済み（wrapped_objがNULL）のラッパーは記憶から削除してNoneを返します。"""
+        key = (self.canonical(o), cls)
+        wrapper = self.__wrappers.get(key)
+        if wrapper is not None and not getattr(wrapper, "wrapped_obj", True):
+            # 内側のrelease_scope等で解放されたラッパーは、新しいラッパーに置き換えるため返しません。
+            del self.__wrappers[key]
+            return None
+        return wrapper
+
+    def set_wrapper[T](self, cls: type, o: Any, wrapper: T) -> T:
+        self.__wrappers[(self.canonical(o), cls)] = wrapper
+        return wrapper
+
+    def clear(self) -> None:
+        """記憶したラッパーとインターフェイスの参照を全て解放します。"""
+        self.__wrappers.clear()
+        self.__interfaces.clear()
+        self.__canons.clear()
+
+    def __enter__(self) -> "IdentityMap":
+        global _identity_map_depth
+        stack = getattr(_identity_map_local, "stack", None)
+        if stack is None:
+            stack = _identity_map_local.stack = []
+        stack.append(self)
+        with _lock:
+            _identity_map_depth += 1
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        global _identity_map_depth
+        with _lock:
+            _identity_map_depth -= 1
+        _identity_map_local.stack.remove(self)
+        self.clear()
+
+
+_identity_map_depth = 0
+_identity_map_local = local()
+
+
+def identity_map() -> IdentityMap:
+    """スコープ内で同じCOMオブジェクトのラッパーを同一のインスタンスにします。マップはスレッドごとです。
+    ラッパーをdictのキーやsetの要素として使用する場合や、同じオブジェクトを繰り返しラップする場合に使用します。
+    マップに記憶したラッパーは__init__を再実行しないため、最初に作成したラッパーの状態を保持します。
+
+    Examples:
+        >>> with identity_map():
+        >>>     a = ShellItem(p)
+        >>>     b = ShellItem(p)
+        >>>     assert a is b
+    """
+    return IdentityMap()
+
+
+def current_identity_map() -> IdentityMap | None:
+    """現在のスレッドで最も内側の :func:`identity_map` を返します。スコープ外ではNoneです。"""
+    stack = getattr(_identity_map_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+#
+# アパートメント
+#
+
+
+class ApartmentType(IntEnum):
+    """スレッドのアパートメントの種類（APTTYPE）です。"""
+
+    CURRENT = -1
+    STA = 0
+    MTA = 1
+    NA = 2
+    MAINSTA = 3
+
+
+_CoGetApartmentType = _ole32.CoGetApartmentType
+_CoGetApartmentType.argtypes = (POINTER(c_int32), POINTER(c_int32))
+_CoGetApartmentType.restype = c_int32
+
+_CoWaitForMultipleHandles = _ole32.CoWaitForMultipleHandles
+_CoWaitForMultipleHandles.argtypes = (c_uint32, c_uint32, c_uint32, POINTER(c_void_p), POINTER(c_uint32))
+_CoWaitForMultipleHandles.restype = c_int32
+
+_CreateEventW = _kernel32.CreateEventW
+_CreateEventW.argtypes = (c_void_p, c_int32, c_int32, c_wchar_p)
+_CreateEventW.restype = c_void_p
+
+_SetEvent = _kernel32.SetEvent
+_SetEvent.argtypes = (c_void_p,)
+_SetEvent.restype = c_int32
+
+_ResetEvent = _kernel32.ResetEvent
+_ResetEvent.argtypes = (c_void_p,)
+_ResetEvent.restype = c_int32
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = (c_void_p,)
+_CloseHandle.restype = c_int32
+
+_PeekMessageW = _user32.PeekMessageW
+_PeekMessageW.argtypes = (POINTER(MSG), c_void_p, c_uint32, c_uint32, c_uint32)
+_PeekMessageW.restype = c_int32
+
+_TranslateMessage = _user32.TranslateMessage
+_TranslateMessage.argtypes = (POINTER(MSG),)
+_TranslateMessage.restype = c_int32
+
+_DispatchMessageW = _user32.DispatchMessageW
+_DispatchMessageW.argtypes = (POINTER(MSG),)
+_DispatchMessageW.restype = c_ssize_t
+
+_PM_REMOVE = 0x0001
+_INFINITE = 0xFFFFFFFF
+_RPC_S_CALLPENDING = hr(0x80010115)
+
+
+def get_apartment_type_nothrow() -> ComResult[ApartmentType]:
+    """現在のスレッドのアパートメントの種類を返します（CoGetApartmentType）。COMを初期化していない場合は失敗します。"""
+    apttype = c_int32()
+    qualifier = c_int32()
+    x = _CoGetApartmentType(byref(apttype), byref(qualifier))
+    return cr(x, ApartmentType(apttype.value) if x >= 0 else ApartmentType.CURRENT)
+
+
+def get_apartment_type() -> ApartmentType:
+    """現在のスレッドのアパートメントの種類を返します（CoGetApartmentType）。
+
+    Raises:
+        OSError: COMを初期化していない。
+    """
+    return get_apartment_type_nothrow().value
+
+
+def is_sta_thread() -> bool:
+    """現在のスレッドがSTA（メインSTAを含む）の場合は真。COMを初期化していない場合は偽です。
+
+    STAのスレッドでは、他のアパートメントからのCOMの呼び出し（コールバック等）はメッセージで届くため、
+    メッセージを処理せずに待機すると呼び出しが届きません。
+    """
+    r = get_apartment_type_nothrow()
+    return r.success and r.value_unchecked in (ApartmentType.STA, ApartmentType.MAINSTA)
+
+
+def pump_waiting_messages() -> None:
+    """現在のスレッドのメッセージキューにあるメッセージを全て処理します。待機はしません。"""
+    msg = MSG()
+    while _PeekMessageW(byref(msg), None, 0, 0, _PM_REMOVE):
+        _TranslateMessage(byref(msg))
+        _DispatchMessageW(byref(msg))
+
+
+class ComWaitEvent:
+    """COMの呼び出しを処理しながら待機できるイベント（手動リセット）です。
+
+    :meth:`wait` はCoWaitForMultipleHandlesで待機するため、STAのスレッドで待機しても
+    他のアパートメントからのCOMの呼び出しを処理します。
+    """
+
+    __handle: int
+
+    __slots__ = ("__handle",)
+
+    def __init__(self) -> None:
+        handle = _CreateEventW(None, True, False, None)
+        if not handle:
+            raise WinError()
+        self.__handle = handle
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """イベントのハンドルを閉じます。"""
+        with _lock:
+            handle = getattr(self, "_ComWaitEvent__handle", 0)
+            self.__handle = 0
+        if handle:
+            _CloseHandle(handle)
+
+    def set(self) -> None:
+        """イベントをシグナル状態にします。"""
+        _SetEvent(self.__handle)
+
+    def clear(self) -> None:
+        """イベントを非シグナル状態にします。"""
+        _ResetEvent(self.__handle)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """シグナル状態になるまで待機します。シグナル状態になった場合は真、タイムアウトした場合は偽を返します。
+
+        Raises:
+            OSError: 待機に失敗した。
+        """
+        ms = _INFINITE if timeout is None else min(max(int(timeout * 1000), 0), _INFINITE - 1)
+        handle = c_void_p(self.__handle)
+        index = c_uint32()
+        x = _CoWaitForMultipleHandles(0, ms, 1, byref(handle), byref(index))
+        if x == _RPC_S_CALLPENDING:
+            return False
+        check_hresult(x)
+        return True
+
+
+#
+# 参照追跡（デバッグ用）
+#
+
+
+class TrackedStats(NamedTuple):
+    """:func:`tracking_report` の集計値です。"""
+
+    count: int
+    bytes: int
+
+
+class ComLeakError(Exception):
+    """:func:`leak_scope` のスコープ内で作成されたオブジェクトが解放されていません。"""
+
+    def __init__(self, leaks: dict[tuple[str, str], TrackedStats]) -> None:
+        lines = "\n".join(
+            f"  {name} ({site}): {stats.count}個, {stats.bytes}バイト" for (name, site), stats in leaks.items()
+        )
+        super().__init__(f"解放されていないCOMオブジェクトまたはメモリがあります。\n{lines}")
+        self.leaks = leaks
+
+
+class _TrackedRecord:
+    __slots__ = ("seq", "typename", "site", "size", "weak")
+    seq: int
+    typename: str
+    site: str
+    size: int
+    weak: Any  # weakref.ref | None
+
+    def __init__(self, seq: int, typename: str, site: str, size: int, weak: Any) -> None:
+        self.seq = seq
+        self.typename = typename
+        self.site = site
+        self.size = size
+        self.weak = weak
+
+
+_tracking = False
+_tracked: dict[int, _TrackedRecord] = {}
+_tracked_seq = count()
+_tracked_types: dict[type, Callable[[Any], int] | None] = {}
+_tracked_patches: dict[type, tuple[Any, Any]] = {}
+
+
+def _caller_site() -> str:
+    """powc系パッケージの外側で最初に見つかった呼び出し元を返します。"""
+    f: Any = sys._getframe(1)
+    while f is not None:
+        name = f.f_globals.get("__name__", "")
+        if not name.startswith("powc") and not name.startswith("comtypes") and name != "contextlib":
+            return f"{f.f_code.co_filename}:{f.f_lineno}"
+        f = f.f_back
+    return "<unknown>"
+
+
+def _untrack(oid: int) -> None:
+    with _lock:
+        _tracked.pop(oid, None)
+
+
+def track_object(obj: Any, size: int | None = None) -> None:
+    """オブジェクトを参照追跡に登録します。追跡が無効の場合は何もしません。
+    登録済みのオブジェクトを再登録した場合はサイズのみ更新します。"""
+    if not _tracking:
+        return
+    oid = id(obj)
+    with _lock:
+        record = _tracked.get(oid)
+        if record is not None:
+            if size is not None:
+                record.size = size
+            return
+    try:
+        weak = ref(obj, lambda _, oid=oid: _untrack(oid))
+    except TypeError:
+        weak = None
+    if size is None:
+        size = sizeof(obj) if weak is None else 0
+    site = _caller_site()
+    with _lock:
+        _tracked.setdefault(oid, _TrackedRecord(next(_tracked_seq), type(obj).__name__, site, size, weak))
+
+
+def _patch_tracked_type(cls: type) -> None:
+    init = cls.__init__
+    delete = getattr(cls, "__del__", None)
+
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        track_object(self)
+
+    def __del__(self):
+        _untrack(id(self))
+        if delete is not None:
+            delete(self)
+
+    _tracked_patches[cls] = (cls.__dict__.get("__init__"), cls.__dict__.get("__del__"))
+    cls.__init__ = __init__  # type: ignore
+    cls.__del__ = __del__  # type: ignore
+
+
+def _unpatch_tracked_type(cls: type) -> None:
+    init, delete = _tracked_patches.pop(cls)
+    if init is None:
+        del cls.__init__  # type: ignore
+    else:
+        cls.__init__ = init  # type: ignore
+    if delete is None:
+        del cls.__del__  # type: ignore
+    else:
+        cls.__del__ = delete  # type: ignore
+
+
+def register_tracked_type(cls: type, size: Callable[[Any], int] | None = None) -> None:
+    """ネイティブメモリを所有する型を参照追跡の対象に登録します。各モジュールのインポート時に呼び出します。
+
+    Args:
+        cls (type): 解放処理を__del__で行う型。
+        size (Callable[[Any], int] | None, optional): 報告時にオブジェクトのネイティブメモリサイズを返す関数。
+            弱参照を作成できない型ではサイズは登録時の値になります。
+    """
+    with _lock:
+        _tracked_types[cls] = size
+        if _tracking and cls not in _tracked_patches:
+            _patch_tracked_type(cls)
+
+
+def enable_tracking() -> None:
+    """参照追跡を有効にします。以降に作成されたラッパーのCOMポインタとネイティブメモリを記録します。
+    登録した型のメソッドを置き換えるため、無効時のオーバーヘッドはありません。"""
+    global _tracking
+    with _lock:
+        if _tracking:
+            return
+        _tracking = True
+        for cls in _tracked_types:
+            _patch_tracked_type(cls)
+
+
+def disable_tracking() -> None:
+    """参照追跡を無効にして、記録を破棄します。"""
+    global _tracking
+    with _lock:
+        _tracking = False
+        for cls in tuple(_tracked_patches):
+            _unpatch_tracked_type(cls)
+        _tracked.clear()
+
+
+def is_tracking() -> bool:
+    return _tracking
+
+
+def _record_size(record: _TrackedRecord) -> int:
+    if record.weak is None:
+        return record.size
+    obj = record.weak()
+    sizefn = _tracked_types.get(type(obj)) if obj is not None else None
+    if sizefn is None:
+        return record.size
+    try:
+        return sizefn(obj)
+    except Exception:
+        return record.size
+
+
+def _aggregate(records: Iterator[_TrackedRecord], by_site: bool) -> dict[tuple[str, str], TrackedStats]:
+    d: dict[tuple[str, str], TrackedStats] = {}
+    for record in records:
+        key = (record.typename, record.site if by_site else "")
+        n, b = d.get(key, (0, 0))
+        d[key] = TrackedStats(n + 1, b + _record_size(record))
+    return d
+
+
+def tracking_report(by_site: bool = True, collect: bool = True) -> dict[tuple[str, str], TrackedStats]:
+    """生存中の追跡オブジェクトを(型名, 作成箇所)ごとに集計します。
+
+    Args:
+        by_site (bool, optional): 偽の場合は作成箇所を空文字列として型名のみで集計します。
+        collect (bool, optional): 集計前にガベージコレクションを実行します。
+    """
+    if collect:
+        gc.collect()
+    with _lock:
+        records = tuple(_tracked.values())
+    return _aggregate(iter(records), by_site)
+
+
+@contextmanager
+def leak_scope(raises: bool = True) -> Iterator[dict[tuple[str, str], TrackedStats]]:
+    """スコープ内で作成されて、スコープ脱出時に生存している追跡オブジェクトを検出します。
+    参照追跡が無効の場合はスコープ内のみ有効にします。
+
+    Args:
+        raises (bool, optional): 真の場合は検出時に :class:`ComLeakError` を発生します。
+            偽の場合はyieldした辞書に結果を格納します。
+
+    Examples:
+        >>> with leak_scope():
+        >>>     item = ShellItem.create_parsingname("C:\\")
+        >>>     del item
+    """
+    was_tracking = _tracking
+    enable_tracking()
+    with _lock:
+        start = next(_tracked_seq)
+    leaks: dict[tuple[str, str], TrackedStats] = {}
+    try:
+        yield leaks
+        gc.collect()
+        with _lock:
+            records = [r for r in _tracked.values() if r.seq > start]
+        leaks.update(_aggregate(iter(records), True))
+    finally:
+        if not was_tracking:
+            disable_tracking()
+    if leaks and raises:
+        raise ComLeakError(leaks)
+
+
+register_tracked_type(CoTaskMem, cotaskmem_size)
@@ -14,14 +14,24 @@ from ctypes import (
     c_void_p,
     c_wchar,
     c_wchar_p,
+    sizeof,
 )
 from enum import IntEnum, IntFlag
 from typing import TYPE_CHECKING, Any, Iterator
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, check_hresult, cr, query_interface
-from powc.globalmem import globalmem_lock
+from powc.core import (
+    ComResult,
+    ComWrapper,
+    check_hresult,
+    cr,
+    is_tracking,
+    query_interface,
+    register_tracked_type,
+    track_object,
+)
+from powc.globalmem import _GlobalSize, globalmem_lock
 from powc.stream import ComStream, IStream
 
 from . import _ole32, _user32
@@ -267,7 +277,7 @@ IEnumFORMATETC._methods_ = [
 ]
 
 
-class FormatEtcEnumerator:
+class FormatEtcEnumerator(ComWrapper):
     __o: Any  # POINTER(IEnumFORMATETC)
 
     __slots__ = ("__o",)
@@ -317,7 +327,7 @@ class IDataObject(IUnknown):
     __slots__ = ()
 
 
-class DataObject:
+class DataObject(ComWrapper):
     __o: Any  # POINTER(IDataObject)
 
     __slots__ = ("__o",)
@@ -332,7 +342,11 @@ class DataObject:
     def get_data_nothrow(self, format: ClipboardFormat) -> ComResult[StorageMedium]:
         fmtetc = FormatEtc.create_simple(format)
         stgmed = StorageMedium()
-        return cr(self.__o.GetData(byref(fmtetc), byref(stgmed)), stgmed)
+        hr = self.__o.GetData(byref(fmtetc), byref(stgmed))
+        if hr >= 0 and is_tracking():
+            # 弱参照を作成できない型のため、追跡のサイズは値を受け取った後に更新します。
+            track_object(stgmed, _storage_medium_size(stgmed))
+        return cr(hr, stgmed)
 
     def get_data(self, format: ClipboardFormat) -> StorageMedium:
         return self.get_data_nothrow(format).value
@@ -391,3 +405,13 @@ _OleSetClipboard.restype = c_int32
 _OleFlushClipboard = _ole32.OleFlushClipboard
 _OleFlushClipboard.argtypes = ()
 _OleFlushClipboard.restype = c_int32
+
+
+def _storage_medium_size(medium: StorageMedium) -> int:
+    """参照追跡で報告するサイズです。構造体と、HGLOBALのメモリを含みます。"""
+    if medium._tymed == MediumType.HGLOBAL and medium.global_handle:
+        return sizeof(StorageMedium) + _GlobalSize(medium.global_handle)
+    return sizeof(StorageMedium)
+
+
+register_tracked_type(StorageMedium, _storage_medium_size)
@@ -5,7 +5,7 @@ from typing import Any
 
 from comtypes import BSTR, GUID, STDMETHOD, IUnknown
 
-from .core import ComResult, cr, query_interface
+from .core import ComResult, ComWrapper, cr, query_interface
 
 
 class ComExceptionInfo(Structure):
@@ -33,7 +33,7 @@ class IErrorLog(IUnknown):
     ]
 
 
-class ErrorLog:
+class ErrorLog(ComWrapper):
     """エラーログ。IErrorLogインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
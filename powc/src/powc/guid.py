@@ -0,0 +1,162 @@
+"""GUIDの高速な解析・書式化とインターン機能。
+
+comtypes.GUIDの文字列変換はole32のCLSIDFromStringとStringFromCLSIDを呼び出します。
+このモジュールは :mod:`struct` と :mod:`uuid` で同じ処理をPython内で完結させます。
+"""
+
+from ctypes import byref, memmove
+from struct import Struct
+from typing import Any
+from uuid import UUID
+
+from comtypes import GUID
+
+_GUID_STRUCT = Struct("<IHH8B")
+_GUID_FORMAT = "{%08X-%04X-%04X-%02X%02X-%02X%02X%02X%02X%02X%02X}"
+
+
+def guid_to_str(guid: GUID) -> str:
+    """GUIDをStringFromCLSIDと同じ形式（波括弧付き大文字）の文字列に変換します。
+
+    Examples:
+        >>> guid_to_str(GUID())  # "{00000000-0000-0000-0000-000000000000}"
+    """
+    if type(guid) is InternedGUID:
+        return guid._str
+    return _GUID_FORMAT % _GUID_STRUCT.unpack(bytes(guid))
+
+
+def guid_to_bytes(s: str) -> bytes:
+    """GUID文字列をGUID構造体のバイト列に変換します。波括弧とハイフンの有無は問いません。
+
+    Raises:
+        ValueError: GUID文字列として解釈できない。
+    """
+    return UUID(s).bytes_le
+
+
+class InternedGUID(GUID):
+    """インターンされたGUIDです。 :func:`guid` 等で取得します。
+
+    文字列表現とハッシュを作成時に計算して保持するため、str()とhash()はole32を呼び出しません。
+    値の等しいインスタンスは1つだけ存在して定数として共有されるため、属性への代入はAttributeErrorになります。
+    変更する場合やCOMの出力引数に渡す場合は :meth:`copy` で複製してください。
+    comtypes.GUIDとの比較やハッシュの互換性は保たれます。
+    """
+
+    _bytes: bytes
+    _str: str
+    _hash: int
+
+    def __init__(self, name: str | None = None) -> None:
+        """直接作成したインスタンスはインターンされません。通常は :func:`guid` を使用してください。"""
+        b = guid_to_bytes(name) if name is not None else bytes(16)
+        GUID.__init__(self)
+        self.__setup(b)
+
+    def __setup(self, b: bytes) -> None:
+        memmove(byref(self), b, 16)
+        object.__setattr__(self, "_bytes", b)
+        object.__setattr__(self, "_str", _GUID_FORMAT % _GUID_STRUCT.unpack(b))
+        object.__setattr__(self, "_hash", hash(b))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"InternedGUIDは変更できません（{name}）。copy()で複製してください。")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"InternedGUIDは変更できません（{name}）。copy()で複製してください。")
+
+    @staticmethod
+    def _from_bytes(b: bytes) -> "InternedGUID":
+        x = InternedGUID.__new__(InternedGUID)
+        x.__setup(b)
+        return x
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __repr__(self) -> str:
+        return f'GUID("{self._str}")'
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        return isinstance(other, GUID) and self._bytes == bytes(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __bool__(self) -> bool:
+        return self._bytes != _NULL_BYTES
+
+    def __bytes__(self) -> bytes:
+        return self._bytes
+
+    def copy(self) -> GUID:
+        """変更可能なcomtypes.GUIDとして複製します。"""
+        return GUID.from_buffer_copy(self._bytes)
+
+
+_NULL_BYTES = bytes(16)
+
+_interned_by_bytes: dict[bytes, InternedGUID] = {}
+_interned_by_str: dict[str, InternedGUID] = {}
+
+
+def guid_from_bytes(b: bytes) -> InternedGUID:
+    """GUID構造体のバイト列（16バイト）からインターンされたGUIDを取得します。
+
+    Raises:
+        ValueError: バイト列の長さが16ではない。
+    """
+    x = _interned_by_bytes.get(b)
+    if x is not None:
+        return x
+    if len(b) != 16:
+        raise ValueError("GUIDのバイト列は16バイトである必要があります。")
+    b = bytes(b)
+    return _interned_by_bytes.setdefault(b, InternedGUID._from_bytes(b))
+
+
+def guid(s: str) -> InternedGUID:
+    """GUID文字列からインターンされたGUIDを取得します。comtypes.GUID(s)の代わりに使用できます。
+
+    Raises:
+        ValueError: GUID文字列として解釈できない。
+
+    Examples:
+        >>> guid("{D20BEEC4-5CA8-4905-AE3B-BF251EA09B53}") is guid("d20beec4-5ca8-4905-ae3b-bf251ea09b53")  # True
+    """
+    x = _interned_by_str.get(s)
+    if x is not None:
+        return x
+    x = guid_from_bytes(guid_to_bytes(s))
+    return _interned_by_str.setdefault(s, x)
+
+
+def guid_from_fields(
+    a: int, b: int, c: int, d: int, e: int, f: int, g: int, h: int, i: int, j: int, k: int
+) -> InternedGUID:
+    """C++のGUID構造体形式でインターンされたGUIDを取得します。
+
+    Examples:
+        >>> guid_from_fields(0xFBF23B40, 0xE3F0, 0x101B, 0x84, 0x88, 0x00, 0xAA, 0x00, 0x3E, 0x56, 0xF8)
+    """
+    return guid_from_bytes(_GUID_STRUCT.pack(a, b, c, d, e, f, g, h, i, j, k))
+
+
+def intern_guid(x: GUID) -> InternedGUID:
+    """任意のGUIDと等しいインターンされたGUIDを取得します。
+
+    インターンしたGUIDは解放されないため、定数のGUIDにのみ使用してください。
+    COMから取得した値等、種類に上限の無いGUIDに使用すると、インターンの表が際限なく大きくなります。
+    """
+    if type(x) is InternedGUID:
+        return x
+    return guid_from_bytes(bytes(x))
+
+
+GUID_NULL = guid_from_bytes(_NULL_BYTES)
@@ -0,0 +1,235 @@
+"""COMインターフェイスメソッドの呼び出し計測機能。
+
+:func:`enable` を呼び出すと、インターフェイスクラスのメソッドを計測用の関数に置き換えて、
+(インターフェイス名, メソッド名)ごとの呼び出し数・レイテンシのヒストグラム・HRESULTごとの失敗数を記録します。
+:func:`disable` で元のメソッドに戻すため、無効時のオーバーヘッドはありません。
+
+Examples:
+    >>> from powc import instrument
+    >>> with instrument.measure() as m:
+    >>>     for obj in services.exec_query("SELECT * FROM Win32_Process"):
+    >>>         obj.get("Name")
+    >>> m.snapshot[("IWbemClassObject", "Get")]["count"]
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Iterable, Iterator
+
+from comtypes import IUnknown
+
+HISTOGRAM_BUCKETS = 24
+"""ヒストグラムのビン数。ビンiは2**(i+10)ナノ秒（約1マイクロ秒×2**i）未満の呼び出しを数えます。"""
+
+
+class MethodStats:
+    """1つのインターフェイスメソッドの計測値です。"""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "histogram", "failures")
+    count: int
+    total_ns: int
+    min_ns: int
+    max_ns: int
+    histogram: list[int]
+    failures: dict[int, int]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+        self.failures = {}
+
+    def record(self, elapsed_ns: int, hr: int | None) -> None:
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.histogram[min(max(elapsed_ns.bit_length() - 10, 0), HISTOGRAM_BUCKETS - 1)] += 1
+        if hr is not None:
+            self.failures[hr] = self.failures.get(hr, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "histogram": tuple(self.histogram),
+            "failures": dict(self.failures),
+        }
+
+
+_lock = Lock()
+_stats: dict[tuple[str, str], MethodStats] = {}
+_patched: dict[tuple[type, str], Any] = {}
+
+
+def _record(key: tuple[str, str], elapsed_ns: int, hr: int | None) -> None:
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = MethodStats()
+        stats.record(elapsed_ns, hr)
+
+
+def _make_wrapper(key: tuple[str, str], original: Any) -> Any:
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            result = original(self, *args, **kwargs)
+        except OSError as e:
+            _record(key, perf_counter_ns() - start, getattr(e, "winerror", None) or e.errno or -1)
+            raise
+        except Exception as e:
+            # comtypes.COMErrorはOSError派生ではないため、hresult属性を参照します。
+            _record(key, perf_counter_ns() - start, getattr(e, "hresult", None) or -1)
+            raise
+        _record(key, perf_counter_ns() - start, result if type(result) is int and result < 0 else None)
+        return result
+
+    wrapper.__name__ = key[1]
+    wrapper.__qualname__ = f"{key[0]}.{key[1]}"
+    wrapper.__wrapped__ = original  # type: ignore
+    return wrapper
+
+
+def _iter_interfaces() -> Iterator[type]:
+    stack = list(IUnknown.__subclasses__())
+    seen = set()
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        stack.extend(cls.__subclasses__())
+        if cls.__module__.startswith("powc") and "_methods_" in cls.__dict__:
+            yield cls
+
+
+def enable(interfaces: Iterable[type] | None = None) -> None:
+    """計測を有効にします。
+
+    Args:
+        interfaces (Iterable[type] | None, optional): 計測するインターフェイスクラス。
+            省略時はインポート済みのpowc系パッケージのインターフェイス全てです。
+            有効化後にインポートしたインターフェイスは計測されないため、再度呼び出してください。
+    """
+    _enable(interfaces)
+
+
+def _enable(interfaces: Iterable[type] | None) -> list[tuple[type, str]]:
+    """メソッドを置き換えて、この呼び出しで置き換えたメソッドを返します。"""
+    applied = []
+    with _lock:
+        for cls in _iter_interfaces() if interfaces is None else interfaces:
+            for method in cls.__dict__.get("_methods_", ()):
+                name = method[1]
+                if not name or (cls, name) in _patched:
+                    continue
+                original = cls.__dict__.get(name)
+                if original is None:
+                    continue
+                _patched[(cls, name)] = original
+                setattr(cls, name, _make_wrapper((cls.__name__, name), original))
+                applied.append((cls, name))
+    return applied
+
+
+def _restore(keys: Iterable[tuple[type, str]]) -> None:
+    with _lock:
+        for key in keys:
+            original = _patched.pop(key, None)
+            if original is not None:
+                setattr(key[0], key[1], original)
+
+
+def disable() -> None:
+    """計測を無効にして、全てのメソッドを元に戻します。記録済みの計測値は保持します。"""
+    with _lock:
+        for (cls, name), original in _patched.items():
+            setattr(cls, name, original)
+        _patched.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def reset() -> None:
+    """記録済みの計測値を破棄します。"""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> dict[tuple[str, str], dict[str, Any]]:
+    """記録済みの計測値を(インターフェイス名, メソッド名)をキーとする辞書で返します。"""
+    with _lock:
+        return {key: stats.to_dict() for key, stats in _stats.items()}
+
+
+def _diff(
+    after: dict[tuple[str, str], dict[str, Any]], before: dict[tuple[str, str], dict[str, Any]]
+) -> dict[tuple[str, str], dict[str, Any]]:
+    d = {}
+    for key, a in after.items():
+        b = before.get(key)
+        if b is None:
+            d[key] = a
+            continue
+        count = a["count"] - b["count"]
+        if count == 0:
+            continue
+        total_ns = a["total_ns"] - b["total_ns"]
+        failures = {hr: n - b["failures"].get(hr, 0) for hr, n in a["failures"].items()}
+        d[key] = {
+            "count": count,
+            "total_ns": total_ns,
+            "mean_ns": total_ns // count,
+            # 最小値と最大値はスコープ内に限定できないため、累計値を返します。
+            "min_ns": a["min_ns"],
+            "max_ns": a["max_ns"],
+            "histogram": tuple(x - y for x, y in zip(a["histogram"], b["histogram"])),
+            "failures": {hr: n for hr, n in failures.items() if n},
+        }
+    return d
+
+
+class Measurement:
+    """:func:`measure` のスコープ内の計測結果です。スコープ脱出後に :attr:`snapshot` が確定します。"""
+
+    __slots__ = ("__before", "__snapshot")
+    __before: dict[tuple[str, str], dict[str, Any]]
+    __snapshot: dict[tuple[str, str], dict[str, Any]] | None
+
+    def __init__(self) -> None:
+        self.__before = snapshot()
+        self.__snapshot = None
+
+    def _finish(self) -> None:
+        self.__snapshot = _diff(snapshot(), self.__before)
+
+    @property
+    def snapshot(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """スコープ内の計測値。スコープ内で参照した場合はその時点までの値です。"""
+        if self.__snapshot is not None:
+            return self.__snapshot
+        return _diff(snapshot(), self.__before)
+
+
+@contextmanager
+def measure(interfaces: Iterable[type] | None = None) -> Iterator[Measurement]:
+    """スコープ内の呼び出しを計測します。スコープ内で有効にしたメソッドは、スコープ脱出時に元に戻します。
+    他のスレッドの呼び出しも含まれます。"""
+    applied = _enable(interfaces) if interfaces is not None or not is_enabled() else []
+    m = Measurement()
+    try:
+        yield m
+    finally:
+        m._finish()
+        _restore(applied)
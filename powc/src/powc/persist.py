@@ -6,7 +6,7 @@ from typing import Any
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from .core import ComResult, cotaskmem, cr, query_interface
+from .core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 from .stream import ComStream, IStream, StorageMode
 
 
@@ -47,7 +47,7 @@ class IPersistStream(IPersist):
     ]
 
 
-class Persist:
+class Persist(ComWrapper):
     """IPersistインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
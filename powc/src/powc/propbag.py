@@ -3,20 +3,28 @@
 from ctypes import (
     POINTER,
     Structure,
+    addressof,
     byref,
+    c_byte,
     c_int16,
     c_int32,
     c_uint16,
     c_uint32,
     c_void_p,
     c_wchar_p,
+    cast,
+    sizeof,
+    wstring_at,
 )
 from enum import IntEnum
-from typing import Any, Sequence
+from struct import Struct, error
+from threading import Lock
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from .core import ComResult, IUnknownPointer, cr, query_interface
+from . import _oleaut32
+from .core import ComResult, ComWrapper, IUnknownPointer, cr, query_interface
 from .errlog import ErrorLog, IErrorLog
 from .variant import VARENUM, Variant
 
@@ -71,7 +79,7 @@ class IPropertyBag2(IUnknown):
     ]
 
 
-class PropertyBag2:
+class PropertyBag2(ComWrapper):
     """IPropertyBag2インターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -88,10 +96,13 @@ class PropertyBag2:
     def read_nothrow(
         self, props: Sequence[PropertyBag2Entry], errlog: ErrorLog | None = None
     ) -> ComResult[tuple[tuple[Variant, ...], tuple[int, ...]]]:
-        _props = (PropertyBag2Entry * len(props))(props)
+        _props = (PropertyBag2Entry * len(props))(*props)
         _values = (Variant * len(props))()
         _hrs = (c_int32 * len(props))()
-        return cr(self.__o.Read(len(props), _props, _values, _hrs), (tuple(_values), tuple(_hrs)))
+        return cr(
+            self.__o.Read(len(props), _props, errlog.wrapped_obj if errlog else None, _values, _hrs),
+            (tuple(_values), tuple(_hrs)),
+        )
 
     # TODO: TEST
     def read(
@@ -100,8 +111,8 @@ class PropertyBag2:
         return self.read_nothrow(props, errlog).value
 
     def write_nothrow(self, props: Sequence[PropertyBag2Entry], values: Sequence[Variant]) -> ComResult[None]:
-        _props = (PropertyBag2Entry * len(props))(props)
-        _values = (Variant * len(props))(values)
+        _props = (PropertyBag2Entry * len(props))(*props)
+        _values = (Variant * len(props))(*values)
         return cr(self.__o.Write(len(props), _props, _values), None)
 
     def write(self, props: Sequence[PropertyBag2Entry], values: Sequence[Variant]) -> None:
@@ -133,3 +144,223 @@ class PropertyBag2:
         self, propname: str, hint: int, outer: IUnknownPointer | None = None, errlog: ErrorLog | None = None
     ) -> None:
         return self.loadobj_nothrow(propname, hint, outer, errlog).value
+
+
+class PropertyBagField(NamedTuple):
+    """:class:`PropertyBagSchema` の要素です。"""
+
+    name: str
+    vt: VARENUM
+    default: Any = None
+
+
+# VARIANTの値部分の構造体。VT_BOOLはVARIANT_BOOL（真は-1）です。
+_VARIANT_VALUE_STRUCTS = {
+    VARENUM.VT_I1: Struct("<b"),
+    VARENUM.VT_UI1: Struct("<B"),
+    VARENUM.VT_I2: Struct("<h"),
+    VARENUM.VT_UI2: Struct("<H"),
+    VARENUM.VT_I4: Struct("<i"),
+    VARENUM.VT_UI4: Struct("<I"),
+    VARENUM.VT_INT: Struct("<i"),
+    VARENUM.VT_UINT: Struct("<I"),
+    VARENUM.VT_ERROR: Struct("<i"),
+    VARENUM.VT_I8: Struct("<q"),
+    VARENUM.VT_UI8: Struct("<Q"),
+    VARENUM.VT_R4: Struct("<f"),
+    VARENUM.VT_R8: Struct("<d"),
+    VARENUM.VT_BOOL: Struct("<h"),
+    VARENUM.VT_BSTR: Struct("<Q" if sizeof(c_void_p) == 8 else "<I"),
+}
+
+_VARIANT_SIZE = sizeof(Variant)
+_VARIANT_VALUE_OFFSET = 8
+
+
+class PropertyBagSchema:
+    """プロパティ名・型・既定値の組を事前に宣言して、 :class:`PropertyBag2` を一括で読み書きします。
+
+    PROPBAG2配列と値配列は作成時に確保して再利用します。値はVariantインスタンスを経由せずに直接変換します。
+    確保した配列はロックで保護するため、複数スレッドから使用できますが、同じスキーマの読み書きは直列化されます。
+
+    Examples:
+        >>> schema = PropertyBagSchema(
+        >>>     (
+        >>>         ("ImageQuality", VARENUM.VT_R4, 1.0),
+        >>>         ("BitmapTransform", VARENUM.VT_UI1, 0),
+        >>>     )
+        >>> )
+        >>> frame, bag = encoder.create_newframe()
+        >>> schema.write_from(bag, {"ImageQuality": 0.8})
+        >>> frame.initialize(bag)
+    """
+
+    __slots__ = ("__fields", "__indexes", "__entries", "__values", "__hrs", "__wentries", "__recordtype", "__lock")
+    __fields: tuple[PropertyBagField, ...]
+    __indexes: dict[str, int]
+    __entries: Any  # PropertyBag2Entry * n
+    __values: Any  # c_byte * (sizeof(Variant) * n)
+    __hrs: Any  # c_int32 * n
+    __wentries: Any  # PropertyBag2Entry * n
+    __recordtype: type
+    __lock: Lock
+
+    def __init__(self, fields: Iterable[PropertyBagField | tuple[str, VARENUM, Any]]) -> None:
+        """
+        Args:
+            fields (Iterable[PropertyBagField | tuple[str, VARENUM, Any]]): (名前, 型, 既定値)の列。
+
+        Raises:
+            ValueError: 名前が識別子ではないか重複している。
+            TypeError: 対応していない型が含まれる。
+        """
+        self.__fields = tuple(PropertyBagField(*field) for field in fields)
+        self.__indexes = {}
+        for i, field in enumerate(self.__fields):
+            if not field.name.isidentifier() or field.name in self.__indexes:
+                raise ValueError(f"プロパティ名が不正か重複しています: {field.name}")
+            if field.vt not in _VARIANT_VALUE_STRUCTS:
+                raise TypeError(f"対応していない型です: {field.vt!r}")
+            self.__indexes[field.name] = i
+
+        n = len(self.__fields)
+        self.__entries = (PropertyBag2Entry * n)()
+        for entry, field in zip(self.__entries, self.__fields):
+            entry.type = PropertyBag2Type.DATA
+            entry._vt = int(field.vt)
+            entry.name = field.name
+        self.__values = (c_byte * (_VARIANT_SIZE * n))()
+        self.__hrs = (c_int32 * n)()
+        self.__wentries = (PropertyBag2Entry * n)()
+        self.__recordtype = type(
+            "PropertyBagRecord",
+            (_PropertyBagRecord,),
+            {"__slots__": tuple(field.name for field in self.__fields)},
+        )
+        self.__lock = Lock()
+
+    @property
+    def fields(self) -> tuple[PropertyBagField, ...]:
+        return self.__fields
+
+    @property
+    def recordtype(self) -> type:
+        """:meth:`read_all` が返すレコードの型。スキーマの名前を__slots__に持ちます。"""
+        return self.__recordtype
+
+    def __len__(self) -> int:
+        return len(self.__fields)
+
+    def __variant_ptr(self, index: int) -> Any:
+        return cast(addressof(self.__values) + _VARIANT_SIZE * index, POINTER(Variant))
+
+    def __clear_values(self, count: int) -> None:
+        for i in range(count):
+            _VariantClear(self.__variant_ptr(i))
+
+    def read_all_nothrow(self, bag: PropertyBag2, errlog: ErrorLog | None = None) -> ComResult[Any]:
+        """全てのプロパティを読み取ってレコードとして返します。読み取りに失敗したプロパティは既定値になります。"""
+        n = len(self.__fields)
+        with self.__lock:
+            values = self.__values
+            hrs = self.__hrs
+            hr = bag.wrapped_obj.Read(
+                n,
+                self.__entries,
+                errlog.wrapped_obj if errlog else None,
+                cast(values, POINTER(Variant)),
+                hrs,
+            )
+            try:
+                record = self.__recordtype.__new__(self.__recordtype)
+                offset = 0
+                for i, field in enumerate(self.__fields):
+                    value = field.default
+                    vt = c_uint16.from_buffer(values, offset).value
+                    if hrs[i] >= 0 and vt == field.vt:
+                        (value,) = _VARIANT_VALUE_STRUCTS[field.vt].unpack_from(values, offset + _VARIANT_VALUE_OFFSET)
+                        if vt == VARENUM.VT_BSTR:
+                            value = wstring_at(value) if value else ""
+                        elif vt == VARENUM.VT_BOOL:
+                            value = value != 0
+                    setattr(record, field.name, value)
+                    offset += _VARIANT_SIZE
+                return cr(hr, record)
+            finally:
+                self.__clear_values(n)
+
+    def read_all(self, bag: PropertyBag2, errlog: ErrorLog | None = None) -> Any:
+        """全てのプロパティを読み取ってレコードとして返します。読み取りに失敗したプロパティは既定値になります。"""
+        return self.read_all_nothrow(bag, errlog).value
+
+    def write_from_nothrow(self, bag: PropertyBag2, values: Mapping[str, Any]) -> ComResult[None]:
+        """マッピングの値をプロパティバッグに書き込みます。
+        マッピングに無いプロパティは既定値を書き込み、既定値がNoneの場合は書き込みません。
+
+        Raises:
+            KeyError: スキーマに無い名前が含まれる。
+            TypeError: 値をプロパティの型に変換できない。
+        """
+        for name in values:
+            if name not in self.__indexes:
+                raise KeyError(name)
+
+        with self.__lock:
+            buffer = self.__values
+            count = 0
+            try:
+                for field, entry in zip(self.__fields, self.__entries):
+                    value = values.get(field.name, field.default)
+                    if value is None:
+                        continue
+                    offset = _VARIANT_SIZE * count
+                    self.__wentries[count] = entry
+                    data = value
+                    try:
+                        if field.vt == VARENUM.VT_BSTR:
+                            if not isinstance(value, str):
+                                raise TypeError
+                            data = _SysAllocString(value)
+                        elif field.vt == VARENUM.VT_BOOL:
+                            data = -1 if value else 0
+                        _VARIANT_VALUE_STRUCTS[field.vt].pack_into(buffer, offset + _VARIANT_VALUE_OFFSET, data)
+                    except (error, TypeError) as e:
+                        raise TypeError(f"{field.name}の値を{field.vt!r}に変換できません: {value!r}") from e
+                    c_uint16.from_buffer(buffer, offset).value = int(field.vt)
+                    count += 1
+                if count == 0:
+                    return cr(0, None)
+                return cr(bag.wrapped_obj.Write(count, self.__wentries, cast(buffer, POINTER(Variant))), None)
+            finally:
+                self.__clear_values(count)
+
+    def write_from(self, bag: PropertyBag2, values: Mapping[str, Any]) -> None:
+        """マッピングの値をプロパティバッグに書き込みます。
+        マッピングに無いプロパティは既定値を書き込み、既定値がNoneの場合は書き込みません。
+
+        Raises:
+            KeyError: スキーマに無い名前が含まれる。
+            TypeError: 値をプロパティの型に変換できない。
+        """
+        return self.write_from_nothrow(bag, values).value
+
+
+class _PropertyBagRecord:
+    """:meth:`PropertyBagSchema.read_all` の結果の基底クラスです。"""
+
+    __slots__ = ()
+
+    def _asdict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"PropertyBagRecord({', '.join(f'{k}={v!r}' for k, v in self._asdict().items())})"
+
+
+_VariantClear = _oleaut32.VariantClear
+_VariantClear.argtypes = (POINTER(Variant),)
+_VariantClear.restype = c_int32
+
+_SysAllocString = _oleaut32.SysAllocString
+_SysAllocString.argtypes = (c_wchar_p,)
+_SysAllocString.restype = c_void_p
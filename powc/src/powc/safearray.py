@@ -33,7 +33,7 @@ from comtypes import BSTR, GUID
 from powc.datetime import FILETIME
 
 from . import _oleaut32
-from .core import ComResult, check_hresult, cr
+from .core import ComResult, check_hresult, cr, register_tracked_type, release_on_exit, take_pointer, track_object
 from .variant import VARENUM
 
 
@@ -49,7 +49,7 @@ class _SAFEARRAYBOUND(Structure):
 class SafeArrayPtr(c_void_p):
     """セーフ配列の管理機能を提供します。データは :code:`SAFEARRAY*` として管理します。"""
 
-    __slots__ = ()
+    # release_scopeは弱参照で登録するため、__slots__を定義しません（ctypes型は__weakref__をスロットにできません）。
 
     @staticmethod
     def create_array(vt: VARENUM, elements: Sequence[int], lbounds: Sequence[int] | None = None) -> "SafeArrayPtr":
@@ -75,7 +75,9 @@ class SafeArrayPtr(c_void_p):
             for i in range(len(elements)):
                 pbounds[i].elements = elements[i]
                 pbounds[i].lbound = lbounds[i]
-        return _SafeArrayCreate(vt, len(elements), pbounds)
+        p = _SafeArrayCreate(vt, len(elements), pbounds)
+        track_object(p)
+        return release_on_exit(p)
 
     @staticmethod
     def create_vector(vt: VARENUM, elements: int, lbound: int = 0) -> "SafeArrayPtr":
@@ -86,12 +88,26 @@ class SafeArrayPtr(c_void_p):
             elements (int): 要素数。
             lbound (int, optional): 要素インデックスの下限値。既定値は0です。
         """
-        return _SafeArrayCreateVector(vt, lbound, elements)
+        p = _SafeArrayCreateVector(vt, lbound, elements)
+        track_object(p)
+        return release_on_exit(p)
 
     def __del__(self):
         """セーフ配列を解放します。"""
         _SafeArrayDestroy(self)
 
+    def release(self) -> None:
+        """セーフ配列を解放します。"""
+        p = take_pointer(self)
+        if p:
+            _SafeArrayDestroy(p)
+
+    def __enter__(self) -> "SafeArrayPtr":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
     def clear_data_nothrow(self) -> ComResult[None]:
         """セーフ配列の各要素を解放します。"""
         return cr(_SafeArrayDestroyData(self), None)
@@ -219,7 +235,7 @@ class SafeArrayPtr(c_void_p):
     def get_elemraw_at_nothrow(self, indexes: Sequence[int]) -> ComResult[Array[c_byte]]:
         """各次元のインデックスを指定して要素のバイナリ表現を取得します。"""
         x = (c_byte * self.elemsize)()
-        a = (c_uint32 * len(indexes))(indexes)
+        a = (c_int32 * len(indexes))(*indexes)
         return cr(_SafeArrayGetElement(self, a, x), x)
 
     def get_elemraw_at(self, indexes: Sequence[int]) -> Array[c_byte]:
@@ -539,7 +555,7 @@ _SafeArrayGetDim.restype = c_uint32
 _SafeArrayGetDim.argtypes = (c_void_p,)
 
 _SafeArrayGetElement = _oleaut32.SafeArrayGetElement
-_SafeArrayGetElement.argtypes = (c_void_p, POINTER(c_uint32), POINTER(c_void_p))
+_SafeArrayGetElement.argtypes = (c_void_p, POINTER(c_int32), c_void_p)
 
 _SafeArrayGetElemsize = _oleaut32.SafeArrayGetElemsize
 _SafeArrayGetElemsize.restype = c_uint32
@@ -554,3 +570,5 @@ _SafeArrayGetUBound.argtypes = (c_void_p, c_uint32, POINTER(c_int32))
 _SafeArrayGetVartype = _oleaut32.SafeArrayGetVartype
 _SafeArrayGetVartype.argtypes = (c_void_p, POINTER(c_int16))
 _SafeArrayGetVartype.argtypes = (c_void_p, POINTER(c_int16))
+
+register_tracked_type(SafeArrayPtr, lambda p: p.totalsize if p else 0)
@@ -24,7 +24,7 @@ from comtypes import GUID, STDMETHOD, IUnknown
 from comtypes.hresult import E_FAIL, S_OK
 
 from . import _shlwapi
-from .core import ComResult, cotaskmem, cr, query_interface
+from .core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 from .datetime import filetimeint64_to_datetime
 
 
@@ -164,7 +164,7 @@ _SHCreateMemStream.argtypes = (POINTER(c_byte), c_uint32)
 _SHCreateMemStream.restype = POINTER(IStream)
 
 
-class ComStream:
+class ComStream(ComWrapper):
     """COMストリーム。IStreamインターフェイスのラッパーです。"""
 
     __o: Any  # IStream
@@ -26,11 +26,22 @@ from ctypes import (
 )
 from datetime import datetime
 from enum import IntFlag
+from typing import Any
 
 from comtypes import GUID
 
 from . import _oleaut32, _propsys
-from .core import ComResult, CoTaskMem, check_hresult, cotaskmem, cotaskmem_free, cr
+from .core import (
+    ComResult,
+    CoTaskMem,
+    check_hresult,
+    cotaskmem,
+    cotaskmem_free,
+    cr,
+    register_tracked_type,
+    release_on_exit,
+    take_struct,
+)
 from .datetime import FILETIME
 
 
@@ -100,10 +111,16 @@ class Variant(Union):
     # DECIMAL decVal;
     _fields_ = (("vt", c_uint16), ("data", c_byte * (24 if sizeof(c_void_p) == 8 else 16)))
 
-    __slots__ = ()
+    # release_scopeは弱参照で登録するため、__slots__を定義しません（ctypes型は__weakref__をスロットにできません）。
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        release_on_exit(self)
 
     def clear(self) -> None:
-        _VariantClear(self)
+        # 値を移してから解放するため、複数のスレッドから同時に解放しても二重解放になりません。
+        if self.vt:
+            _VariantClear(cast(take_struct(self), POINTER(Variant)))
 
     def __del__(self) -> None:
         self.clear()
@@ -127,12 +144,15 @@ class Variant(Union):
     def __repr__(self) -> str:
         return f"Variant({self.__str__()})"
 
-    def __enter__(self):
+    def release(self) -> None:
+        """値を解放します。clear()と同じです。"""
+        self.clear()
+
+    def __enter__(self) -> "Variant":
         return self
 
-    def __exit__(self):
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         self.clear()
-        return True
 
     @property
     def vartype(self) -> VARENUM:
@@ -152,7 +172,8 @@ class Variant(Union):
 
     @property
     def data_memview(self) -> memoryview:
-        return memoryview(self.data)[Variant.data.offset :]
+        # Unionのdataはvtと同じ位置から始まるため、vtとwReserved1～3の8バイトを除きます。
+        return memoryview(self.data)[8:]
 
     def change_type_nothrow(self, vt: VARENUM) -> "ComResult[Variant]":
         v = Variant()
@@ -568,3 +589,55 @@ _VariantToStringArrayAlloc.argtypes = (POINTER(Variant), POINTER(POINTER(c_wchar
 
 _InitVariantFromVariantArrayElem = _propsys.InitVariantFromVariantArrayElem
 _InitVariantFromVariantArrayElem.argtypes = (POINTER(Variant), c_uint32, POINTER(Variant))
+
+# 参照追跡のサイズ用。safearrayモジュールはこのモジュールをインポートするため、ここで定義します。
+
+_SysStringByteLen = _oleaut32.SysStringByteLen
+_SysStringByteLen.argtypes = (c_void_p,)
+_SysStringByteLen.restype = c_uint32
+
+_SafeArrayGetDim = _oleaut32.SafeArrayGetDim
+_SafeArrayGetDim.argtypes = (c_void_p,)
+_SafeArrayGetDim.restype = c_uint32
+
+_SafeArrayGetElemsize = _oleaut32.SafeArrayGetElemsize
+_SafeArrayGetElemsize.argtypes = (c_void_p,)
+_SafeArrayGetElemsize.restype = c_uint32
+
+_SafeArrayGetLBound = _oleaut32.SafeArrayGetLBound
+_SafeArrayGetLBound.argtypes = (c_void_p, c_uint32, POINTER(c_int32))
+_SafeArrayGetLBound.restype = c_int32
+
+_SafeArrayGetUBound = _oleaut32.SafeArrayGetUBound
+_SafeArrayGetUBound.argtypes = (c_void_p, c_uint32, POINTER(c_int32))
+_SafeArrayGetUBound.restype = c_int32
+
+# BSTRは長さの4バイトと終端の2バイトを含みます。
+_BSTR_OVERHEAD = sizeof(c_uint32) + sizeof(c_uint16)
+
+
+def _owned_size(vt: int, data: memoryview) -> int:
+    """VARIANT・PROPVARIANTの値が所有するBSTR・SAFEARRAYのバイト数を返します。参照追跡のサイズに使用します。
+
+    SAFEARRAYは全要素のバイト数で、BSTRの要素等が指すメモリは含みません。
+    """
+    if vt & VARENUM.VT_BYREF:
+        return 0
+    p = c_void_p.from_buffer(data).value
+    if not p:
+        return 0
+    if vt & VARENUM.VT_ARRAY:
+        size = _SafeArrayGetElemsize(p)
+        lower = c_int32()
+        upper = c_int32()
+        for dim in range(1, _SafeArrayGetDim(p) + 1):
+            check_hresult(_SafeArrayGetLBound(p, dim, byref(lower)))
+            check_hresult(_SafeArrayGetUBound(p, dim, byref(upper)))
+            size *= upper.value - lower.value + 1
+        return size
+    if vt == VARENUM.VT_BSTR:
+        return _SysStringByteLen(p) + _BSTR_OVERHEAD
+    return 0
+
+
+register_tracked_type(Variant, lambda v: sizeof(Variant) + _owned_size(v.vt, v.data_memview))
@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+
+pytest.importorskip("comtypes")
+
+from comtypes import IUnknown  # noqa: E402
+
+from powc.core import ComWrapper, identity_map, query_interface, release_scope  # noqa: E402
+from powc.stream import ComStream  # noqa: E402
+
+
+class _StatefulWrapper(ComWrapper):
+    __o: Any
+    __state: int
+
+    __slots__ = ("__o", "__state")
+
+    def __init__(self, o: Any, state: int = 0) -> None:
+        self.__o = query_interface(o, IUnknown)
+        self.__state = state
+
+    @property
+    def wrapped_obj(self) -> Any:
+        return self.__o
+
+    @property
+    def state(self) -> int:
+        return self.__state
+
+    @state.setter
+    def state(self, value: int) -> None:
+        self.__state = value
+
+
+def test_identity_map_keeps_first_wrapper_state() -> None:
+    stream = ComStream.create_on_mem(b"\0")
+    with identity_map():
+        a = _StatefulWrapper(stream.wrapped_obj, 1)
+        a.state = 2
+        b = _StatefulWrapper(stream.wrapped_obj, 3)
+        assert a is b
+        assert b.state == 2
+
+
+def test_identity_map_wraps_different_objects_separately() -> None:
+    stream1 = ComStream.create_on_mem(b"\0")
+    stream2 = ComStream.create_on_mem(b"\0")
+    with identity_map():
+        a = _StatefulWrapper(stream1.wrapped_obj, 1)
+        b = _StatefulWrapper(stream2.wrapped_obj, 2)
+        assert a is not b
+        assert (a.state, b.state) == (1, 2)
+
+
+def test_identity_map_replaces_released_wrapper() -> None:
+    stream = ComStream.create_on_mem(b"\0")
+    with identity_map():
+        with release_scope():
+            a = _StatefulWrapper(stream.wrapped_obj, 1)
+        assert not a.wrapped_obj
+        b = _StatefulWrapper(stream.wrapped_obj, 2)
+        assert b is not a
+        assert b.wrapped_obj
+        assert b.state == 2
+        assert _StatefulWrapper(stream.wrapped_obj, 3) is b
+
+
+def test_outside_identity_map_creates_new_wrapper() -> None:
+    stream = ComStream.create_on_mem(b"\0")
+    a = _StatefulWrapper(stream.wrapped_obj, 1)
+    b = _StatefulWrapper(stream.wrapped_obj, 2)
+    assert a is not b
+    assert b.state == 2
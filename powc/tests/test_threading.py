@@ -0,0 +1,194 @@
+from ctypes import c_uint16, c_void_p, cast, memmove, sizeof, string_at
+from pathlib import Path
+from threading import Barrier, Thread
+from typing import Any, Callable
+
+import pytest
+
+pytest.importorskip("comtypes")
+
+from comtypes import COINIT_MULTITHREADED, COMObject, CoInitializeEx, CoUninitialize  # noqa: E402
+from comtypes.hresult import E_INVALIDARG, S_OK  # noqa: E402
+
+from powc import core  # noqa: E402
+from powc.comobj import Moniker, MonikerCache  # noqa: E402
+from powc.core import detach_from_scope, release_on_exit, release_scope, take_pointer  # noqa: E402
+from powc.propbag import IPropertyBag2, PropertyBag2, PropertyBagSchema  # noqa: E402
+from powc.variant import VARENUM, Variant  # noqa: E402
+
+_THREADS = 8
+_ROUNDS = 200
+_VARIANT_VALUE_OFFSET = 8
+
+
+def _run_threads(target: Callable[[int], None], count: int = _THREADS) -> None:
+    """count個のMTAのスレッドでtargetを同時に開始して、全ての終了を待機します。最初の例外を再発生します。"""
+    barrier = Barrier(count)
+    errors: list[BaseException] = []
+
+    def run(i: int) -> None:
+        CoInitializeEx(COINIT_MULTITHREADED)
+        try:
+            barrier.wait()
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            CoUninitialize()
+
+    threads = [Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+class _Counted:
+    __slots__ = ("released", "__weakref__")
+
+    def __init__(self) -> None:
+        self.released = 0
+
+    def release(self) -> None:
+        self.released += 1
+
+
+class _MemoryPropertyBag(COMObject):
+    """VT_I4・VT_R8等の値をメモリに保持するIPropertyBag2の実装です。"""
+
+    _com_interfaces_ = [IPropertyBag2]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: dict[str, tuple[int, bytes]] = {}
+
+    @staticmethod
+    def _variant_address(values: Any, i: int) -> int:
+        # 要素のVariantインスタンスを作ると__del__で値が解放されるため、アドレスで読み書きします。
+        return (cast(values, c_void_p).value or 0) + sizeof(Variant) * i
+
+    def Write(self, this: Any, count: int, props: Any, values: Any) -> int:
+        for i in range(count):
+            address = self._variant_address(values, i)
+            self.values[props[i].name] = (
+                c_uint16.from_address(address).value,
+                string_at(address + _VARIANT_VALUE_OFFSET, sizeof(Variant) - _VARIANT_VALUE_OFFSET),
+            )
+        return S_OK
+
+    def Read(self, this: Any, count: int, props: Any, errlog: Any, values: Any, hrs: Any) -> int:
+        for i in range(count):
+            entry = self.values.get(props[i].name)
+            if entry is None:
+                hrs[i] = E_INVALIDARG
+                continue
+            address = self._variant_address(values, i)
+            c_uint16.from_address(address).value = entry[0]
+            memmove(address + _VARIANT_VALUE_OFFSET, entry[1], len(entry[1]))
+            hrs[i] = S_OK
+        return S_OK
+
+
+def _touch(directory: Path, count: int) -> list[str]:
+    names = []
+    for i in range(count):
+        path = directory / f"moniker{i}.txt"
+        path.write_bytes(b"")
+        names.append(str(path))
+    return names
+
+
+def test_take_pointer_returns_each_value_once() -> None:
+    pointers = [c_void_p(i + 1) for i in range(_ROUNDS * 10)]
+    taken: list[list[int]] = [[] for _ in range(_THREADS)]
+    _run_threads(lambda i: taken[i].extend(take_pointer(p) for p in pointers))
+    assert sorted(x for xs in taken for x in xs if x) == list(range(1, len(pointers) + 1))
+    assert all(p.value is None for p in pointers)
+
+
+def test_variant_clear_from_many_threads() -> None:
+    # BSTRは二重に解放するとヒープが破損するため、値を1回だけ解放することを確認できます。
+    variants = [Variant.init_int32(i).change_type(VARENUM.VT_BSTR) for i in range(_ROUNDS * 10)]
+
+    def work(i: int) -> None:
+        for v in variants:
+            if i % 2:
+                v.clear()
+            else:
+                v.release()
+
+    _run_threads(work)
+    assert all(v.vt == VARENUM.VT_EMPTY for v in variants)
+
+
+def test_release_scope_is_per_thread() -> None:
+    outside: list[list[_Counted]] = [[] for _ in range(_THREADS)]
+
+    def work(i: int) -> None:
+        for _ in range(_ROUNDS):
+            if i % 2:
+                # スコープ外のスレッドで作成したオブジェクトは、他のスレッドのスコープに登録されません。
+                outside[i].extend(release_on_exit(_Counted()) for _ in range(10))
+                continue
+            with release_scope():
+                objs = [release_on_exit(_Counted()) for _ in range(10)]
+                kept = detach_from_scope(release_on_exit(_Counted()))
+            assert all(obj.released == 1 for obj in objs)
+            assert kept.released == 0
+
+    _run_threads(work)
+    assert all(obj.released == 0 for objs in outside for obj in objs)
+    assert core._release_scope_depth == 0
+
+
+def test_moniker_cache_returns_one_moniker_per_name(tmp_path: Path) -> None:
+    names = _touch(tmp_path, 8)
+    cache = MonikerCache(maxsize=len(names))
+    results: list[list[Moniker]] = [[] for _ in names]
+
+    def work(i: int) -> None:
+        for _ in range(_ROUNDS // 10):
+            for j, name in enumerate(names):
+                results[j].append(cache.parse_displayname(name))
+
+    try:
+        _run_threads(work)
+        # 同時に解析した場合も、先に追加されたモニカーを全てのスレッドに返します。
+        for monikers in results:
+            assert all(m is monikers[0] for m in monikers)
+        assert len(cache) == len(names)
+    finally:
+        cache.clear()
+
+
+def test_moniker_cache_stays_within_maxsize(tmp_path: Path) -> None:
+    names = _touch(tmp_path, 32)
+    cache = MonikerCache(maxsize=4)
+
+    def work(i: int) -> None:
+        for k in range(_ROUNDS // 10):
+            name = names[(i * 7 + k) % len(names)]
+            moniker = cache.parse_displayname(name)
+            assert cache.get_displayname(moniker).casefold() == name.casefold()
+
+    try:
+        _run_threads(work)
+        assert len(cache) <= cache.maxsize
+    finally:
+        cache.clear()
+
+
+def test_property_bag_schema_from_many_threads() -> None:
+    schema = PropertyBagSchema((("Index", VARENUM.VT_I4, 0), ("Scale", VARENUM.VT_R8, 1.0)))
+
+    def work(i: int) -> None:
+        bag = PropertyBag2(_MemoryPropertyBag().QueryInterface(IPropertyBag2))
+        for k in range(_ROUNDS):
+            # スキーマの配列は共有されるため、読み書きが直列化されていなければ他のスレッドの値が混ざります。
+            schema.write_from(bag, {"Index": i * _ROUNDS + k, "Scale": k / 2})
+            record = schema.read_all(bag)
+            assert (record.Index, record.Scale) == (i * _ROUNDS + k, k / 2)
+
+    _run_threads(work)
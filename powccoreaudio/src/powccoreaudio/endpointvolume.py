@@ -10,7 +10,7 @@ from typing import Any
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 
 
 class IAudioEndpointVolume(IUnknown):
@@ -89,7 +89,7 @@ class IAudioMeterInformation(IUnknown):
     ]
 
 
-class AudioEndpointVolume:
+class AudioEndpointVolume(ComWrapper):
     """オーディオエンドポイント。IAudioEndpointVolumeインターフェイスのラッパーです。"""
 
     __slots__ = ("__o", "__eventcontext_guid")
@@ -255,7 +255,7 @@ class AudioEndpointVolume:
         return self.volume_range_nothrow.value
 
 
-class AudioMeterInformation:
+class AudioMeterInformation(ComWrapper):
     """聴覚メーター情報。IAudioMeterInformationインターフェイスのラッパーです。
 
     作成には :class:`MMDevice` を使用します。
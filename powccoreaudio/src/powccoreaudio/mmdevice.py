@@ -32,6 +32,7 @@ from comtypes.hresult import S_OK
 
 from powc.core import (
     ComResult,
+    ComWrapper,
     IUnknownWrapper,
     check_hresult,
     cotaskmem,
@@ -88,7 +89,7 @@ class IMMDevice(IUnknown):
     __slots__ = ()
 
 
-class MMDevice:
+class MMDevice(ComWrapper):
     """マルチメディアデバイス。IMMDeviceインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IMMDevice)
@@ -202,7 +203,7 @@ class IMMDeviceCollection(IUnknown):
     __slots__ = ()
 
 
-class MMDeviceCollection:
+class MMDeviceCollection(ComWrapper):
     """マルチメディアデバイスコレクション。IMMDeviceCollectionインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IMMDeviceCollection)
@@ -271,7 +272,7 @@ class IMMEndpoint(IUnknown):
     ]
 
 
-class MMEndpoint:
+class MMEndpoint(ComWrapper):
     """マルチメディアエンドポイント。IMMEndpointインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IMMEndpoint)
@@ -421,7 +422,7 @@ class IMMDeviceEnumerator(IUnknown):
     ]
 
 
-class MMDeviceEnumerator:
+class MMDeviceEnumerator(ComWrapper):
     """マルチメディアデバイスの列挙機能。IMMDeviceEnumeratorインターフェイスのラッパーです。
 
     Examples:
@@ -661,7 +662,7 @@ class IAudioSystemEffectsPropertyStore(IUnknown):
     ]
 
 
-class AudioSystemEffectsPropertyStore:
+class AudioSystemEffectsPropertyStore(ComWrapper):
     """聴覚システム効果プロパティストア。IAudioSystemEffectsPropertyStoreインターフェイスのラッパーです。
 
     作成にはMMDeviceを使用します。"""
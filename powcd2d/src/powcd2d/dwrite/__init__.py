@@ -2,13 +2,13 @@ from ctypes import byref, c_wchar
 from typing import Any, Iterator
 
 from comtypes.hresult import S_OK
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 
 from .. import _dwrite
 from .types import *
 
 
-class DWriteLocalizedStrings:
+class DWriteLocalizedStrings(ComWrapper):
     """DirectWriteローカライズ済み文字列。IDWriteLocalizedStringsインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -92,7 +92,7 @@ class DWriteLocalizedStrings:
         return tuple(self.string_iter)
 
 
-class DWriteFont:
+class DWriteFont(ComWrapper):
     """DirectWriteフォント。IDWriteFontインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -168,7 +168,7 @@ class DWriteFont:
 # ]
 
 
-class DWriteFontFace:
+class DWriteFontFace(ComWrapper):
     """DirectWriteフォントフェイス。IDWriteFontFaceインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -237,7 +237,7 @@ class DWriteFontFace:
 # ]
 
 
-class DWriteFontCollection:
+class DWriteFontCollection(ComWrapper):
     """DirectWriteフォントコレクション。IDWriteFontCollectionインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -290,7 +290,7 @@ class DWriteFontCollection:
         return self.get_font_from_fontface_nothrow(fontface).value
 
 
-class DWriteFontList:
+class DWriteFontList(ComWrapper):
     """DirectWriteフォントリスト（順序付きコレクション）。IDWriteFontListインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -363,7 +363,7 @@ _DWriteCreateFactory = _dwrite.DWriteCreateFactory
 _DWriteCreateFactory.argtypes = (c_int32, POINTER(GUID), POINTER(POINTER(IUnknown)))
 
 
-class DWriteFactory:
+class DWriteFactory(ComWrapper):
     """DirectWriteファクトリー。IDWriteFactoryインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -4,6 +4,7 @@ from typing import Any, Iterator, Sequence
 
 from powc.core import (
     ComResult,
+    ComWrapper,
     IUnknownPointer,
     IUnknownWrapper,
     cr,
@@ -15,7 +16,7 @@ from .. import _dxgi
 from .types import *
 
 
-class DXGIObject:
+class DXGIObject(ComWrapper):
     """DXGIオブジェクト。IDXGIObjectインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
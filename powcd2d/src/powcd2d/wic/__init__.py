@@ -24,7 +24,7 @@ from powc.comobj import (
     IEnumUnknown,
     IUnknownEnumerator,
 )
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 from powc.propbag import PropertyBag2
 from powc.stream import ComStream
 from powcpropsys.propvariant import PropVariant
@@ -33,7 +33,7 @@ from .constant import *
 from .types import *
 
 
-class WICPalette:
+class WICPalette(ComWrapper):
     """WICパレット。IWICPaletteインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -128,7 +128,7 @@ class WICPalette:
         return self.has_alpha_nothrow.value
 
 
-class WICBitmapSource:
+class WICBitmapSource(ComWrapper):
     """ビットマップソース。IWICBitmapSourceインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -242,7 +242,7 @@ class WICBitmapSource:
 #     ]
 
 
-class WICBitmapLock:
+class WICBitmapLock(ComWrapper):
     """固定されたビットマップ領域。IWICBitmapLockインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -450,7 +450,7 @@ class WICBitmapFrameDecode(WICBitmapSource):
 #     ]
 
 
-class WICBitmapFrameEncode:
+class WICBitmapFrameEncode(ComWrapper):
     """エンコーダーの個々のイメージフレーム。IWICBitmapFrameEncodeインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -618,7 +618,7 @@ class WICBitmapFrameEncode:
 #
 
 
-class WICComponentInfo:
+class WICComponentInfo(ComWrapper):
     """WICコンポーネント情報。IWICComponentInfoインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -899,7 +899,7 @@ class WICBitmapDecoderInfo(WICBitmapCodecInfo):
     #     return self.create_instance_nothrow().value
 
 
-class WICBitmapEncoder:
+class WICBitmapEncoder(ComWrapper):
     """ビットマップエンコーダー。IWICBitmapEncoderインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -941,7 +941,18 @@ class WICBitmapEncoder:
     # STDMETHOD(c_int32, "SetPalette", (POINTER(IWICPalette),)),
     # STDMETHOD(c_int32, "SetThumbnail", (POINTER(IWICBitmapSource),)),
     # STDMETHOD(c_int32, "SetPreview", (POINTER(IWICBitmapSource),)),
-    # STDMETHOD(c_int32, "CreateNewFrame", (POINTER(POINTER(IWICBitmapFrameEncode)), POINTER(POINTER(IPropertyBag2)))),
+
+    def create_newframe_nothrow(self) -> ComResult[tuple[WICBitmapFrameEncode, PropertyBag2]]:
+        """新しいフレームとエンコーダーオプションのプロパティバッグを作成します。
+        オプションの設定後に :meth:`WICBitmapFrameEncode.initialize` を呼び出してください。"""
+        x1 = POINTER(IWICBitmapFrameEncode)()
+        x2 = POINTER(IPropertyBag2)()
+        return cr(self.__o.CreateNewFrame(byref(x1), byref(x2)), (WICBitmapFrameEncode(x1), PropertyBag2(x2)))
+
+    def create_newframe(self) -> tuple[WICBitmapFrameEncode, PropertyBag2]:
+        """新しいフレームとエンコーダーオプションのプロパティバッグを作成します。
+        オプションの設定後に :meth:`WICBitmapFrameEncode.initialize` を呼び出してください。"""
+        return self.create_newframe_nothrow().value
 
     def commit_nothrow(self) -> ComResult[None]:
         return cr(self.__o.Commit(), None)
@@ -954,7 +965,7 @@ class WICBitmapEncoder:
 # ]
 
 
-class WICBitmapDecoder:
+class WICBitmapDecoder(ComWrapper):
     """ビットマップデコーダー。IWICBitmapDecoderインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -1029,7 +1040,7 @@ class WICBitmapDecoder:
         return self.get_frame_nothrow(index).value
 
 
-class WICImageEncoder:
+class WICImageEncoder(ComWrapper):
     """ID2D1ImageインターフェイスからIWICBitmapEncoderへのエンコード。
     IWICImageEncoderインターフェイスのラッパーです。"""
 
@@ -1073,7 +1084,7 @@ class WICImageEncoder:
         return self.write_thumbnail_nothrow(image, options).value
 
 
-class WICMetadataQueryReader:
+class WICMetadataQueryReader(ComWrapper):
     """WICのメタデータクエリリーダー。IWICMetadataQueryReaderインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -1146,7 +1157,7 @@ class WICMetadataQueryWriter(WICMetadataQueryReader):
         return self.remove_metadata_by_name_nothrow(name).value
 
 
-class WICFastMetadataEncoder:
+class WICFastMetadataEncoder(ComWrapper):
     """WICの高速メタデータエンコーダー。IWICFastMetadataEncoderインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -1175,7 +1186,7 @@ class WICFastMetadataEncoder:
         return self.metadataquerywriter_nothrow.value
 
 
-class WICImagingFactory:
+class WICImagingFactory(ComWrapper):
     """WICイメージングのファクトリクラス。IWICImagingFactoryインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -4,7 +4,7 @@
 
 from enum import IntEnum, IntFlag
 
-from powc.core import guid_from_define
+from powc.guid import guid_from_fields
 
 
 class FileAccess(IntFlag):
@@ -23,94 +23,94 @@ class WICColorContextType(IntFlag):
 WINCODEC_SDK_VERSION1 = 0x0236
 WINCODEC_SDK_VERSION2 = 0x0237
 
-CLSID_WIC_IMAGING_FACTORY = guid_from_define(0xCACAF262, 0x9370, 0x4615, 0xA1, 0x3B, 0x9F, 0x55, 0x39, 0xDA, 0x4C, 0xA)
-CLSID_WIC_IMAGING_FACTORY1 = guid_from_define(0xCACAF262, 0x9370, 0x4615, 0xA1, 0x3B, 0x9F, 0x55, 0x39, 0xDA, 0x4C, 0xA)
-CLSID_WIC_IMAGING_FACTORY2 = guid_from_define(
+CLSID_WIC_IMAGING_FACTORY = guid_from_fields(0xCACAF262, 0x9370, 0x4615, 0xA1, 0x3B, 0x9F, 0x55, 0x39, 0xDA, 0x4C, 0xA)
+CLSID_WIC_IMAGING_FACTORY1 = guid_from_fields(0xCACAF262, 0x9370, 0x4615, 0xA1, 0x3B, 0x9F, 0x55, 0x39, 0xDA, 0x4C, 0xA)
+CLSID_WIC_IMAGING_FACTORY2 = guid_from_fields(
     0x317D06E8, 0x5F24, 0x433D, 0xBD, 0xF7, 0x79, 0xCE, 0x68, 0xD8, 0xAB, 0xC2
 )
 
-GUID_VENDOR_MICROSOFT = guid_from_define(0xF0E749CA, 0xEDEF, 0x4589, 0xA7, 0x3A, 0xEE, 0xE, 0x62, 0x6A, 0x2A, 0x2B)
-GUID_VENDOR_MICROSOFT_BUILTIN = guid_from_define(
+GUID_VENDOR_MICROSOFT = guid_from_fields(0xF0E749CA, 0xEDEF, 0x4589, 0xA7, 0x3A, 0xEE, 0xE, 0x62, 0x6A, 0x2A, 0x2B)
+GUID_VENDOR_MICROSOFT_BUILTIN = guid_from_fields(
     0x257A30FD, 0x6B6, 0x462B, 0xAE, 0xA4, 0x63, 0xF7, 0xB, 0x86, 0xE5, 0x33
 )
 
-CLSID_WIC_PNG_DECODER = guid_from_define(0x389EA17B, 0x5078, 0x4CDE, 0xB6, 0xEF, 0x25, 0xC1, 0x51, 0x75, 0xC7, 0x51)
-CLSID_WIC_PNG_DECODER1 = guid_from_define(0x389EA17B, 0x5078, 0x4CDE, 0xB6, 0xEF, 0x25, 0xC1, 0x51, 0x75, 0xC7, 0x51)
-CLSID_WIC_PNG_DECODER2 = guid_from_define(0xE018945B, 0xAA86, 0x4008, 0x9B, 0xD4, 0x67, 0x77, 0xA1, 0xE4, 0x0C, 0x11)
-CLSID_WIC_BMP_DECODER = guid_from_define(0x6B462062, 0x7CBF, 0x400D, 0x9F, 0xDB, 0x81, 0x3D, 0xD1, 0x0F, 0x27, 0x78)
-CLSID_WIC_ICO_DECODER = guid_from_define(0xC61BFCDF, 0x2E0F, 0x4AAD, 0xA8, 0xD7, 0xE0, 0x6B, 0xAF, 0xEB, 0xCD, 0xFE)
-CLSID_WIC_JPEG_DECODER = guid_from_define(0x9456A480, 0xE88B, 0x43EA, 0x9E, 0x73, 0x0B, 0x2D, 0x9B, 0x71, 0xB1, 0xCA)
-CLSID_WIC_GIF_DECODER = guid_from_define(0x381DDA3C, 0x9CE9, 0x4834, 0xA2, 0x3E, 0x1F, 0x98, 0xF8, 0xFC, 0x52, 0xBE)
-CLSID_WIC_TIFF_DECODER = guid_from_define(0xB54E85D9, 0xFE23, 0x499F, 0x8B, 0x88, 0x6A, 0xCE, 0xA7, 0x13, 0x75, 0x2B)
-CLSID_WIC_WMP_DECODER = guid_from_define(0xA26CEC36, 0x234C, 0x4950, 0xAE, 0x16, 0xE3, 0x4A, 0xAC, 0xE7, 0x1D, 0x0D)
-CLSID_WIC_DDS_DECODER = guid_from_define(0x9053699F, 0xA341, 0x429D, 0x9E, 0x90, 0xEE, 0x43, 0x7C, 0xF8, 0x0C, 0x73)
-CLSID_WIC_BMP_ENCODER = guid_from_define(0x69BE8BB4, 0xD66D, 0x47C8, 0x86, 0x5A, 0xED, 0x15, 0x89, 0x43, 0x37, 0x82)
-CLSID_WIC_PNG_ENCODER = guid_from_define(0x27949969, 0x876A, 0x41D7, 0x94, 0x47, 0x56, 0x8F, 0x6A, 0x35, 0xA4, 0xDC)
-CLSID_WIC_JPEG_ENCODER = guid_from_define(0x1A34F5C1, 0x4A5A, 0x46DC, 0xB6, 0x44, 0x1F, 0x45, 0x67, 0xE7, 0xA6, 0x76)
-CLSID_WIC_GIF_ENCODER = guid_from_define(0x114F5598, 0x0B22, 0x40A0, 0x86, 0xA1, 0xC8, 0x3E, 0xA4, 0x95, 0xAD, 0xBD)
-CLSID_WIC_TIFF_ENCODER = guid_from_define(0x0131BE10, 0x2001, 0x4C5F, 0xA9, 0xB0, 0xCC, 0x88, 0xFA, 0xB6, 0x4C, 0xE8)
-CLSID_WIC_WMP_ENCODER = guid_from_define(0xAC4CE3CB, 0xE1C1, 0x44CD, 0x82, 0x15, 0x5A, 0x16, 0x65, 0x50, 0x9E, 0xC2)
-CLSID_WIC_DDS_ENCODER = guid_from_define(0xA61DDE94, 0x66CE, 0x4AC1, 0x88, 0x1B, 0x71, 0x68, 0x05, 0x88, 0x89, 0x5E)
-CLSID_WIC_ADNG_DECODER = guid_from_define(0x981D9411, 0x909E, 0x42A7, 0x8F, 0x5D, 0xA7, 0x47, 0xFF, 0x05, 0x2E, 0xDB)
-CLSID_WIC_JPEG_QUALCOMM_PHONE_ENCODER = guid_from_define(
+CLSID_WIC_PNG_DECODER = guid_from_fields(0x389EA17B, 0x5078, 0x4CDE, 0xB6, 0xEF, 0x25, 0xC1, 0x51, 0x75, 0xC7, 0x51)
+CLSID_WIC_PNG_DECODER1 = guid_from_fields(0x389EA17B, 0x5078, 0x4CDE, 0xB6, 0xEF, 0x25, 0xC1, 0x51, 0x75, 0xC7, 0x51)
+CLSID_WIC_PNG_DECODER2 = guid_from_fields(0xE018945B, 0xAA86, 0x4008, 0x9B, 0xD4, 0x67, 0x77, 0xA1, 0xE4, 0x0C, 0x11)
+CLSID_WIC_BMP_DECODER = guid_from_fields(0x6B462062, 0x7CBF, 0x400D, 0x9F, 0xDB, 0x81, 0x3D, 0xD1, 0x0F, 0x27, 0x78)
+CLSID_WIC_ICO_DECODER = guid_from_fields(0xC61BFCDF, 0x2E0F, 0x4AAD, 0xA8, 0xD7, 0xE0, 0x6B, 0xAF, 0xEB, 0xCD, 0xFE)
+CLSID_WIC_JPEG_DECODER = guid_from_fields(0x9456A480, 0xE88B, 0x43EA, 0x9E, 0x73, 0x0B, 0x2D, 0x9B, 0x71, 0xB1, 0xCA)
+CLSID_WIC_GIF_DECODER = guid_from_fields(0x381DDA3C, 0x9CE9, 0x4834, 0xA2, 0x3E, 0x1F, 0x98, 0xF8, 0xFC, 0x52, 0xBE)
+CLSID_WIC_TIFF_DECODER = guid_from_fields(0xB54E85D9, 0xFE23, 0x499F, 0x8B, 0x88, 0x6A, 0xCE, 0xA7, 0x13, 0x75, 0x2B)
+CLSID_WIC_WMP_DECODER = guid_from_fields(0xA26CEC36, 0x234C, 0x4950, 0xAE, 0x16, 0xE3, 0x4A, 0xAC, 0xE7, 0x1D, 0x0D)
+CLSID_WIC_DDS_DECODER = guid_from_fields(0x9053699F, 0xA341, 0x429D, 0x9E, 0x90, 0xEE, 0x43, 0x7C, 0xF8, 0x0C, 0x73)
+CLSID_WIC_BMP_ENCODER = guid_from_fields(0x69BE8BB4, 0xD66D, 0x47C8, 0x86, 0x5A, 0xED, 0x15, 0x89, 0x43, 0x37, 0x82)
+CLSID_WIC_PNG_ENCODER = guid_from_fields(0x27949969, 0x876A, 0x41D7, 0x94, 0x47, 0x56, 0x8F, 0x6A, 0x35, 0xA4, 0xDC)
+CLSID_WIC_JPEG_ENCODER = guid_from_fields(0x1A34F5C1, 0x4A5A, 0x46DC, 0xB6, 0x44, 0x1F, 0x45, 0x67, 0xE7, 0xA6, 0x76)
+CLSID_WIC_GIF_ENCODER = guid_from_fields(0x114F5598, 0x0B22, 0x40A0, 0x86, 0xA1, 0xC8, 0x3E, 0xA4, 0x95, 0xAD, 0xBD)
+CLSID_WIC_TIFF_ENCODER = guid_from_fields(0x0131BE10, 0x2001, 0x4C5F, 0xA9, 0xB0, 0xCC, 0x88, 0xFA, 0xB6, 0x4C, 0xE8)
+CLSID_WIC_WMP_ENCODER = guid_from_fields(0xAC4CE3CB, 0xE1C1, 0x44CD, 0x82, 0x15, 0x5A, 0x16, 0x65, 0x50, 0x9E, 0xC2)
+CLSID_WIC_DDS_ENCODER = guid_from_fields(0xA61DDE94, 0x66CE, 0x4AC1, 0x88, 0x1B, 0x71, 0x68, 0x05, 0x88, 0x89, 0x5E)
+CLSID_WIC_ADNG_DECODER = guid_from_fields(0x981D9411, 0x909E, 0x42A7, 0x8F, 0x5D, 0xA7, 0x47, 0xFF, 0x05, 0x2E, 0xDB)
+CLSID_WIC_JPEG_QUALCOMM_PHONE_ENCODER = guid_from_fields(
     0x68ED5C62, 0xF534, 0x4979, 0xB2, 0xB3, 0x68, 0x6A, 0x12, 0xB2, 0xB3, 0x4C
 )
-CLSID_WIC_HEIF_DECODER = guid_from_define(0xE9A4A80A, 0x44FE, 0x4DE4, 0x89, 0x71, 0x71, 0x50, 0xB1, 0x0A, 0x51, 0x99)
-CLSID_WIC_HEIF_ENCODER = guid_from_define(0x0DBECEC1, 0x9EB3, 0x4860, 0x9C, 0x6F, 0xDD, 0xBE, 0x86, 0x63, 0x45, 0x75)
-CLSID_WIC_WEBP_DECODER = guid_from_define(0x7693E886, 0x51C9, 0x4070, 0x84, 0x19, 0x9F, 0x70, 0x73, 0x8E, 0xC8, 0xFA)
-CLSID_WICRAW_DECODER = guid_from_define(0x41945702, 0x8302, 0x44A6, 0x94, 0x45, 0xAC, 0x98, 0xE8, 0xAF, 0xA0, 0x86)
-CLSID_WIC_JPEG_XL_DECODER = guid_from_define(0xFC6CEECE, 0xAEF5, 0x4A23, 0x96, 0xEC, 0x59, 0x84, 0xFF, 0xB4, 0x86, 0xD9)
-CLSID_WIC_JPEG_XL_ENCODER = guid_from_define(0x0E4ECD3B, 0x1BA6, 0x4636, 0x81, 0x98, 0x56, 0xC7, 0x30, 0x40, 0x96, 0x4A)
-
-GUID_CONTAINER_FORMAT_BMP = guid_from_define(0x0AF1D87E, 0xFCFE, 0x4188, 0xBD, 0xEB, 0xA7, 0x90, 0x64, 0x71, 0xCB, 0xE3)
-GUID_CONTAINER_FORMAT_PNG = guid_from_define(0x1B7CFAF4, 0x713F, 0x473C, 0xBB, 0xCD, 0x61, 0x37, 0x42, 0x5F, 0xAE, 0xAF)
-GUID_CONTAINER_FORMAT_ICO = guid_from_define(0xA3A860C4, 0x338F, 0x4C17, 0x91, 0x9A, 0xFB, 0xA4, 0xB5, 0x62, 0x8F, 0x21)
-GUID_CONTAINER_FORMAT_JPEG = guid_from_define(
+CLSID_WIC_HEIF_DECODER = guid_from_fields(0xE9A4A80A, 0x44FE, 0x4DE4, 0x89, 0x71, 0x71, 0x50, 0xB1, 0x0A, 0x51, 0x99)
+CLSID_WIC_HEIF_ENCODER = guid_from_fields(0x0DBECEC1, 0x9EB3, 0x4860, 0x9C, 0x6F, 0xDD, 0xBE, 0x86, 0x63, 0x45, 0x75)
+CLSID_WIC_WEBP_DECODER = guid_from_fields(0x7693E886, 0x51C9, 0x4070, 0x84, 0x19, 0x9F, 0x70, 0x73, 0x8E, 0xC8, 0xFA)
+CLSID_WICRAW_DECODER = guid_from_fields(0x41945702, 0x8302, 0x44A6, 0x94, 0x45, 0xAC, 0x98, 0xE8, 0xAF, 0xA0, 0x86)
+CLSID_WIC_JPEG_XL_DECODER = guid_from_fields(0xFC6CEECE, 0xAEF5, 0x4A23, 0x96, 0xEC, 0x59, 0x84, 0xFF, 0xB4, 0x86, 0xD9)
+CLSID_WIC_JPEG_XL_ENCODER = guid_from_fields(0x0E4ECD3B, 0x1BA6, 0x4636, 0x81, 0x98, 0x56, 0xC7, 0x30, 0x40, 0x96, 0x4A)
+
+GUID_CONTAINER_FORMAT_BMP = guid_from_fields(0x0AF1D87E, 0xFCFE, 0x4188, 0xBD, 0xEB, 0xA7, 0x90, 0x64, 0x71, 0xCB, 0xE3)
+GUID_CONTAINER_FORMAT_PNG = guid_from_fields(0x1B7CFAF4, 0x713F, 0x473C, 0xBB, 0xCD, 0x61, 0x37, 0x42, 0x5F, 0xAE, 0xAF)
+GUID_CONTAINER_FORMAT_ICO = guid_from_fields(0xA3A860C4, 0x338F, 0x4C17, 0x91, 0x9A, 0xFB, 0xA4, 0xB5, 0x62, 0x8F, 0x21)
+GUID_CONTAINER_FORMAT_JPEG = guid_from_fields(
     0x19E4A5AA, 0x5662, 0x4FC5, 0xA0, 0xC0, 0x17, 0x58, 0x02, 0x8E, 0x10, 0x57
 )
-GUID_CONTAINER_FORMAT_TIFF = guid_from_define(
+GUID_CONTAINER_FORMAT_TIFF = guid_from_fields(
     0x163BCC30, 0xE2E9, 0x4F0B, 0x96, 0x1D, 0xA3, 0xE9, 0xFD, 0xB7, 0x88, 0xA3
 )
-GUID_CONTAINER_FORMAT_GIF = guid_from_define(0x1F8A5601, 0x7D4D, 0x4CBD, 0x9C, 0x82, 0x1B, 0xC8, 0xD4, 0xEE, 0xB9, 0xA5)
-GUID_CONTAINER_FORMAT_WMP = guid_from_define(0x57A37CAA, 0x367A, 0x4540, 0x91, 0x6B, 0xF1, 0x83, 0xC5, 0x09, 0x3A, 0x4B)
-GUID_CONTAINER_FORMAT_DDS = guid_from_define(0x9967CB95, 0x2E85, 0x4AC8, 0x8C, 0xA2, 0x83, 0xD7, 0xCC, 0xD4, 0x25, 0xC9)
-GUID_CONTAINER_FORMAT_ADNG = guid_from_define(
+GUID_CONTAINER_FORMAT_GIF = guid_from_fields(0x1F8A5601, 0x7D4D, 0x4CBD, 0x9C, 0x82, 0x1B, 0xC8, 0xD4, 0xEE, 0xB9, 0xA5)
+GUID_CONTAINER_FORMAT_WMP = guid_from_fields(0x57A37CAA, 0x367A, 0x4540, 0x91, 0x6B, 0xF1, 0x83, 0xC5, 0x09, 0x3A, 0x4B)
+GUID_CONTAINER_FORMAT_DDS = guid_from_fields(0x9967CB95, 0x2E85, 0x4AC8, 0x8C, 0xA2, 0x83, 0xD7, 0xCC, 0xD4, 0x25, 0xC9)
+GUID_CONTAINER_FORMAT_ADNG = guid_from_fields(
     0xF3FF6D0D, 0x38C0, 0x41C4, 0xB1, 0xFE, 0x1F, 0x38, 0x24, 0xF1, 0x7B, 0x84
 )
-GUID_CONTAINER_FORMAT_HEIF = guid_from_define(
+GUID_CONTAINER_FORMAT_HEIF = guid_from_fields(
     0xE1E62521, 0x6787, 0x405B, 0xA3, 0x39, 0x50, 0x07, 0x15, 0xB5, 0x76, 0x3F
 )
-GUID_CONTAINER_FORMAT_WEBP = guid_from_define(
+GUID_CONTAINER_FORMAT_WEBP = guid_from_fields(
     0xE094B0E2, 0x67F2, 0x45B3, 0xB0, 0xEA, 0x11, 0x53, 0x37, 0xCA, 0x7C, 0xF3
 )
-GUID_CONTAINER_FORMAT_RAW = guid_from_define(0xFE99CE60, 0xF19C, 0x433C, 0xA3, 0xAE, 0x00, 0xAC, 0xEF, 0xA9, 0xCA, 0x21)
-GUID_CONTAINER_FORMAT_JPEG_XL = guid_from_define(
+GUID_CONTAINER_FORMAT_RAW = guid_from_fields(0xFE99CE60, 0xF19C, 0x433C, 0xA3, 0xAE, 0x00, 0xAC, 0xEF, 0xA9, 0xCA, 0x21)
+GUID_CONTAINER_FORMAT_JPEG_XL = guid_from_fields(
     0xFEC14E3F, 0x427A, 0x4736, 0xAA, 0xE6, 0x27, 0xED, 0x84, 0xF6, 0x93, 0x22
 )
 
-CLSID_WICImagingCategories = guid_from_define(
+CLSID_WICImagingCategories = guid_from_fields(
     0xFAE3D380, 0xFEA4, 0x4623, 0x8C, 0x75, 0xC6, 0xB6, 0x11, 0x10, 0xB6, 0x81
 )
 
-CATID_WICBitmapDecoders = guid_from_define(0x7ED96837, 0x96F0, 0x4812, 0xB2, 0x11, 0xF1, 0x3C, 0x24, 0x11, 0x7E, 0xD3)
-CATID_WICBitmapEncoders = guid_from_define(0xAC757296, 0x3522, 0x4E11, 0x98, 0x62, 0xC1, 0x7B, 0xE5, 0xA1, 0x76, 0x7E)
-CATID_WICPixelFormats = guid_from_define(0x2B46E70F, 0xCDA7, 0x473E, 0x89, 0xF6, 0xDC, 0x96, 0x30, 0xA2, 0x39, 0x0B)
-CATID_WICFormatConverters = guid_from_define(0x7835EAE8, 0xBF14, 0x49D1, 0x93, 0xCE, 0x53, 0x3A, 0x40, 0x7B, 0x22, 0x48)
-CATID_WICMetadataReader = guid_from_define(0x05AF94D8, 0x7174, 0x4CD2, 0xBE, 0x4A, 0x41, 0x24, 0xB8, 0x0E, 0xE4, 0xB8)
-CATID_WICMetadataWriter = guid_from_define(0xABE3B9A4, 0x257D, 0x4B97, 0xBD, 0x1A, 0x29, 0x4A, 0xF4, 0x96, 0x22, 0x2E)
-CLSID_WICDefaultFormatConverter = guid_from_define(
+CATID_WICBitmapDecoders = guid_from_fields(0x7ED96837, 0x96F0, 0x4812, 0xB2, 0x11, 0xF1, 0x3C, 0x24, 0x11, 0x7E, 0xD3)
+CATID_WICBitmapEncoders = guid_from_fields(0xAC757296, 0x3522, 0x4E11, 0x98, 0x62, 0xC1, 0x7B, 0xE5, 0xA1, 0x76, 0x7E)
+CATID_WICPixelFormats = guid_from_fields(0x2B46E70F, 0xCDA7, 0x473E, 0x89, 0xF6, 0xDC, 0x96, 0x30, 0xA2, 0x39, 0x0B)
+CATID_WICFormatConverters = guid_from_fields(0x7835EAE8, 0xBF14, 0x49D1, 0x93, 0xCE, 0x53, 0x3A, 0x40, 0x7B, 0x22, 0x48)
+CATID_WICMetadataReader = guid_from_fields(0x05AF94D8, 0x7174, 0x4CD2, 0xBE, 0x4A, 0x41, 0x24, 0xB8, 0x0E, 0xE4, 0xB8)
+CATID_WICMetadataWriter = guid_from_fields(0xABE3B9A4, 0x257D, 0x4B97, 0xBD, 0x1A, 0x29, 0x4A, 0xF4, 0x96, 0x22, 0x2E)
+CLSID_WICDefaultFormatConverter = guid_from_fields(
     0x1A3F11DC, 0xB514, 0x4B17, 0x8C, 0x5F, 0x21, 0x54, 0x51, 0x38, 0x52, 0xF1
 )
-CLSID_WICFormatConverterHighColor = guid_from_define(
+CLSID_WICFormatConverterHighColor = guid_from_fields(
     0xAC75D454, 0x9F37, 0x48F8, 0xB9, 0x72, 0x4E, 0x19, 0xBC, 0x85, 0x60, 0x11
 )
-CLSID_WICFormatConverterNChannel = guid_from_define(
+CLSID_WICFormatConverterNChannel = guid_from_fields(
     0xC17CABB2, 0xD4A3, 0x47D7, 0xA5, 0x57, 0x33, 0x9B, 0x2E, 0xFB, 0xD4, 0xF1
 )
-CLSID_WICFormatConverterWMPhoto = guid_from_define(
+CLSID_WICFormatConverterWMPhoto = guid_from_fields(
     0x9CB5172B, 0xD600, 0x46BA, 0xAB, 0x77, 0x77, 0xBB, 0x7E, 0x3A, 0x00, 0xD9
 )
-CLSID_WICPlanarFormatConverter = guid_from_define(
+CLSID_WICPlanarFormatConverter = guid_from_fields(
     0x184132B8, 0x32F8, 0x4784, 0x91, 0x31, 0xDD, 0x72, 0x24, 0xB2, 0x34, 0x38
 )
 
@@ -127,275 +127,275 @@ WIC_JPEG_HUFFMAN_BASELINE_ONE = 0
 WIC_JPEG_HUFFMAN_BASELINE_THREE = 0x111100
 
 
-GUID_WICPixelFormatDontCare = guid_from_define(
+GUID_WICPixelFormatDontCare = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x00
 )
 GUID_WICPixelFormatUndefined = GUID_WICPixelFormatDontCare
-GUID_WICPixelFormat1bppIndexed = guid_from_define(
+GUID_WICPixelFormat1bppIndexed = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x01
 )
-GUID_WICPixelFormat2bppIndexed = guid_from_define(
+GUID_WICPixelFormat2bppIndexed = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x02
 )
-GUID_WICPixelFormat4bppIndexed = guid_from_define(
+GUID_WICPixelFormat4bppIndexed = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x03
 )
-GUID_WICPixelFormat8bppIndexed = guid_from_define(
+GUID_WICPixelFormat8bppIndexed = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x04
 )
-GUID_WICPixelFormatBlackWhite = guid_from_define(
+GUID_WICPixelFormatBlackWhite = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x05
 )
-GUID_WICPixelFormat2bppGray = guid_from_define(
+GUID_WICPixelFormat2bppGray = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x06
 )
-GUID_WICPixelFormat4bppGray = guid_from_define(
+GUID_WICPixelFormat4bppGray = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x07
 )
-GUID_WICPixelFormat8bppGray = guid_from_define(
+GUID_WICPixelFormat8bppGray = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x08
 )
-GUID_WICPixelFormat8bppAlpha = guid_from_define(
+GUID_WICPixelFormat8bppAlpha = guid_from_fields(
     0xE6CD0116, 0xEEBA, 0x4161, 0xAA, 0x85, 0x27, 0xDD, 0x9F, 0xB3, 0xA8, 0x95
 )
-GUID_WICPixelFormat8bppDepth = guid_from_define(
+GUID_WICPixelFormat8bppDepth = guid_from_fields(
     0x4C9C9F45, 0x1D89, 0x4E31, 0x9B, 0xC7, 0x69, 0x34, 0x3A, 0x0D, 0xCA, 0x69
 )
-GUID_WICPixelFormat8bppGain = guid_from_define(
+GUID_WICPixelFormat8bppGain = guid_from_fields(
     0xA884022A, 0xAF13, 0x4C16, 0xB7, 0x46, 0x61, 0x9B, 0xF6, 0x18, 0xB8, 0x78
 )
-GUID_WICPixelFormat16bppBGR555 = guid_from_define(
+GUID_WICPixelFormat16bppBGR555 = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x09
 )
-GUID_WICPixelFormat16bppBGR565 = guid_from_define(
+GUID_WICPixelFormat16bppBGR565 = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0A
 )
-GUID_WICPixelFormat16bppBGRA5551 = guid_from_define(
+GUID_WICPixelFormat16bppBGRA5551 = guid_from_fields(
     0x05EC7C2B, 0xF1E6, 0x4961, 0xAD, 0x46, 0xE1, 0xCC, 0x81, 0x0A, 0x87, 0xD2
 )
-GUID_WICPixelFormat16bppGray = guid_from_define(
+GUID_WICPixelFormat16bppGray = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0B
 )
-GUID_WICPixelFormat24bppBGR = guid_from_define(
+GUID_WICPixelFormat24bppBGR = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0C
 )
-GUID_WICPixelFormat24bppRGB = guid_from_define(
+GUID_WICPixelFormat24bppRGB = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0D
 )
-GUID_WICPixelFormat32bppBGR = guid_from_define(
+GUID_WICPixelFormat32bppBGR = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0E
 )
-GUID_WICPixelFormat32bppBGRA = guid_from_define(
+GUID_WICPixelFormat32bppBGRA = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x0F
 )
-GUID_WICPixelFormat32bppPBGRA = guid_from_define(
+GUID_WICPixelFormat32bppPBGRA = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x10
 )
-GUID_WICPixelFormat32bppGrayFloat = guid_from_define(
+GUID_WICPixelFormat32bppGrayFloat = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x11
 )
-GUID_WICPixelFormat32bppRGB = guid_from_define(
+GUID_WICPixelFormat32bppRGB = guid_from_fields(
     0xD98C6B95, 0x3EFE, 0x47D6, 0xBB, 0x25, 0xEB, 0x17, 0x48, 0xAB, 0x0C, 0xF1
 )
-GUID_WICPixelFormat32bppRGBA = guid_from_define(
+GUID_WICPixelFormat32bppRGBA = guid_from_fields(
     0xF5C7AD2D, 0x6A8D, 0x43DD, 0xA7, 0xA8, 0xA2, 0x99, 0x35, 0x26, 0x1A, 0xE9
 )
-GUID_WICPixelFormat32bppPRGBA = guid_from_define(
+GUID_WICPixelFormat32bppPRGBA = guid_from_fields(
     0x3CC4A650, 0xA527, 0x4D37, 0xA9, 0x16, 0x31, 0x42, 0xC7, 0xEB, 0xED, 0xBA
 )
-GUID_WICPixelFormat48bppRGB = guid_from_define(
+GUID_WICPixelFormat48bppRGB = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x15
 )
-GUID_WICPixelFormat48bppBGR = guid_from_define(
+GUID_WICPixelFormat48bppBGR = guid_from_fields(
     0xE605A384, 0xB468, 0x46CE, 0xBB, 0x2E, 0x36, 0xF1, 0x80, 0xE6, 0x43, 0x13
 )
-GUID_WICPixelFormat64bppRGB = guid_from_define(
+GUID_WICPixelFormat64bppRGB = guid_from_fields(
     0xA1182111, 0x186D, 0x4D42, 0xBC, 0x6A, 0x9C, 0x83, 0x03, 0xA8, 0xDF, 0xF9
 )
-GUID_WICPixelFormat64bppRGBA = guid_from_define(
+GUID_WICPixelFormat64bppRGBA = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x16
 )
-GUID_WICPixelFormat64bppBGRA = guid_from_define(
+GUID_WICPixelFormat64bppBGRA = guid_from_fields(
     0x1562FF7C, 0xD352, 0x46F9, 0x97, 0x9E, 0x42, 0x97, 0x6B, 0x79, 0x22, 0x46
 )
-GUID_WICPixelFormat64bppPRGBA = guid_from_define(
+GUID_WICPixelFormat64bppPRGBA = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x17
 )
-GUID_WICPixelFormat64bppPBGRA = guid_from_define(
+GUID_WICPixelFormat64bppPBGRA = guid_from_fields(
     0x8C518E8E, 0xA4EC, 0x468B, 0xAE, 0x70, 0xC9, 0xA3, 0x5A, 0x9C, 0x55, 0x30
 )
-GUID_WICPixelFormat16bppGrayFixedPoint = guid_from_define(
+GUID_WICPixelFormat16bppGrayFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x13
 )
-GUID_WICPixelFormat32bppBGR101010 = guid_from_define(
+GUID_WICPixelFormat32bppBGR101010 = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x14
 )
-GUID_WICPixelFormat48bppRGBFixedPoint = guid_from_define(
+GUID_WICPixelFormat48bppRGBFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x12
 )
-GUID_WICPixelFormat48bppBGRFixedPoint = guid_from_define(
+GUID_WICPixelFormat48bppBGRFixedPoint = guid_from_fields(
     0x49CA140E, 0xCAB6, 0x493B, 0x9D, 0xDF, 0x60, 0x18, 0x7C, 0x37, 0x53, 0x2A
 )
-GUID_WICPixelFormat96bppRGBFixedPoint = guid_from_define(
+GUID_WICPixelFormat96bppRGBFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x18
 )
-GUID_WICPixelFormat96bppRGBFloat = guid_from_define(
+GUID_WICPixelFormat96bppRGBFloat = guid_from_fields(
     0xE3FED78F, 0xE8DB, 0x4ACF, 0x84, 0xC1, 0xE9, 0x7F, 0x61, 0x36, 0xB3, 0x27
 )
-GUID_WICPixelFormat128bppRGBAFloat = guid_from_define(
+GUID_WICPixelFormat128bppRGBAFloat = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x19
 )
-GUID_WICPixelFormat128bppPRGBAFloat = guid_from_define(
+GUID_WICPixelFormat128bppPRGBAFloat = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1A
 )
-GUID_WICPixelFormat128bppRGBFloat = guid_from_define(
+GUID_WICPixelFormat128bppRGBFloat = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1B
 )
-GUID_WICPixelFormat32bppCMYK = guid_from_define(
+GUID_WICPixelFormat32bppCMYK = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1C
 )
-GUID_WICPixelFormat64bppRGBAFixedPoint = guid_from_define(
+GUID_WICPixelFormat64bppRGBAFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1D
 )
-GUID_WICPixelFormat64bppBGRAFixedPoint = guid_from_define(
+GUID_WICPixelFormat64bppBGRAFixedPoint = guid_from_fields(
     0x356DE33C, 0x54D2, 0x4A23, 0xBB, 0x4, 0x9B, 0x7B, 0xF9, 0xB1, 0xD4, 0x2D
 )
-GUID_WICPixelFormat64bppRGBFixedPoint = guid_from_define(
+GUID_WICPixelFormat64bppRGBFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x40
 )
-GUID_WICPixelFormat128bppRGBAFixedPoint = guid_from_define(
+GUID_WICPixelFormat128bppRGBAFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1E
 )
-GUID_WICPixelFormat128bppRGBFixedPoint = guid_from_define(
+GUID_WICPixelFormat128bppRGBFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x41
 )
-GUID_WICPixelFormat64bppRGBAHalf = guid_from_define(
+GUID_WICPixelFormat64bppRGBAHalf = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x3A
 )
-GUID_WICPixelFormat64bppPRGBAHalf = guid_from_define(
+GUID_WICPixelFormat64bppPRGBAHalf = guid_from_fields(
     0x58AD26C2, 0xC623, 0x4D9D, 0xB3, 0x20, 0x38, 0x7E, 0x49, 0xF8, 0xC4, 0x42
 )
-GUID_WICPixelFormat64bppRGBHalf = guid_from_define(
+GUID_WICPixelFormat64bppRGBHalf = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x42
 )
-GUID_WICPixelFormat48bppRGBHalf = guid_from_define(
+GUID_WICPixelFormat48bppRGBHalf = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x3B
 )
-GUID_WICPixelFormat32bppRGBE = guid_from_define(
+GUID_WICPixelFormat32bppRGBE = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x3D
 )
-GUID_WICPixelFormat16bppGrayHalf = guid_from_define(
+GUID_WICPixelFormat16bppGrayHalf = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x3E
 )
-GUID_WICPixelFormat32bppGrayFixedPoint = guid_from_define(
+GUID_WICPixelFormat32bppGrayFixedPoint = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x3F
 )
-GUID_WICPixelFormat32bppRGBA1010102 = guid_from_define(
+GUID_WICPixelFormat32bppRGBA1010102 = guid_from_fields(
     0x25238D72, 0xFCF9, 0x4522, 0xB5, 0x14, 0x55, 0x78, 0xE5, 0xAD, 0x55, 0xE0
 )
-GUID_WICPixelFormat32bppRGBA1010102XR = guid_from_define(
+GUID_WICPixelFormat32bppRGBA1010102XR = guid_from_fields(
     0x00DE6B9A, 0xC101, 0x434B, 0xB5, 0x02, 0xD0, 0x16, 0x5E, 0xE1, 0x12, 0x2C
 )
-GUID_WICPixelFormat32bppR10G10B10A2 = guid_from_define(
+GUID_WICPixelFormat32bppR10G10B10A2 = guid_from_fields(
     0x604E1BB5, 0x8A3C, 0x4B65, 0xB1, 0x1C, 0xBC, 0x0B, 0x8D, 0xD7, 0x5B, 0x7F
 )
-GUID_WICPixelFormat32bppR10G10B10A2HDR10 = guid_from_define(
+GUID_WICPixelFormat32bppR10G10B10A2HDR10 = guid_from_fields(
     0x9C215C5D, 0x1ACC, 0x4F0E, 0xA4, 0xBC, 0x70, 0xFB, 0x3A, 0xE8, 0xFD, 0x28
 )
-GUID_WICPixelFormat64bppCMYK = guid_from_define(
+GUID_WICPixelFormat64bppCMYK = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x1F
 )
-GUID_WICPixelFormat24bpp3Channels = guid_from_define(
+GUID_WICPixelFormat24bpp3Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x20
 )
-GUID_WICPixelFormat32bpp4Channels = guid_from_define(
+GUID_WICPixelFormat32bpp4Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x21
 )
-GUID_WICPixelFormat40bpp5Channels = guid_from_define(
+GUID_WICPixelFormat40bpp5Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x22
 )
-GUID_WICPixelFormat48bpp6Channels = guid_from_define(
+GUID_WICPixelFormat48bpp6Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x23
 )
-GUID_WICPixelFormat56bpp7Channels = guid_from_define(
+GUID_WICPixelFormat56bpp7Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x24
 )
-GUID_WICPixelFormat64bpp8Channels = guid_from_define(
+GUID_WICPixelFormat64bpp8Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x25
 )
-GUID_WICPixelFormat48bpp3Channels = guid_from_define(
+GUID_WICPixelFormat48bpp3Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x26
 )
-GUID_WICPixelFormat64bpp4Channels = guid_from_define(
+GUID_WICPixelFormat64bpp4Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x27
 )
-GUID_WICPixelFormat80bpp5Channels = guid_from_define(
+GUID_WICPixelFormat80bpp5Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x28
 )
-GUID_WICPixelFormat96bpp6Channels = guid_from_define(
+GUID_WICPixelFormat96bpp6Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x29
 )
-GUID_WICPixelFormat112bpp7Channels = guid_from_define(
+GUID_WICPixelFormat112bpp7Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2A
 )
-GUID_WICPixelFormat128bpp8Channels = guid_from_define(
+GUID_WICPixelFormat128bpp8Channels = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2B
 )
-GUID_WICPixelFormat40bppCMYKAlpha = guid_from_define(
+GUID_WICPixelFormat40bppCMYKAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2C
 )
-GUID_WICPixelFormat80bppCMYKAlpha = guid_from_define(
+GUID_WICPixelFormat80bppCMYKAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2D
 )
-GUID_WICPixelFormat32bpp3ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat32bpp3ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2E
 )
-GUID_WICPixelFormat40bpp4ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat40bpp4ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x2F
 )
-GUID_WICPixelFormat48bpp5ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat48bpp5ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x30
 )
-GUID_WICPixelFormat56bpp6ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat56bpp6ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x31
 )
-GUID_WICPixelFormat64bpp7ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat64bpp7ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x32
 )
-GUID_WICPixelFormat72bpp8ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat72bpp8ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x33
 )
-GUID_WICPixelFormat64bpp3ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat64bpp3ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x34
 )
-GUID_WICPixelFormat80bpp4ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat80bpp4ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x35
 )
-GUID_WICPixelFormat96bpp5ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat96bpp5ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x36
 )
-GUID_WICPixelFormat112bpp6ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat112bpp6ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x37
 )
-GUID_WICPixelFormat128bpp7ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat128bpp7ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x38
 )
-GUID_WICPixelFormat144bpp8ChannelsAlpha = guid_from_define(
+GUID_WICPixelFormat144bpp8ChannelsAlpha = guid_from_fields(
     0x6FDDC324, 0x4E03, 0x4BFE, 0xB1, 0x85, 0x3D, 0x77, 0x76, 0x8D, 0xC9, 0x39
 )
-GUID_WICPixelFormat8bppY = guid_from_define(0x91B4DB54, 0x2DF9, 0x42F0, 0xB4, 0x49, 0x29, 0x09, 0xBB, 0x3D, 0xF8, 0x8E)
-GUID_WICPixelFormat8bppCb = guid_from_define(0x1339F224, 0x6BFE, 0x4C3E, 0x93, 0x02, 0xE4, 0xF3, 0xA6, 0xD0, 0xCA, 0x2A)
-GUID_WICPixelFormat8bppCr = guid_from_define(0xB8145053, 0x2116, 0x49F0, 0x88, 0x35, 0xED, 0x84, 0x4B, 0x20, 0x5C, 0x51)
-GUID_WICPixelFormat16bppCbCr = guid_from_define(
+GUID_WICPixelFormat8bppY = guid_from_fields(0x91B4DB54, 0x2DF9, 0x42F0, 0xB4, 0x49, 0x29, 0x09, 0xBB, 0x3D, 0xF8, 0x8E)
+GUID_WICPixelFormat8bppCb = guid_from_fields(0x1339F224, 0x6BFE, 0x4C3E, 0x93, 0x02, 0xE4, 0xF3, 0xA6, 0xD0, 0xCA, 0x2A)
+GUID_WICPixelFormat8bppCr = guid_from_fields(0xB8145053, 0x2116, 0x49F0, 0x88, 0x35, 0xED, 0x84, 0x4B, 0x20, 0x5C, 0x51)
+GUID_WICPixelFormat16bppCbCr = guid_from_fields(
     0xFF95BA6E, 0x11E0, 0x4263, 0xBB, 0x45, 0x01, 0x72, 0x1F, 0x34, 0x60, 0xA4
 )
-GUID_WICPixelFormat16bppYQuantizedDctCoefficients = guid_from_define(
+GUID_WICPixelFormat16bppYQuantizedDctCoefficients = guid_from_fields(
     0xA355F433, 0x48E8, 0x4A42, 0x84, 0xD8, 0xE2, 0xAA, 0x26, 0xCA, 0x80, 0xA4
 )
-GUID_WICPixelFormat16bppCbQuantizedDctCoefficients = guid_from_define(
+GUID_WICPixelFormat16bppCbQuantizedDctCoefficients = guid_from_fields(
     0xD2C4FF61, 0x56A5, 0x49C2, 0x8B, 0x5C, 0x4C, 0x19, 0x25, 0x96, 0x48, 0x37
 )
-GUID_WICPixelFormat16bppCrQuantizedDctCoefficients = guid_from_define(
+GUID_WICPixelFormat16bppCrQuantizedDctCoefficients = guid_from_fields(
     0x2FE354F0, 0x1680, 0x42D8, 0x92, 0x31, 0xE7, 0x3C, 0x05, 0x65, 0xBF, 0xC1
 )
 
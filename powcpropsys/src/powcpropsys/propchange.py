@@ -3,7 +3,7 @@ from enum import IntFlag
 from typing import Any
 
 from comtypes import GUID, STDMETHOD, IUnknown
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 
 from . import _propsys
 from .propkey import PropertyKey
@@ -33,7 +33,7 @@ class IPropertyChange(IObjectWithPropertyKey):
     __slots__ = ()
 
 
-class PropertyChange:
+class PropertyChange(ComWrapper):
     """プロパティ変更情報。IPropertyChangeのラッパーです。"""
 
     __o: Any  # POINTER(IPropertyChange)
@@ -98,7 +98,7 @@ class IPropertyChangeArray(IUnknown):
     __slots__ = ()
 
 
-class PropertyChangeArray:
+class PropertyChangeArray(ComWrapper):
     """プロパティ変更情報配列。IPropertyChangeArrayのラッパーです。"""
 
     __o: Any  # POINTER(IPropertyChangeArray)
@@ -8,7 +8,7 @@ from enum import IntEnum, IntFlag
 from typing import Any, Iterator, overload
 
 from comtypes import GUID, STDMETHOD, IUnknown
-from powc.core import ComResult, check_hresult, cotaskmem, cr, query_interface
+from powc.core import ComResult, ComWrapper, check_hresult, cotaskmem, cr, query_interface
 from powc.variant import VARENUM
 
 from .propkey import PropertyKey
@@ -223,7 +223,7 @@ class IPropertyEnumType(IUnknown):
     __slots__ = ()
 
 
-class PropertyEnumType:
+class PropertyEnumType(ComWrapper):
     """プロパティの列挙情報。IPropertyEnumTypeのラッパーです。"""
 
     __o: Any  # POINTER(IPropertyEnumType)
@@ -295,7 +295,7 @@ class IPropertyEnumTypeList(IUnknown):
     __slots__ = ()
 
 
-class PropertyEnumTypeList:
+class PropertyEnumTypeList(ComWrapper):
     """プロパティの列挙情報リスト。PropertyEnumTypeListのラッパーです。"""
 
     __o: Any  # POINTER(IPropertyEnumTypeList)
@@ -407,7 +407,7 @@ class IPropertyDescriptionList(IUnknown):
     __slots__ = ()
 
 
-class PropertyDescription:
+class PropertyDescription(ComWrapper):
     """プロパティシステムのプロパティの説明。IPropertyDescriptionのラッパーです。"""
 
     __o: Any  # IPropertyDescription
@@ -640,7 +640,7 @@ class PropertyDescription:
         return self.is_value_canonical_nothrow(value).value
 
 
-class PropertyDescriptionList:
+class PropertyDescriptionList(ComWrapper):
     """プロパティシステムのプロパティの説明リスト。IPropertyDescriptionListのラッパーです。"""
 
     __o: Any  # IPropertyDescriptionList
@@ -4,7 +4,8 @@ from ctypes import POINTER, Structure, byref, c_int32, c_uint32, c_wchar_p
 
 from comtypes import GUID
 
-from powc.core import ComResult, cotaskmem, cr, guid_from_define
+from powc.core import ComResult, cotaskmem, cr
+from powc.guid import guid_from_fields, guid_to_str
 
 from . import _propsys
 
@@ -20,19 +21,19 @@ class PropertyKey(Structure):
     def from_define(
         a: int, b: int, c: int, d: int, e: int, f: int, g: int, h: int, i: int, j: int, k: int, l: int  # noqa: E741
     ) -> "PropertyKey":
-        return PropertyKey(guid_from_define(a, b, c, d, e, f, g, h, i, j, k), l)
+        return PropertyKey(guid_from_fields(a, b, c, d, e, f, g, h, i, j, k), l)
 
     def __str__(self) -> str:
-        return f"{self.fmtid} {self.pid}"
+        return f"{guid_to_str(self.fmtid)} {self.pid}"
 
     def __repr__(self) -> str:
         cname = self.canonicalname_nothrow
-        return f'PropertyKey({self.fmtid} {self.pid}, "{cname.value_unchecked if cname else ""}")'
+        return f'PropertyKey({guid_to_str(self.fmtid)} {self.pid}, "{cname.value_unchecked if cname else ""}")'
 
     def __eq__(self, other) -> bool:
-        if other is not PropertyKey:
+        if not isinstance(other, PropertyKey):
             return False
-        return self.fmtid == other.fmtid and self.pid == other.fmtid
+        return bytes(self) == bytes(other)
 
     def __hash__(self) -> int:
         """ハッシュを計算します。mutableなのでハッシュは可変です。"""
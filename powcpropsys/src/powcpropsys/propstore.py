@@ -6,7 +6,7 @@ from typing import Any, Iterable, Iterator, OrderedDict
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 
 from . import _propsys
 from .propkey import PropertyKey
@@ -47,7 +47,7 @@ class IPropertyStore(IUnknown):
     __slots__ = ()
 
 
-class PropertyStore:
+class PropertyStore(ComWrapper):
     """プロパティストア。IPropertyStoreインターフェイスのラッパーです。"""
 
     __o: Any  # IPropertyStore
@@ -117,7 +117,10 @@ class PropertyStore:
         return self
 
     def __exit__(self, ex_type, ex_value, trace):
-        self.commit()
+        try:
+            self.commit()
+        finally:
+            self.release()
 
     def iter_keys(self) -> Iterator[PropertyKey]:
         return (self.get_key_at(i) for i in range(self.count))
@@ -4,7 +4,7 @@ from ctypes import POINTER, byref, c_int32, c_uint32, c_void_p, c_wchar_p
 from typing import Any
 
 from comtypes import GUID, STDMETHOD, IUnknown
-from powc.core import ComResult, cotaskmem, cr, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 
 from . import _propsys
 from .propdesc import (
@@ -43,7 +43,7 @@ class IPropertySystem(IUnknown):
     __slots__ = ()
 
 
-class PropertySystem:
+class PropertySystem(ComWrapper):
     """プロパティシステム。IPropertySystemインターフェイスのラッパーです。
 
     Examples:
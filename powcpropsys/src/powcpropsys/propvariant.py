@@ -25,12 +25,24 @@ from ctypes import (
     sizeof,
 )
 from datetime import datetime
+from typing import Any
 
 from comtypes import GUID
 
-from powc.core import ComResult, CoTaskMem, check_hresult, cotaskmem, cotaskmem_free, cr
+from powc.core import (
+    ComResult,
+    CoTaskMem,
+    check_hresult,
+    cotaskmem,
+    cotaskmem_free,
+    cotaskmem_size,
+    cr,
+    register_tracked_type,
+    release_on_exit,
+    take_struct,
+)
 from powc.datetime import FILETIME
-from powc.variant import VARENUM
+from powc.variant import VARENUM, _owned_size
 
 from . import _ole32, _propsys
 
@@ -44,10 +56,16 @@ class PropVariant(Union):
     # PROPVAR_PAD3 wReserved3;
     _fields_ = (("vt", c_uint16), ("data", c_byte * (24 if sizeof(c_void_p) == 8 else 16)))
 
-    __slots__ = ()
+    # release_scopeは弱参照で登録するため、__slots__を定義しません（ctypes型は__weakref__をスロットにできません）。
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        release_on_exit(self)
 
     def clear(self) -> None:
-        _PropVariantClear(self)
+        # 値を移してから解放するため、複数のスレッドから同時に解放しても二重解放になりません。
+        if self.vt:
+            _PropVariantClear(cast(take_struct(self), POINTER(PropVariant)))
 
     def __del__(self) -> None:
         self.clear()
@@ -71,12 +89,15 @@ class PropVariant(Union):
     def __repr__(self) -> str:
         return f"PropVariant({self.__str__()})"
 
-    def __enter__(self):
+    def release(self) -> None:
+        """値を解放します。clear()と同じです。"""
+        self.clear()
+
+    def __enter__(self) -> "PropVariant":
         return self
 
-    def __exit__(self):
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         self.clear()
-        return True
 
     @property
     def vartype(self) -> VARENUM:
@@ -96,7 +117,8 @@ class PropVariant(Union):
 
     @property
     def data_memview(self) -> memoryview:
-        return memoryview(self.data)[PropVariant.data.offset :]
+        # Unionのdataはvtと同じ位置から始まるため、vtとwReserved1～3の8バイトを除きます。
+        return memoryview(self.data)[8:]
 
     def change_type_nothrow(self, vt: VARENUM) -> "ComResult[PropVariant]":
         global PropVariantChangeType
@@ -423,3 +445,28 @@ _PropVariantToStringVectorAlloc = _propsys.PropVariantToStringVectorAlloc
 _PropVariantToStringVectorAlloc.argtypes = (POINTER(PropVariant), POINTER(c_void_p), POINTER(c_uint32))
 _PropVariantToStringVectorAlloc.restype = c_int32
 _PropVariantToStringVectorAlloc.restype = c_int32
+
+# 値がCOMメモリへのポインタの型。
+_COTASKMEM_VALUE_TYPES = frozenset((VARENUM.VT_LPSTR, VARENUM.VT_LPWSTR, VARENUM.VT_CLSID, VARENUM.VT_CF))
+
+
+def _propvariant_size(pv: PropVariant) -> int:
+    """参照追跡で報告するサイズです。構造体と、値が所有するBSTR・SAFEARRAY・COMメモリを含みます。
+
+    ベクターは要素の配列のバイト数で、VT_VECTOR | VT_LPWSTRの要素等が指すメモリは含みません。
+    """
+    vt = pv.vt
+    data = pv.data_memview
+    if vt & (VARENUM.VT_ARRAY | VARENUM.VT_BYREF) or vt == VARENUM.VT_BSTR:
+        return sizeof(PropVariant) + _owned_size(vt, data)
+    if vt & VARENUM.VT_VECTOR or vt == VARENUM.VT_BLOB:
+        # CAxxx・BLOB構造体は、ULONGの要素数（バイト数）の後に配列へのポインタが続きます。
+        p = c_void_p.from_buffer(data, sizeof(c_void_p)).value
+    elif vt in _COTASKMEM_VALUE_TYPES:
+        p = c_void_p.from_buffer(data).value
+    else:
+        return sizeof(PropVariant)
+    return sizeof(PropVariant) + cotaskmem_size(p)
+
+
+register_tracked_type(PropVariant, _propvariant_size)
@@ -11,7 +11,7 @@ from typing import Any, Iterator
 
 from comtypes import GUID, STDMETHOD, CoCreateInstanceEx, IUnknown
 
-from powc.core import ComResult, cotaskmem, cr, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 
 from .shellitemarray import IShellItemArray, ShellItemArray
 
@@ -71,7 +71,7 @@ class IDesktopWallpaper(IUnknown):
     __slots__ = ()
 
 
-class DesktopWallpaper:
+class DesktopWallpaper(ComWrapper):
     """デスクトップ壁紙の設定。IDesktopWallpaperのラッパーです。
 
     Examples:
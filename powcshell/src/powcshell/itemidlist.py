@@ -3,12 +3,12 @@
 主なクラスは :class:`ItemIDList` です。
 """
 
-from ctypes import POINTER, byref, c_int32, c_void_p
+from ctypes import POINTER, byref, c_int32, c_uint32, c_void_p
 from typing import Any
 
 from comtypes import IUnknown
 
-from powc.core import check_hresult, cotaskmem_free
+from powc.core import check_hresult, cotaskmem_free, register_tracked_type, release_on_exit, take_pointer
 
 from . import _shell32
 
@@ -16,11 +16,25 @@ from . import _shell32
 class ItemIDList(c_void_p):
     """アイテムIDリスト。"""
 
-    __slots__ = ()
+    # release_scopeは弱参照で登録するため、__slots__を定義しません（ctypes型は__weakref__をスロットにできません）。
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        release_on_exit(self)
 
     def __del__(self):
         cotaskmem_free(self)
 
+    def release(self) -> None:
+        """アイテムIDリストを解放します。"""
+        cotaskmem_free(take_pointer(self))
+
+    def __enter__(self) -> "ItemIDList":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
     @staticmethod
     def from_object(o: Any) -> "ItemIDList":
         x = ItemIDList()
@@ -32,3 +46,9 @@ _SHGetIDListFromObject = _shell32.SHGetIDListFromObject
 _SHGetIDListFromObject.argtypes = (POINTER(IUnknown), POINTER(ItemIDList))
 _SHGetIDListFromObject.restype = c_int32
 _SHGetIDListFromObject.restype = c_int32
+
+_ILGetSize = _shell32.ILGetSize
+_ILGetSize.argtypes = (c_void_p,)
+_ILGetSize.restype = c_uint32
+
+register_tracked_type(ItemIDList, lambda p: _ILGetSize(p) if p else 0)
@@ -19,7 +19,7 @@ from typing import Any, Sequence
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 
-from powc.core import ComResult, cotaskmem, cotaskmem_free, cr, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cotaskmem_free, cr, query_interface
 
 from .itemidlist import ItemIDList
 from .shellitem import IShellItem, ShellItem
@@ -175,7 +175,7 @@ class IKnownFolder(IUnknown):
     __slots__ = ()
 
 
-class KnownFolder:
+class KnownFolder(ComWrapper):
     """既知フォルダ。IKnownFolderインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -326,7 +326,7 @@ class IKnownFolderManager(IUnknown):
     __slots__ = ()
 
 
-class KnownFolderManager:
+class KnownFolderManager(ComWrapper):
     """既知フォルダマネージャ。IKnownFolderManagerインターフェイスのラッパーです。
 
     Examples:
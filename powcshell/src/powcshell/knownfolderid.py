@@ -1,151 +1,151 @@
 """既知のフォルダID。"""
 
-from comtypes import GUID
+from powc.guid import guid
 
 
 class KnownFolderID:
     """既知フォルダID定数。"""
 
-    NETWORK_FOLDER = GUID("{D20BEEC4-5CA8-4905-AE3B-BF251EA09B53}")
-    COMPUTER_FOLDER = GUID("{0AC0837C-BBF8-452A-850D-79D08E667CA7}")
-    INTERNET_FOLDER = GUID("{4D9F7874-4E0C-4904-967B-40B0D20C3E4B}")
-    CONTROL_PANEL_FOLDER = GUID("{82A74AEB-AEB4-465C-A014-D097EE346D63}")
-    PRINTERS_FOLDER = GUID("{76FC4E2D-D6AD-4519-A663-37BD56068185}")
-    SYNC_MANAGER_FOLDER = GUID("{43668BF8-C14E-49B2-97C9-747784D784B7}")
-    SYNC_SETUP_FOLDER = GUID("{0F214138-B1D3-4a90-BBA9-27CBC0C5389A}")
-    CONFLICT_FOLDER = GUID("{4bfefb45-347d-4006-a5be-ac0cb0567192}")
-    SYNC_RESULTS_FOLDER = GUID("{289a9a43-be44-4057-a41b-587a76d7e7f9}")
-    RECYCLE_BIN_FOLDER = GUID("{B7534046-3ECB-4C18-BE4E-64CD4CB7D6AC}")
-    CONNECTIONS_FOLDER = GUID("{6F0CD92B-2E97-45D1-88FF-B0D186B8DEDD}")
-    FONTS = GUID("{FD228CB7-AE11-4AE3-864C-16F3910AB8FE}")
-    DESKTOP = GUID("{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}")
-    STARTUP = GUID("{B97D20BB-F46A-4C97-BA10-5E3608430854}")
-    PROGRAMS = GUID("{A77F5D77-2E2B-44C3-A6A2-ABA601054A51}")
-    STARTMENU = GUID("{625B53C3-AB48-4EC1-BA1F-A1EF4146FC19}")
-    RECENT = GUID("{AE50C081-EBD2-438A-8655-8A092E34987A}")
-    SENDTO = GUID("{8983036C-27C0-404B-8F08-102D10DCFD74}")
-    DOCUMENTS = GUID("{FDD39AD0-238F-46AF-ADB4-6C85480369C7}")
-    FAVORITES = GUID("{1777F761-68AD-4D8A-87BD-30B759FA33DD}")
-    NETHOOD = GUID("{C5ABBF53-E17F-4121-8900-86626FC2C973}")
-    PRINTHOOD = GUID("{9274BD8D-CFD1-41C3-B35E-B13F55A758F4}")
-    TEMPLATES = GUID("{A63293E8-664E-48DB-A079-DF759E0509F7}")
-    COMMON_STARTUP = GUID("{82A5EA35-D9CD-47C5-9629-E15D2F714E6E}")
-    COMMON_PROGRAMS = GUID("{0139D44E-6AFE-49F2-8690-3DAFCAE6FFB8}")
-    COMMON_STARTMENU = GUID("{A4115719-D62E-491D-AA7C-E74B8BE3B067}")
-    PUBLIC_DESKTOP = GUID("{C4AA340D-F20F-4863-AFEF-F87EF2E6BA25}")
-    PROGRAMDATA = GUID("{62AB5D82-FDC1-4DC3-A9DD-070D1D495D97}")
-    COMMON_TEMPLATES = GUID("{B94237E7-57AC-4347-9151-B08C6C32D1F7}")
-    PUBLIC_DOCUMENTS = GUID("{ED4824AF-DCE4-45A8-81E2-FC7965083634}")
-    ROAMING_APPDATA = GUID("{3EB685DB-65F9-4CF6-A03A-E3EF65729F3D}")
-    LOCAL_APPDATA = GUID("{F1B32785-6FBA-4FCF-9D55-7B8E7F157091}")
-    LOCAL_APPDATA_LOW = GUID("{A520A1A4-1780-4FF6-BD18-167343C5AF16}")
-    INTERNETCACHE = GUID("{352481E8-33BE-4251-BA85-6007CAEDCF9D}")
-    COOKIES = GUID("{2B0F765D-C0E9-4171-908E-08A611B84FF6}")
-    HISTORY = GUID("{D9DC8A3B-B784-432E-A781-5A1130A75963}")
-    SYSTEM = GUID("{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}")
-    SYSTEMX86 = GUID("{D65231B0-B2F1-4857-A4CE-A8E7C6EA7D27}")
-    WINDOWS = GUID("{F38BF404-1D43-42F2-9305-67DE0B28FC23}")
-    PROFILE = GUID("{5E6C858F-0E22-4760-9AFE-EA3317B67173}")
-    PICTURES = GUID("{33E28130-4E1E-4676-835A-98395C3BC3BB}")
-    PROGRAMFILES_X86 = GUID("{7C5A40EF-A0FB-4BFC-874A-C0F2E0B9FA8E}")
-    PROGRAMFILES_COMMON_X86 = GUID("{DE974D24-D9C6-4D3E-BF91-F4455120B917}")
-    PROGRAMFILES_X64 = GUID("{6D809377-6AF0-444b-8957-A3773F02200E}")
-    PROGRAMFILES_COMMON_X64 = GUID("{6365D5A7-0F0D-45e5-87F6-0DA56B6A4F7D}")
-    PROGRAMFILES = GUID("{905e63b6-c1bf-494e-b29c-65b732d3d21a}")
-    PROGRAMFILES_COMMON = GUID("{F7F1ED05-9F6D-47A2-AAAE-29D317C6F066}")
-    USER_PROGRAMFILES = GUID("{5cd7aee2-2219-4a67-b85d-6c9ce15660cb}")
-    USER_PROGRAMFILES_COMMON = GUID("{bcbd3057-ca5c-4622-b42d-bc56db0ae516}")
-    ADMINTOOLS = GUID("{724EF170-A42D-4FEF-9F26-B60E846FBA4F}")
-    COMMON_ADMINTOOLS = GUID("{D0384E7D-BAC3-4797-8F14-CBA229B392B5}")
-    MUSIC = GUID("{4BD8D571-6D19-48D3-BE97-422220080E43}")
-    VIDEOS = GUID("{18989B1D-99B5-455B-841C-AB7C74E4DDFC}")
-    RINGTONES = GUID("{C870044B-F49E-4126-A9C3-B52A1FF411E8}")
-    PUBLIC_PICTURES = GUID("{B6EBFB86-6907-413C-9AF7-4FC2ABF07CC5}")
-    PUBLIC_MUSIC = GUID("{3214FAB5-9757-4298-BB61-92A9DEAA44FF}")
-    PUBLIC_VIDEOS = GUID("{2400183A-6185-49FB-A2D8-4A392A602BA3}")
-    PUBLIC_RINGTONES = GUID("{E555AB60-153B-4D17-9F04-A5FE99FC15EC}")
-    RESOURCE_DIR = GUID("{8AD10C31-2ADB-4296-A8F7-E4701232C972}")
-    LOCALIZED_RESOURCES_DIR = GUID("{2A00375E-224C-49DE-B8D1-440DF7EF3DDC}")
-    COMMON_OEMLINKS = GUID("{C1BAE2D0-10DF-4334-BEDD-7AA20B227A9D}")
-    CDBURNING = GUID("{9E52AB10-F80D-49DF-ACB8-4330F5687855}")
-    USER_PROFILES = GUID("{0762D272-C50A-4BB0-A382-697DCD729B80}")
-    PLAYLISTS = GUID("{DE92C1C7-837F-4F69-A3BB-86E631204A23}")
-    SAMPLE_PLAYLISTS = GUID("{15CA69B3-30EE-49C1-ACE1-6B5EC372AFB5}")
-    SAMPLE_MUSIC = GUID("{B250C668-F57D-4EE1-A63C-290EE7D1AA1F}")
-    SAMPLE_PICTURES = GUID("{C4900540-2379-4C75-844B-64E6FAF8716B}")
-    SAMPLE_VIDEOS = GUID("{859EAD94-2E85-48AD-A71A-0969CB56A6CD}")
-    PHOTOALBUMS = GUID("{69D2CF90-FC33-4FB7-9A0C-EBB0F0FCB43C}")
-    PUBLIC = GUID("{DFDF76A2-C82A-4D63-906A-5644AC457385}")
-    CHANGE_REMOVE_PROGRAMS = GUID("{df7266ac-9274-4867-8d55-3bd661de872d}")
-    APPUPDATES = GUID("{a305ce99-f527-492b-8b1a-7e76fa98d6e4}")
-    ADD_NEW_PROGRAMS = GUID("{de61d971-5ebc-4f02-a3a9-6c82895e5c04}")
-    DOWNLOADS = GUID("{374DE290-123F-4565-9164-39C4925E467B}")
-    PUBLIC_DOWNLOADS = GUID("{3D644C9B-1FB8-4f30-9B45-F670235F79C0}")
-    SAVED_SEARCHES = GUID("{7d1d3a04-debb-4115-95cf-2f29da2920da}")
-    QUICKLAUNCH = GUID("{52a4f021-7b75-48a9-9f6b-4b87a210bc8f}")
-    CONTACTS = GUID("{56784854-C6CB-462b-8169-88E350ACB882}")
-    SIDEBAR_PARTS = GUID("{A75D362E-50FC-4fb7-AC2C-A8BEAA314493}")
-    SIDEBAR_DEFAULT_PARTS = GUID("{7B396E54-9EC5-4300-BE0A-2482EBAE1A26}")
-    PUBLIC_GAMETASKS = GUID("{DEBF2536-E1A8-4c59-B6A2-414586476AEA}")
-    GAMETASKS = GUID("{054FAE61-4DD8-4787-80B6-090220C4B700}")
-    SAVED_GAMES = GUID("{4C5C32FF-BB9D-43b0-B5B4-2D72E54EAAA4}")
-    SEARCH_MAPI = GUID("{98ec0e18-2098-4d44-8644-66979315a281}")
-    SEARCH_CSC = GUID("{ee32e446-31ca-4aba-814f-a5ebd2fd6d5e}")
-    LINKS = GUID("{bfb9d5e0-c6a9-404c-b2b2-ae6db6af4968}")
-    USERS_FILES = GUID("{f3ce0f7c-4901-4acc-8648-d5d44b04ef8f}")
-    USERS_LIBRARIES = GUID("{A302545D-DEFF-464b-ABE8-61C8648D939B}")
-    SEARCHHOME = GUID("{190337d1-b8ca-4121-a639-6d472d16972a}")
-    ORIGINALIMAGES = GUID("{2C36C0AA-5812-4b87-BFD0-4CD0DFB19B39}")
-    DOCUMENTS_LIBRARY = GUID("{7b0db17d-9cd2-4a93-9733-46cc89022e7c}")
-    MUCIS_LIBRARY = GUID("{2112AB0A-C86A-4ffe-A368-0DE96E47012E}")
-    PICTURES_LIBRARY = GUID("{A990AE9F-A03B-4e80-94BC-9912D7504104}")
-    VIDEOS_LIBRARY = GUID("{491E922F-5643-4af4-A7EB-4E7A138D8174}")
-    RECORDEDTV_LIBRARY = GUID("{1A6FDBA2-F42D-4358-A798-B74D745926C5}")
-    HOMEGROUP = GUID("{52528A6B-B9E3-4add-B60D-588C2DBA842D}")
-    HOMEGROUP_CURRENTUSER = GUID("{9B74B6A3-0DFD-4f11-9E78-5F7800F2E772}")
-    DEVICEMETADATASTORE = GUID("{5CE4A5E9-E4EB-479D-B89F-130C02886155}")
-    LIBRARIES = GUID("{1B3EA5DC-B587-4786-B4EF-BD1DC332AEAE}")
-    PUBLIC_LIBRARIES = GUID("{48daf80b-e6cf-4f4e-b800-0e69d84ee384}")
-    USER_PINNED = GUID("{9e3995ab-1f9c-4f13-b827-48b24b6c7174}")
-    IMPLICIT_APPSHORTCUTS = GUID("{bcb5256f-79f6-4cee-b725-dc34e402fd46}")
-    ACCOUNTPICTURES = GUID("{008ca0b1-55b4-4c56-b8a8-4de4b299d3be}")
-    PUBLIC_USERTILES = GUID("{0482af6c-08f1-4c34-8c90-e17ec98b1e17}")
-    APPSFOLDER = GUID("{1e87508d-89c2-42f0-8a7e-645a0f50ca58}")
-    STARTMENU_ALLPROGRAMS = GUID("{F26305EF-6948-40B9-B255-81453D09C785}")
-    COMMON_STARTMENU_PLACES = GUID("{A440879F-87A0-4F7D-B700-0207B966194A}")
-    APPLICATION_SHORTCUTS = GUID("{A3918781-E5F2-4890-B3D9-A7E54332328C}")
-    ROAMINGTILES = GUID("{00BCFC5A-ED94-4e48-96A1-3F6217F21990}")
-    ROAMEDTILEIMAGES = GUID("{AAA8D5A5-F1D6-4259-BAA8-78E7EF60835E}")
-    SCREENSHOTS = GUID("{b7bede81-df94-4682-a7d8-57a52620b86f}")
-    CAMERAROLL = GUID("{AB5FB87B-7CE2-4F83-915D-550846C9537B}")
-    ONEDRIVE = GUID("{A52BBA46-E9E1-435f-B3D9-28DAA648C0F6}")
-    SKYDRIVE = GUID("{A52BBA46-E9E1-435f-B3D9-28DAA648C0F6}")
-    SKYDRIVE_DOCUMENTS = GUID("{24D89E24-2F19-4534-9DDE-6A6671FBB8FE}")
-    SKYDRIVE_PICTURES = GUID("{339719B5-8C47-4894-94C2-D8F77ADD44A6}")
-    SKYDRIVE_MUSIC = GUID("{C3F2459E-80D6-45DC-BFEF-1F769F2BE730}")
-    SKYDRIVE_CAMERAROLL = GUID("{767E6811-49CB-4273-87C2-20F355E1085B}")
-    SEARCH_HISTORY = GUID("{0D4C3DB6-03A3-462F-A0E6-08924C41B5D4}")
-    SEARCH_TEMPLATES = GUID("{7E636BFE-DFA9-4D5E-B456-D7B39851D8A9}")
-    CAMERAROLL_LIBRARY = GUID("{2B20DF75-1EDA-4039-8097-38798227D5B7}")
-    SAVED_PICTURES = GUID("{3B193882-D3AD-4eab-965A-69829D1FB59F}")
-    SAVES_PICTURES_LIBRARY = GUID("{E25B5812-BE88-4bd9-94B0-29233477B6C3}")
-    RETAILDEMO = GUID("{12D4C69E-24AD-4923-BE19-31321C43A767}")
-    DEVICE = GUID("{1C2AC1DC-4358-4B6C-9733-AF21156576F0}")
-    DEVELOPMENTFILES = GUID("{DBE8E08E-3053-4BBC-B183-2A7B2B191E59}")
-    OBJECTS3D = GUID("{31C0DD25-9439-4F12-BF41-7FF4EDA38722}")
-    APPCAPTURES = GUID("{EDC0FE71-98D8-4F4A-B920-C8DC133CB165}")
-    LOCAL_DOCUMENTS = GUID("{f42ee2d3-909f-4907-8871-4c22fc0bf756}")
-    LOCAL_PICTURES = GUID("{0ddd015d-b06c-45d5-8c4c-f59713854639}")
-    LOCAL_VIDEOS = GUID("{35286a68-3c57-41a1-bbb1-0eae73d76c95}")
-    LOCAL_MUSIC = GUID("{a0c69a99-21c8-4671-8703-7934162fcf1d}")
-    LOCAL_DOWNLOADS = GUID("{7d83ee9b-2244-4e70-b1f5-5393042af1e4}")
-    RECORDEDCALLS = GUID("{2f8b40c2-83ed-48ee-b383-a1f157ec6f9a}")
-    ALL_APPMODS = GUID("{7ad67899-66af-43ba-9156-6aad42e6c596}")
-    CURRENT_APPMODS = GUID("{3db40b20-2a30-4dbe-917e-771dd21dd099}")
-    APPDATA_DESKTOP = GUID("{B2C5E279-7ADD-439F-B28C-C41FE1BBF672}")
-    APPDATA_DOCUMENTS = GUID("{7BE16610-1F7F-44AC-BFF0-83E15F2FFCA1}")
-    APPDATA_FAVORITES = GUID("{7CFBEFBC-DE1F-45AA-B843-A542AC536CC9}")
-    APPDATA_PROGRAMDATA = GUID("{559D40A3-A036-40FA-AF61-84CB430A4D34}")
-    LOCAL_STORAGE = GUID("{B3EB08D3-A1F3-496B-865A-42B536CDA0EC}")
+    NETWORK_FOLDER = guid("{D20BEEC4-5CA8-4905-AE3B-BF251EA09B53}")
+    COMPUTER_FOLDER = guid("{0AC0837C-BBF8-452A-850D-79D08E667CA7}")
+    INTERNET_FOLDER = guid("{4D9F7874-4E0C-4904-967B-40B0D20C3E4B}")
+    CONTROL_PANEL_FOLDER = guid("{82A74AEB-AEB4-465C-A014-D097EE346D63}")
+    PRINTERS_FOLDER = guid("{76FC4E2D-D6AD-4519-A663-37BD56068185}")
+    SYNC_MANAGER_FOLDER = guid("{43668BF8-C14E-49B2-97C9-747784D784B7}")
+    SYNC_SETUP_FOLDER = guid("{0F214138-B1D3-4a90-BBA9-27CBC0C5389A}")
+    CONFLICT_FOLDER = guid("{4bfefb45-347d-4006-a5be-ac0cb0567192}")
+    SYNC_RESULTS_FOLDER = guid("{289a9a43-be44-4057-a41b-587a76d7e7f9}")
+    RECYCLE_BIN_FOLDER = guid("{B7534046-3ECB-4C18-BE4E-64CD4CB7D6AC}")
+    CONNECTIONS_FOLDER = guid("{6F0CD92B-2E97-45D1-88FF-B0D186B8DEDD}")
+    FONTS = guid("{FD228CB7-AE11-4AE3-864C-16F3910AB8FE}")
+    DESKTOP = guid("{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}")
+    STARTUP = guid("{B97D20BB-F46A-4C97-BA10-5E3608430854}")
+    PROGRAMS = guid("{A77F5D77-2E2B-44C3-A6A2-ABA601054A51}")
+    STARTMENU = guid("{625B53C3-AB48-4EC1-BA1F-A1EF4146FC19}")
+    RECENT = guid("{AE50C081-EBD2-438A-8655-8A092E34987A}")
+    SENDTO = guid("{8983036C-27C0-404B-8F08-102D10DCFD74}")
+    DOCUMENTS = guid("{FDD39AD0-238F-46AF-ADB4-6C85480369C7}")
+    FAVORITES = guid("{1777F761-68AD-4D8A-87BD-30B759FA33DD}")
+    NETHOOD = guid("{C5ABBF53-E17F-4121-8900-86626FC2C973}")
+    PRINTHOOD = guid("{9274BD8D-CFD1-41C3-B35E-B13F55A758F4}")
+    TEMPLATES = guid("{A63293E8-664E-48DB-A079-DF759E0509F7}")
+    COMMON_STARTUP = guid("{82A5EA35-D9CD-47C5-9629-E15D2F714E6E}")
+    COMMON_PROGRAMS = guid("{0139D44E-6AFE-49F2-8690-3DAFCAE6FFB8}")
+    COMMON_STARTMENU = guid("{A4115719-D62E-491D-AA7C-E74B8BE3B067}")
+    PUBLIC_DESKTOP = guid("{C4AA340D-F20F-4863-AFEF-F87EF2E6BA25}")
+    PROGRAMDATA = guid("{62AB5D82-FDC1-4DC3-A9DD-070D1D495D97}")
+    COMMON_TEMPLATES = guid("{B94237E7-57AC-4347-9151-B08C6C32D1F7}")
+    PUBLIC_DOCUMENTS = guid("{ED4824AF-DCE4-45A8-81E2-FC7965083634}")
+    ROAMING_APPDATA = guid("{3EB685DB-65F9-4CF6-A03A-E3EF65729F3D}")
+    LOCAL_APPDATA = guid("{F1B32785-6FBA-4FCF-9D55-7B8E7F157091}")
+    LOCAL_APPDATA_LOW = guid("{A520A1A4-1780-4FF6-BD18-167343C5AF16}")
+    INTERNETCACHE = guid("{352481E8-33BE-4251-BA85-6007CAEDCF9D}")
+    COOKIES = guid("{2B0F765D-C0E9-4171-908E-08A611B84FF6}")
+    HISTORY = guid("{D9DC8A3B-B784-432E-A781-5A1130A75963}")
+    SYSTEM = guid("{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}")
+    SYSTEMX86 = guid("{D65231B0-B2F1-4857-A4CE-A8E7C6EA7D27}")
+    WINDOWS = guid("{F38BF404-1D43-42F2-9305-67DE0B28FC23}")
+    PROFILE = guid("{5E6C858F-0E22-4760-9AFE-EA3317B67173}")
+    PICTURES = guid("{33E28130-4E1E-4676-835A-98395C3BC3BB}")
+    PROGRAMFILES_X86 = guid("{7C5A40EF-A0FB-4BFC-874A-C0F2E0B9FA8E}")
+    PROGRAMFILES_COMMON_X86 = guid("{DE974D24-D9C6-4D3E-BF91-F4455120B917}")
+    PROGRAMFILES_X64 = guid("{6D809377-6AF0-444b-8957-A3773F02200E}")
+    PROGRAMFILES_COMMON_X64 = guid("{6365D5A7-0F0D-45e5-87F6-0DA56B6A4F7D}")
+    PROGRAMFILES = guid("{905e63b6-c1bf-494e-b29c-65b732d3d21a}")
+    PROGRAMFILES_COMMON = guid("{F7F1ED05-9F6D-47A2-AAAE-29D317C6F066}")
+    USER_PROGRAMFILES = guid("{5cd7aee2-2219-4a67-b85d-6c9ce15660cb}")
+    USER_PROGRAMFILES_COMMON = guid("{bcbd3057-ca5c-4622-b42d-bc56db0ae516}")
+    ADMINTOOLS = guid("{724EF170-A42D-4FEF-9F26-B60E846FBA4F}")
+    COMMON_ADMINTOOLS = guid("{D0384E7D-BAC3-4797-8F14-CBA229B392B5}")
+    MUSIC = guid("{4BD8D571-6D19-48D3-BE97-422220080E43}")
+    VIDEOS = guid("{18989B1D-99B5-455B-841C-AB7C74E4DDFC}")
+    RINGTONES = guid("{C870044B-F49E-4126-A9C3-B52A1FF411E8}")
+    PUBLIC_PICTURES = guid("{B6EBFB86-6907-413C-9AF7-4FC2ABF07CC5}")
+    PUBLIC_MUSIC = guid("{3214FAB5-9757-4298-BB61-92A9DEAA44FF}")
+    PUBLIC_VIDEOS = guid("{2400183A-6185-49FB-A2D8-4A392A602BA3}")
+    PUBLIC_RINGTONES = guid("{E555AB60-153B-4D17-9F04-A5FE99FC15EC}")
+    RESOURCE_DIR = guid("{8AD10C31-2ADB-4296-A8F7-E4701232C972}")
+    LOCALIZED_RESOURCES_DIR = guid("{2A00375E-224C-49DE-B8D1-440DF7EF3DDC}")
+    COMMON_OEMLINKS = guid("{C1BAE2D0-10DF-4334-BEDD-7AA20B227A9D}")
+    CDBURNING = guid("{9E52AB10-F80D-49DF-ACB8-4330F5687855}")
+    USER_PROFILES = guid("{0762D272-C50A-4BB0-A382-697DCD729B80}")
+    PLAYLISTS = guid("{DE92C1C7-837F-4F69-A3BB-86E631204A23}")
+    SAMPLE_PLAYLISTS = guid("{15CA69B3-30EE-49C1-ACE1-6B5EC372AFB5}")
+    SAMPLE_MUSIC = guid("{B250C668-F57D-4EE1-A63C-290EE7D1AA1F}")
+    SAMPLE_PICTURES = guid("{C4900540-2379-4C75-844B-64E6FAF8716B}")
+    SAMPLE_VIDEOS = guid("{859EAD94-2E85-48AD-A71A-0969CB56A6CD}")
+    PHOTOALBUMS = guid("{69D2CF90-FC33-4FB7-9A0C-EBB0F0FCB43C}")
+    PUBLIC = guid("{DFDF76A2-C82A-4D63-906A-5644AC457385}")
+    CHANGE_REMOVE_PROGRAMS = guid("{df7266ac-9274-4867-8d55-3bd661de872d}")
+    APPUPDATES = guid("{a305ce99-f527-492b-8b1a-7e76fa98d6e4}")
+    ADD_NEW_PROGRAMS = guid("{de61d971-5ebc-4f02-a3a9-6c82895e5c04}")
+    DOWNLOADS = guid("{374DE290-123F-4565-9164-39C4925E467B}")
+    PUBLIC_DOWNLOADS = guid("{3D644C9B-1FB8-4f30-9B45-F670235F79C0}")
+    SAVED_SEARCHES = guid("{7d1d3a04-debb-4115-95cf-2f29da2920da}")
+    QUICKLAUNCH = guid("{52a4f021-7b75-48a9-9f6b-4b87a210bc8f}")
+    CONTACTS = guid("{56784854-C6CB-462b-8169-88E350ACB882}")
+    SIDEBAR_PARTS = guid("{A75D362E-50FC-4fb7-AC2C-A8BEAA314493}")
+    SIDEBAR_DEFAULT_PARTS = guid("{7B396E54-9EC5-4300-BE0A-2482EBAE1A26}")
+    PUBLIC_GAMETASKS = guid("{DEBF2536-E1A8-4c59-B6A2-414586476AEA}")
+    GAMETASKS = guid("{054FAE61-4DD8-4787-80B6-090220C4B700}")
+    SAVED_GAMES = guid("{4C5C32FF-BB9D-43b0-B5B4-2D72E54EAAA4}")
+    SEARCH_MAPI = guid("{98ec0e18-2098-4d44-8644-66979315a281}")
+    SEARCH_CSC = guid("{ee32e446-31ca-4aba-814f-a5ebd2fd6d5e}")
+    LINKS = guid("{bfb9d5e0-c6a9-404c-b2b2-ae6db6af4968}")
+    USERS_FILES = guid("{f3ce0f7c-4901-4acc-8648-d5d44b04ef8f}")
+    USERS_LIBRARIES = guid("{A302545D-DEFF-464b-ABE8-61C8648D939B}")
+    SEARCHHOME = guid("{190337d1-b8ca-4121-a639-6d472d16972a}")
+    ORIGINALIMAGES = guid("{2C36C0AA-5812-4b87-BFD0-4CD0DFB19B39}")
+    DOCUMENTS_LIBRARY = guid("{7b0db17d-9cd2-4a93-9733-46cc89022e7c}")
+    MUCIS_LIBRARY = guid("{2112AB0A-C86A-4ffe-A368-0DE96E47012E}")
+    PICTURES_LIBRARY = guid("{A990AE9F-A03B-4e80-94BC-9912D7504104}")
+    VIDEOS_LIBRARY = guid("{491E922F-5643-4af4-A7EB-4E7A138D8174}")
+    RECORDEDTV_LIBRARY = guid("{1A6FDBA2-F42D-4358-A798-B74D745926C5}")
+    HOMEGROUP = guid("{52528A6B-B9E3-4add-B60D-588C2DBA842D}")
+    HOMEGROUP_CURRENTUSER = guid("{9B74B6A3-0DFD-4f11-9E78-5F7800F2E772}")
+    DEVICEMETADATASTORE = guid("{5CE4A5E9-E4EB-479D-B89F-130C02886155}")
+    LIBRARIES = guid("{1B3EA5DC-B587-4786-B4EF-BD1DC332AEAE}")
+    PUBLIC_LIBRARIES = guid("{48daf80b-e6cf-4f4e-b800-0e69d84ee384}")
+    USER_PINNED = guid("{9e3995ab-1f9c-4f13-b827-48b24b6c7174}")
+    IMPLICIT_APPSHORTCUTS = guid("{bcb5256f-79f6-4cee-b725-dc34e402fd46}")
+    ACCOUNTPICTURES = guid("{008ca0b1-55b4-4c56-b8a8-4de4b299d3be}")
+    PUBLIC_USERTILES = guid("{0482af6c-08f1-4c34-8c90-e17ec98b1e17}")
+    APPSFOLDER = guid("{1e87508d-89c2-42f0-8a7e-645a0f50ca58}")
+    STARTMENU_ALLPROGRAMS = guid("{F26305EF-6948-40B9-B255-81453D09C785}")
+    COMMON_STARTMENU_PLACES = guid("{A440879F-87A0-4F7D-B700-0207B966194A}")
+    APPLICATION_SHORTCUTS = guid("{A3918781-E5F2-4890-B3D9-A7E54332328C}")
+    ROAMINGTILES = guid("{00BCFC5A-ED94-4e48-96A1-3F6217F21990}")
+    ROAMEDTILEIMAGES = guid("{AAA8D5A5-F1D6-4259-BAA8-78E7EF60835E}")
+    SCREENSHOTS = guid("{b7bede81-df94-4682-a7d8-57a52620b86f}")
+    CAMERAROLL = guid("{AB5FB87B-7CE2-4F83-915D-550846C9537B}")
+    ONEDRIVE = guid("{A52BBA46-E9E1-435f-B3D9-28DAA648C0F6}")
+    SKYDRIVE = guid("{A52BBA46-E9E1-435f-B3D9-28DAA648C0F6}")
+    SKYDRIVE_DOCUMENTS = guid("{24D89E24-2F19-4534-9DDE-6A6671FBB8FE}")
+    SKYDRIVE_PICTURES = guid("{339719B5-8C47-4894-94C2-D8F77ADD44A6}")
+    SKYDRIVE_MUSIC = guid("{C3F2459E-80D6-45DC-BFEF-1F769F2BE730}")
+    SKYDRIVE_CAMERAROLL = guid("{767E6811-49CB-4273-87C2-20F355E1085B}")
+    SEARCH_HISTORY = guid("{0D4C3DB6-03A3-462F-A0E6-08924C41B5D4}")
+    SEARCH_TEMPLATES = guid("{7E636BFE-DFA9-4D5E-B456-D7B39851D8A9}")
+    CAMERAROLL_LIBRARY = guid("{2B20DF75-1EDA-4039-8097-38798227D5B7}")
+    SAVED_PICTURES = guid("{3B193882-D3AD-4eab-965A-69829D1FB59F}")
+    SAVES_PICTURES_LIBRARY = guid("{E25B5812-BE88-4bd9-94B0-29233477B6C3}")
+    RETAILDEMO = guid("{12D4C69E-24AD-4923-BE19-31321C43A767}")
+    DEVICE = guid("{1C2AC1DC-4358-4B6C-9733-AF21156576F0}")
+    DEVELOPMENTFILES = guid("{DBE8E08E-3053-4BBC-B183-2A7B2B191E59}")
+    OBJECTS3D = guid("{31C0DD25-9439-4F12-BF41-7FF4EDA38722}")
+    APPCAPTURES = guid("{EDC0FE71-98D8-4F4A-B920-C8DC133CB165}")
+    LOCAL_DOCUMENTS = guid("{f42ee2d3-909f-4907-8871-4c22fc0bf756}")
+    LOCAL_PICTURES = guid("{0ddd015d-b06c-45d5-8c4c-f59713854639}")
+    LOCAL_VIDEOS = guid("{35286a68-3c57-41a1-bbb1-0eae73d76c95}")
+    LOCAL_MUSIC = guid("{a0c69a99-21c8-4671-8703-7934162fcf1d}")
+    LOCAL_DOWNLOADS = guid("{7d83ee9b-2244-4e70-b1f5-5393042af1e4}")
+    RECORDEDCALLS = guid("{2f8b40c2-83ed-48ee-b383-a1f157ec6f9a}")
+    ALL_APPMODS = guid("{7ad67899-66af-43ba-9156-6aad42e6c596}")
+    CURRENT_APPMODS = guid("{3db40b20-2a30-4dbe-917e-771dd21dd099}")
+    APPDATA_DESKTOP = guid("{B2C5E279-7ADD-439F-B28C-C41FE1BBF672}")
+    APPDATA_DOCUMENTS = guid("{7BE16610-1F7F-44AC-BFF0-83E15F2FFCA1}")
+    APPDATA_FAVORITES = guid("{7CFBEFBC-DE1F-45AA-B843-A542AC536CC9}")
+    APPDATA_PROGRAMDATA = guid("{559D40A3-A036-40FA-AF61-84CB430A4D34}")
+    LOCAL_STORAGE = guid("{B3EB08D3-A1F3-496B-865A-42B536CDA0EC}")
 
     __slots__ = ()
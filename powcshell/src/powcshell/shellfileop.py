@@ -10,7 +10,7 @@ from typing import Any
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, COMObject, IUnknown, hresult
 
-from powc.core import ComResult, cr, query_interface
+from powc.core import ComResult, ComWrapper, cr, query_interface
 from powcpropsys.propchange import PropertyChangeArray
 from powcshell.shellitemarray import ShellItemArray, ShellItemAttributeFlag
 from powcshell.shellitemenum import EnumShellItems
@@ -394,7 +394,7 @@ class _ShellFileOperationProgressSink(COMObject):
         return hresult.S_OK
 
 
-class ShellFileOperation:
+class ShellFileOperation(ComWrapper):
     """シェルのファイル操作。IShellItemインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
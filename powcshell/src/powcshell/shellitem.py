@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, Iterator
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, cotaskmem, cr, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 from powc.stream import ComStream, IStream
 
 from . import _shell32
@@ -115,7 +115,7 @@ IShellItem._methods_ = [
 from .shellitemenum import EnumShellItems, IEnumShellItems  # isort: skip  # noqa: E402
 
 
-class ShellItem:
+class ShellItem(ComWrapper):
     """シェル項目。IShellItemインターフェイスのラッパーです。"""
 
     __o: Any  # POINTER(IShellItem)
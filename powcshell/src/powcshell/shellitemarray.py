@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Iterator, Sequence, overload
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, check_hresult, cr, query_interface
+from powc.core import ComResult, ComWrapper, check_hresult, cr, query_interface
 from powcpropsys.propdesc import IPropertyDescriptionList, PropertyDescriptionList
 from powcpropsys.propkey import PropertyKey
 from powcpropsys.propstore import GetPropertyStoreFlag, IPropertyStore, PropertyStore
@@ -50,7 +50,7 @@ class IShellItemArray(IUnknown):
     __slots__ = ()
 
 
-class ShellItemArray:
+class ShellItemArray(ComWrapper):
     """
     シェル項目配列。IShellItemArrayインターフェイスのラッパーです。
     """
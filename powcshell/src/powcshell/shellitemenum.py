@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from comtypes import GUID, STDMETHOD, IUnknown
 
-from powc.core import ComResult, check_hresult, cr, query_interface
+from powc.core import ComResult, ComWrapper, check_hresult, cr, query_interface
 
 from .shellitem import IShellItem
 
@@ -34,7 +34,7 @@ IEnumShellItems._methods_ = [
 ]
 
 
-class EnumShellItems:
+class EnumShellItems(ComWrapper):
     """IEnumShellItemsインターフェイスのラッパーです。IShellItemを列挙します。"""
 
     __o: Any  # IEnumShellItems
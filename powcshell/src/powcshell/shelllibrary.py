@@ -10,7 +10,7 @@ from typing import Any
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 
-from powc.core import ComResult, cotaskmem, cr, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cr, query_interface
 from powc.stream import StorageMode
 
 from .knownfolderid import KnownFolderID
@@ -75,7 +75,7 @@ class IShellLibrary(IUnknown):
     __slots__ = ()
 
 
-class ShellLibrary:
+class ShellLibrary(ComWrapper):
     """シェルライブラリ。IShellLibraryインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
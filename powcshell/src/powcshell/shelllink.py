@@ -18,7 +18,7 @@ from typing import Any, Final
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 
-from powc.core import ComResult, check_hresult, cr, query_interface
+from powc.core import ComResult, ComWrapper, check_hresult, cr, query_interface
 from powc.persist import PersistFile, PersistStream
 from powc.stream import ComStream, StorageMode
 
@@ -78,7 +78,7 @@ class ShellLinkResolve(IntFlag):
     NO_OBJECT_ID = 0x2000
 
 
-class ShellLink:
+class ShellLink(ComWrapper):
     """ショートカット(.lnk)。IShellLinkWのラッパーです。
 
     Examples:
@@ -18,7 +18,7 @@ from typing import Any
 
 from comtypes import GUID, STDMETHOD, CoCreateInstance, IUnknown
 
-from powc.core import ComResult, cotaskmem, cr, guid_from_define, query_interface
+from powc.core import ComResult, ComWrapper, cotaskmem, cr, guid_from_define, query_interface
 from powc.persist import PersistFile, PersistStream
 from powc.stream import ComStream, StorageMode
 
@@ -60,7 +60,7 @@ class IUniformResourceLocatorW(IUnknown):
     __slots__ = ()
 
 
-class UniformResourceLocator:
+class UniformResourceLocator(ComWrapper):
     """インターネットショートカット。IUniformResourceLocatorWのラッパーです。
 
     Examples:
@@ -1,18 +1,23 @@
 """WMI。 :class:`WBEMLocator` 経由で :class:`WBEMServices` を取得した後、
 WMIクラスやインスタンスの情報を取得できます。"""
 
+import re
+from collections.abc import Mapping
 from csv import Error
-from ctypes import POINTER, WinDLL, byref, c_int32, c_uint32, c_void_p
+from ctypes import POINTER, WinDLL, byref, c_int32, c_uint32, c_void_p, cast
 from dataclasses import dataclass
 from enum import IntEnum, IntFlag
-from typing import Any, Iterator, Literal, NamedTuple, OrderedDict
+from threading import Condition
+from typing import Any, Callable, Hashable, Iterable, Iterator, Literal, NamedTuple, OrderedDict, Sequence
 
 from comtypes import BSTR, GUID, CoCreateInstance
+from comtypes.hresult import E_NOINTERFACE, S_OK
 from powc.comsec import com_init_security, com_set_securityblanket
-from powc.core import ComResult, check_hresult, cr, query_interface
+from powc.core import ComResult, ComWrapper, check_hresult, cr, query_interface
 from powc.safearray import SafeArrayPtr
 from powc.variant import Variant
 
+from .cimtype import CimType
 from .comtypes import *
 from .wbemflags import *
 from .wbemstatus import *
@@ -69,30 +74,6 @@ class WBEMFlavor(IntFlag):
     MASK_AMENDED = 0x80
 
 
-class CimType(IntFlag):
-    """CIMTYPE_ENUMERATION"""
-
-    ILLEGAL = 0xFFF
-    EMPTY = 0
-    SINT8 = 16
-    UINT8 = 17
-    SINT16 = 2
-    UINT16 = 18
-    SINT32 = 3
-    UINT32 = 19
-    SINT64 = 20
-    UINT64 = 21
-    REAL32 = 4
-    REAL64 = 5
-    BOOLEAN = 11
-    STRING = 8
-    DATETIME = 101
-    REFERENCE = 102
-    CHAR16 = 103
-    OBJECT = 13
-    ARRAY = 0x2000
-
-
 class WBEMStatusFormat(IntEnum):
     """WBEMSTATUS_FORMAT"""
 
@@ -128,7 +109,7 @@ class WMIObjectText(IntEnum):
     WMI_DTD_2_0 = 2
 
 
-class WBEMLocator:
+class WBEMLocator(ComWrapper):
     """WBEMロケーター。IWbemLocatorインターフェイスのラッパーです。
 
     :func:`connect_server` で :class:`WBEMServices` を作成できます。
@@ -183,8 +164,21 @@ class WBEMLocator:
         return self.connect_server_nothrow(network_resource, user, password, locale, waits_max, authority).value
 
 
-# TODO: async系メソッドの追加
-class WBEMServices:
+def _set_blanket(hr: int, proxy: Any) -> int:
+    """呼び出しが成功して取得したプロキシにセキュリティブランケットを設定します。hrをそのまま返します。
+
+    NULLや、プロキシではない（プロセス内の）オブジェクトには設定しません。
+    """
+    if hr >= 0 and proxy:
+        try:
+            com_set_securityblanket(proxy)
+        except OSError as e:
+            if e.winerror != E_NOINTERFACE:
+                raise
+    return hr
+
+
+class WBEMServices(ComWrapper):
     """WBEMサービス。IWbemServicesインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -192,7 +186,7 @@ class WBEMServices:
 
     def __init__(self, o: Any) -> None:
         self.__o = query_interface(o, IWbemServices)
-        com_set_securityblanket(self.wrapped_obj)
+        _set_blanket(0, self.__o)
 
     @property
     def wrapped_obj(self) -> c_void_p:
@@ -283,7 +277,8 @@ class WBEMServices:
             | (WBEM_FLAG_FORWARD_ONLY if forward_only else WBEM_FLAG_BIDIRECTIONAL)
         )
         x = POINTER(IEnumWbemClassObject)()
-        return cr(self.__o.CreateClassEnum(superclass, flags, None, byref(x)), WBEMClassObjectEnumerator(x))
+        hr = _set_blanket(self.__o.CreateClassEnum(superclass, flags, None, byref(x)), x)
+        return cr(hr, WBEMClassObjectEnumerator(x))
 
     def create_classenum(
         self,
@@ -338,7 +333,8 @@ class WBEMServices:
             | (WBEM_FLAG_DIRECT_READ if direct_read else 0)
         )
         x = POINTER(IEnumWbemClassObject)()
-        return cr(self.__o.CreateInstanceEnum(filter, flags, None, byref(x)), WBEMClassObjectEnumerator(x))
+        hr = _set_blanket(self.__o.CreateInstanceEnum(filter, flags, None, byref(x)), x)
+        return cr(hr, WBEMClassObjectEnumerator(x))
 
     def create_instanceenum(
         self,
@@ -360,16 +356,33 @@ class WBEMServices:
         direct_read: bool = False,
         ensures_locatable: bool = False,
         prototype: bool = False,
+        batch_size: int = 1,
+        semisync: bool = False,
+        timeout: int = WBEMTimeout.INFINITE,
     ) -> "ComResult[WBEMClassObjectEnumerator]":
+        """WQLクエリを実行します。
+
+        Args:
+            batch_size (int, optional): 列挙子の1回のNextで取得するオブジェクト数。
+                リモートの名前空間では1オブジェクトごとのラウンドトリップを削減できます。
+            semisync (bool, optional): 真の場合はWBEM_FLAG_RETURN_IMMEDIATELYを指定して半同期で実行します。
+                結果を待たずに列挙子を返し、列挙と並行して結果が送られます。
+            timeout (int, optional): 列挙子の1回のNextの待ち時間（ミリ秒）。
+                タイムアウトした場合は取得済みのオブジェクトを返して列挙を続けます。
+        """
         flags = (
             (WBEM_FLAG_USE_AMENDED_QUALIFIERS if uses_amended_qualifiers else 0)
             | (WBEM_FLAG_FORWARD_ONLY if forward_only else WBEM_FLAG_BIDIRECTIONAL)
             | (WBEM_FLAG_DIRECT_READ if direct_read else 0)
             | (WBEM_FLAG_ENSURE_LOCATABLE if ensures_locatable else 0)
             | (WBEM_FLAG_PROTOTYPE if prototype else 0)
+            | (WBEM_FLAG_RETURN_IMMEDIATELY if semisync else 0)
         )
         x = POINTER(IEnumWbemClassObject)()
-        return cr(self.__o.ExecQuery("WQL", query, flags, None, byref(x)), WBEMClassObjectEnumerator(x))
+        return cr(
+            _set_blanket(self.__o.ExecQuery("WQL", query, flags, None, byref(x)), x),
+            WBEMClassObjectEnumerator(x, timeout, batch_size),
+        )
 
     def exec_query(
         self,
@@ -379,7 +392,24 @@ class WBEMServices:
         direct_read: bool = False,
         ensures_locatable: bool = False,
         prototype: bool = False,
+        batch_size: int = 1,
+        semisync: bool = False,
+        timeout: int = WBEMTimeout.INFINITE,
     ) -> "WBEMClassObjectEnumerator":
+        """WQLクエリを実行します。
+
+        Args:
+            batch_size (int, optional): 列挙子の1回のNextで取得するオブジェクト数。
+                リモートの名前空間では1オブジェクトごとのラウンドトリップを削減できます。
+            semisync (bool, optional): 真の場合はWBEM_FLAG_RETURN_IMMEDIATELYを指定して半同期で実行します。
+                結果を待たずに列挙子を返し、列挙と並行して結果が送られます。
+            timeout (int, optional): 列挙子の1回のNextの待ち時間（ミリ秒）。
+                タイムアウトした場合は取得済みのオブジェクトを返して列挙を続けます。
+
+        Examples:
+            >>> for obj in services.exec_query("SELECT * FROM Win32_Process", batch_size=256, semisync=True):
+            >>>     print(obj.get("Name").value)
+        """
         return self.exec_query_nothrow(
             query,
             uses_amended_qualifiers,
@@ -387,13 +417,47 @@ class WBEMServices:
             direct_read,
             ensures_locatable,
             prototype,
+            batch_size,
+            semisync,
+            timeout,
         ).value
 
+    def query_table(
+        self,
+        query: str,
+        columns: Sequence[str] | None = None,
+        batch_size: int = 256,
+        types: "Mapping[str, CimType] | None" = None,
+    ) -> "WBEMTable":
+        """WQLクエリの結果を列形式で取得します。
+
+        オブジェクトを列挙しながら指定したプロパティを列ごとの配列に格納するため、
+        結果の行数に比例したPythonオブジェクト（辞書やVariant）を作成しません。
+        列の型は最初のオブジェクトのCIM型から1回だけ決定します。
+        columnsを指定した場合、"SELECT * FROM"のクエリは取得するプロパティのみを選択するクエリに書き換えます。
+        プロバイダーが他のプロパティを計算せず、転送量も減ります。
+
+        Args:
+            columns (Sequence[str] | None, optional): 取得するプロパティ名。省略時は最初のオブジェクトの非システムプロパティ全てです。
+            batch_size (int, optional): 列挙子の1回のNextで取得するオブジェクト数。
+            types (Mapping[str, CimType] | None, optional): 列のCIM型。
+                :attr:`powcwmi.schema.WBEMClassSchema.types` を渡すと、最初のオブジェクトで型を取得しません。
+                結果が空の場合も、型を指定した列は同じ型の空の列になります。columnsの省略時はtypesの全ての列です。
+
+        Examples:
+            >>> t = services.query_table("SELECT Name, Size FROM Win32_LogicalDisk", ("Name", "Size"))
+            >>> numpy.frombuffer(t.columns["Size"], dtype=numpy.uint64)
+        """
+        return _query_table(self, query, columns, batch_size, types)
+
     def exec_notificationquery_nothrow(self, query: str) -> ComResult["WBEMClassObjectEnumerator"]:
         x = POINTER(IEnumWbemClassObject)()
         return cr(
-            self.__o.ExecNotificationQuery(
-                "WQL", query, WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY, None, byref(x)
+            _set_blanket(
+                self.__o.ExecNotificationQuery(
+                    "WQL", query, WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY, None, byref(x)
+                ),
+                x,
             ),
             WBEMClassObjectEnumerator(x),
         )
@@ -401,6 +465,63 @@ class WBEMServices:
     def exec_notificationquery(self, query: str) -> "WBEMClassObjectEnumerator":
         return self.exec_notificationquery_nothrow(query).value
 
+    def exec_notificationquery_async_nothrow(
+        self,
+        query: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+    ) -> "ComResult[WBEMAsyncCall]":
+        """イベントのWQLクエリを非同期で実行します。イベントは :meth:`WBEMAsyncCall.cancel` まで通知されます。
+
+        引数とアパートメントの注意は :meth:`exec_query_async_nothrow` と同じです。
+        """
+        call = WBEMAsyncCall(self, callback, on_complete, maxsize)
+        return cr(self.__o.ExecNotificationQueryAsync("WQL", query, 0, None, call.sink), call)
+
+    def exec_notificationquery_async(
+        self,
+        query: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+    ) -> "WBEMAsyncCall":
+        """イベントのWQLクエリを非同期で実行します。イベントは :meth:`WBEMAsyncCall.cancel` まで通知されます。
+
+        引数とアパートメントの注意は :meth:`exec_query_async_nothrow` と同じです。
+        """
+        return self.exec_notificationquery_async_nothrow(query, callback, on_complete, maxsize).value
+
+    def cached_query(
+        self,
+        query: str,
+        ttl: float = 60.0,
+        invalidate_within: float | None = None,
+        cache: "WBEMQueryCache | None" = None,
+        connection: Hashable | None = None,
+    ) -> "tuple[Mapping[str, Any], ...]":
+        """WQLクエリの結果をキャッシュして返します。
+
+        同じ名前空間・同じクエリの結果はttl秒間共有され、プロバイダーを呼び出しません。
+        接続（プロキシ）が異なっても、同じ名前空間であれば結果を共有します。
+        各行はプロパティ名からPythonの値への変更不可のMappingです。
+
+        Args:
+            ttl (float, optional): 結果を保持する秒数。
+            invalidate_within (float | None, optional): 指定した場合、クエリ対象のクラスのインスタンスの作成・削除・変更を
+                この秒数の間隔（WITHIN）で監視して、変更があればttlより前に破棄します。
+                監視はクエリの前に開始して、クエリの実行中に変更があった場合は結果をキャッシュしません。
+            cache (WBEMQueryCache | None, optional): 使用するキャッシュ。省略時は共有のキャッシュです。
+            connection (Hashable | None, optional): 結果を共有する接続の識別子
+                （例: :meth:`powcwmi.pool.WBEMConnectionPool.make_key` の戻り値）。省略時は名前空間のパスです。
+                資格情報ごとに結果を分ける場合に指定します。
+
+        Examples:
+            >>> for disk in services.cached_query("SELECT * FROM Win32_LogicalDisk", ttl=30, invalidate_within=5):
+            >>>     print(disk["DeviceID"], disk["FreeSpace"])
+        """
+        return (cache or _shared_query_cache).get(self, query, ttl, invalidate_within, connection)
+
     def exec_method_nothrow(
         self, path: str, methodname: str, inparams: "WBEMClassObject"
     ) -> ComResult["WBEMClassObject"]:
@@ -412,47 +533,339 @@ class WBEMServices:
     def exec_method(self, path: str, methodname: str, inparams: "WBEMClassObject") -> "WBEMClassObject":
         return self.exec_method_nothrow(path, methodname, inparams).value
 
+    def exec_query_async_nothrow(
+        self,
+        query: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+        uses_amended_qualifiers: bool = True,
+        ensures_locatable: bool = False,
+        prototype: bool = False,
+    ) -> "ComResult[WBEMAsyncCall]":
+        """WQLクエリを非同期で実行します。結果は :class:`WBEMAsyncCall` で受け取ります。
+
+        MTAのスレッドから呼び出した場合、結果はWMIのスレッドから通知されます。
+        STA（comtypesをインポートしたスレッドの既定）から呼び出した場合、結果はそのスレッドのメッセージで届くため、
+        そのスレッドがメッセージを処理するまで通知されません。
+        :class:`WBEMAsyncCall` のfor文・async for文・wait()はメッセージを処理しながら待機しますが、
+        コールバックのみを使用する場合や他のスレッドで結果を取り出す場合は、呼び出したスレッドでメッセージを処理してください。
+
+        Args:
+            callback (Callable[[list[WBEMClassObject]], None] | None, optional):
+                結果の一括通知（IWbemObjectSink::Indicate）ごとに呼び出す関数。
+                MTAではWMIのスレッドから、STAでは呼び出したスレッドから呼び出されます。
+                省略時は結果をキューに格納して、for文またはasync for文で取得します。
+            on_complete (Callable[[WBEMAsyncCall], None] | None, optional):
+                完了時（IWbemObjectSink::SetStatus）に呼び出す関数。呼び出されるスレッドはcallbackと同じです。
+            maxsize (int, optional): キューに格納する一括通知の最大数。超えた場合はWMIへの応答を待機させます。
+                STAでは待機させません。
+        """
+        flags = (
+            (WBEM_FLAG_USE_AMENDED_QUALIFIERS if uses_amended_qualifiers else 0)
+            | (WBEM_FLAG_ENSURE_LOCATABLE if ensures_locatable else 0)
+            | (WBEM_FLAG_PROTOTYPE if prototype else 0)
+        )
+        call = WBEMAsyncCall(self, callback, on_complete, maxsize)
+        return cr(self.__o.ExecQueryAsync("WQL", query, flags, None, call.sink), call)
+
+    def exec_query_async(
+        self,
+        query: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+        uses_amended_qualifiers: bool = True,
+        ensures_locatable: bool = False,
+        prototype: bool = False,
+    ) -> "WBEMAsyncCall":
+        """WQLクエリを非同期で実行します。結果は :class:`WBEMAsyncCall` で受け取ります。
+
+        引数とアパートメントの注意は :meth:`exec_query_async_nothrow` と同じです。
+
+        Examples:
+            >>> async for obj in services.exec_query_async("SELECT * FROM Win32_Process"):
+            >>>     print(obj.get("Name").value)
+        """
+        return self.exec_query_async_nothrow(
+            query, callback, on_complete, maxsize, uses_amended_qualifiers, ensures_locatable, prototype
+        ).value
+
+    def create_instanceenum_async_nothrow(
+        self,
+        filter: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+        uses_amended_qualifiers: bool = True,
+        shallow: bool = True,
+    ) -> "ComResult[WBEMAsyncCall]":
+        """クラスのインスタンスを非同期で列挙します。引数は :meth:`exec_query_async_nothrow` と同じです。"""
+        flags = (WBEM_FLAG_USE_AMENDED_QUALIFIERS if uses_amended_qualifiers else 0) | (
+            WBEM_FLAG_SHALLOW if shallow else WBEM_FLAG_DEEP
+        )
+        call = WBEMAsyncCall(self, callback, on_complete, maxsize)
+        return cr(self.__o.CreateInstanceEnumAsync(filter, flags, None, call.sink), call)
 
-class WBEMClassObjectEnumerator:
+    def create_instanceenum_async(
+        self,
+        filter: str,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+        uses_amended_qualifiers: bool = True,
+        shallow: bool = True,
+    ) -> "WBEMAsyncCall":
+        """クラスのインスタンスを非同期で列挙します。引数は :meth:`exec_query_async_nothrow` と同じです。"""
+        return self.create_instanceenum_async_nothrow(
+            filter, callback, on_complete, maxsize, uses_amended_qualifiers, shallow
+        ).value
+
+    def exec_method_async_nothrow(
+        self,
+        path: str,
+        methodname: str,
+        inparams: "WBEMClassObject | None",
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+    ) -> "ComResult[WBEMAsyncCall]":
+        """メソッドを非同期で実行します。出力パラメータは一括通知で1つのオブジェクトとして返されます。"""
+        call = WBEMAsyncCall(self, callback, on_complete, 1)
+        return cr(
+            self.__o.ExecMethodAsync(
+                path, methodname, 0, None, inparams.wrapped_obj if inparams is not None else None, call.sink
+            ),
+            call,
+        )
+
+    def exec_method_async(
+        self,
+        path: str,
+        methodname: str,
+        inparams: "WBEMClassObject | None",
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+    ) -> "WBEMAsyncCall":
+        """メソッドを非同期で実行します。出力パラメータは一括通知で1つのオブジェクトとして返されます。"""
+        return self.exec_method_async_nothrow(path, methodname, inparams, callback, on_complete).value
+
+    def exec_method_many(
+        self,
+        paths: Iterable[str],
+        methodname: str,
+        inparams_factory: "Callable[[str, WBEMClassObject], None] | None" = None,
+        concurrency: int = 16,
+    ) -> "dict[str, ComResult[WBEMClassObject]]":
+        """複数のインスタンスのメソッドを並行して実行します。
+
+        ExecMethodAsyncで最大concurrency個の呼び出しを同時に実行し、パスごとの出力パラメータまたはエラーコードを返します。
+        入力パラメータの定義はクラスごとに1回だけ取得し、呼び出しごとにそのインスタンスを作成します。
+        完了の通知を待機するため、MTAのスレッドから呼び出してください。
+
+        Args:
+            paths (Iterable[str]): インスタンスのパス（例: 'Win32_Service.Name="Spooler"'）。
+            methodname (str): メソッド名。
+            inparams_factory (Callable[[str, WBEMClassObject], None] | None, optional):
+                入力パラメータを設定する関数。パスと作成した入力パラメータのインスタンスを受け取ります。
+                省略時は入力パラメータを渡しません。
+            concurrency (int, optional): 同時に実行する呼び出しの最大数。
+
+        Returns:
+            dict[str, ComResult[WBEMClassObject]]: パスから結果への辞書（pathsの順）。
+                失敗した呼び出しの値は空のWBEMClassObjectです。メソッドの戻り値は出力パラメータのReturnValueで確認します。
+
+        Examples:
+            >>> paths = [obj.relpath for obj in services.exec_query("SELECT Handle FROM Win32_Process")]
+            >>> for path, r in services.exec_method_many(paths, "GetOwner").items():
+            >>>     if r:
+            >>>         print(path, r.value_unchecked.get("User").value)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrencyは1以上である必要があります。")
+        order: list[str] = []
+        results: dict[str, ComResult[WBEMClassObject]] = {}
+        signatures: dict[str, ComResult[WBEMClassObject]] = {}
+        cond = Condition()
+        running = 0
+
+        def fail(path: str, hr: int) -> None:
+            with cond:
+                results[path] = cr(hr, WBEMClassObject(POINTER(IWbemClassObject)()))
+
+        def signature(path: str) -> ComResult[WBEMClassObject]:
+            m = _PATH_CLASS.match(path)
+            classname = m.group(1) if m else path
+            key = classname.casefold()
+            sig = signatures.get(key)
+            if sig is None:
+                cls = self.get_object_nothrow(classname, uses_amended_qualifiers=False)
+                if cls:
+                    info = cls.value_unchecked.get_method_nothrow(methodname)
+                    sig = cr(info.hr, info.value_unchecked.inparams)
+                else:
+                    sig = cls
+                signatures[key] = sig
+            return sig
+
+        def start(path: str, inparams: "WBEMClassObject | None") -> None:
+            nonlocal running
+            out: list[WBEMClassObject] = []
+
+            def on_complete(call: WBEMAsyncCall) -> None:
+                nonlocal running
+                r = cr(call.status or S_OK, out[0] if out else WBEMClassObject(POINTER(IWbemClassObject)()))
+                with cond:
+                    results[path] = r
+                    running -= 1
+                    cond.notify_all()
+
+            # 完了の通知は呼び出しから戻る前に届く場合があるため、先に数えます。
+            with cond:
+                running += 1
+            r = self.exec_method_async_nothrow(path, methodname, inparams, out.extend, on_complete)
+            if not r:
+                with cond:
+                    running -= 1
+                fail(path, r.hr)
+
+        try:
+            for path in paths:
+                order.append(path)
+                inparams = None
+                if inparams_factory is not None:
+                    sig = signature(path)
+                    if not sig:
+                        fail(path, sig.hr)
+                        continue
+                    # 入力パラメータの無いメソッドではNULLが返されます。
+                    if sig.value_unchecked.wrapped_obj:
+                        r = sig.value_unchecked.spawn_derivedinstance_nothrow()
+                        if not r:
+                            fail(path, r.hr)
+                            continue
+                        inparams = r.value_unchecked
+                        inparams_factory(path, inparams)
+                with cond:
+                    cond.wait_for(lambda: running < concurrency)
+                start(path, inparams)
+        finally:
+            with cond:
+                cond.wait_for(lambda: running == 0)
+        return {path: results[path] for path in order}
+
+
+class WBEMClassObjectEnumerator(ComWrapper):
     """WBEMクラスオブジェクト列挙子。IEnumWbemClassObjectインターフェイスのラッパーです。"""
 
-    __slots__ = ("__o", "__timeout")
+    __slots__ = ("__o", "__timeout", "__batch_size", "__batch")
     __o: Any  # POINTER(IEnumWbemClassObject)
     __timeout: int
-
-    def __init__(self, o: Any, timeout: int = WBEMTimeout.INFINITE) -> None:
+    __batch_size: int
+    __batch: Any  # c_void_p * batch_size
+
+    def __init__(self, o: Any, timeout: int = WBEMTimeout.INFINITE, batch_size: int = 1) -> None:
+        """
+        Args:
+            o (Any): IEnumWbemClassObjectインターフェイスに変換可能なインターフェイス。
+            timeout (int, optional): 1回のNextの待ち時間（ミリ秒）。
+            batch_size (int, optional): 1回のNextで取得するオブジェクト数。
+        """
+        if batch_size < 1:
+            raise ValueError("batch_sizeは1以上である必要があります。")
         self.__o = query_interface(o, IEnumWbemClassObject)
         self.__timeout = timeout
+        self.__batch_size = batch_size
+        self.__batch = None
 
     @property
     def wrapped_obj(self) -> c_void_p:
         return self.__o
 
+    @property
+    def timeout(self) -> int:
+        return self.__timeout
+
+    @property
+    def batch_size(self) -> int:
+        return self.__batch_size
+
+    def iter_batches(self) -> "Iterator[list[WBEMClassObject]]":
+        """Nextの呼び出しごとに取得したオブジェクトのリストを返します。
+        タイムアウトした場合は取得済みのオブジェクト（空の場合もあります）を返して列挙を続けるため、
+        呼び出し側で列挙を中断できます。"""
+        n = self.__batch_size
+        batch = self.__batch
+        if batch is None:
+            # 出力配列は列挙子ごとに1回だけ確保して再利用します。
+            batch = self.__batch = (c_void_p * n)()
+        pbatch = cast(batch, POINTER(POINTER(IWbemClassObject)))
+        returned = c_uint32()
+        while True:
+            hr = self.__o.Next(self.__timeout, n, pbatch, byref(returned))
+            check_hresult(hr)
+            objs = []
+            for i in range(returned.value):
+                # 配列要素のビューを作らずに、Nextが返した参照を所有するポインタへ移します。
+                x = POINTER(IWbemClassObject)()
+                c_void_p.from_buffer(x).value = batch[i]
+                batch[i] = None
+                objs.append(WBEMClassObject(x))
+            if hr == WBEM_S_TIMEDOUT:
+                yield objs
+                continue
+            if objs:
+                yield objs
+            if hr != 0:
+                break
+
     def __iter__(self) -> "Iterator[WBEMClassObject]":
+        if self.__batch_size > 1:
+            for objs in self.iter_batches():
+                yield from objs
+            return
         ret = c_uint32()
         while True:
             x = POINTER(IWbemClassObject)()
             hr = self.__o.Next(self.__timeout, 1, byref(x), byref(ret))
             if hr != 0:
-                if hr == 1:
+                if hr == WBEM_S_TIMEDOUT:
+                    continue
+                if hr == WBEM_S_FALSE:
                     break
                 check_hresult(hr)
             yield WBEMClassObject(x)
 
 
-class WBEMClassObject:
+def _take_wbemobject(address: int | None, addref: bool) -> "WBEMClassObject":
+    """IWbemClassObject*の値から、参照を所有するWBEMClassObjectを作成します。"""
+    x = POINTER(IWbemClassObject)()
+    if address:
+        c_void_p.from_buffer(x).value = address
+        if addref:
+            x.AddRef()
+    return WBEMClassObject(x)
+
+
+class WBEMClassObject(ComWrapper):
     """WBEMクラスオブジェクト。IWbemClassObjectインターフェイスのラッパーです。"""
 
-    __slots__ = ("__o",)
+    __slots__ = ("__o", "__props")
     __o: Any  # POINTER(IWbemClassObject)
+    __props: "WBEMPropertyMap | None"
 
     def __init__(self, o: Any) -> None:
         self.__o = query_interface(o, IWbemClassObject)
+        self.__props = None
 
     @property
     def wrapped_obj(self) -> c_void_p:
         return self.__o
 
+    def release(self) -> None:
+        # プロパティのMappingもインターフェイスを保持するため、破棄してから解放します。
+        self.__props = None
+        super().release()
+
     @property
     def qualifierset_nothrow(self) -> "ComResult[WBEMQualifierSet]":
         x = POINTER(IWbemQualifierSet)()
@@ -462,6 +875,11 @@ class WBEMClassObject:
     def qualifierset(self) -> "WBEMQualifierSet":
         return self.qualifierset_nothrow.value
 
+    @property
+    def object_access(self) -> "WBEMObjectAccess":
+        """ハンドルで値を読み書きするIWbemObjectAccessインターフェイス。"""
+        return WBEMObjectAccess(self.__o)
+
     class Property(NamedTuple):
         value: Variant
         type: CimType
@@ -472,7 +890,7 @@ class WBEMClassObject:
         x2 = c_int32()
         x3 = c_int32()
         return cr(
-            self.__o.Get(name, 0, byref(x1), byref(x2), byref(x2)),
+            self.__o.Get(name, 0, byref(x1), byref(x2), byref(x3)),
             WBEMClassObject.Property(x1, CimType(x2.value), WBEMFlavor(x3.value)),
         )
 
@@ -592,11 +1010,21 @@ class WBEMClassObject:
                     if hr == WBEM_S_NO_MORE_DATA:
                         break
                     check_hresult(hr)
-                d[name.value] = (WBEMClassObject.Property(val, CimType(type.value), WBEMFlavor(flavor.value)),)
+                d[name.value] = WBEMClassObject.Property(val, CimType(type.value), WBEMFlavor(flavor.value))
             return d
         finally:
             self.__o.EndEnumeration()
 
+    @property
+    def props(self) -> "WBEMPropertyMap":
+        """プロパティの遅延読み込みのMapping。値はアクセス時に取得して保持します。
+
+        一部のプロパティのみを参照する場合、 :attr:`props_all` 等よりも高速です。
+        """
+        if self.__props is None:
+            self.__props = WBEMPropertyMap(self)
+        return self.__props
+
     @property
     def props_all(self) -> OrderedDict[str, Property]:
         return self.get_props(
@@ -960,7 +1388,7 @@ class WBEMClassObject:
         return x.value_unchecked.value.get_bstr_or_none()
 
 
-class WBEMQualifierSet:
+class WBEMQualifierSet(ComWrapper):
     """IWbemQualifierSetインターフェイスのラッパーです。"""
 
     __slots__ = ("__o",)
@@ -1075,3 +1503,59 @@ class WBEMQualifierSet:
     @property
     def qualifiers_propagated(self) -> tuple[Qualifier, ...]:
         return self.__get_qualifiers_nothrow(WBEM_FLAG_PROPAGATED_ONLY).value
+
+
+class WBEMObjectTextSrc(ComWrapper):
+    """オブジェクトとXMLテキストの変換。IWbemObjectTextSrcインターフェイスのラッパーです。
+
+    テキストは :mod:`powcwmi.moftext` でWMIを使用せずに読み込めます。
+    """
+
+    __slots__ = ("__o",)
+    __o: Any  # POINTER(IWbemObjectTextSrc)
+
+    def __init__(self, o: Any) -> None:
+        self.__o = query_interface(o, IWbemObjectTextSrc)
+
+    @property
+    def wrapped_obj(self) -> c_void_p:
+        return self.__o
+
+    @staticmethod
+    def create() -> "WBEMObjectTextSrc":
+        return WBEMObjectTextSrc(CoCreateInstance(GUID("{8d1c559d-84f0-4bb3-a7d5-56a7435a9ba6}"), IWbemObjectTextSrc))
+
+    def get_text_nothrow(
+        self, obj: "WBEMClassObject", format: WMIObjectText = WMIObjectText.CIM_DTD_2_0
+    ) -> ComResult[str]:
+        x = BSTR()
+        return cr(self.__o.GetText(0, obj.wrapped_obj, int(format), None, byref(x)), x.value)
+
+    def get_text(self, obj: "WBEMClassObject", format: WMIObjectText = WMIObjectText.CIM_DTD_2_0) -> str:
+        """オブジェクトをXMLテキストに変換します。"""
+        return self.get_text_nothrow(obj, format).value
+
+    def create_from_text_nothrow(
+        self, text: str, format: WMIObjectText = WMIObjectText.CIM_DTD_2_0
+    ) -> "ComResult[WBEMClassObject]":
+        x = POINTER(IWbemClassObject)()
+        return cr(self.__o.CreateFromText(0, text, int(format), None, byref(x)), WBEMClassObject(x))
+
+    def create_from_text(self, text: str, format: WMIObjectText = WMIObjectText.CIM_DTD_2_0) -> "WBEMClassObject":
+        """XMLテキストからオブジェクトを作成します。"""
+        return self.create_from_text_nothrow(text, format).value
+
+
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+_PATH_CLASS = re.compile(r'^(?:(?:\\\\|//)[^:]*:|[^.=:"]*:)?([^.=:"]+)')
+"""オブジェクトパスのクラス名。名前空間の部分を読み飛ばします。"""
+
+
+# 以下のモジュールは上のクラスを参照するため、最後にインポートします。
+from .accessor import WBEMObjectAccess, WBEMObjectAccessor  # noqa: E402
+from .asynccall import WBEMAsyncCall  # noqa: E402
+from .propertymap import WBEMPropertyMap  # noqa: E402
+from .querycache import WBEMQueryCache, _shared_query_cache  # noqa: E402
+from .refresher import WBEMHiPerfEnum, WBEMRefresher, WBEMRefresherSnapshot  # noqa: E402
+from .table import WBEMTable, _query_table  # noqa: E402
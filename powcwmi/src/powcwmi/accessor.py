@@ -0,0 +1,242 @@
+"""プロパティハンドルによるWBEMクラスオブジェクトの値の読み書き（IWbemObjectAccess）。"""
+
+from ctypes import POINTER, byref, c_byte, c_int32, c_uint32, c_uint64, c_void_p, cast, create_unicode_buffer, sizeof
+from struct import Struct
+from typing import Any, Iterable, MutableSequence, Sequence
+
+from powc.core import ComResult, ComWrapper, check_hresult, cr, query_interface
+
+from . import CimType, WBEMClassObject
+from .comtypes import IWbemObjectAccess
+from .wbemstatus import WBEM_E_BUFFER_TOO_SMALL
+
+
+class WBEMObjectAccess(ComWrapper):
+    """IWbemObjectAccessインターフェイスのラッパーです。プロパティハンドルで値を読み書きします。
+
+    ハンドルは同じクラスのインスタンス間で共通です。通常は :class:`WBEMObjectAccessor` を使用してください。
+    """
+
+    __slots__ = ("__o",)
+    __o: Any  # POINTER(IWbemObjectAccess)
+
+    def __init__(self, o: Any) -> None:
+        self.__o = query_interface(o, IWbemObjectAccess)
+
+    @property
+    def wrapped_obj(self) -> c_void_p:
+        return self.__o
+
+    def get_propertyhandle_nothrow(self, name: str) -> ComResult[tuple[int, CimType]]:
+        """プロパティのハンドルと型を取得します。配列とオブジェクトのプロパティはハンドルを取得できません。"""
+        x1 = c_int32()
+        x2 = c_int32()
+        return cr(self.__o.GetPropertyHandle(name, byref(x1), byref(x2)), (x2.value, CimType(x1.value)))
+
+    def get_propertyhandle(self, name: str) -> tuple[int, CimType]:
+        """プロパティのハンドルと型を取得します。配列とオブジェクトのプロパティはハンドルを取得できません。"""
+        return self.get_propertyhandle_nothrow(name).value
+
+    def read_dword_nothrow(self, handle: int) -> ComResult[int]:
+        x = c_uint32()
+        return cr(self.__o.ReadDWORD(handle, byref(x)), x.value)
+
+    def read_dword(self, handle: int) -> int:
+        return self.read_dword_nothrow(handle).value
+
+    def read_qword_nothrow(self, handle: int) -> ComResult[int]:
+        x = c_uint64()
+        return cr(self.__o.ReadQWORD(handle, byref(x)), x.value)
+
+    def read_qword(self, handle: int) -> int:
+        return self.read_qword_nothrow(handle).value
+
+    def read_bytes_nothrow(self, handle: int, size: int) -> ComResult[bytes]:
+        """プロパティの値をsizeバイトまで読み取ります。"""
+        buf = (c_byte * size)()
+        consumed = c_int32()
+        hr = self.__o.ReadPropertyValue(handle, size, byref(consumed), buf)
+        return cr(hr, bytes(memoryview(buf)[: consumed.value]) if hr == 0 else b"")
+
+    def read_bytes(self, handle: int, size: int) -> bytes:
+        """プロパティの値をsizeバイトまで読み取ります。"""
+        return self.read_bytes_nothrow(handle, size).value
+
+    def read_string_nothrow(self, handle: int, bufsize: int = 128) -> ComResult[str | None]:
+        """文字列（STRING、DATETIME、REFERENCE）のプロパティを読み取ります。NULLの場合はNoneを返します。
+
+        Args:
+            bufsize (int, optional): 最初に確保するバッファの文字数。不足する場合は確保し直します。
+        """
+        buf = create_unicode_buffer(bufsize)
+        consumed = c_int32()
+        hr = self.__o.ReadPropertyValue(handle, sizeof(buf), byref(consumed), cast(buf, POINTER(c_byte)))
+        if hr == WBEM_E_BUFFER_TOO_SMALL:
+            buf = create_unicode_buffer((consumed.value + 1) // 2)
+            hr = self.__o.ReadPropertyValue(handle, sizeof(buf), byref(consumed), cast(buf, POINTER(c_byte)))
+        if hr != 0:
+            return cr(hr, None)
+        return cr(hr, buf.value)
+
+    def read_string(self, handle: int, bufsize: int = 128) -> str | None:
+        """文字列（STRING、DATETIME、REFERENCE）のプロパティを読み取ります。NULLの場合はNoneを返します。"""
+        return self.read_string_nothrow(handle, bufsize).value
+
+    def write_dword_nothrow(self, handle: int, value: int) -> ComResult[None]:
+        return cr(self.__o.WriteDWORD(handle, value & 0xFFFFFFFF), None)
+
+    def write_dword(self, handle: int, value: int) -> None:
+        return self.write_dword_nothrow(handle, value).value
+
+    def write_qword_nothrow(self, handle: int, value: int) -> ComResult[None]:
+        return cr(self.__o.WriteQWORD(handle, value & 0xFFFFFFFFFFFFFFFF), None)
+
+    def write_qword(self, handle: int, value: int) -> None:
+        return self.write_qword_nothrow(handle, value).value
+
+
+# ReadPropertyValueで読み取る固定長の型と、その書式（struct）です。
+_ACCESSOR_STRUCTS = {
+    CimType.SINT8: Struct("<b"),
+    CimType.UINT8: Struct("<B"),
+    CimType.SINT16: Struct("<h"),
+    CimType.UINT16: Struct("<H"),
+    CimType.CHAR16: Struct("<H"),
+    CimType.BOOLEAN: Struct("<h"),
+    CimType.REAL32: Struct("<f"),
+    CimType.REAL64: Struct("<d"),
+}
+_ACCESSOR_STRINGS = frozenset((CimType.STRING, CimType.DATETIME, CimType.REFERENCE))
+
+
+class WBEMObjectAccessor:
+    """プロパティハンドルで、同じクラスのインスタンスのプロパティを高速に読み取ります。
+
+    作成時にプロパティ名からハンドルを解決しておき、読み取り時は名前の検索やVARIANTの作成を行いません。
+    カウンターのポーリングのように、多数のインスタンスを繰り返し読み取る用途に使用します。
+
+    Examples:
+        >>> objs = list(services.exec_query("SELECT * FROM Win32_PerfRawData_PerfProc_Process"))
+        >>> accessor = WBEMObjectAccessor(objs[0], ("Name", "IDProcess", "WorkingSet"))
+        >>> rows = accessor.read_rows(objs)
+        >>> ws = accessor.read_column(objs, "WorkingSet", array("Q", bytes(8 * len(objs))))
+    """
+
+    __slots__ = ("__names", "__handles", "__types", "__indices")
+    __names: tuple[str, ...]
+    __handles: tuple[int, ...]
+    __types: tuple[CimType, ...]
+    __indices: dict[str, int]
+
+    def __init__(self, template: "WBEMClassObject | WBEMObjectAccess", names: Iterable[str]) -> None:
+        """
+        Args:
+            template (WBEMClassObject | WBEMObjectAccess): 読み取るインスタンスと同じクラスのオブジェクト。
+            names (Iterable[str]): 読み取るプロパティ名。
+
+        Raises:
+            OSError: プロパティが存在しないか、ハンドルで読み取れない型（配列・オブジェクト）である。
+        """
+        access = WBEMObjectAccessor.access(template)
+        self.__names = tuple(names)
+        handles = []
+        types = []
+        for name in self.__names:
+            handle, type = access.get_propertyhandle(name)
+            handles.append(handle)
+            types.append(type)
+        self.__handles = tuple(handles)
+        self.__types = tuple(types)
+        self.__indices = {name: i for i, name in enumerate(self.__names)}
+
+    @staticmethod
+    def access(obj: "WBEMClassObject | WBEMObjectAccess") -> WBEMObjectAccess:
+        """オブジェクトのIWbemObjectAccessを取得します。繰り返し読み取る場合は結果を保持してください。"""
+        if isinstance(obj, WBEMObjectAccess):
+            return obj
+        return WBEMObjectAccess(obj.wrapped_obj)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self.__names
+
+    @property
+    def handles(self) -> tuple[int, ...]:
+        return self.__handles
+
+    @property
+    def types(self) -> tuple[CimType, ...]:
+        return self.__types
+
+    def handle(self, name: str) -> tuple[int, CimType]:
+        """プロパティ名に対応するハンドルと型を返します。"""
+        i = self.__indices[name]
+        return (self.__handles[i], self.__types[i])
+
+    @staticmethod
+    def __read(access: WBEMObjectAccess, handle: int, type: CimType) -> Any:
+        if type == CimType.UINT32:
+            return access.read_dword(handle)
+        if type == CimType.SINT32:
+            x = access.read_dword(handle)
+            return x - 0x100000000 if x & 0x80000000 else x
+        if type == CimType.UINT64:
+            return access.read_qword(handle)
+        if type == CimType.SINT64:
+            x = access.read_qword(handle)
+            return x - 0x10000000000000000 if x & 0x8000000000000000 else x
+        if type in _ACCESSOR_STRINGS:
+            return access.read_string(handle)
+        st = _ACCESSOR_STRUCTS.get(type)
+        if st is None:
+            raise TypeError(f"ハンドルで読み取れない型です: {type!r}")
+        b = access.read_bytes(handle, st.size)
+        if len(b) < st.size:
+            return None
+        x = st.unpack(b)[0]
+        return x != 0 if type == CimType.BOOLEAN else x
+
+    def read(self, obj: "WBEMClassObject | WBEMObjectAccess", name: str) -> Any:
+        """1つのプロパティを型に応じたPythonの値（int、float、bool、str、None）として読み取ります。"""
+        i = self.__indices[name]
+        return WBEMObjectAccessor.__read(WBEMObjectAccessor.access(obj), self.__handles[i], self.__types[i])
+
+    def read_row(self, obj: "WBEMClassObject | WBEMObjectAccess") -> tuple[Any, ...]:
+        """全てのプロパティを :attr:`names` の順で読み取ります。"""
+        access = WBEMObjectAccessor.access(obj)
+        read = WBEMObjectAccessor.__read
+        return tuple(read(access, h, t) for h, t in zip(self.__handles, self.__types))
+
+    def read_rows(self, objs: "Iterable[WBEMClassObject | WBEMObjectAccess]") -> list[tuple[Any, ...]]:
+        """複数のインスタンスの全てのプロパティを読み取ります。"""
+        return [self.read_row(obj) for obj in objs]
+
+    def read_column[S: MutableSequence[Any]](
+        self, objs: "Sequence[WBEMClassObject | WBEMObjectAccess]", name: str, out: S | None = None
+    ) -> S | list[Any]:
+        """複数のインスタンスの1つのプロパティを読み取り、outに格納します。
+
+        DWORDとQWORDの型は1つのバッファを使い回して読み取るため、 ``array.array`` 等の事前に確保した配列を
+        outに渡すと、インスタンスごとのオブジェクトの作成を最小限にできます。
+
+        Args:
+            out (MutableSequence | None, optional): 格納先。長さはobjs以上である必要があります。省略時はリストを作成します。
+        """
+        handle, type = self.handle(name)
+        if out is None:
+            out = [None] * len(objs)
+        elif len(out) < len(objs):
+            raise ValueError("outの長さが不足しています。")
+        access = WBEMObjectAccessor.access
+        if type in (CimType.UINT32, CimType.UINT64):
+            x = c_uint32() if type == CimType.UINT32 else c_uint64()
+            px = byref(x)
+            method = "ReadDWORD" if type == CimType.UINT32 else "ReadQWORD"
+            for i, obj in enumerate(objs):
+                check_hresult(getattr(access(obj).wrapped_obj, method)(handle, px))
+                out[i] = x.value
+        else:
+            read = WBEMObjectAccessor.__read
+            for i, obj in enumerate(objs):
+                out[i] = read(access(obj), handle, type)
+        return out
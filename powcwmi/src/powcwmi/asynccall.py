@@ -0,0 +1,292 @@
+"""WMIの非同期呼び出し。
+
+:meth:`WBEMServices.exec_query_async` 等は、IWbemObjectSinkで結果を受け取る :class:`WBEMAsyncCall` を返します。
+結果はfor文（呼び出しスレッドで待機）またはasync for文（イベントループを待機させない）で取得できます。
+
+STAのスレッドで呼び出した場合、結果はそのスレッドのメッセージで届きます。
+for文・async for文・ :meth:`WBEMAsyncCall.wait` はメッセージを処理しながら待機します。
+"""
+
+from collections import deque
+from ctypes import POINTER, c_void_p, cast
+from threading import Condition
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
+
+from comtypes import COMObject
+from comtypes.hresult import S_OK
+from powc.core import ComResult, ComWaitEvent, check_hresult, cr, is_sta_thread, pump_waiting_messages
+
+from . import WBEMClassObject, WBEMServices, WBEMStatus, _take_wbemobject
+from .comtypes import IWbemObjectSink
+from .wbemstatus import WBEM_E_CALL_CANCELLED
+
+if TYPE_CHECKING:
+    import asyncio
+
+_STA_POLL_INTERVAL = 0.01
+"""STAのイベントループでメッセージを処理する間隔（秒）。"""
+
+
+class _WBEMObjectSink(COMObject):
+    """WBEMAsyncCallに結果を転送するIWbemObjectSinkの実装です。
+
+    MTAで作成した場合はWMIのスレッドから、STAで作成した場合は作成したスレッドのメッセージ処理中に呼び出されます。
+    """
+
+    _com_interfaces_ = [IWbemObjectSink]
+
+    def __init__(self, call: "WBEMAsyncCall") -> None:
+        super().__init__()
+        self.__call = call
+
+    def Indicate(self, this: Any, count: int, objects: Any) -> int:
+        # 配列とその要素の参照は呼び出し元が所有するため、AddRefしてから保持します。
+        addresses = cast(objects, POINTER(c_void_p))
+        self.__call._indicate([_take_wbemobject(addresses[i], True) for i in range(count)])
+        return S_OK
+
+    def SetStatus(self, this: Any, flags: int, hr: int, param: Any, obj: Any) -> int:
+        if flags == WBEMStatus.COMPLETE:
+            address = cast(obj, c_void_p).value if obj else None
+            self.__call._complete(hr, param, _take_wbemobject(address, True) if address else None)
+        return S_OK
+
+
+class WBEMAsyncCall:
+    """WMIの非同期呼び出しです。 :meth:`WBEMServices.exec_query_async` 等が返します。
+
+    結果はfor文（呼び出しスレッドで待機）またはasync for文（イベントループを待機させない）で取得できます。
+    キューが一杯の場合、WMIからの通知は取り出されるまで待機します。
+    作成時にコールバックを指定した場合、結果はキューに格納されません。
+
+    STAのスレッドで作成した場合、通知とコールバックはそのスレッドがメッセージを処理している間に届きます。
+    for文・async for文・ :meth:`wait` はSTAのスレッドではメッセージを処理しながら待機します。
+    通知を受け取るスレッドと取り出すスレッドが同じになるため、キューの上限による待機は行いません。
+    """
+
+    __slots__ = (
+        "__services",
+        "__sink",
+        "__callback",
+        "__on_complete",
+        "__maxsize",
+        "__cond",
+        "__event",
+        "__sta",
+        "__batches",
+        "__waiters",
+        "__status",
+        "__message",
+        "__errorobj",
+        "__cancelled",
+    )
+    __services: WBEMServices
+    __sink: Any  # POINTER(IWbemObjectSink)
+    __callback: "Callable[[list[WBEMClassObject]], None] | None"
+    __on_complete: "Callable[[WBEMAsyncCall], None] | None"
+    __maxsize: int
+    __cond: Condition
+    __event: ComWaitEvent | None
+    __sta: bool
+    __batches: "deque[list[WBEMClassObject]]"
+    __waiters: "list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]"
+    __status: int | None
+    __message: str | None
+    __errorobj: "WBEMClassObject | None"
+    __cancelled: bool
+
+    def __init__(
+        self,
+        services: WBEMServices,
+        callback: "Callable[[list[WBEMClassObject]], None] | None" = None,
+        on_complete: "Callable[[WBEMAsyncCall], None] | None" = None,
+        maxsize: int = 64,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsizeは1以上である必要があります。")
+        self.__services = services
+        self.__callback = callback
+        self.__on_complete = on_complete
+        self.__maxsize = maxsize
+        self.__cond = Condition()
+        # STAでは通知がメッセージで届くため、メッセージを処理しながら待機できるイベントでも通知します。
+        self.__sta = is_sta_thread()
+        self.__event = ComWaitEvent() if self.__sta else None
+        self.__batches = deque()
+        self.__waiters = []
+        self.__status = None
+        self.__message = None
+        self.__errorobj = None
+        self.__cancelled = False
+        self.__sink = _WBEMObjectSink(self).QueryInterface(IWbemObjectSink)
+
+    @property
+    def sink(self) -> Any:
+        """呼び出しに渡すIWbemObjectSinkインターフェイス。"""
+        return self.__sink
+
+    @property
+    def done(self) -> bool:
+        """完了（SetStatus）を受け取った場合は真。"""
+        return self.__status is not None
+
+    @property
+    def status(self) -> int | None:
+        """完了時のHRESULT。未完了の場合はNoneです。"""
+        return self.__status
+
+    @property
+    def message(self) -> str | None:
+        """完了時に通知された文字列。"""
+        return self.__message
+
+    @property
+    def errorobj(self) -> "WBEMClassObject | None":
+        """完了時に通知されたエラーオブジェクト（__ExtendedStatus）。"""
+        return self.__errorobj
+
+    def _indicate(self, objs: "list[WBEMClassObject]") -> None:
+        if self.__callback is not None:
+            self.__callback(objs)
+            return
+        with self.__cond:
+            while not self.__sta and len(self.__batches) >= self.__maxsize and not self.__cancelled:
+                self.__cond.wait()
+            if self.__cancelled:
+                return
+            self.__batches.append(objs)
+            self.__notify()
+        self.__wake_async()
+
+    def _complete(self, hr: int, message: str | None, errorobj: "WBEMClassObject | None") -> None:
+        with self.__cond:
+            self.__message = message
+            self.__errorobj = errorobj
+            self.__status = hr
+            self.__notify()
+        self.__wake_async()
+        if self.__on_complete is not None:
+            self.__on_complete(self)
+
+    def __notify(self) -> None:
+        """状態の変化を待機中のスレッドに通知します。__condを取得して呼び出します。"""
+        self.__cond.notify_all()
+        if self.__event is not None:
+            self.__event.set()
+
+    def __wait_for(self, predicate: "Callable[[], object]", timeout: float | None = None) -> bool:
+        """条件が真になるまで待機します。STAのスレッドではメッセージを処理しながら待機します。"""
+        event = self.__event
+        if event is None or not is_sta_thread():
+            with self.__cond:
+                return bool(self.__cond.wait_for(predicate, timeout))
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            with self.__cond:
+                # 状態の変化は__condを取得して通知されるため、確認と同時にリセットしても通知を失いません。
+                event.clear()
+                if predicate():
+                    return True
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            event.wait(remaining)
+
+    def __wake_async(self) -> None:
+        with self.__cond:
+            waiters = tuple(self.__waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def cancel_nothrow(self) -> ComResult[None]:
+        """呼び出しを取り消します（CancelAsyncCall）。キューに格納済みの結果は取得できます。"""
+        with self.__cond:
+            self.__cancelled = True
+            self.__notify()
+        return cr(self.__services.wrapped_obj.CancelAsyncCall(self.__sink), None)
+
+    def cancel(self) -> None:
+        """呼び出しを取り消します（CancelAsyncCall）。キューに格納済みの結果は取得できます。"""
+        return self.cancel_nothrow().value
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """完了を待機します。完了した場合は真を返します。STAのスレッドではメッセージを処理しながら待機します。"""
+        return self.__wait_for(lambda: self.__status is not None, timeout)
+
+    def __pop(self) -> "list[WBEMClassObject] | None":
+        """キューから取り出します。完了済みで空の場合は空のリスト、未完了で空の場合はNoneを返します。"""
+        with self.__cond:
+            if self.__batches:
+                objs = self.__batches.popleft()
+                self.__notify()
+                return objs
+            return [] if self.__status is not None else None
+
+    def __raise_if_failed(self) -> None:
+        if self.__status is not None and self.__status != WBEM_E_CALL_CANCELLED:
+            check_hresult(self.__status)
+
+    def iter_batches(self) -> "Iterator[list[WBEMClassObject]]":
+        """一括通知ごとの結果を返します。完了まで呼び出しスレッドで待機します。
+        STAのスレッドではメッセージを処理しながら待機します。
+
+        Raises:
+            OSError: 呼び出しが失敗した。取り消した場合は発生しません。
+        """
+        while True:
+            self.__wait_for(lambda: self.__batches or self.__status is not None)
+            objs = self.__pop()
+            if not objs:
+                if objs is not None:
+                    break
+                continue
+            yield objs
+        self.__raise_if_failed()
+
+    def __iter__(self) -> "Iterator[WBEMClassObject]":
+        for objs in self.iter_batches():
+            yield from objs
+
+    async def aiter_batches(self) -> "AsyncIterator[list[WBEMClassObject]]":
+        """一括通知ごとの結果を返します。イベントループのスレッドを待機させません。
+        STAのスレッドでは、待機中に一定間隔でメッセージを処理します。
+
+        Raises:
+            OSError: 呼び出しが失敗した。取り消した場合は発生しません。
+        """
+        # asyncioのインポートは重いため、非同期で取得する場合のみインポートします。
+        import asyncio
+
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        sta = self.__event is not None and is_sta_thread()
+        with self.__cond:
+            self.__waiters.append(waiter)
+        try:
+            while True:
+                waiter[1].clear()
+                if sta:
+                    # イベントループはメッセージを処理しないため、STAに届く通知をここで処理します。
+                    pump_waiting_messages()
+                objs = self.__pop()
+                if objs is None:
+                    if not sta:
+                        await waiter[1].wait()
+                        continue
+                    try:
+                        await asyncio.wait_for(waiter[1].wait(), _STA_POLL_INTERVAL)
+                    except TimeoutError:
+                        pass
+                    continue
+                if not objs:
+                    break
+                yield objs
+        finally:
+            with self.__cond:
+                self.__waiters.remove(waiter)
+        self.__raise_if_failed()
+
+    async def __aiter__(self) -> "AsyncIterator[WBEMClassObject]":
+        async for objs in self.aiter_batches():
+            for obj in objs:
+                yield obj
@@ -0,0 +1,27 @@
+"""CIMの型。COMを使用しないため、 :mod:`powcwmi.moftext` 等のWMIを使用しない処理からも参照できます。"""
+
+from enum import IntFlag
+
+
+class CimType(IntFlag):
+    """CIMTYPE_ENUMERATION"""
+
+    ILLEGAL = 0xFFF
+    EMPTY = 0
+    SINT8 = 16
+    UINT8 = 17
+    SINT16 = 2
+    UINT16 = 18
+    SINT32 = 3
+    UINT32 = 19
+    SINT64 = 20
+    UINT64 = 21
+    REAL32 = 4
+    REAL64 = 5
+    BOOLEAN = 11
+    STRING = 8
+    DATETIME = 101
+    REFERENCE = 102
+    CHAR16 = 103
+    OBJECT = 13
+    ARRAY = 0x2000
@@ -50,6 +50,26 @@ class IWbemContext(IUnknown):
     _iid_ = GUID("{44aca674-e8fc-11d0-a07c-00c04fb68820}")
 
 
+class IWbemRefresher(IUnknown):
+    __slots__ = ()
+    _iid_ = GUID("{49353c99-516b-11d1-aea6-00c04fb68820}")
+
+
+class IWbemHiPerfEnum(IUnknown):
+    __slots__ = ()
+    _iid_ = GUID("{2705C288-79AE-11d2-B348-00105A1F8177}")
+
+
+class IWbemConfigureRefresher(IUnknown):
+    __slots__ = ()
+    _iid_ = GUID("{49353c92-516b-11d1-aea6-00c04fb68820}")
+
+
+class IWbemObjectTextSrc(IUnknown):
+    __slots__ = ()
+    _iid_ = GUID("{bfbf883a-cad7-11d3-a11b-00105a1f515a}")
+
+
 class WbemCompileStatusInfo(Structure):
     """WBEM_COMPILE_STATUS_INFO"""
 
@@ -128,80 +148,6 @@ class WbemCompileStatusInfo(Structure):
 
 #     };
 
-#     MIDL_INTERFACE("49353c99-516b-11d1-aea6-00c04fb68820")
-#     IWbemRefresher : public IUnknown
-#     {
-#     public:
-#         virtual HRESULT STDMETHODCALLTYPE Refresh(
-#             /* [in] */ long lFlags) = 0;
-
-#     };
-
-#     MIDL_INTERFACE("2705C288-79AE-11d2-B348-00105A1F8177")
-#     IWbemHiPerfEnum : public IUnknown
-#     {
-#     public:
-#         virtual HRESULT STDMETHODCALLTYPE AddObjects(
-#             /* [in] */ long lFlags,
-#             /* [in] */ ULONG uNumObjects,
-#             /* [size_is][in] */ long *apIds,
-#             /* [size_is][in] */ IWbemObjectAccess **apObj) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE RemoveObjects(
-#             /* [in] */ long lFlags,
-#             /* [in] */ ULONG uNumObjects,
-#             /* [size_is][in] */ long *apIds) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE GetObjects(
-#             /* [in] */ long lFlags,
-#             /* [in] */ ULONG uNumObjects,
-#             /* [length_is][size_is][out] */ IWbemObjectAccess **apObj,
-#             /* [out] */ ULONG *puReturned) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE RemoveAll(
-#             /* [in] */ long lFlags) = 0;
-
-#     };
-
-#     MIDL_INTERFACE("49353c92-516b-11d1-aea6-00c04fb68820")
-#     IWbemConfigureRefresher : public IUnknown
-#     {
-#     public:
-#         virtual HRESULT STDMETHODCALLTYPE AddObjectByPath(
-#             /* [in] */ IWbemServices *pNamespace,
-#             /* [string][in] */ LPCWSTR wszPath,
-#             /* [in] */ long lFlags,
-#             /* [in] */ IWbemContext *pContext,
-#             /* [out] */ IWbemClassObject **ppRefreshable,
-#             /* [unique][in][out] */ long *plId) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE AddObjectByTemplate(
-#             /* [in] */ IWbemServices *pNamespace,
-#             /* [in] */ IWbemClassObject *pTemplate,
-#             /* [in] */ long lFlags,
-#             /* [in] */ IWbemContext *pContext,
-#             /* [out] */ IWbemClassObject **ppRefreshable,
-#             /* [unique][in][out] */ long *plId) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE AddRefresher(
-#             /* [in] */ IWbemRefresher *pRefresher,
-#             /* [in] */ long lFlags,
-#             /* [unique][in][out] */ long *plId) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE Remove(
-#             /* [in] */ long lId,
-#             /* [in] */ long lFlags) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE AddEnum(
-#             /* [in] */ IWbemServices *pNamespace,
-#             /* [string][in] */ LPCWSTR wszClassName,
-#             /* [in] */ long lFlags,
-#             /* [in] */ IWbemContext *pContext,
-#             /* [out] */ IWbemHiPerfEnum **ppEnum,
-#             /* [unique][in][out] */ long *plId) = 0;
-
-#     };
-
 
 IWbemClassObject._methods_ = [
     STDMETHOD(c_int32, "GetQualifierSet", (POINTER(POINTER(IWbemQualifierSet)),)),
@@ -290,13 +236,11 @@ IWbemServices._methods_ = [
         c_int32, "PutClassAsync", (POINTER(IWbemClassObject), c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink))
     ),
     STDMETHOD(c_int32, "DeleteClass", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemCallResult)))),
-    STDMETHOD(c_int32, "DeleteClassAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink)))),
+    STDMETHOD(c_int32, "DeleteClassAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink))),
     STDMETHOD(
         c_int32, "CreateClassEnum", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IEnumWbemClassObject)))
     ),
-    STDMETHOD(
-        c_int32, "CreateClassEnumAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink)))
-    ),
+    STDMETHOD(c_int32, "CreateClassEnumAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink))),
     STDMETHOD(
         c_int32,
         "PutInstance",
@@ -308,23 +252,19 @@ IWbemServices._methods_ = [
         (POINTER(IWbemClassObject), c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink)),
     ),
     STDMETHOD(c_int32, "DeleteInstance", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemCallResult)))),
-    STDMETHOD(
-        c_int32, "DeleteInstanceAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink)))
-    ),
+    STDMETHOD(c_int32, "DeleteInstanceAsync", (BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink))),
     STDMETHOD(
         c_int32, "CreateInstanceEnum", (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IEnumWbemClassObject)))
     ),
     STDMETHOD(
         c_int32,
         "CreateInstanceEnumAsync",
-        (BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink))),
+        (BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink)),
     ),
     STDMETHOD(
         c_int32, "ExecQuery", (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IEnumWbemClassObject)))
     ),
-    STDMETHOD(
-        c_int32, "ExecQueryAsync", (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink)))
-    ),
+    STDMETHOD(c_int32, "ExecQueryAsync", (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink))),
     STDMETHOD(
         c_int32,
         "ExecNotificationQuery",
@@ -333,7 +273,7 @@ IWbemServices._methods_ = [
     STDMETHOD(
         c_int32,
         "ExecNotificationQueryAsync",
-        (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(POINTER(IWbemObjectSink))),
+        (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemObjectSink)),
     ),
     STDMETHOD(
         c_int32,
@@ -351,15 +291,7 @@ IWbemServices._methods_ = [
     STDMETHOD(
         c_int32,
         "ExecMethodAsync",
-        (
-            BSTR,
-            BSTR,
-            c_int32,
-            POINTER(IWbemContext),
-            POINTER(IWbemClassObject),
-            POINTER(POINTER(IWbemClassObject)),
-            POINTER(POINTER(IWbemObjectSink)),
-        ),
+        (BSTR, BSTR, c_int32, POINTER(IWbemContext), POINTER(IWbemClassObject), POINTER(IWbemObjectSink)),
     ),
 ]
 
@@ -406,26 +338,6 @@ IWbemServices._methods_ = [
 
 #     };
 
-#     MIDL_INTERFACE("bfbf883a-cad7-11d3-a11b-00105a1f515a")
-#     IWbemObjectTextSrc : public IUnknown
-#     {
-#     public:
-#         virtual HRESULT STDMETHODCALLTYPE GetText(
-#             /* [in] */ long lFlags,
-#             /* [in] */ IWbemClassObject *pObj,
-#             /* [in] */ ULONG uObjTextFormat,
-#             /* [in] */ IWbemContext *pCtx,
-#             /* [out] */ BSTR *strText) = 0;
-
-#         virtual HRESULT STDMETHODCALLTYPE CreateFromText(
-#             /* [in] */ long lFlags,
-#             /* [in] */ BSTR strText,
-#             /* [in] */ ULONG uObjTextFormat,
-#             /* [in] */ IWbemContext *pCtx,
-#             /* [out] */ IWbemClassObject **pNewObj) = 0;
-
-#     };
-
 #     MIDL_INTERFACE("6daf974e-2e37-11d2-aec9-00c04fb68820")
 #     IMofCompiler : public IUnknown
 #     {
@@ -510,8 +422,8 @@ IEnumWbemClassObject._methods_ = [
     STDMETHOD(c_int32, "Skip", (c_int32, c_uint32)),
 ]
 
-IWbemCallResult._methods = [
-    STDMETHOD(c_int32, "GetResultObject", (c_int32, POINTER(IWbemClassObject))),
+IWbemCallResult._methods_ = [
+    STDMETHOD(c_int32, "GetResultObject", (c_int32, POINTER(POINTER(IWbemClassObject)))),
     STDMETHOD(c_int32, "GetResultString", (c_int32, POINTER(BSTR))),
     STDMETHOD(c_int32, "GetResultServices", (c_int32, POINTER(POINTER(IWbemServices)))),
     STDMETHOD(c_int32, "GetCallStatus", (c_int32, POINTER(c_int32))),
@@ -527,3 +439,64 @@ IWbemContext._methods_ = [
     STDMETHOD(c_int32, "GetValue", (c_wchar_p, c_int32, POINTER(Variant))),
     STDMETHOD(c_int32, "DeleteValue", (c_wchar_p, c_int32)),
 ]
+
+IWbemRefresher._methods_ = [
+    STDMETHOD(c_int32, "Refresh", (c_int32,)),
+]
+
+IWbemHiPerfEnum._methods_ = [
+    STDMETHOD(c_int32, "AddObjects", (c_int32, c_uint32, POINTER(c_int32), POINTER(POINTER(IWbemObjectAccess)))),
+    STDMETHOD(c_int32, "RemoveObjects", (c_int32, c_uint32, POINTER(c_int32))),
+    STDMETHOD(c_int32, "GetObjects", (c_int32, c_uint32, POINTER(POINTER(IWbemObjectAccess)), POINTER(c_uint32))),
+    STDMETHOD(c_int32, "RemoveAll", (c_int32,)),
+]
+
+IWbemConfigureRefresher._methods_ = [
+    STDMETHOD(
+        c_int32,
+        "AddObjectByPath",
+        (
+            POINTER(IWbemServices),
+            c_wchar_p,
+            c_int32,
+            POINTER(IWbemContext),
+            POINTER(POINTER(IWbemClassObject)),
+            POINTER(c_int32),
+        ),
+    ),
+    STDMETHOD(
+        c_int32,
+        "AddObjectByTemplate",
+        (
+            POINTER(IWbemServices),
+            POINTER(IWbemClassObject),
+            c_int32,
+            POINTER(IWbemContext),
+            POINTER(POINTER(IWbemClassObject)),
+            POINTER(c_int32),
+        ),
+    ),
+    STDMETHOD(c_int32, "AddRefresher", (POINTER(IWbemRefresher), c_int32, POINTER(c_int32))),
+    STDMETHOD(c_int32, "Remove", (c_int32, c_int32)),
+    STDMETHOD(
+        c_int32,
+        "AddEnum",
+        (
+            POINTER(IWbemServices),
+            c_wchar_p,
+            c_int32,
+            POINTER(IWbemContext),
+            POINTER(POINTER(IWbemHiPerfEnum)),
+            POINTER(c_int32),
+        ),
+    ),
+]
+
+IWbemObjectTextSrc._methods_ = [
+    STDMETHOD(c_int32, "GetText", (c_int32, POINTER(IWbemClassObject), c_uint32, POINTER(IWbemContext), POINTER(BSTR))),
+    STDMETHOD(
+        c_int32,
+        "CreateFromText",
+        (c_int32, BSTR, c_uint32, POINTER(IWbemContext), POINTER(POINTER(IWbemClassObject))),
+    ),
+]
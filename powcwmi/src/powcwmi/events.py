@@ -0,0 +1,270 @@
+"""WMIイベントの受信。
+
+:class:`WBEMEventSubscription` は専用のスレッドでイベントのクエリを列挙し、
+短いタイムアウトで一括して取得したイベントを上限付きのキューに格納します。
+同じインスタンスの変更イベント（__InstanceModificationEvent）は、一定時間内のものを1つにまとめます。
+
+Examples:
+    >>> query = "SELECT * FROM __InstanceCreationEvent WITHIN 1 WHERE TargetInstance ISA 'Win32_Process'"
+    >>> with WBEMEventSubscription(services, query) as sub:
+    >>>     for event in sub:
+    >>>         print(event.target.get("Name").value)
+"""
+
+from ctypes import c_void_p
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from time import monotonic
+from typing import Iterator, NamedTuple
+
+from comtypes import COINIT_MULTITHREADED, CoInitializeEx, CoUninitialize
+from powc.comobj import GlobalInterfaceTable
+from powc.variant import VARENUM
+
+from . import WBEMClassObject, WBEMClassObjectEnumerator, WBEMServices, _take_wbemobject
+from .comtypes import IWbemServices
+
+
+class WBEMEvent(NamedTuple):
+    """受信したイベントです。"""
+
+    classname: str
+    """イベントのクラス名（例: __InstanceCreationEvent）。"""
+    relpath: str | None
+    """TargetInstanceの相対パス。TargetInstanceの無いイベントではNoneです。"""
+    target: WBEMClassObject | None
+    """TargetInstance。変更イベントをまとめた場合は最後のイベントのものです。"""
+    event: WBEMClassObject
+    count: int
+    """まとめたイベントの数。"""
+
+
+_MODIFICATION = "__instancemodificationevent"
+
+
+def _decode(obj: WBEMClassObject) -> WBEMEvent:
+    classname = obj.classname or ""
+    target = None
+    relpath = None
+    r = obj.get_nothrow("TargetInstance")
+    if r and r.value_unchecked.value.vartype == VARENUM.VT_UNKNOWN:
+        # VARIANTが参照を所有するため、AddRefしてから保持します。
+        target = _take_wbemobject(c_void_p.from_buffer(r.value_unchecked.value.data_memview).value, True)
+        relpath = target.relpath
+    return WBEMEvent(classname, relpath, target, obj, 1)
+
+
+class WBEMEventSubscription:
+    """イベントのクエリを専用のスレッドで受信します。
+
+    キューが一杯の場合、受信スレッドは取り出されるまで待機します（WMI側でイベントが保留されます）。
+    :meth:`stop` はまとめ中のイベントをキューに格納してから終了し、 :meth:`cancel` は破棄して終了します。
+    """
+
+    __slots__ = (
+        "__queue",
+        "__stop",
+        "__cancelled",
+        "__thread",
+        "__started",
+        "__error",
+        "__batch_size",
+        "__timeout",
+        "__coalesce",
+    )
+    __queue: "Queue[WBEMEvent]"
+    __stop: Event
+    __cancelled: bool
+    __thread: Thread
+    __started: Event
+    __error: BaseException | None
+    __batch_size: int
+    __timeout: int
+    __coalesce: float
+
+    def __init__(
+        self,
+        services: WBEMServices,
+        query: str,
+        maxsize: int = 1024,
+        batch_size: int = 64,
+        timeout: int = 200,
+        coalesce: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            services (WBEMServices): イベントを受信する名前空間。
+            query (str): イベントのWQLクエリ。
+            maxsize (int, optional): キューに格納するイベントの最大数。
+            batch_size (int, optional): 1回のNextで取得するイベントの最大数。
+            timeout (int, optional): 1回のNextの待ち時間（ミリ秒）。停止の応答時間になります。
+            coalesce (float, optional): 同じインスタンスの変更イベントをまとめる時間（秒）。0の場合はまとめません。
+
+        Raises:
+            OSError: クエリを開始できない。
+        """
+        self.__queue = Queue(maxsize)
+        self.__stop = Event()
+        self.__cancelled = False
+        self.__started = Event()
+        self.__error = None
+        self.__batch_size = batch_size
+        self.__timeout = timeout
+        self.__coalesce = coalesce
+        # 受信スレッドのアパートメントで使用するため、グローバルインターフェイステーブル経由で渡します。
+        git = GlobalInterfaceTable.create()
+        cookie = git.register(services.wrapped_obj, IWbemServices)
+        self.__thread = Thread(target=self.__run, args=(git, cookie, query), name="WBEMEventSubscription", daemon=True)
+        self.__thread.start()
+        self.__started.wait()
+        if self.__error is not None:
+            self.__thread.join()
+            raise self.__error
+
+    def __put(self, event: WBEMEvent) -> bool:
+        while not self.__cancelled:
+            try:
+                self.__queue.put(event, timeout=self.__timeout / 1000)
+                return True
+            except Full:
+                # 停止後はキューが空くまで待たずに破棄して、 :meth:`stop` が戻るようにします。
+                if self.__stop.is_set():
+                    return False
+        return False
+
+    def __run(self, git: GlobalInterfaceTable, cookie: int, query: str) -> None:
+        CoInitializeEx(COINIT_MULTITHREADED)
+        services: WBEMServices | None = None
+        enum: WBEMClassObjectEnumerator | None = None
+        try:
+            try:
+                try:
+                    services = WBEMServices(git.get(cookie, IWbemServices))
+                finally:
+                    git.revoke_nothrow(cookie)
+                enum = WBEMClassObjectEnumerator(
+                    services.exec_notificationquery(query).wrapped_obj, self.__timeout, self.__batch_size
+                )
+            except BaseException as e:
+                self.__error = e
+                return
+            finally:
+                self.__started.set()
+            self.__pump(enum)
+        finally:
+            # アパートメントの終了後にプロキシを解放しないように、CoUninitializeの前に解放します。
+            try:
+                if enum is not None:
+                    enum.release()
+                if services is not None:
+                    services.release()
+                git.release()
+            finally:
+                CoUninitialize()
+
+    def __pump(self, enum: WBEMClassObjectEnumerator) -> None:
+        # まとめ中の変更イベント。相対パスごとに(イベント, 最初の受信時刻)を保持します。
+        pending: dict[str, tuple[WBEMEvent, float]] = {}
+        try:
+            for objs in enum.iter_batches():
+                for obj in objs:
+                    event = _decode(obj)
+                    if self.__coalesce > 0 and event.relpath is not None:
+                        if event.classname.casefold() == _MODIFICATION:
+                            prev = pending.get(event.relpath)
+                            if prev is None:
+                                pending[event.relpath] = (event, monotonic())
+                            else:
+                                pending[event.relpath] = (event._replace(count=prev[0].count + 1), prev[1])
+                            continue
+                        # 作成・削除イベントの前に、同じインスタンスの変更イベントを送って順序を保ちます。
+                        prev = pending.pop(event.relpath, None)
+                        if prev is not None and not self.__put(prev[0]):
+                            return
+                    if not self.__put(event):
+                        return
+                if pending:
+                    now = monotonic()
+                    for relpath, (event, t) in list(pending.items()):
+                        if now - t >= self.__coalesce:
+                            del pending[relpath]
+                            if not self.__put(event):
+                                return
+                if self.__stop.is_set():
+                    break
+        except OSError as e:
+            self.__error = e
+        if not self.__cancelled:
+            for event, _ in pending.values():
+                if not self.__put(event):
+                    break
+
+    @property
+    def error(self) -> BaseException | None:
+        """受信スレッドで発生したエラー。"""
+        return self.__error
+
+    @property
+    def running(self) -> bool:
+        return self.__thread.is_alive()
+
+    def get(self, timeout: float | None = None) -> WBEMEvent | None:
+        """キューからイベントを1つ取り出します。タイムアウトした場合はNoneを返します。"""
+        try:
+            return self.__queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def get_batch(self, maxcount: int = 256, timeout: float | None = None) -> list[WBEMEvent]:
+        """キューからイベントを最大maxcount個取り出します。1つ目はtimeout秒まで待機し、残りは待機しません。"""
+        event = self.get(timeout)
+        if event is None:
+            return []
+        events = [event]
+        while len(events) < maxcount:
+            try:
+                events.append(self.__queue.get_nowait())
+            except Empty:
+                break
+        return events
+
+    def __iter__(self) -> Iterator[WBEMEvent]:
+        """停止してキューが空になるまでイベントを返します。
+
+        Raises:
+            OSError: 受信スレッドでエラーが発生した。
+        """
+        while True:
+            event = self.get(self.__timeout / 1000)
+            if event is not None:
+                yield event
+                continue
+            if not self.__thread.is_alive() and self.__queue.empty():
+                break
+        if self.__error is not None:
+            raise self.__error
+
+    def stop(self, timeout: float | None = None) -> None:
+        """受信を停止します。まとめ中のイベントはキューに格納されます。受信スレッドの終了まで待機します。
+
+        キューが一杯の場合、停止後に格納できなかったイベントは破棄します。
+        """
+        self.__stop.set()
+        self.__thread.join(timeout)
+
+    def cancel(self, timeout: float | None = None) -> None:
+        """受信を停止して、キュー内とまとめ中のイベントを破棄します。"""
+        self.__cancelled = True
+        self.__stop.set()
+        self.__thread.join(timeout)
+        while True:
+            try:
+                self.__queue.get_nowait()
+            except Empty:
+                break
+
+    def __enter__(self) -> "WBEMEventSubscription":
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.cancel()
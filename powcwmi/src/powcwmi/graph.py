@@ -0,0 +1,273 @@
+"""WMIの関連付け（アソシエーション）のたどり。
+
+:class:`WBEMGraph` はASSOCIATORS OF・REFERENCES OFのクエリを複数のオブジェクトについて半同期で同時に実行し、
+取得したオブジェクトを__RELPATHごとに1つだけ保持します。同じオブジェクトとクエリは2回取得しません。
+
+Examples:
+    >>> graph = WBEMGraph(services)
+    >>> disks = graph.add(services.exec_query("SELECT * FROM Win32_DiskDrive"))
+    >>> steps = (
+    >>>     ("Win32_DiskDriveToDiskPartition", "Win32_DiskPartition"),
+    >>>     ("Win32_LogicalDiskToPartition", "Win32_LogicalDisk"),
+    >>> )
+    >>> levels = graph.walk(disks, steps)
+    >>> for disk in disks:
+    >>>     for partition in graph.neighbors(disk, "Win32_DiskDriveToDiskPartition"):
+    >>>         print(disk, partition, graph.neighbors(partition, "Win32_LogicalDiskToPartition"))
+"""
+
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, NamedTuple, Sequence
+
+from . import _IDENTIFIER, WBEMClassObject, WBEMClassObjectEnumerator, WBEMServices
+
+
+class WBEMGraphEdge(NamedTuple):
+    """オブジェクト間の関連付けです。"""
+
+    source: str
+    target: str
+    assoc_class: str | None
+    """関連付けのクラス。ASSOCIATORS OFでAssocClassを指定しなかった場合はNoneです。
+
+    REFERENCES OFの場合、targetは関連付けのインスタンスで、このクラスはそのインスタンスのクラスです。
+    """
+
+
+class _Query(NamedTuple):
+    kind: str
+    assoc_class: str | None
+    result_class: str | None
+    role: str | None
+    result_role: str | None
+    class_defs_only: bool
+
+
+class WBEMGraph:
+    """関連付けでつながったオブジェクトのグラフです。スレッドセーフではありません。
+
+    オブジェクトは__RELPATH（大文字と小文字を区別しません）で識別し、最初に取得したものを保持します。
+    クエリの結果はオブジェクトとクエリの条件ごとに保持し、 :meth:`invalidate` まで再実行しません。
+    """
+
+    __slots__ = ("__services", "__objects", "__results", "__edges", "__concurrency")
+    __services: WBEMServices
+    __objects: dict[str, tuple[str, WBEMClassObject]]
+    __results: dict[tuple[str, _Query], tuple[str, ...]]
+    __edges: dict[str, list[WBEMGraphEdge]]
+    __concurrency: int
+
+    def __init__(self, services: WBEMServices, concurrency: int = 16) -> None:
+        """
+        Args:
+            services (WBEMServices): クエリを実行する名前空間。
+            concurrency (int, optional): 同時に実行するクエリの最大数。
+        """
+        if concurrency < 1:
+            raise ValueError("concurrencyは1以上である必要があります。")
+        self.__services = services
+        self.__objects = {}
+        self.__results = {}
+        self.__edges = {}
+        self.__concurrency = concurrency
+
+    @property
+    def objects(self) -> Mapping[str, tuple[str, WBEMClassObject]]:
+        """小文字に変換した__RELPATHから(__RELPATH, オブジェクト)へのMapping（読み取り専用）。"""
+        return MappingProxyType(self.__objects)
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __contains__(self, relpath: object) -> bool:
+        return isinstance(relpath, str) and relpath.casefold() in self.__objects
+
+    def __intern(self, obj: WBEMClassObject) -> str | None:
+        """オブジェクトを登録して、保持している__RELPATHを返します。"""
+        relpath = obj.relpath
+        if relpath is None:
+            return None
+        entry = self.__objects.get(relpath.casefold())
+        if entry is None:
+            self.__objects[relpath.casefold()] = (relpath, obj)
+            return relpath
+        return entry[0]
+
+    def add(self, objs: Iterable[WBEMClassObject]) -> tuple[str, ...]:
+        """オブジェクトを登録して、その__RELPATHを返します。__RELPATHの無いオブジェクトは無視します。"""
+        return tuple(relpath for relpath in map(self.__intern, objs) if relpath is not None)
+
+    def object(self, relpath: str) -> WBEMClassObject:
+        """オブジェクトを返します。登録されていない場合は取得して登録します。
+
+        Raises:
+            OSError: オブジェクトが存在しない。
+        """
+        entry = self.__objects.get(relpath.casefold())
+        if entry is not None:
+            return entry[1]
+        obj = self.__services.get_object(relpath)
+        self.__intern(obj)
+        return obj
+
+    def __build(self, relpath: str, q: _Query) -> str:
+        conditions = []
+        for name, value in (
+            ("AssocClass", q.assoc_class),
+            ("ResultClass", q.result_class),
+            ("Role", q.role),
+            ("ResultRole", q.result_role),
+        ):
+            if value is None:
+                continue
+            if not _IDENTIFIER.fullmatch(value):
+                raise ValueError(f"{name}が正しくありません: {value!r}")
+            conditions.append(f"{name} = {value}")
+        if q.class_defs_only:
+            conditions.append("ClassDefsOnly")
+        query = f"{q.kind} OF {{{relpath}}}"
+        return f"{query} WHERE {' '.join(conditions)}" if conditions else query
+
+    def __run(self, relpaths: Iterable[str], q: _Query) -> dict[str, tuple[str, ...]]:
+        """クエリを実行して、オブジェクトごとの結果の__RELPATH（ClassDefsOnlyの場合はクラス名）を返します。"""
+        results: dict[str, tuple[str, ...]] = {}
+        pending = []
+        for relpath in dict.fromkeys(relpaths):
+            cached = self.__results.get((relpath.casefold(), q))
+            if cached is not None:
+                results[relpath] = cached
+            else:
+                pending.append(relpath)
+        for i in range(0, len(pending), self.__concurrency):
+            # 1つの塊のクエリを半同期で全て開始してから順に受け取るため、WMI側では同時に処理されます。
+            # 結果は呼び出したスレッドで列挙子から取得するため、STAのスレッドでもメッセージを処理せずに待機できます。
+            enums: list[tuple[str, WBEMClassObjectEnumerator]] = []
+            try:
+                for relpath in pending[i : i + self.__concurrency]:
+                    enums.append(
+                        (relpath, self.__services.exec_query(self.__build(relpath, q), batch_size=64, semisync=True))
+                    )
+                for relpath, enum in enums:
+                    found = []
+                    for obj in enum:
+                        name = obj.classname if q.class_defs_only else self.__intern(obj)
+                        if name is not None:
+                            found.append(name)
+                    results[relpath] = self.__results[(relpath.casefold(), q)] = tuple(found)
+            finally:
+                # 途中で失敗した場合は、開始済みの残りのクエリを列挙子の解放で取り消します。
+                for _, enum in enums:
+                    enum.release()
+        return results
+
+    def __record(self, results: dict[str, tuple[str, ...]], assoc_class: Callable[[str], str | None]) -> None:
+        """クエリの結果を関連付けとして記録します。assoc_classは結果の__RELPATHから関連付けのクラスを返します。"""
+        for source, targets in results.items():
+            edges = self.__edges.setdefault(source.casefold(), [])
+            known = {(e.target.casefold(), e.assoc_class) for e in edges}
+            for target in targets:
+                edge = WBEMGraphEdge(source, target, assoc_class(target))
+                if (target.casefold(), edge.assoc_class) not in known:
+                    known.add((target.casefold(), edge.assoc_class))
+                    edges.append(edge)
+
+    def __classname(self, relpath: str) -> str | None:
+        return self.__objects[relpath.casefold()][1].classname
+
+    def associators(
+        self,
+        relpaths: Iterable[str],
+        assoc_class: str | None = None,
+        result_class: str | None = None,
+        role: str | None = None,
+        result_role: str | None = None,
+    ) -> dict[str, tuple[str, ...]]:
+        """関連付けられたオブジェクトを取得して登録します（ASSOCIATORS OF）。
+
+        Args:
+            relpaths (Iterable[str]): 起点のオブジェクトの__RELPATH。
+            assoc_class (str | None, optional): 関連付けのクラス（AssocClass）。
+            result_class (str | None, optional): 結果のクラス（ResultClass）。
+            role (str | None, optional): 起点のオブジェクトを参照するプロパティ名（Role）。
+            result_role (str | None, optional): 結果のオブジェクトを参照するプロパティ名（ResultRole）。
+
+        Returns:
+            dict[str, tuple[str, ...]]: 起点の__RELPATHから、関連付けられたオブジェクトの__RELPATHへの辞書。
+
+        Raises:
+            OSError: クエリが失敗した。
+        """
+        results = self.__run(relpaths, _Query("ASSOCIATORS", assoc_class, result_class, role, result_role, False))
+        self.__record(results, lambda _: assoc_class)
+        return results
+
+    def references(
+        self, relpaths: Iterable[str], result_class: str | None = None, role: str | None = None
+    ) -> dict[str, tuple[str, ...]]:
+        """起点のオブジェクトを参照する関連付けのインスタンスを取得して登録します（REFERENCES OF）。
+
+        起点から関連付けのインスタンスへの関連付けも記録します。その関連付けのクラスはインスタンスのクラスです。
+
+        Args:
+            result_class (str | None, optional): 関連付けのクラス（ResultClass）。
+            role (str | None, optional): 起点のオブジェクトを参照するプロパティ名（Role）。
+
+        Returns:
+            dict[str, tuple[str, ...]]: 起点の__RELPATHから、関連付けのインスタンスの__RELPATHへの辞書。
+        """
+        results = self.__run(relpaths, _Query("REFERENCES", None, result_class, role, None, False))
+        self.__record(results, self.__classname)
+        return results
+
+    def association_classes(self, relpaths: Iterable[str]) -> dict[str, tuple[str, ...]]:
+        """起点のオブジェクトを参照する関連付けのクラス名を返します（REFERENCES OF ... WHERE ClassDefsOnly）。
+
+        インスタンスを取得しないため、どの関連付けをたどるかの調査に使用します。
+        """
+        return self.__run(relpaths, _Query("REFERENCES", None, None, None, None, True))
+
+    def walk(self, starts: Iterable[str], steps: Sequence[tuple[str | None, str | None]]) -> list[tuple[str, ...]]:
+        """起点から関連付けを順にたどります。各段階のクエリは全てのオブジェクトについてまとめて実行します。
+
+        Args:
+            starts (Iterable[str]): 起点のオブジェクトの__RELPATH。
+            steps (Sequence[tuple[str | None, str | None]]): 各段階の(AssocClass, ResultClass)。
+
+        Returns:
+            list[tuple[str, ...]]: 起点と各段階で到達したオブジェクトの__RELPATH（重複なし）。
+        """
+        frontier = tuple(dict.fromkeys(starts))
+        levels = [frontier]
+        for assoc_class, result_class in steps:
+            results = self.associators(frontier, assoc_class, result_class)
+            seen: dict[str, str] = {}
+            for targets in results.values():
+                for target in targets:
+                    seen.setdefault(target.casefold(), target)
+            frontier = tuple(seen.values())
+            levels.append(frontier)
+        return levels
+
+    def neighbors(self, relpath: str, assoc_class: str | None = None) -> tuple[str, ...]:
+        """取得済みの関連付けでつながったオブジェクトの__RELPATHを返します。クエリは実行しません。
+
+        Args:
+            assoc_class (str | None, optional): 指定した場合、その関連付けのクラスでたどった結果のみ返します。
+        """
+        folded = assoc_class.casefold() if assoc_class is not None else None
+        return tuple(
+            e.target
+            for e in self.__edges.get(relpath.casefold(), ())
+            if folded is None or (e.assoc_class is not None and e.assoc_class.casefold() == folded)
+        )
+
+    @property
+    def edges(self) -> tuple[WBEMGraphEdge, ...]:
+        """取得済みの関連付け。"""
+        return tuple(e for edges in self.__edges.values() for e in edges)
+
+    def invalidate(self) -> None:
+        """登録したオブジェクトとクエリの結果を全て破棄します。"""
+        self.__objects.clear()
+        self.__results.clear()
+        self.__edges.clear()
@@ -0,0 +1,512 @@
+"""MOFテキストとXMLテキスト（DTD 2.0）からのインスタンスの読み込み。
+
+:attr:`WBEMClassObject.objtext` は1回の呼び出しでインスタンス全体を返すため、
+プロパティごとにGetを呼び出してVARIANTを変換するよりも少ない呼び出しで値を取得できます。
+このモジュールはテキストをWMIを使用せずに解析するため、 :func:`dumps` で保存したクエリ結果を後から読み込むこともできます。
+
+MOFテキストには型の情報が無いため、64ビット整数は文字列、NULLのプロパティは省略されます。
+クラスのスキーマ（ :meth:`WBEMSchemaCache.get` など）を渡すと、スキーマの型に変換して全てのプロパティを返します。
+XMLテキスト（ :meth:`WBEMObjectTextSrc.get_text` ）には型の情報が含まれます。
+
+Examples:
+    >>> cache = WBEMSchemaCache(services, "ROOT\\\\CIMV2")
+    >>> for inst in query_instances(services, "SELECT * FROM Win32_Process", cache.get):
+    >>>     print(inst.properties["Name"], inst.properties["KernelModeTime"])
+    >>> text = dumps(services.exec_query("SELECT * FROM Win32_Service"))
+    >>> archived = list(iter_mof(text, cache.get))
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
+
+from .cimtype import CimType
+
+# テキストの解析はCOMを使用しないため、WMIのラッパーは型の注釈にのみ使用します。
+if TYPE_CHECKING:
+    from . import WBEMClassObject, WBEMServices
+    from .schema import WBEMClassSchema
+
+
+class WBEMTextInstance(NamedTuple):
+    """テキストから読み込んだインスタンスです。"""
+
+    classname: str
+    properties: dict[str, Any]
+    """プロパティ名から値への辞書。配列はタプル、埋め込みオブジェクトは :class:`WBEMTextInstance` です。"""
+
+
+class WBEMTextSyntaxError(ValueError):
+    """MOFテキストの構文エラーです。"""
+
+    pos: int
+    """エラーの位置（文字数）。"""
+
+    def __init__(self, message: str, pos: int) -> None:
+        super().__init__(f"{message}（位置: {pos}）")
+        self.pos = pos
+
+
+_TOKEN = re.compile(
+    r"""\s+|//[^\n]*|/\*.*?\*/
+    |(?P<s>"(?:[^"\\]|\\.)*")
+    |(?P<c>'(?:[^'\\]|\\.)+')
+    |(?P<n>[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?))
+    |(?P<i>[A-Za-z_]\w*|\$\w+)
+    |(?P<p>[{}\[\]();,=:])""",
+    re.DOTALL | re.VERBOSE,
+)
+
+_ESCAPE = re.compile(r"\\(?:[xX]([0-9a-fA-F]{1,4})|(.))", re.DOTALL)
+_ESCAPES = {"b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r"}
+
+
+def _unescape_match(m: re.Match[str]) -> str:
+    if m.group(1) is not None:
+        return chr(int(m.group(1), 16))
+    c = m.group(2)
+    return _ESCAPES.get(c, c)
+
+
+def _unescape(s: str) -> str:
+    return _ESCAPE.sub(_unescape_match, s) if "\\" in s else s
+
+
+def _tokenize(text: str) -> list[tuple[str, str, int]]:
+    """(種類, 文字列, 位置)のリストを返します。種類はs（文字列）・c（文字）・n（数値）・i（識別子）・p（記号）です。"""
+    tokens = []
+    pos = 0
+    end = len(text)
+    match = _TOKEN.match
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            raise WBEMTextSyntaxError(f"解析できない文字 {text[pos]!r}", pos)
+        kind = m.lastgroup
+        if kind is not None:
+            tokens.append((kind, m.group(kind), pos))
+        pos = m.end()
+    tokens.append(("", "", end))
+    return tokens
+
+
+class _MofParser:
+    __slots__ = ("tokens", "i")
+    tokens: list[tuple[str, str, int]]
+    i: int
+
+    def __init__(self, text: str) -> None:
+        self.tokens = _tokenize(text)
+        self.i = 0
+
+    def error(self, message: str) -> WBEMTextSyntaxError:
+        kind, value, pos = self.tokens[self.i]
+        return WBEMTextSyntaxError(f"{message}（{value!r}）" if kind else f"{message}（終端）", pos)
+
+    def accept(self, value: str) -> bool:
+        kind, v, _ = self.tokens[self.i]
+        if (kind == "p" or kind == "i") and v.casefold() == value:
+            self.i += 1
+            return True
+        return False
+
+    def expect(self, value: str) -> None:
+        if not self.accept(value):
+            raise self.error(f"{value!r}が必要です")
+
+    def ident(self) -> str:
+        kind, value, _ = self.tokens[self.i]
+        if kind != "i":
+            raise self.error("識別子が必要です")
+        self.i += 1
+        return value
+
+    def skip_qualifiers(self) -> None:
+        """修飾子の一覧（[...]）を読み飛ばします。"""
+        if not self.accept("["):
+            return
+        depth = 1
+        tokens = self.tokens
+        while depth:
+            kind, value, _ = tokens[self.i]
+            if not kind:
+                raise self.error("']'が必要です")
+            if kind == "p":
+                if value == "[":
+                    depth += 1
+                elif value == "]":
+                    depth -= 1
+            self.i += 1
+
+    def at_end(self) -> bool:
+        return not self.tokens[self.i][0]
+
+    def instance(self) -> WBEMTextInstance:
+        self.skip_qualifiers()
+        if self.accept("class"):
+            raise self.error("クラス定義は読み込めません")
+        self.expect("instance")
+        self.expect("of")
+        classname = self.ident()
+        if self.accept("as"):
+            self.ident()
+        self.expect("{")
+        properties = {}
+        while not self.accept("}"):
+            self.skip_qualifiers()
+            name = self.ident()
+            self.expect("=")
+            properties[name] = self.value()
+            self.expect(";")
+        return WBEMTextInstance(classname, properties)
+
+    def value(self) -> Any:
+        kind, value, _ = self.tokens[self.i]
+        if kind == "s":
+            # 隣接する文字列は連結されます。
+            parts = []
+            while self.tokens[self.i][0] == "s":
+                parts.append(_unescape(self.tokens[self.i][1][1:-1]))
+                self.i += 1
+            return "".join(parts)
+        if kind == "n":
+            self.i += 1
+            if value.lstrip("+-")[:2] in ("0x", "0X"):
+                return int(value, 16)
+            if "." in value or "e" in value or "E" in value:
+                return float(value)
+            return int(value)
+        if kind == "c":
+            self.i += 1
+            return _unescape(value[1:-1])
+        if kind == "i":
+            folded = value.casefold()
+            if folded == "true":
+                self.i += 1
+                return True
+            if folded == "false":
+                self.i += 1
+                return False
+            if folded == "null":
+                self.i += 1
+                return None
+            if folded == "instance":
+                return self.instance()
+            if value.startswith("$"):
+                # エイリアスの参照は名前のまま返します。
+                self.i += 1
+                return value
+        if kind == "p" and value == "{":
+            self.i += 1
+            values = []
+            if not self.accept("}"):
+                values.append(self.value())
+                while self.accept(","):
+                    values.append(self.value())
+                self.expect("}")
+            return tuple(values)
+        if kind == "p" and value == "[":
+            # 埋め込みオブジェクトの前の修飾子です。
+            self.skip_qualifiers()
+            return self.value()
+        raise self.error("値が必要です")
+
+
+_INTEGER_TYPES = frozenset(
+    (
+        CimType.SINT8,
+        CimType.UINT8,
+        CimType.SINT16,
+        CimType.UINT16,
+        CimType.SINT32,
+        CimType.UINT32,
+        CimType.SINT64,
+        CimType.UINT64,
+    )
+)
+
+
+def _coerce(value: Any, type: CimType) -> Any:
+    """テキストから読み込んだ値をCIM型のPythonの値に変換します。"""
+    if value is None:
+        return None
+    if type & CimType.ARRAY:
+        if not isinstance(value, tuple):
+            return value
+        elemtype = CimType(type & ~CimType.ARRAY)
+        return tuple(_coerce(x, elemtype) for x in value)
+    if type in _INTEGER_TYPES:
+        return int(value) if isinstance(value, (str, float)) else value
+    if type == CimType.REAL32 or type == CimType.REAL64:
+        return float(value) if isinstance(value, (str, int)) else value
+    if type == CimType.CHAR16:
+        return chr(value) if isinstance(value, int) else value
+    if type == CimType.BOOLEAN:
+        return value.casefold() == "true" if isinstance(value, str) else bool(value)
+    return value
+
+
+class _SchemaApplier:
+    """クラスごとのスキーマの型で値を変換します。"""
+
+    __slots__ = ("__schemas", "__types")
+    __schemas: "Callable[[str], WBEMClassSchema] | None"
+    __types: dict[str, tuple[tuple[str, ...], dict[str, tuple[str, CimType]]]]
+
+    def __init__(self, schemas: "Callable[[str], WBEMClassSchema] | None") -> None:
+        self.__schemas = schemas
+        self.__types = {}
+
+    def __call__(self, inst: WBEMTextInstance) -> WBEMTextInstance:
+        if self.__schemas is None:
+            return inst
+        key = inst.classname.casefold()
+        entry = self.__types.get(key)
+        if entry is None:
+            schema = self.__schemas(inst.classname)
+            entry = self.__types[key] = (
+                schema.propnames,
+                {p.name.casefold(): (p.name, p.type) for p in schema.properties},
+            )
+        propnames, types = entry
+        # テキストで省略されたNULLのプロパティも含め、スキーマの順序で返します。
+        properties: dict[str, Any] = dict.fromkeys(propnames)
+        for name, value in inst.properties.items():
+            t = types.get(name.casefold())
+            if t is None:
+                properties[name] = value
+            else:
+                properties[t[0]] = _coerce(value, t[1])
+        return WBEMTextInstance(inst.classname, properties)
+
+
+def iter_mof(text: str, schemas: "Callable[[str], WBEMClassSchema] | None" = None) -> Iterator[WBEMTextInstance]:
+    """MOFテキストに含まれるインスタンスを返します。
+
+    Args:
+        text (str): :attr:`WBEMClassObject.objtext` または :func:`dumps` のテキスト。
+        schemas (Callable[[str], WBEMClassSchema] | None, optional): クラス名からスキーマを返す関数。
+
+    Raises:
+        WBEMTextSyntaxError: 構文が正しくない。
+    """
+    parser = _MofParser(text)
+    apply = _SchemaApplier(schemas)
+    while True:
+        # インスタンスの区切りのセミコロンは省略できます。
+        while parser.accept(";"):
+            pass
+        if parser.at_end():
+            break
+        yield apply(parser.instance())
+
+
+def parse_mof(text: str, schemas: "Callable[[str], WBEMClassSchema] | None" = None) -> WBEMTextInstance:
+    """MOFテキストの最初のインスタンスを返します。
+
+    Raises:
+        WBEMTextSyntaxError: 構文が正しくないか、インスタンスが含まれない。
+    """
+    for inst in iter_mof(text, schemas):
+        return inst
+    raise WBEMTextSyntaxError("インスタンスが含まれていません", len(text))
+
+
+_XML_TYPES = {
+    "boolean": CimType.BOOLEAN,
+    "string": CimType.STRING,
+    "char16": CimType.CHAR16,
+    "uint8": CimType.UINT8,
+    "sint8": CimType.SINT8,
+    "uint16": CimType.UINT16,
+    "sint16": CimType.SINT16,
+    "uint32": CimType.UINT32,
+    "sint32": CimType.SINT32,
+    "uint64": CimType.UINT64,
+    "sint64": CimType.SINT64,
+    "real32": CimType.REAL32,
+    "real64": CimType.REAL64,
+    "datetime": CimType.DATETIME,
+}
+
+
+# 連結したテキストの途中にもXML宣言が含まれるため、位置に関わらず全て除きます。
+_XML_DECLARATION = re.compile(r"<\?xml[^>]*\?>")
+
+
+def _xml_scalar(text: str | None, type: CimType) -> Any:
+    text = text or ""
+    if type in _INTEGER_TYPES:
+        text = text.strip()
+        return int(text, 16) if text[:2] in ("0x", "0X") else int(text)
+    if type == CimType.REAL32 or type == CimType.REAL64:
+        return float(text)
+    if type == CimType.BOOLEAN:
+        return text.strip().casefold() == "true"
+    return text
+
+
+def _xml_keyvalue(e: ET.Element) -> str:
+    if e.tag == "VALUE.REFERENCE":
+        return '"' + _xml_reference(e).replace("\\", "\\\\").replace('"', '\\"') + '"'
+    text = e.text or ""
+    if e.get("VALUETYPE", "string") == "string":
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text.strip().upper() if e.get("VALUETYPE") == "boolean" else text.strip()
+
+
+def _xml_instancename(e: ET.Element) -> str:
+    classname = e.get("CLASSNAME", "")
+    bindings = e.findall("KEYBINDING")
+    if bindings:
+        return classname + "." + ",".join(f"{b.get('NAME')}={_xml_keyvalue(b[0])}" for b in bindings if len(b))
+    if len(e):
+        # キーが1つの場合はKEYBINDINGを省略できます。
+        return f"{classname}={_xml_keyvalue(e[0])}"
+    return f"{classname}=@"
+
+
+def _xml_namespace(e: ET.Element | None) -> str:
+    if e is None:
+        return ""
+    return "\\".join(ns.get("NAME", "") for ns in e.iter("NAMESPACE"))
+
+
+def _xml_reference(e: ET.Element) -> str:
+    """VALUE.REFERENCEをオブジェクトパスの文字列に変換します。"""
+    for child in e:
+        if child.tag == "INSTANCENAME":
+            return _xml_instancename(child)
+        if child.tag == "LOCALINSTANCEPATH":
+            name = child.find("INSTANCENAME")
+            path = _xml_instancename(name) if name is not None else ""
+            return f"{_xml_namespace(child.find('LOCALNAMESPACEPATH'))}:{path}"
+        if child.tag == "INSTANCEPATH":
+            nspath = child.find("NAMESPACEPATH")
+            name = child.find("INSTANCENAME")
+            path = _xml_instancename(name) if name is not None else ""
+            if nspath is None:
+                return path
+            host = nspath.findtext("HOST", "").strip()
+            return f"\\\\{host}\\{_xml_namespace(nspath.find('LOCALNAMESPACEPATH'))}:{path}"
+        if child.tag == "CLASSNAME":
+            return child.get("NAME", "")
+        if child.tag in ("LOCALCLASSPATH", "CLASSPATH"):
+            classname = child.find("CLASSNAME")
+            return f"{_xml_namespace(child)}:{classname.get('NAME', '') if classname is not None else ''}"
+    return (e.text or "").strip()
+
+
+def _xml_embedded(e: ET.Element) -> Any:
+    """VALUE.OBJECT（WMI DTD）の値を返します。"""
+    inst = e.find("INSTANCE")
+    return _xml_instance(inst) if inst is not None else None
+
+
+def _xml_value(prop: ET.Element) -> Any:
+    tag = prop.tag
+    type = _XML_TYPES.get(prop.get("TYPE", "string"), CimType.STRING)
+    if tag == "PROPERTY":
+        value = prop.find("VALUE")
+        if value is None:
+            return None
+        text = value.text or ""
+        # CIM DTDでは埋め込みオブジェクトはXMLを値とする文字列になります。
+        if type == CimType.STRING and text.lstrip().startswith("<INSTANCE"):
+            return _xml_instance(ET.fromstring(text))
+        return _xml_scalar(text, type)
+    if tag == "PROPERTY.ARRAY":
+        values = prop.find("VALUE.ARRAY")
+        if values is None:
+            return None
+        return tuple(None if v.tag == "VALUE.NULL" else _xml_scalar(v.text, type) for v in values)
+    if tag == "PROPERTY.REFERENCE":
+        ref = prop.find("VALUE.REFERENCE")
+        return _xml_reference(ref) if ref is not None else None
+    if tag == "PROPERTY.REFARRAY":
+        refs = prop.find("VALUE.REFARRAY")
+        if refs is None:
+            return None
+        return tuple(None if v.tag == "VALUE.NULL" else _xml_reference(v) for v in refs)
+    if tag == "PROPERTY.OBJECT":
+        obj = prop.find("VALUE.OBJECT")
+        return _xml_embedded(obj) if obj is not None else None
+    if tag == "PROPERTY.OBJECTARRAY":
+        objs = prop.find("VALUE.OBJECTARRAY")
+        if objs is None:
+            return None
+        return tuple(None if v.tag == "VALUE.NULL" else _xml_embedded(v) for v in objs)
+    return None
+
+
+def _xml_instance(e: ET.Element) -> WBEMTextInstance:
+    properties = {}
+    for prop in e:
+        if prop.tag.startswith("PROPERTY"):
+            properties[prop.get("NAME", "")] = _xml_value(prop)
+    return WBEMTextInstance(e.get("CLASSNAME", ""), properties)
+
+
+def _xml_instances(e: ET.Element) -> Iterator[ET.Element]:
+    for child in e:
+        if child.tag == "INSTANCE":
+            yield child
+        elif not child.tag.startswith("PROPERTY"):
+            # VALUE.NAMEDINSTANCE等の入れ物の中のインスタンスです。
+            yield from _xml_instances(child)
+
+
+def iter_xml(text: str, schemas: "Callable[[str], WBEMClassSchema] | None" = None) -> Iterator[WBEMTextInstance]:
+    """XMLテキスト（CIM DTD 2.0またはWMI DTD 2.0）に含まれるインスタンスを返します。
+
+    Args:
+        text (str): :meth:`WBEMObjectTextSrc.get_text` のテキスト。複数のINSTANCE要素を連結したものも読み込めます。
+        schemas (Callable[[str], WBEMClassSchema] | None, optional): クラス名からスキーマを返す関数。
+            省略時もXMLの型情報で変換しますが、NULLのプロパティが省略される場合があります。
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XMLが正しくない。
+    """
+    apply = _SchemaApplier(schemas)
+    # 複数のINSTANCE要素を読み込めるように、全てのXML宣言を除いて1つの要素で囲みます。
+    root = ET.fromstring(f"<_>{_XML_DECLARATION.sub('', text)}</_>")
+    for e in _xml_instances(root):
+        yield apply(_xml_instance(e))
+
+
+def parse_xml(text: str, schemas: "Callable[[str], WBEMClassSchema] | None" = None) -> WBEMTextInstance:
+    """XMLテキストの最初のインスタンスを返します。
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XMLが正しくない。
+        ValueError: インスタンスが含まれない。
+    """
+    for inst in iter_xml(text, schemas):
+        return inst
+    raise ValueError("インスタンスが含まれていません。")
+
+
+def dumps(objs: "Iterable[WBEMClassObject]") -> str:
+    """オブジェクトをMOFテキストに変換して連結します。 :func:`iter_mof` で読み込めます。"""
+    return "\n".join(obj.objtext_noflavors for obj in objs)
+
+
+def query_instances(
+    services: "WBEMServices",
+    query: str,
+    schemas: "Callable[[str], WBEMClassSchema] | None" = None,
+    batch_size: int = 256,
+) -> Iterator[WBEMTextInstance]:
+    """WQLクエリを実行して、結果をMOFテキスト経由で読み込みます。
+
+    インスタンスごとのCOM呼び出しはGetObjectTextの1回だけです。
+    多数のプロパティを読み取る場合、 :meth:`WBEMClassObject.get` よりも高速です。
+
+    Args:
+        schemas (Callable[[str], WBEMClassSchema] | None, optional): クラス名からスキーマを返す関数。
+            省略時は64ビット整数が文字列のまま返され、NULLのプロパティは含まれません。
+        batch_size (int, optional): 列挙子の1回のNextで取得するオブジェクト数。
+    """
+    apply = _SchemaApplier(schemas)
+    for obj in services.exec_query(query, batch_size=batch_size):
+        yield apply(_MofParser(obj.objtext_noflavors).instance())
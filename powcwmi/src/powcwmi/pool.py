@@ -0,0 +1,245 @@
+"""WMI接続のプール。
+
+ConnectServerによる名前空間への接続は1回に数百ミリ秒かかるため、
+(名前空間, 資格情報, ロケール)ごとに接続を1つだけ作成して、全てのスレッドで共有します。
+接続はグローバルインターフェイステーブルに登録し、各スレッドには
+そのスレッドのアパートメント用にマーシャリングしたプロキシを渡します。
+
+各スレッドは事前にCOMを初期化してください。
+
+Examples:
+    >>> pool = WBEMConnectionPool()
+    >>> services = pool.get("root\\\\cimv2")
+    >>> pool.run(lambda s: list(s.exec_query("SELECT * FROM Win32_Service")), "root\\\\cimv2")
+"""
+
+from hashlib import sha256
+from threading import Lock, RLock, local
+from time import monotonic
+from typing import Callable, NamedTuple
+
+from powc.comobj import GlobalInterfaceTable
+from powc.comsec import com_init_security
+from powc.core import detach_from_scope, hr
+
+from . import WBEMLocator, WBEMServices
+from .comtypes import IWbemServices
+from .wbemstatus import WBEM_E_SHUTTING_DOWN, WBEM_E_TRANSPORT_FAILURE
+
+RPC_E_DISCONNECTED = hr(0x80010108)
+RPC_S_SERVER_UNAVAILABLE = hr(0x800706BA)
+RPC_S_CALL_FAILED = hr(0x800706BE)
+
+DISCONNECTED_ERRORS = frozenset(
+    (RPC_E_DISCONNECTED, RPC_S_SERVER_UNAVAILABLE, RPC_S_CALL_FAILED, WBEM_E_TRANSPORT_FAILURE, WBEM_E_SHUTTING_DOWN)
+)
+"""接続が切断されたことを示すエラーコード。 :meth:`WBEMConnectionPool.run` は再接続して再試行します。"""
+
+
+class WBEMConnectionKey(NamedTuple):
+    """接続の識別子です。パスワードはハッシュ値のみ保持します。"""
+
+    network_resource: str
+    user: str | None
+    password_hash: str | None
+    locale: str | None
+    authority: str | None
+
+
+class _Entry(NamedTuple):
+    cookie: int
+    generation: int
+
+
+class _ThreadItem:
+    __slots__ = ("services", "generation", "checked")
+    services: WBEMServices
+    generation: int
+    checked: float
+
+    def __init__(self, services: WBEMServices, generation: int) -> None:
+        self.services = services
+        self.generation = generation
+        self.checked = monotonic()
+
+
+class WBEMConnectionPool:
+    """WMI接続のプールです。スレッドセーフです。
+
+    取得した :class:`WBEMServices` は同じスレッド内で再利用され、
+    check_interval秒ごとに軽量な呼び出しで接続を確認します。切断されていた場合は再接続します。
+    プロキシのセキュリティブランケットは、プロキシごとに1回だけ設定されます。
+    """
+
+    __slots__ = ("__git", "__lock", "__entries", "__connecting", "__generation", "__local", "__check_interval")
+    __git: GlobalInterfaceTable | None
+    __lock: RLock
+    __entries: dict[WBEMConnectionKey, _Entry]
+    __connecting: dict[WBEMConnectionKey, Lock]
+    __generation: int
+    __local: local
+    __check_interval: float
+
+    def __init__(self, check_interval: float = 30.0) -> None:
+        """
+        Args:
+            check_interval (float, optional): 同じスレッドで接続を確認する間隔（秒）。0の場合は取得のたびに確認します。
+        """
+        self.__git = None
+        self.__lock = RLock()
+        self.__entries = {}
+        self.__connecting = {}
+        self.__generation = 0
+        self.__local = local()
+        self.__check_interval = check_interval
+
+    @staticmethod
+    def make_key(
+        network_resource: str,
+        user: str | None = None,
+        password: str | None = None,
+        locale: str | None = None,
+        authority: str | None = None,
+    ) -> WBEMConnectionKey:
+        return WBEMConnectionKey(
+            network_resource.casefold(),
+            user,
+            sha256(password.encode("utf-8")).hexdigest() if password is not None else None,
+            locale,
+            authority,
+        )
+
+    def __table(self) -> GlobalInterfaceTable:
+        with self.__lock:
+            if self.__git is None:
+                # 接続前にCOMセキュリティをWMI用に初期化します。既に初期化されている場合は何もしません。
+                com_init_security()
+                self.__git = detach_from_scope(GlobalInterfaceTable.create())
+            return self.__git
+
+    def __items(self) -> dict[WBEMConnectionKey, _ThreadItem]:
+        items = getattr(self.__local, "items", None)
+        if items is None:
+            items = self.__local.items = {}
+        return items
+
+    def __connect(
+        self,
+        key: WBEMConnectionKey,
+        network_resource: str,
+        user: str | None,
+        password: str | None,
+        locale: str | None,
+        authority: str | None,
+    ) -> tuple[_Entry, WBEMServices]:
+        git = self.__table()
+        with self.__lock:
+            connecting = self.__connecting.setdefault(key, Lock())
+        # 同じ接続先への同時接続は1つにまとめ、異なる接続先はロックせずに並行して接続します。
+        with connecting:
+            with self.__lock:
+                entry = self.__entries.get(key)
+            if entry is not None:
+                return entry, WBEMServices(git.get(entry.cookie, IWbemServices))
+            locator = WBEMLocator.create_nosecinit()
+            services = locator.connect_server(network_resource, user, password, locale, False, authority)
+            cookie = git.register(services.wrapped_obj, IWbemServices)
+            with self.__lock:
+                self.__generation += 1
+                entry = self.__entries[key] = _Entry(cookie, self.__generation)
+            return entry, services
+
+    @staticmethod
+    def is_alive(services: WBEMServices) -> bool:
+        """軽量な呼び出し（__NAMESPACEクラスの取得）で接続を確認します。"""
+        return bool(services.get_object_nothrow("__NAMESPACE", uses_amended_qualifiers=False))
+
+    def get(
+        self,
+        network_resource: str = "root\\cimv2",
+        user: str | None = None,
+        password: str | None = None,
+        locale: str | None = None,
+        authority: str | None = None,
+    ) -> WBEMServices:
+        """接続を取得します。引数は :meth:`WBEMLocator.connect_server` と同じです。
+
+        Raises:
+            OSError: 接続できない。
+        """
+        key = WBEMConnectionPool.make_key(network_resource, user, password, locale, authority)
+        items = self.__items()
+        item = items.get(key)
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if item is not None and entry is not None and item.generation == entry.generation:
+            now = monotonic()
+            if now - item.checked < self.__check_interval:
+                return item.services
+            if WBEMConnectionPool.is_alive(item.services):
+                item.checked = now
+                return item.services
+            self.__invalidate(key, entry)
+            entry = None
+        if entry is None:
+            entry, services = self.__connect(key, network_resource, user, password, locale, authority)
+        else:
+            services = WBEMServices(self.__table().get(entry.cookie, IWbemServices))
+        # プールが保持する接続は、release_scopeの脱出時に解放しません。
+        items[key] = _ThreadItem(detach_from_scope(services), entry.generation)
+        return services
+
+    def run[T](
+        self,
+        fn: Callable[[WBEMServices], T],
+        network_resource: str = "root\\cimv2",
+        user: str | None = None,
+        password: str | None = None,
+        locale: str | None = None,
+        authority: str | None = None,
+    ) -> T:
+        """接続を取得してfnを呼び出します。切断を示すエラーが発生した場合は、再接続して1回だけ再試行します。"""
+        services = self.get(network_resource, user, password, locale, authority)
+        try:
+            return fn(services)
+        except OSError as e:
+            if e.winerror not in DISCONNECTED_ERRORS:
+                raise
+        self.invalidate(network_resource, user, password, locale, authority)
+        return fn(self.get(network_resource, user, password, locale, authority))
+
+    def __invalidate(self, key: WBEMConnectionKey, entry: _Entry) -> None:
+        with self.__lock:
+            if self.__entries.get(key) != entry:
+                return
+            del self.__entries[key]
+            git = self.__git
+        self.__items().pop(key, None)
+        if git is not None:
+            git.revoke_nothrow(entry.cookie)
+
+    def invalidate(
+        self,
+        network_resource: str = "root\\cimv2",
+        user: str | None = None,
+        password: str | None = None,
+        locale: str | None = None,
+        authority: str | None = None,
+    ) -> None:
+        """接続を破棄します。次回の取得時に再接続します。他のスレッドが保持している接続は、次回の取得時に破棄されます。"""
+        key = WBEMConnectionPool.make_key(network_resource, user, password, locale, authority)
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if entry is not None:
+            self.__invalidate(key, entry)
+
+    def clear(self) -> None:
+        """全ての接続を破棄します。"""
+        with self.__lock:
+            entries = list(self.__entries.values())
+            self.__entries.clear()
+            git = self.__git
+        self.__items().clear()
+        if git is not None:
+            for entry in entries:
+                git.revoke_nothrow(entry.cookie)
@@ -0,0 +1,97 @@
+"""WBEMクラスオブジェクトのプロパティの遅延読み込みのMapping。 :attr:`WBEMClassObject.props` で取得します。"""
+
+from collections.abc import Mapping
+from ctypes import byref, c_int32
+from typing import Any, Iterable, Iterator
+
+from powc.core import check_hresult, detach_from_scope
+from powc.safearray import SafeArrayPtr
+from powc.variant import Variant
+
+from . import CimType, WBEMClassObject, WBEMFlavor
+from .table import _property_to_python
+from .wbemflags import WBEM_FLAG_ALWAYS
+from .wbemstatus import WBEM_E_NOT_FOUND
+
+
+class WBEMPropertyMap(Mapping[str, WBEMClassObject.Property]):
+    """WBEMクラスオブジェクトのプロパティのMappingです。 :attr:`WBEMClassObject.props` で取得します。
+
+    キーはGetNamesで1回だけ取得し、値は参照時にGetで取得して保持します。
+    オブジェクトの値を変更（put）した後は :meth:`invalidate` を呼び出してください。
+    """
+
+    __slots__ = ("__o", "__names", "__values")
+    # WBEMClassObjectとの循環参照を避けるため、インターフェイスを直接保持します。
+    __o: Any  # POINTER(IWbemClassObject)
+    __names: tuple[str, ...] | None
+    __values: dict[str, WBEMClassObject.Property]
+
+    def __init__(self, obj: WBEMClassObject) -> None:
+        self.__o = obj.wrapped_obj
+        self.__names = None
+        self.__values = {}
+
+    def __names_cached(self) -> tuple[str, ...]:
+        if self.__names is None:
+            sa = SafeArrayPtr()
+            check_hresult(self.__o.GetNames(None, WBEM_FLAG_ALWAYS, None, byref(sa)))
+            self.__names = sa.to_bstrarray()
+        return self.__names
+
+    def __getitem__(self, name: str) -> WBEMClassObject.Property:
+        # WMIのプロパティ名は大文字と小文字を区別しないため、取得した値も区別せずに保持します。
+        key = name.casefold()
+        x = self.__values.get(key)
+        if x is not None:
+            return x
+        v = Variant()
+        type = c_int32()
+        flavor = c_int32()
+        hr = self.__o.Get(name, 0, byref(v), byref(type), byref(flavor))
+        if hr == WBEM_E_NOT_FOUND:
+            raise KeyError(name)
+        check_hresult(hr)
+        # 保持した値はこのMappingと同じ期間使用するため、release_scopeの終了時に解放されないようにします。
+        prop = WBEMClassObject.Property(detach_from_scope(v), CimType(type.value), WBEMFlavor(flavor.value))
+        return self.__values.setdefault(key, prop)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__names_cached())
+
+    def __len__(self) -> int:
+        return len(self.__names_cached())
+
+    def __contains__(self, name: object) -> bool:
+        # WMIのプロパティ名は大文字と小文字を区別しません。
+        if not isinstance(name, str):
+            return False
+        name = name.casefold()
+        if name in self.__values:
+            return True
+        return any(name == x.casefold() for x in self.__names_cached())
+
+    def value(self, name: str) -> Any:
+        """プロパティの値をCIM型に応じたPythonの値（int、float、bool、str、None）に変換して返します。
+
+        配列はタプルに変換します。オブジェクトのプロパティはVariantのまま返します。
+        """
+        return _property_to_python(self[name])
+
+    def select(self, names: Iterable[str], typed: bool = False) -> dict[str, Any]:
+        """複数のプロパティをまとめて取得します。
+
+        Args:
+            typed (bool, optional): 真の場合は :meth:`value` と同様にPythonの値に変換します。
+
+        Raises:
+            KeyError: プロパティが存在しない。
+        """
+        if typed:
+            return {name: _property_to_python(self[name]) for name in names}
+        return {name: self[name] for name in names}
+
+    def invalidate(self) -> None:
+        """取得済みの名前と値を破棄します。"""
+        self.__names = None
+        self.__values = {}
@@ -0,0 +1,193 @@
+"""WQLクエリの結果のキャッシュ。 :meth:`WBEMServices.cached_query` で使用します。"""
+
+import re
+from collections.abc import Mapping
+from threading import Lock, RLock
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Hashable, OrderedDict
+from weakref import WeakKeyDictionary
+
+from powc.core import detach_from_scope
+
+from . import WBEMClassObject, WBEMServices
+from .asynccall import WBEMAsyncCall
+from .table import _property_to_python
+
+
+class _QueryCacheEntry:
+    __slots__ = ("services", "rows", "expires", "subscription", "invalidated")
+    services: WBEMServices
+    rows: tuple[Mapping[str, Any], ...]
+    expires: float
+    subscription: WBEMAsyncCall | None
+    invalidated: bool
+    """監視がイベントを受け取った。読み込み中に受け取った場合、結果はキャッシュに追加しません。"""
+
+    def __init__(self, services: WBEMServices) -> None:
+        self.services = services
+        self.rows = ()
+        self.expires = 0.0
+        self.subscription = None
+        self.invalidated = False
+
+
+def _query_rows(services: WBEMServices, query: str) -> tuple[Mapping[str, Any], ...]:
+    return tuple(
+        MappingProxyType({name: _property_to_python(prop) for name, prop in obj.props_nonsystem.items()})
+        for obj in services.exec_query(query, batch_size=64)
+    )
+
+
+_FROM_CLASS = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+
+class WBEMQueryCache:
+    """WQLクエリの結果のLRU/TTLキャッシュです。スレッドセーフです。 :meth:`WBEMServices.cached_query` で使用します。
+
+    結果は名前空間のパス（または指定した接続の識別子）とクエリの組をキーとして保持します。
+    同じキーの同時の問い合わせは1回のクエリにまとめます。
+    エントリーは接続（WBEMServices）を保持するため、エントリーが存在する間は接続が解放されません。
+    """
+
+    __slots__ = ("__maxsize", "__lock", "__entries", "__loading", "__namespaces")
+    __maxsize: int
+    __lock: RLock
+    __entries: "OrderedDict[tuple[Hashable, str], _QueryCacheEntry]"
+    __loading: dict[tuple[Hashable, str], Lock]
+    __namespaces: "WeakKeyDictionary[WBEMServices, str]"
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.__maxsize = maxsize
+        self.__lock = RLock()
+        self.__entries = OrderedDict()
+        self.__loading = {}
+        self.__namespaces = WeakKeyDictionary()
+
+    def __namespace(self, services: WBEMServices) -> str:
+        """接続の名前空間のパス（\\\\サーバー\\名前空間）を返します。接続ごとに1回だけ取得します。"""
+        with self.__lock:
+            namespace = self.__namespaces.get(services)
+        if namespace is None:
+            path = services.get_object("__SystemClass", uses_amended_qualifiers=False).path or ""
+            namespace = path.rpartition(":")[0].casefold()
+            with self.__lock:
+                self.__namespaces[services] = namespace
+        return namespace
+
+    def __key(self, services: WBEMServices, query: str, connection: Hashable | None) -> tuple[Hashable, str]:
+        if connection is None:
+            connection = self.__namespace(services)
+        return (connection, " ".join(query.split()).casefold())
+
+    def __lookup(self, key: tuple[Hashable, str]) -> "tuple[Mapping[str, Any], ...] | None":
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires > monotonic():
+                self.__entries.move_to_end(key)
+                return entry.rows
+            subscription = self.__pop(key)
+        WBEMQueryCache.__cancel(subscription)
+        return None
+
+    def get(
+        self,
+        services: WBEMServices,
+        query: str,
+        ttl: float,
+        invalidate_within: float | None = None,
+        connection: Hashable | None = None,
+    ) -> "tuple[Mapping[str, Any], ...]":
+        """キャッシュした結果を返します。存在しないか期限切れの場合はクエリを実行します。
+
+        引数は :meth:`WBEMServices.cached_query` と同じです。
+        """
+        key = self.__key(services, query, connection)
+        rows = self.__lookup(key)
+        if rows is not None:
+            return rows
+        with self.__lock:
+            loading = self.__loading.setdefault(key, Lock())
+        try:
+            with loading:
+                rows = self.__lookup(key)
+                if rows is not None:
+                    return rows
+                # キャッシュが保持する接続と監視は、release_scopeの脱出時に解放しません。
+                entry = _QueryCacheEntry(detach_from_scope(services))
+                if invalidate_within is not None:
+                    # クエリの実行中に発生した変更も検出できるように、監視をクエリより先に開始します。
+                    subscription = self.__subscribe(key, entry, services, query, invalidate_within)
+                    entry.subscription = detach_from_scope(subscription)
+                subscriptions = [entry.subscription]
+                try:
+                    rows = _query_rows(services, query)
+                    with self.__lock:
+                        # 読み込み中に変更を通知された場合、結果は古い可能性があるため返すだけでキャッシュしません。
+                        if not entry.invalidated:
+                            entry.rows = rows
+                            entry.expires = monotonic() + ttl
+                            subscriptions = [self.__pop(key)]
+                            self.__entries[key] = entry
+                            while len(self.__entries) > self.__maxsize:
+                                subscriptions.append(self.__pop(next(iter(self.__entries))))
+                finally:
+                    WBEMQueryCache.__cancel(*subscriptions)
+                return rows
+        finally:
+            with self.__lock:
+                self.__loading.pop(key, None)
+
+    def __subscribe(
+        self, key: tuple[Hashable, str], entry: _QueryCacheEntry, services: WBEMServices, query: str, within: float
+    ) -> WBEMAsyncCall | None:
+        m = _FROM_CLASS.search(query)
+        if m is None:
+            return None
+        event_query = (
+            f"SELECT * FROM __InstanceOperationEvent WITHIN {within:g} WHERE TargetInstance ISA '{m.group(1)}'"
+        )
+
+        def on_event(objs: list[WBEMClassObject]) -> None:
+            with self.__lock:
+                # 読み込み中のエントリーは、追加前に印を付けてキャッシュへの追加を取り止めます。
+                entry.invalidated = True
+                if self.__entries.get(key) is not entry:
+                    return
+                subscription = self.__pop(key)
+            WBEMQueryCache.__cancel(subscription)
+
+        r = services.exec_notificationquery_async_nothrow(event_query, on_event)
+        # 監視できないクラス（イベントプロバイダーの無いクラス等）はTTLのみで破棄します。
+        return r.value_unchecked if r else None
+
+    def __pop(self, key: tuple[Hashable, str]) -> WBEMAsyncCall | None:
+        """エントリーを削除して、その監視を返します。ロックを取得して呼び出します。"""
+        entry = self.__entries.pop(key, None)
+        return entry.subscription if entry is not None else None
+
+    @staticmethod
+    def __cancel(*subscriptions: WBEMAsyncCall | None) -> None:
+        # 監視の通知（on_event）は同じロックを取得するため、取り消しはロックを解放してから行います。
+        for subscription in subscriptions:
+            if subscription is not None:
+                subscription.cancel_nothrow()
+
+    def invalidate(self, services: WBEMServices, query: str, connection: Hashable | None = None) -> None:
+        """クエリの結果を破棄します。"""
+        key = self.__key(services, query, connection)
+        with self.__lock:
+            subscription = self.__pop(key)
+        WBEMQueryCache.__cancel(subscription)
+
+    def clear(self) -> None:
+        """全ての結果を破棄して、監視を取り消します。"""
+        with self.__lock:
+            subscriptions = [entry.subscription for entry in self.__entries.values()]
+            self.__entries.clear()
+        WBEMQueryCache.__cancel(*subscriptions)
+
+
+_shared_query_cache = WBEMQueryCache()
@@ -0,0 +1,188 @@
+"""リフレッシャー（IWbemRefresher）によるオブジェクトとインスタンスの集合の定期的な更新。"""
+
+from array import array
+from ctypes import POINTER, byref, c_int32, c_uint32, c_void_p, cast
+from typing import Any, NamedTuple, Sequence
+
+from comtypes import GUID, CoCreateInstance
+from powc.core import ComResult, ComWrapper, cr, query_interface
+
+from . import CimType, WBEMClassObject, WBEMServices
+from .accessor import WBEMObjectAccess, WBEMObjectAccessor
+from .comtypes import IWbemClassObject, IWbemConfigureRefresher, IWbemHiPerfEnum, IWbemObjectAccess, IWbemRefresher
+from .wbemflags import WBEM_FLAG_REFRESH_AUTO_RECONNECT, WBEM_FLAG_REFRESH_NO_AUTO_RECONNECT
+from .wbemstatus import WBEM_E_BUFFER_TOO_SMALL
+
+
+# WBEMHiPerfEnum.snapshotで列ごとに作成する配列（array.array）の型コードです。
+_SNAPSHOT_TYPECODES = {
+    CimType.SINT8: "b",
+    CimType.UINT8: "B",
+    CimType.SINT16: "h",
+    CimType.UINT16: "H",
+    CimType.CHAR16: "H",
+    CimType.SINT32: "i",
+    CimType.UINT32: "I",
+    CimType.SINT64: "q",
+    CimType.UINT64: "Q",
+    CimType.REAL32: "f",
+    CimType.REAL64: "d",
+}
+
+
+class WBEMRefresherSnapshot(NamedTuple):
+    """リフレッシュ1回分の列形式の値です。
+
+    keysのi番目のインスタンスの値は、各列のi番目の要素です。
+    数値の列は ``array.array`` 、文字列と論理値の列はリストです。
+    """
+
+    keys: tuple[Any, ...]
+    columns: dict[str, Any]
+
+
+class WBEMHiPerfEnum(ComWrapper):
+    """リフレッシャーに登録したクラスのインスタンスの集合です。IWbemHiPerfEnumインターフェイスのラッパーです。
+
+    :meth:`WBEMRefresher.refresh` を呼び出すたびに、インスタンスの追加・削除と値が更新されます。
+    """
+
+    __slots__ = ("__o", "__id", "__accessor")
+    __o: Any  # POINTER(IWbemHiPerfEnum)
+    __id: int
+    __accessor: WBEMObjectAccessor | None
+
+    def __init__(self, o: Any, id: int = 0) -> None:
+        self.__o = query_interface(o, IWbemHiPerfEnum)
+        self.__id = id
+        self.__accessor = None
+
+    @property
+    def wrapped_obj(self) -> c_void_p:
+        return self.__o
+
+    @property
+    def id(self) -> int:
+        """リフレッシャーでの識別子。 :meth:`WBEMRefresher.remove` に渡します。"""
+        return self.__id
+
+    def get_objects_nothrow(self) -> ComResult[list[WBEMObjectAccess]]:
+        """現在のインスタンスを取得します。値は最後のリフレッシュ時点のものです。"""
+        n = c_uint32()
+        hr = self.__o.GetObjects(0, 0, None, byref(n))
+        while hr == WBEM_E_BUFFER_TOO_SMALL:
+            # 所有権を受け取るため、一度c_void_pの配列で受け取ってからポインタに移します。
+            count = n.value
+            buf = (c_void_p * count)()
+            hr = self.__o.GetObjects(0, count, cast(buf, POINTER(POINTER(IWbemObjectAccess))), byref(n))
+            if hr == 0:
+                objs = []
+                for address in buf[: n.value]:
+                    x = POINTER(IWbemObjectAccess)()
+                    c_void_p.from_buffer(x).value = address
+                    objs.append(WBEMObjectAccess(x))
+                return cr(hr, objs)
+        return cr(hr, [])
+
+    def get_objects(self) -> list[WBEMObjectAccess]:
+        """現在のインスタンスを取得します。値は最後のリフレッシュ時点のものです。"""
+        return self.get_objects_nothrow().value
+
+    def snapshot(self, names: Sequence[str], key: str | None = "Name") -> WBEMRefresherSnapshot:
+        """現在のインスタンスのプロパティを列形式で読み取ります。
+
+        Args:
+            names (Sequence[str]): 読み取るプロパティ（カウンター）名。
+            key (str | None, optional): インスタンスを識別するプロパティ名。Noneの場合は0から始まる連番です。
+
+        Examples:
+            >>> procs = refresher.add_enum(services, "Win32_PerfFormattedData_PerfProc_Process")
+            >>> while True:
+            >>>     refresher.refresh()
+            >>>     snap = procs.snapshot(("PercentProcessorTime", "WorkingSet"))
+            >>>     dict(zip(snap.keys, snap.columns["WorkingSet"]))
+            >>>     time.sleep(1)
+        """
+        objs = self.get_objects()
+        if not objs:
+            return WBEMRefresherSnapshot((), {name: [] for name in names})
+        # ハンドルはクラスごとに共通のため、同じプロパティ名であれば前回のアクセサーを使い回します。
+        allnames = tuple(names) if key is None else (key, *names)
+        accessor = self.__accessor
+        if accessor is None or accessor.names != allnames:
+            accessor = self.__accessor = WBEMObjectAccessor(objs[0], allnames)
+        keys = tuple(range(len(objs))) if key is None else tuple(accessor.read_column(objs, key))
+        columns = {}
+        for name in names:
+            typecode = _SNAPSHOT_TYPECODES.get(accessor.handle(name)[1])
+            out = array(typecode, bytes(array(typecode).itemsize * len(objs))) if typecode else None
+            columns[name] = accessor.read_column(objs, name, out)
+        return WBEMRefresherSnapshot(keys, columns)
+
+
+class WBEMRefresher(ComWrapper):
+    """リフレッシャー。IWbemRefresherとIWbemConfigureRefresherインターフェイスのラッパーです。
+
+    登録したオブジェクトとインスタンスの集合を :meth:`refresh` でまとめて更新します。
+    パフォーマンスカウンターの定期的な取得では、毎回クエリを実行するよりも大幅に高速です。
+    値の読み取りには :class:`WBEMObjectAccessor` を使用してください。
+    """
+
+    __slots__ = ("__o", "__config")
+    __o: Any  # POINTER(IWbemRefresher)
+    __config: Any  # POINTER(IWbemConfigureRefresher)
+
+    def __init__(self, o: Any) -> None:
+        self.__o = query_interface(o, IWbemRefresher)
+        self.__config = query_interface(o, IWbemConfigureRefresher)
+
+    @property
+    def wrapped_obj(self) -> c_void_p:
+        return self.__o
+
+    @staticmethod
+    def create() -> "WBEMRefresher":
+        return WBEMRefresher(CoCreateInstance(GUID("{c71566f2-561e-11d1-ad87-00c04fd8fdff}"), IWbemRefresher))
+
+    def add_enum_nothrow(self, services: WBEMServices, classname: str) -> ComResult[WBEMHiPerfEnum]:
+        """クラスのインスタンスの集合を登録します。"""
+        x = POINTER(IWbemHiPerfEnum)()
+        id = c_int32()
+        hr = self.__config.AddEnum(services.wrapped_obj, classname, 0, None, byref(x), byref(id))
+        return cr(hr, WBEMHiPerfEnum(x, id.value))
+
+    def add_enum(self, services: WBEMServices, classname: str) -> WBEMHiPerfEnum:
+        """クラスのインスタンスの集合を登録します。"""
+        return self.add_enum_nothrow(services, classname).value
+
+    def add_object_nothrow(self, services: WBEMServices, path: str) -> ComResult[tuple[WBEMClassObject, int]]:
+        """1つのインスタンスを登録します。返されたオブジェクトの値がリフレッシュごとに更新されます。
+
+        Returns:
+            ComResult[tuple[WBEMClassObject, int]]: 更新されるオブジェクトと、 :meth:`remove` に渡す識別子。
+        """
+        x = POINTER(IWbemClassObject)()
+        id = c_int32()
+        hr = self.__config.AddObjectByPath(services.wrapped_obj, path, 0, None, byref(x), byref(id))
+        return cr(hr, (WBEMClassObject(x), id.value))
+
+    def add_object(self, services: WBEMServices, path: str) -> tuple[WBEMClassObject, int]:
+        """1つのインスタンスを登録します。返されたオブジェクトの値がリフレッシュごとに更新されます。"""
+        return self.add_object_nothrow(services, path).value
+
+    def remove_nothrow(self, id: int) -> ComResult[None]:
+        """登録したオブジェクトまたはインスタンスの集合を削除します。"""
+        return cr(self.__config.Remove(id, 0), None)
+
+    def remove(self, id: int) -> None:
+        """登録したオブジェクトまたはインスタンスの集合を削除します。"""
+        return self.remove_nothrow(id).value
+
+    def refresh_nothrow(self, auto_reconnect: bool = True) -> ComResult[None]:
+        """登録した全てのオブジェクトとインスタンスの集合を更新します。"""
+        flags = WBEM_FLAG_REFRESH_AUTO_RECONNECT if auto_reconnect else WBEM_FLAG_REFRESH_NO_AUTO_RECONNECT
+        return cr(self.__o.Refresh(flags), None)
+
+    def refresh(self, auto_reconnect: bool = True) -> None:
+        """登録した全てのオブジェクトとインスタンスの集合を更新します。"""
+        return self.refresh_nothrow(auto_reconnect).value
@@ -0,0 +1,716 @@
+"""WMIのクエリ結果の記録と再生。
+
+:class:`WBEMRecorder` はクエリ・列挙・GetObjectの結果を、オブジェクトごとのMOFテキストとクラスごとの型の情報として
+ファイル（JSON Lines、拡張子が.gzの場合はgzip圧縮）に記録します。
+:class:`WBEMReplay` は記録を読み込み、IWbemServices・IEnumWbemClassObject・IWbemClassObjectを実装した
+プロセス内のオブジェクトで再生します。 :class:`WBEMServices` 以降の処理はそのまま実行されるため、
+WMIサービスに接続せずに、本番環境の件数のクエリ結果で結果処理の性能を測定・検証できます。
+
+再生するオブジェクトは読み取り専用です。値はWMIと同じVARTYPE（uint32はVT_I4、64ビット整数はVT_BSTR等）で返します。
+修飾子とプロパティの由来は記録しないため、修飾子の取得やLOCAL_ONLY等の指定はWBEM_E_NOT_SUPPORTEDになります。
+列挙を途中で中断した呼び出しは未完了として記録し、再生時はWBEM_E_CALL_CANCELLEDになります。
+
+Examples:
+    >>> with WBEMRecorder(services, "services.jsonl.gz") as recorder:
+    >>>     for obj in recorder.exec_query("SELECT * FROM Win32_Service"):
+    >>>         pass
+    >>> replay = WBEMReplay.load("services.jsonl.gz")
+    >>> t = replay.services().query_table("SELECT * FROM Win32_Service", ("Name", "State"))
+"""
+
+import gzip
+import json
+from ctypes import POINTER, c_byte, c_uint16, c_void_p, c_wchar_p, cast, sizeof
+from struct import Struct
+from typing import IO, Any, Callable, Iterator, NamedTuple
+
+from comtypes import BSTR, COMObject
+from comtypes.hresult import S_OK
+from powc import _oleaut32
+from powc.core import take_pointer
+from powc.safearray import SafeArrayPtr
+from powc.variant import VARENUM, Variant
+
+from . import (
+    CimType,
+    WBEMClassObject,
+    WBEMClassObjectEnumerator,
+    WBEMFlavor,
+    WBEMServices,
+    WBEMTimeout,
+    _take_wbemobject,
+)
+from .comtypes import IEnumWbemClassObject, IWbemClassObject, IWbemServices
+from .moftext import WBEMTextInstance, _coerce, _MofParser
+from .table import _variant_to_python
+from .wbemflags import (
+    WBEM_FLAG_KEYS_ONLY,
+    WBEM_FLAG_NONSYSTEM_ONLY,
+    WBEM_FLAG_REFS_ONLY,
+    WBEM_FLAG_SYSTEM_ONLY,
+    WBEM_MASK_CONDITION_ORIGIN,
+    WBEM_MASK_PRIMARY_CONDITION,
+)
+from .wbemstatus import (
+    WBEM_E_CALL_CANCELLED,
+    WBEM_E_NOT_FOUND,
+    WBEM_E_NOT_SUPPORTED,
+    WBEM_E_UNEXPECTED,
+    WBEM_S_FALSE,
+    WBEM_S_NO_MORE_DATA,
+)
+from .wql import quote
+
+_FORMAT_VERSION = 1
+
+_EXEC_QUERY = "exec_query"
+_CREATE_INSTANCEENUM = "create_instanceenum"
+_GET_OBJECT = "get_object"
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class WBEMRecorder:
+    """クエリ結果をファイルに記録します。スレッドセーフではありません。
+
+    結果は列挙しながら記録するため、大量の結果もメモリに保持しません。
+    列挙を途中で中断した場合（breakやイテレータの破棄）は、それまでの結果を未完了の呼び出しとして記録します。
+    未完了の呼び出しは結果が欠けているため、再生できません（ :attr:`WBEMReplay.incomplete_calls` ）。
+    """
+
+    __slots__ = ("__services", "__file", "__schemas", "__active")
+    __services: WBEMServices
+    __file: IO[str]
+    __schemas: dict[str, tuple[str, ...]]
+    __active: bool
+
+    def __init__(self, services: WBEMServices, path: str) -> None:
+        """
+        Args:
+            services (WBEMServices): 記録する名前空間。
+            path (str): 記録するファイル。拡張子が.gzの場合はgzip圧縮します。
+        """
+        self.__services = services
+        self.__file = _open(path, "w")
+        # 記録済みのクラス（小文字）から、埋め込みオブジェクトのプロパティ名への辞書。
+        self.__schemas = {}
+        self.__active = False
+        self.__write({"version": _FORMAT_VERSION})
+
+    def __write(self, record: dict[str, Any]) -> None:
+        self.__file.write(json.dumps(record, ensure_ascii=False))
+        self.__file.write("\n")
+
+    def __schema(self, obj: WBEMClassObject, sysprops: dict[str, WBEMClassObject.Property]) -> str:
+        """クラスの型を初回のみ記録して、クラス名を返します。埋め込みオブジェクトのクラスも記録します。"""
+        classname = sysprops["__CLASS"].value.get_bstr()
+        objnames = self.__schemas.get(classname.casefold())
+        if objnames is None:
+            props = obj.props_nonsystem
+            keys = obj.get_names(
+                WBEMClassObject.GetNamesFlag1.ALL_PROPS,
+                WBEMClassObject.GetNamesFlag2.KEYS_ONLY,
+                WBEMClassObject.GetNamesFlag3.NONSYSTEM_ONLY,
+            )
+            self.__write(
+                {
+                    "schema": classname,
+                    "system": [[name, int(p.type)] for name, p in sysprops.items()],
+                    "props": [[name, int(p.type)] for name, p in props.items()],
+                    "keys": list(keys),
+                }
+            )
+            objnames = self.__schemas[classname.casefold()] = tuple(
+                name for name, p in props.items() if CimType(p.type & ~CimType.ARRAY) == CimType.OBJECT
+            )
+        for name in objnames:
+            r = obj.get_nothrow(name)
+            if not r:
+                continue
+            v = r.value_unchecked.value
+            for x in (v.get_elem(i) for i in range(v.elemcount)) if v.is_array else (v,):
+                if x.vartype == VARENUM.VT_UNKNOWN:
+                    embedded = _take_wbemobject(c_void_p.from_buffer(x.data_memview).value, True)
+                    self.__schema(embedded, embedded.props_system)
+        return classname
+
+    def __object(self, obj: WBEMClassObject) -> None:
+        sysprops = obj.props_system
+        classname = self.__schema(obj, sysprops)
+        self.__write(
+            {
+                "class": classname,
+                "mof": obj.objtext_noflavors,
+                "sys": [_variant_to_python(p.value, p.type) for p in sysprops.values()],
+            }
+        )
+
+    def __begin(self, kind: str, arg: str) -> None:
+        if self.__active:
+            raise RuntimeError("前の呼び出しの記録が終わっていません。")
+        self.__active = True
+        self.__write({"call": kind, "arg": arg})
+
+    def __end(self, status: int, complete: bool) -> None:
+        self.__active = False
+        self.__write({"end": status} if complete else {"end": status, "incomplete": True})
+
+    def __record(
+        self, kind: str, arg: str, start: Callable[[], WBEMClassObjectEnumerator]
+    ) -> Iterator[WBEMClassObject]:
+        self.__begin(kind, arg)
+        status = S_OK
+        # 最後まで列挙したか、WMIのエラーで終わった場合のみ完了です。
+        # 途中でイテレータを閉じた場合（GeneratorExit）やその他の例外では、結果が欠けているため未完了として記録します。
+        complete = False
+        try:
+            for obj in start():
+                self.__object(obj)
+                yield obj
+            complete = True
+        except OSError as e:
+            status = e.winerror
+            complete = True
+            raise
+        finally:
+            self.__end(status, complete)
+
+    def exec_query(self, query: str, batch_size: int = 256) -> Iterator[WBEMClassObject]:
+        """WQLクエリを半同期で実行して、結果を記録しながら返します。
+
+        Raises:
+            OSError: クエリが失敗した。失敗も記録され、再生時に同じエラーになります。
+        """
+        return self.__record(
+            _EXEC_QUERY, query, lambda: self.__services.exec_query(query, batch_size=batch_size, semisync=True)
+        )
+
+    def create_instanceenum(self, classname: str, batch_size: int = 256) -> Iterator[WBEMClassObject]:
+        """クラスのインスタンスを列挙して、結果を記録しながら返します。"""
+
+        def start() -> WBEMClassObjectEnumerator:
+            enum = self.__services.create_instanceenum(classname)
+            return WBEMClassObjectEnumerator(enum.wrapped_obj, WBEMTimeout.INFINITE, batch_size)
+
+        return self.__record(_CREATE_INSTANCEENUM, classname, start)
+
+    def get_object(self, path: str) -> WBEMClassObject:
+        """インスタンスを取得して記録します。
+
+        Raises:
+            OSError: インスタンスが存在しない。失敗も記録され、再生時に同じエラーになります。
+        """
+        self.__begin(_GET_OBJECT, path)
+        status = S_OK
+        complete = False
+        try:
+            r = self.__services.get_object_nothrow(path)
+            status = r.hr
+            if r:
+                self.__object(r.value_unchecked)
+            complete = True
+            return r.value
+        finally:
+            self.__end(status, complete)
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __enter__(self) -> "WBEMRecorder":
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+
+class _ReplaySchema(NamedTuple):
+    classname: str
+    names: tuple[str, ...]
+    """システムプロパティ、非システムプロパティの順のプロパティ名。"""
+    types: tuple[CimType, ...]
+    nsystem: int
+    keys: frozenset[int]
+    indexes: dict[str, int]
+    """小文字に変換したプロパティ名からインデックスへの辞書。"""
+
+
+class _ReplayInstance(NamedTuple):
+    schema: _ReplaySchema
+    values: tuple[Any, ...]
+    text: str | None
+    """記録したMOFテキスト。埋め込みオブジェクトはNoneです。"""
+
+
+class _ReplayCall(NamedTuple):
+    kind: str
+    arg: str
+    status: int
+    instances: tuple[_ReplayInstance, ...]
+    complete: bool
+    """偽の場合は列挙を途中で中断した呼び出しで、instancesは結果の一部です。"""
+
+
+def _load_schema(record: dict[str, Any]) -> _ReplaySchema:
+    system = record["system"]
+    props = system + record["props"]
+    names = tuple(name for name, _ in props)
+    keys = {name.casefold() for name in record["keys"]}
+    return _ReplaySchema(
+        record["schema"],
+        names,
+        tuple(CimType(t) for _, t in props),
+        len(system),
+        frozenset(i for i, name in enumerate(names) if name.casefold() in keys),
+        {name.casefold(): i for i, name in enumerate(names)},
+    )
+
+
+def _find_schema(schemas: dict[str, _ReplaySchema], classname: str) -> _ReplaySchema:
+    schema = schemas.get(classname.casefold())
+    if schema is None:
+        raise ValueError(f"{classname}の型が記録されていません。")
+    return schema
+
+
+def _load_value(schemas: dict[str, _ReplaySchema], value: Any, type: CimType) -> Any:
+    if CimType(type & ~CimType.ARRAY) != CimType.OBJECT:
+        return _coerce(value, type)
+    # WBEMTextInstanceもタプルのため、配列より先に判定します。
+    if isinstance(value, WBEMTextInstance):
+        return _load_embedded(schemas, value)
+    if isinstance(value, tuple):
+        return tuple(_load_value(schemas, x, CimType.OBJECT) for x in value)
+    return None
+
+
+def _load_embedded(schemas: dict[str, _ReplaySchema], inst: WBEMTextInstance) -> _ReplayInstance:
+    """埋め込みオブジェクトを読み込みます。システムプロパティは__CLASS以外NULLになります。"""
+    schema = _find_schema(schemas, inst.classname)
+    values = [None] * len(schema.names)
+    i = schema.indexes.get("__class")
+    if i is not None:
+        values[i] = schema.classname
+    properties = inst.properties
+    for i in range(schema.nsystem, len(schema.names)):
+        values[i] = _load_value(schemas, properties.get(schema.names[i]), schema.types[i])
+    return _ReplayInstance(schema, tuple(values), None)
+
+
+def _load_instance(schemas: dict[str, _ReplaySchema], record: dict[str, Any]) -> _ReplayInstance:
+    schema = _find_schema(schemas, record["class"])
+    text = record["mof"]
+    properties = _MofParser(text).instance().properties
+    values = [tuple(x) if isinstance(x, list) else x for x in record["sys"]]
+    for i in range(schema.nsystem, len(schema.names)):
+        values.append(_load_value(schemas, properties.get(schema.names[i]), schema.types[i]))
+    return _ReplayInstance(schema, tuple(values), text)
+
+
+def _text_instance(inst: _ReplayInstance) -> WBEMTextInstance:
+    schema = inst.schema
+    properties = {}
+    for i in range(schema.nsystem, len(schema.names)):
+        value = inst.values[i]
+        if isinstance(value, _ReplayInstance):
+            value = _text_instance(value)
+        elif isinstance(value, tuple) and value and isinstance(value[0], _ReplayInstance):
+            value = tuple(_text_instance(x) for x in value)
+        properties[schema.names[i]] = value
+    return WBEMTextInstance(schema.classname, properties)
+
+
+class WBEMReplay:
+    """記録したクエリ結果です。変更不可です。"""
+
+    __slots__ = ("__calls",)
+    __calls: dict[tuple[str, str], _ReplayCall]
+
+    def __init__(self, calls: dict[tuple[str, str], _ReplayCall]) -> None:
+        self.__calls = calls
+
+    @staticmethod
+    def load(path: str) -> "WBEMReplay":
+        """記録を読み込みます。MOFテキストは読み込み時に1回だけ解析します。
+
+        同じ呼び出しが複数回記録されている場合は最後の結果を使用します。終了が記録されていない呼び出しは無視します。
+        未完了の呼び出しは、同じ呼び出しの完了した記録が無い場合のみ読み込み、再生時はWBEM_E_CALL_CANCELLEDになります。
+
+        Raises:
+            ValueError: 形式のバージョンが異なるか、内容が正しくない。
+        """
+        schemas: dict[str, _ReplaySchema] = {}
+        calls: dict[tuple[str, str], _ReplayCall] = {}
+        call = None
+        instances: list[_ReplayInstance] = []
+        with _open(path, "r") as f:
+            header = json.loads(f.readline() or "null")
+            if not isinstance(header, dict) or header.get("version") != _FORMAT_VERSION:
+                raise ValueError("記録の形式が異なります。")
+            for line in f:
+                record = json.loads(line)
+                if "class" in record:
+                    instances.append(_load_instance(schemas, record))
+                elif "schema" in record:
+                    schemas[record["schema"].casefold()] = _load_schema(record)
+                elif "call" in record:
+                    call = (record["call"], record["arg"])
+                    instances = []
+                elif "end" in record and call is not None:
+                    kind, arg = call
+                    key = (kind, arg.casefold())
+                    complete = not record.get("incomplete", False)
+                    previous = calls.get(key)
+                    if complete or previous is None or not previous.complete:
+                        calls[key] = _ReplayCall(kind, arg, record["end"], tuple(instances), complete)
+                    call = None
+        return WBEMReplay(calls)
+
+    @property
+    def calls(self) -> tuple[tuple[str, str], ...]:
+        """記録した呼び出しの(種類, 引数)。種類は"exec_query"、"create_instanceenum"、"get_object"です。"""
+        return tuple((call.kind, call.arg) for call in self.__calls.values())
+
+    @property
+    def incomplete_calls(self) -> tuple[tuple[str, str], ...]:
+        """列挙を途中で中断したため再生できない呼び出しの(種類, 引数)。 :attr:`calls` にも含まれます。"""
+        return tuple((call.kind, call.arg) for call in self.__calls.values() if not call.complete)
+
+    def instances(self, kind: str, arg: str) -> tuple[WBEMTextInstance, ...]:
+        """記録した結果を、COMを使用せずに :class:`WBEMTextInstance` として返します。システムプロパティは含みません。
+
+        Raises:
+            KeyError: 呼び出しが記録されていない。
+            ValueError: 呼び出しが未完了で、結果の一部しか記録されていない。
+        """
+        call = self.__calls[(kind, arg.casefold())]
+        if not call.complete:
+            raise ValueError(f"{kind}({arg})の記録は未完了です。")
+        return tuple(_text_instance(inst) for inst in call.instances)
+
+    def services(self) -> WBEMServices:
+        """記録を再生する名前空間を作成します。
+
+        記録されていない呼び出しはWBEM_E_NOT_FOUND、未完了の呼び出しはWBEM_E_CALL_CANCELLEDになります。
+        """
+        return WBEMServices(_ReplayServices(self.__calls).QueryInterface(IWbemServices))
+
+
+def _detach(obj: COMObject, interface: type) -> int:
+    """COMObjectのインターフェイスポインタを、参照とともに呼び出し元に渡す値として返します。"""
+    p = obj.QueryInterface(interface)
+    return take_pointer(c_void_p.from_buffer(p)) or 0
+
+
+def _str(x: Any) -> str:
+    # BSTR型の引数はBSTRのインスタンスとして渡されます。
+    return (x.value if isinstance(x, BSTR) else x) or ""
+
+
+class _ReplayServices(COMObject):
+    """記録を再生するIWbemServicesの実装です。"""
+
+    _com_interfaces_ = [IWbemServices]
+
+    def __init__(self, calls: dict[tuple[str, str], _ReplayCall]) -> None:
+        super().__init__()
+        self.__calls = calls
+
+    def __enum(self, kind: str, arg: Any, enum: Any) -> int:
+        call = self.__calls.get((kind, _str(arg).casefold()))
+        if call is None:
+            return WBEM_E_NOT_FOUND
+        if not call.complete:
+            return WBEM_E_CALL_CANCELLED
+        # 結果を返す前に失敗した呼び出しは呼び出し自体が失敗し、途中で失敗した呼び出しは列挙の最後で失敗します。
+        if call.status < 0 and not call.instances:
+            return call.status
+        cast(enum, POINTER(c_void_p))[0] = _detach(
+            _ReplayEnum(call.instances, min(call.status, 0), 0), IEnumWbemClassObject
+        )
+        return S_OK
+
+    def ExecQuery(self, this: Any, language: Any, query: Any, flags: int, ctx: Any, enum: Any) -> int:
+        return self.__enum(_EXEC_QUERY, query, enum)
+
+    def CreateInstanceEnum(self, this: Any, filter: Any, flags: int, ctx: Any, enum: Any) -> int:
+        return self.__enum(_CREATE_INSTANCEENUM, filter, enum)
+
+    def GetObject(self, this: Any, path: Any, flags: int, ctx: Any, obj: Any, callresult: Any) -> int:
+        call = self.__calls.get((_GET_OBJECT, _str(path).casefold()))
+        if call is None:
+            return WBEM_E_NOT_FOUND
+        if not call.complete:
+            return WBEM_E_CALL_CANCELLED
+        if call.status < 0 or not call.instances:
+            return call.status
+        if obj:
+            cast(obj, POINTER(c_void_p))[0] = _detach(_ReplayClassObject(call.instances[0]), IWbemClassObject)
+        return S_OK
+
+
+class _ReplayEnum(COMObject):
+    """記録を再生するIEnumWbemClassObjectの実装です。Nextの呼び出しごとにオブジェクトを作成します。"""
+
+    _com_interfaces_ = [IEnumWbemClassObject]
+
+    def __init__(self, instances: tuple[_ReplayInstance, ...], status: int, pos: int) -> None:
+        super().__init__()
+        self.__instances = instances
+        self.__status = status
+        self.__pos = pos
+
+    def Reset(self, this: Any) -> int:
+        self.__pos = 0
+        return S_OK
+
+    def Next(self, this: Any, timeout: int, count: int, objs: Any, returned: Any) -> int:
+        instances = self.__instances
+        start = self.__pos
+        end = min(start + count, len(instances))
+        addresses = cast(objs, POINTER(c_void_p))
+        for i in range(start, end):
+            addresses[i - start] = _detach(_ReplayClassObject(instances[i]), IWbemClassObject)
+        self.__pos = end
+        if returned:
+            returned[0] = end - start
+        if end - start == count:
+            return S_OK
+        if self.__status < 0:
+            # 取得済みのオブジェクトを返してから、次の呼び出しで記録したエラーを返します。
+            return S_OK if end > start else self.__status
+        return WBEM_S_FALSE
+
+    def Skip(self, this: Any, timeout: int, count: int) -> int:
+        end = min(self.__pos + count, len(self.__instances))
+        skipped = end - self.__pos
+        self.__pos = end
+        return S_OK if skipped == count else WBEM_S_FALSE
+
+    def Clone(self, this: Any, enum: Any) -> int:
+        clone = _ReplayEnum(self.__instances, self.__status, self.__pos)
+        cast(enum, POINTER(c_void_p))[0] = _detach(clone, IEnumWbemClassObject)
+        return S_OK
+
+
+_SUPPORTED_CONDITIONS = WBEM_FLAG_KEYS_ONLY | WBEM_FLAG_REFS_ONLY | WBEM_MASK_CONDITION_ORIGIN
+
+
+class _ReplayClassObject(COMObject):
+    """記録したインスタンスを返すIWbemClassObjectの実装です。値の変更はできません。"""
+
+    _com_interfaces_ = [IWbemClassObject]
+
+    def __init__(self, inst: _ReplayInstance) -> None:
+        super().__init__()
+        self.__inst = inst
+        self.__selected: list[int] | None = None
+        self.__pos = 0
+
+    def __select(self, flags: int) -> list[int] | None:
+        """条件に一致するプロパティのインデックスを返します。記録していない情報による条件の場合はNoneを返します。"""
+        if flags & ~_SUPPORTED_CONDITIONS:
+            return None
+        schema = self.__inst.schema
+        origin = flags & WBEM_MASK_CONDITION_ORIGIN
+        if origin == 0:
+            indexes = range(len(schema.names))
+        elif origin == WBEM_FLAG_SYSTEM_ONLY:
+            indexes = range(schema.nsystem)
+        elif origin == WBEM_FLAG_NONSYSTEM_ONLY:
+            indexes = range(schema.nsystem, len(schema.names))
+        else:
+            return None
+        return [
+            i
+            for i in indexes
+            if (not flags & WBEM_FLAG_KEYS_ONLY or i in schema.keys)
+            and (not flags & WBEM_FLAG_REFS_ONLY or schema.types[i] == CimType.REFERENCE)
+        ]
+
+    def __property(self, i: int, value: Any, type: Any, flavor: Any) -> None:
+        schema = self.__inst.schema
+        if value:
+            _write_variant(cast(value, c_void_p).value or 0, self.__inst.values[i], schema.types[i])
+        if type:
+            type[0] = int(schema.types[i])
+        if flavor:
+            flavor[0] = int(WBEMFlavor.ORIGIN_SYSTEM if i < schema.nsystem else WBEMFlavor.ORIGIN_LOCAL)
+
+    def Get(self, this: Any, name: str | None, flags: int, value: Any, type: Any, flavor: Any) -> int:
+        i = self.__inst.schema.indexes.get(name.casefold()) if name else None
+        if i is None:
+            return WBEM_E_NOT_FOUND
+        self.__property(i, value, type, flavor)
+        return S_OK
+
+    def GetNames(self, this: Any, qualifier_name: str | None, flags: int, qualifier_value: Any, names: Any) -> int:
+        # 修飾子は記録しないため、修飾子による選択はできません。
+        if qualifier_name or flags & WBEM_MASK_PRIMARY_CONDITION:
+            return WBEM_E_NOT_SUPPORTED
+        selected = self.__select(flags)
+        if selected is None:
+            return WBEM_E_NOT_SUPPORTED
+        schema = self.__inst.schema
+        sa = SafeArrayPtr.create_vector(VARENUM.VT_BSTR, len(selected))
+        if selected:
+            with sa.access_data() as data:
+                addresses = (c_void_p * len(selected)).from_buffer(data)
+                for j, i in enumerate(selected):
+                    addresses[j] = _SysAllocString(schema.names[i])
+        cast(names, POINTER(c_void_p))[0] = take_pointer(sa)
+        return S_OK
+
+    def BeginEnumeration(self, this: Any, flags: int) -> int:
+        selected = self.__select(flags)
+        if selected is None:
+            return WBEM_E_NOT_SUPPORTED
+        self.__selected = selected
+        self.__pos = 0
+        return S_OK
+
+    def Next(self, this: Any, flags: int, name: Any, value: Any, type: Any, flavor: Any) -> int:
+        selected = self.__selected
+        if selected is None:
+            return WBEM_E_UNEXPECTED
+        if self.__pos >= len(selected):
+            return WBEM_S_NO_MORE_DATA
+        i = selected[self.__pos]
+        self.__pos += 1
+        if name:
+            cast(name, POINTER(c_void_p))[0] = _SysAllocString(self.__inst.schema.names[i])
+        self.__property(i, value, type, flavor)
+        return S_OK
+
+    def EndEnumeration(self, this: Any) -> int:
+        self.__selected = None
+        return S_OK
+
+    def Clone(self, this: Any, copy: Any) -> int:
+        cast(copy, POINTER(c_void_p))[0] = _detach(_ReplayClassObject(self.__inst), IWbemClassObject)
+        return S_OK
+
+    def GetObjectText(self, this: Any, flags: int, text: Any) -> int:
+        # 修飾子は記録しないため、フラグに関わらず修飾子の無いテキストを返します。
+        inst = self.__inst
+        s = inst.text if inst.text is not None else _mof_text(inst) + ";\n"
+        cast(text, POINTER(c_void_p))[0] = _SysAllocString(s)
+        return S_OK
+
+    def InheritsFrom(self, this: Any, ancestor: str | None) -> int:
+        i = self.__inst.schema.indexes.get("__derivation")
+        derivation = self.__inst.values[i] if i is not None else None
+        if ancestor and derivation and ancestor.casefold() in (name.casefold() for name in derivation):
+            return S_OK
+        return WBEM_S_FALSE
+
+
+def _mof_value(value: Any, type: CimType) -> str:
+    if isinstance(value, _ReplayInstance):
+        return _mof_text(value)
+    if isinstance(value, tuple):
+        elemtype = CimType(type & ~CimType.ARRAY)
+        return "{" + ", ".join(_mof_value(x, elemtype) for x in value) + "}"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if type == CimType.CHAR16:
+        return str(ord(value)) if isinstance(value, str) else str(value)
+    if isinstance(value, str) or type == CimType.SINT64 or type == CimType.UINT64:
+        # WMIは64ビット整数を文字列として出力します。
+        return quote(str(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _mof_text(inst: _ReplayInstance) -> str:
+    """埋め込みオブジェクトのMOFテキストを作成します。記録には最上位のオブジェクトのテキストのみが含まれます。"""
+    schema = inst.schema
+    lines = [f"instance of {schema.classname}", "{"]
+    for i in range(schema.nsystem, len(schema.names)):
+        value = inst.values[i]
+        if value is not None:
+            lines.append(f"\t{schema.names[i]} = {_mof_value(value, schema.types[i])};")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+# Getで返すVARTYPE。64ビット整数・日時・参照・文字列はVT_BSTRです。
+_CIMTYPE_VARTYPES = {
+    CimType.SINT8: VARENUM.VT_I2,
+    CimType.UINT8: VARENUM.VT_UI1,
+    CimType.SINT16: VARENUM.VT_I2,
+    CimType.UINT16: VARENUM.VT_I4,
+    CimType.SINT32: VARENUM.VT_I4,
+    CimType.UINT32: VARENUM.VT_I4,
+    CimType.REAL32: VARENUM.VT_R4,
+    CimType.REAL64: VARENUM.VT_R8,
+    CimType.BOOLEAN: VARENUM.VT_BOOL,
+    CimType.CHAR16: VARENUM.VT_I2,
+    CimType.OBJECT: VARENUM.VT_UNKNOWN,
+}
+
+_VARIANT_VALUE_STRUCTS = {
+    VARENUM.VT_UI1: Struct("<B"),
+    VARENUM.VT_I2: Struct("<h"),
+    VARENUM.VT_I4: Struct("<i"),
+    VARENUM.VT_R4: Struct("<f"),
+    VARENUM.VT_R8: Struct("<d"),
+    VARENUM.VT_BOOL: Struct("<h"),
+    VARENUM.VT_BSTR: Struct("P"),
+    VARENUM.VT_UNKNOWN: Struct("P"),
+}
+
+_POINTER_STRUCT = Struct("P")
+
+_VARIANT_SIZE = sizeof(Variant)
+_VARIANT_VALUE_OFFSET = 8
+
+
+def _raw_value(value: Any, type: CimType, vt: VARENUM) -> Any:
+    """値をVARIANTに書き込む値に変換します。BSTRとインターフェイスポインタは参照を所有する値です。"""
+    if vt == VARENUM.VT_BSTR:
+        return _SysAllocString(str(value))
+    if vt == VARENUM.VT_UNKNOWN:
+        return _detach(_ReplayClassObject(value), IWbemClassObject)
+    if vt == VARENUM.VT_BOOL:
+        return -1 if value else 0
+    if type == CimType.CHAR16 and isinstance(value, str):
+        value = ord(value)
+    # 符号なしの型は符号付きのVARTYPEで返すため、ビット幅で折り返します。
+    if vt == VARENUM.VT_I4:
+        return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    if vt == VARENUM.VT_I2:
+        return ((value + 0x8000) & 0xFFFF) - 0x8000
+    return value
+
+
+def _write_variant(address: int, value: Any, type: CimType) -> None:
+    """出力引数のVARIANTに値を書き込みます。Variantインスタンスは解放時にVariantClearを呼び出すため使用しません。"""
+    buffer = (c_byte * _VARIANT_SIZE).from_address(address)
+    if value is None:
+        vt = VARENUM.VT_NULL
+    elif type & CimType.ARRAY:
+        elemtype = CimType(type & ~CimType.ARRAY)
+        elemvt = _CIMTYPE_VARTYPES.get(elemtype, VARENUM.VT_BSTR)
+        st = _VARIANT_VALUE_STRUCTS[elemvt]
+        sa = SafeArrayPtr.create_vector(elemvt, len(value))
+        if value:
+            with sa.access_data() as data:
+                for k, x in enumerate(value):
+                    if x is not None:
+                        st.pack_into(data, k * st.size, _raw_value(x, elemtype, elemvt))
+        _POINTER_STRUCT.pack_into(buffer, _VARIANT_VALUE_OFFSET, take_pointer(sa))
+        vt = VARENUM.VT_ARRAY | elemvt
+    else:
+        vt = _CIMTYPE_VARTYPES.get(type, VARENUM.VT_BSTR)
+        _VARIANT_VALUE_STRUCTS[vt].pack_into(buffer, _VARIANT_VALUE_OFFSET, _raw_value(value, type, vt))
+    c_uint16.from_buffer(buffer).value = int(vt)
+
+
+# oleaut32
+
+_SysAllocString = _oleaut32.SysAllocString
+_SysAllocString.argtypes = (c_wchar_p,)
+_SysAllocString.restype = c_void_p
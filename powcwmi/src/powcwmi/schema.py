@@ -0,0 +1,334 @@
+"""WMIクラスのスキーマ（プロパティ・型・キー・メソッド）のキャッシュ。
+
+クラス定義の取得とプロパティごとの修飾子・オリジンの列挙は(名前空間, クラス)ごとに1回だけ行い、
+結果を変更不可の :class:`WBEMClassSchema` として保持します。ファイルに保存して、プロセス間で共有することもできます。
+
+Examples:
+    >>> cache = WBEMSchemaCache(services, "ROOT\\\\CIMV2", "wmischema.json")
+    >>> schema = cache.get("Win32_Process")
+    >>> schema.keys  # ("Handle",)
+    >>> services.query_table("SELECT * FROM Win32_Process", schema.propnames, types=schema.types)
+    >>> cache.save()
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import RLock
+from typing import Any, Callable
+
+from powc.core import detach_from_scope
+from powc.variant import VARENUM, Variant
+
+from . import CimType, WBEMClassObject, WBEMClassObjectGetMethodException, WBEMServices
+from .table import _VARIANT_GETTERS, _python_converter, _variant_to_python
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class WBEMPropertySchema:
+    name: str
+    type: CimType
+    origin: str
+    is_key: bool
+    qualifiers: tuple[tuple[str, str], ...]
+    """修飾子の名前と値（文字列表現）。"""
+
+    def decoder(self) -> Callable[[Variant], Any]:
+        """Getで取得したVARIANTをこのプロパティの型のPythonの値に変換する関数を返します。
+
+        配列はタプルに変換します。オブジェクトのプロパティはVariantのまま返します。
+        """
+        convert = _python_converter(self.type)
+        if convert is None or self.type & CimType.ARRAY:
+            type = self.type
+            return lambda v: _variant_to_python(v, type)
+
+        def decode(v: Variant) -> Any:
+            getter = _VARIANT_GETTERS.get(v.vt)
+            if getter is None:
+                return None if v.vt == VARENUM.VT_NULL or v.vt == VARENUM.VT_EMPTY else v
+            return convert(getter(v))
+
+        return decode
+
+
+@dataclass(frozen=True)
+class WBEMMethodSchema:
+    name: str
+    origin: str
+    inparams: tuple[tuple[str, CimType], ...]
+    outparams: tuple[tuple[str, CimType], ...]
+
+
+@dataclass(frozen=True)
+class WBEMClassSchema:
+    """WMIクラスのスキーマです。 :meth:`WBEMSchemaCache.get` で取得します。"""
+
+    namespace: str
+    classname: str
+    path: str
+    superclass: str | None
+    properties: tuple[WBEMPropertySchema, ...]
+    methods: tuple[WBEMMethodSchema, ...]
+    hash: str
+    """クラス定義のMOFテキストのハッシュ。ファイルから読み込んだスキーマの検証に使用します。"""
+
+    @property
+    def propnames(self) -> tuple[str, ...]:
+        return tuple(p.name for p in self.properties)
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """キープロパティの名前。"""
+        return tuple(p.name for p in self.properties if p.is_key)
+
+    @property
+    def types(self) -> dict[str, CimType]:
+        return {p.name: p.type for p in self.properties}
+
+    def property(self, name: str) -> WBEMPropertySchema:
+        """プロパティのスキーマを返します。大文字と小文字を区別しません。
+
+        Raises:
+            KeyError: プロパティが存在しない。
+        """
+        folded = name.casefold()
+        for p in self.properties:
+            if p.name.casefold() == folded:
+                return p
+        raise KeyError(name)
+
+    def method(self, name: str) -> WBEMMethodSchema:
+        """メソッドのスキーマを返します。大文字と小文字を区別しません。
+
+        Raises:
+            KeyError: メソッドが存在しない。
+        """
+        folded = name.casefold()
+        for m in self.methods:
+            if m.name.casefold() == folded:
+                return m
+        raise KeyError(name)
+
+    def decoders(self, names: tuple[str, ...] | None = None) -> tuple[Callable[[Variant], Any], ...]:
+        """プロパティごとの変換関数（ :meth:`WBEMPropertySchema.decoder` ）を返します。"""
+        return tuple(self.property(name).decoder() for name in (names or self.propnames))
+
+    @staticmethod
+    def from_class(obj: WBEMClassObject, namespace: str | None = None) -> "WBEMClassSchema":
+        """クラス定義のオブジェクトからスキーマを作成します。"""
+        props = []
+        for name, prop in obj.get_props(
+            WBEMClassObject.GetNamesFlag1.ALL_PROPS,
+            WBEMClassObject.GetNamesFlag2.ALL,
+            WBEMClassObject.GetNamesFlag3.NONSYSTEM_ONLY,
+        ).items():
+            qualifiers = tuple((q.name, str(q.value)) for q in obj.get_propqualifierset(name).qualifiers_all)
+            is_key = any(q[0].casefold() == "key" for q in qualifiers)
+            props.append(WBEMPropertySchema(name, prop.type, obj.get_proporigin(name), is_key, qualifiers))
+        methods = []
+        try:
+            methoddict = obj.get_methoddict(WBEMClassObject.GetMethodFlag.ALL)
+        except WBEMClassObjectGetMethodException:
+            methoddict = {}
+        for name, info in methoddict.items():
+            methods.append(
+                WBEMMethodSchema(
+                    name, obj.get_methodorigin(name), _signature(info.inparams), _signature(info.outparams)
+                )
+            )
+        return WBEMClassSchema(
+            namespace if namespace is not None else obj.namespacename or "",
+            obj.classname or "",
+            obj.path or "",
+            obj.superclassname,
+            tuple(props),
+            tuple(methods),
+            _hash_class(obj),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "namespace": self.namespace,
+            "classname": self.classname,
+            "path": self.path,
+            "superclass": self.superclass,
+            "properties": [
+                [p.name, int(p.type), p.origin, p.is_key, [list(q) for q in p.qualifiers]] for p in self.properties
+            ],
+            "methods": [
+                [m.name, m.origin, [[n, int(t)] for n, t in m.inparams], [[n, int(t)] for n, t in m.outparams]]
+                for m in self.methods
+            ],
+            "hash": self.hash,
+        }
+
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> "WBEMClassSchema":
+        return WBEMClassSchema(
+            d["namespace"],
+            d["classname"],
+            d["path"],
+            d["superclass"],
+            tuple(
+                WBEMPropertySchema(name, CimType(type), origin, is_key, tuple((q[0], q[1]) for q in qualifiers))
+                for name, type, origin, is_key, qualifiers in d["properties"]
+            ),
+            tuple(
+                WBEMMethodSchema(
+                    name,
+                    origin,
+                    tuple((n, CimType(t)) for n, t in inparams),
+                    tuple((n, CimType(t)) for n, t in outparams),
+                )
+                for name, origin, inparams, outparams in d["methods"]
+            ),
+            d["hash"],
+        )
+
+
+def _signature(params: WBEMClassObject) -> tuple[tuple[str, CimType], ...]:
+    # パラメータの無いメソッドではNULLが返されます。
+    if not params.wrapped_obj:
+        return ()
+    return tuple(
+        (name, prop.type)
+        for name, prop in params.get_props(
+            WBEMClassObject.GetNamesFlag1.ALL_PROPS,
+            WBEMClassObject.GetNamesFlag2.ALL,
+            WBEMClassObject.GetNamesFlag3.NONSYSTEM_ONLY,
+        ).items()
+    )
+
+
+def _hash_class(obj: WBEMClassObject) -> str:
+    return sha256(obj.objtext.encode("utf-8")).hexdigest()
+
+
+class WBEMSchemaCache:
+    """1つの名前空間のクラスのスキーマのキャッシュです。スレッドセーフです。
+
+    ファイルを指定した場合、 :meth:`save` で保存したスキーマを次回以降のプロセスで読み込みます。
+    読み込んだスキーマは、既定ではクラス定義を1回取得してハッシュを比較し、変更されていない場合のみ使用します。
+    プロパティごとの修飾子とオリジンの列挙は省略されます。
+    """
+
+    __slots__ = ("__services", "__namespace", "__path", "__validate", "__lock", "__schemas", "__persisted", "__dirty")
+    __services: WBEMServices
+    __namespace: str
+    __path: str | None
+    __validate: bool
+    __lock: RLock
+    __schemas: dict[str, WBEMClassSchema]
+    __persisted: dict[str, WBEMClassSchema] | None
+    __dirty: bool
+
+    def __init__(
+        self,
+        services: WBEMServices,
+        namespace: str,
+        path: str | os.PathLike[str] | None = None,
+        validate: bool = True,
+    ) -> None:
+        """
+        Args:
+            services (WBEMServices): スキーマを取得する名前空間。
+            namespace (str): servicesの名前空間名（例: "ROOT\\\\CIMV2"）。ファイル内のキーに使用します。
+            path (str | os.PathLike[str] | None, optional): キャッシュファイルのパス。
+            validate (bool, optional): 偽の場合、ファイルから読み込んだスキーマを検証せずに使用します。
+        """
+        self.__services = detach_from_scope(services)
+        self.__namespace = namespace
+        self.__path = os.fspath(path) if path is not None else None
+        self.__validate = validate
+        self.__lock = RLock()
+        self.__schemas = {}
+        self.__persisted = None
+        self.__dirty = False
+
+    @property
+    def namespace(self) -> str:
+        return self.__namespace
+
+    def __key(self, classname: str) -> str:
+        return f"{self.__namespace}:{classname}".casefold()
+
+    def __load_persisted(self) -> dict[str, WBEMClassSchema]:
+        if self.__persisted is None:
+            self.__persisted = {}
+            if self.__path is not None:
+                try:
+                    with open(self.__path, encoding="utf-8") as f:
+                        d = json.load(f)
+                except FileNotFoundError:
+                    d = {}
+                if d.get("version") == _FORMAT_VERSION:
+                    self.__persisted = {k: WBEMClassSchema.from_dict(v) for k, v in d["classes"].items()}
+        return self.__persisted
+
+    def get(self, classname: str) -> WBEMClassSchema:
+        """クラスのスキーマを返します。
+
+        Raises:
+            OSError: クラスが存在しない。
+        """
+        key = self.__key(classname)
+        with self.__lock:
+            schema = self.__schemas.get(key)
+            if schema is not None:
+                return schema
+            persisted = self.__load_persisted().get(key)
+            if persisted is not None and not self.__validate:
+                self.__schemas[key] = persisted
+                return persisted
+        # クラス定義の取得と列挙はロックの外で行い、先に登録された結果を優先します。
+        obj = self.__services.get_object(classname)
+        if persisted is not None and persisted.hash == _hash_class(obj):
+            schema = persisted
+        else:
+            schema = WBEMClassSchema.from_class(obj, self.__namespace)
+        with self.__lock:
+            if schema is not persisted:
+                self.__dirty = True
+            return self.__schemas.setdefault(key, schema)
+
+    def invalidate(self, classname: str | None = None) -> None:
+        """キャッシュしたスキーマを破棄します。省略時は全てのクラスです。ファイルの内容は :meth:`save` で更新されます。"""
+        with self.__lock:
+            if classname is None:
+                self.__schemas.clear()
+                self.__persisted = {}
+            else:
+                key = self.__key(classname)
+                self.__schemas.pop(key, None)
+                self.__load_persisted().pop(key, None)
+            self.__dirty = True
+
+    def save(self) -> None:
+        """取得したスキーマをファイルに保存します。ファイルを指定していない場合は何もしません。
+
+        同じファイルに保存された他の名前空間のスキーマは保持されます。
+        """
+        if self.__path is None:
+            return
+        with self.__lock:
+            if not self.__dirty:
+                return
+            try:
+                with open(self.__path, encoding="utf-8") as f:
+                    d = json.load(f)
+            except FileNotFoundError:
+                d = {}
+            classes = d.get("classes", {}) if d.get("version") == _FORMAT_VERSION else {}
+            prefix = f"{self.__namespace}:".casefold()
+            classes = {k: v for k, v in classes.items() if not k.startswith(prefix)}
+            merged = {**self.__load_persisted(), **self.__schemas}
+            classes.update((k, v.to_dict()) for k, v in merged.items())
+            tmp = f"{self.__path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": _FORMAT_VERSION, "classes": classes}, f, ensure_ascii=False)
+            os.replace(tmp, self.__path)
+            self.__dirty = False
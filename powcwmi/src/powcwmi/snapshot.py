@@ -0,0 +1,276 @@
+"""クエリ結果のスナップショットと差分。
+
+:meth:`WBEMSnapshot.capture` はクエリの結果をキーごとの値のタプル（CIM型に応じたPythonの値）として保持し、
+取得時に行ごとの内容のハッシュを計算します。 :meth:`WBEMSnapshot.diff` はハッシュが異なる行のみ列を比較します。
+
+Examples:
+    >>> columns = ("State", "StartMode", "PathName")
+    >>> prev = WBEMSnapshot.capture(services, "SELECT * FROM Win32_Service", "Name", columns)
+    >>> ...
+    >>> cur = WBEMSnapshot.capture(services, "SELECT * FROM Win32_Service", "Name", columns)
+    >>> d = cur.diff(prev)
+    >>> for name, change in d.changed.items():
+    >>>     print(name, change.columns)
+"""
+
+from ctypes import byref, c_int32, c_void_p
+from hashlib import blake2b
+from time import time
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from powc.core import check_hresult
+from powc.variant import VARENUM, Variant
+
+from . import CimType, WBEMServices, _take_wbemobject
+from .table import _project, _variant_to_python
+from .wbemstatus import WBEM_E_NOT_FOUND
+
+_FORMAT_VERSION = 1
+
+
+class WBEMSnapshotChange(NamedTuple):
+    """変更された行です。"""
+
+    old: tuple[Any, ...]
+    new: tuple[Any, ...]
+    columns: tuple[str, ...]
+    """値が変更された列の名前。"""
+
+
+class WBEMSnapshotDiff(NamedTuple):
+    """:meth:`WBEMSnapshot.diff` の結果です。行はキーの値から列の値のタプルへの辞書です。"""
+
+    columns: tuple[str, ...]
+    added: dict[Any, tuple[Any, ...]]
+    removed: dict[Any, tuple[Any, ...]]
+    changed: dict[Any, WBEMSnapshotChange]
+
+    @property
+    def empty(self) -> bool:
+        """差分が無い場合は真。"""
+        return not (self.added or self.removed or self.changed)
+
+
+def _snapshot_value(v: Variant, type: CimType) -> Any:
+    """VARIANTをPythonの値に変換します。埋め込みオブジェクトはMOFテキストとして保持します。"""
+    if CimType(type & ~CimType.ARRAY) != CimType.OBJECT:
+        value = _variant_to_python(v, type)
+        # 変換できない値はVARIANTのまま返されますが、VARIANTは内容で比較できないため保持しません。
+        return None if isinstance(value, Variant) else value
+    if v.is_array:
+        return tuple(_snapshot_value(v.get_elem(i), CimType.OBJECT) for i in range(v.elemcount))
+    if v.vartype == VARENUM.VT_UNKNOWN:
+        return _take_wbemobject(c_void_p.from_buffer(v.data_memview).value, True).objtext_noflavors
+    return None
+
+
+def _row_hash(values: tuple[Any, ...]) -> int:
+    # hash()は文字列についてプロセスごとに異なるため、保存したスナップショットとの比較には使用できません。
+    return int.from_bytes(blake2b(repr(values).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _from_json(value: Any) -> Any:
+    return tuple(_from_json(x) for x in value) if isinstance(value, list) else value
+
+
+class WBEMSnapshot:
+    """クエリ結果のスナップショットです。変更不可です。"""
+
+    __slots__ = ("__key", "__columns", "__types", "__rows", "__hashes", "__captured")
+    __key: str
+    __columns: tuple[str, ...]
+    __types: tuple[CimType, ...]
+    __rows: dict[Any, tuple[Any, ...]]
+    __hashes: dict[Any, int]
+    __captured: float
+
+    def __init__(
+        self,
+        key: str,
+        columns: tuple[str, ...],
+        types: tuple[CimType, ...],
+        rows: dict[Any, tuple[Any, ...]],
+        hashes: dict[Any, int],
+        captured: float,
+    ) -> None:
+        self.__key = key
+        self.__columns = columns
+        self.__types = types
+        self.__rows = rows
+        self.__hashes = hashes
+        self.__captured = captured
+
+    @staticmethod
+    def capture(
+        services: WBEMServices,
+        wql: str,
+        key: str = "__RELPATH",
+        columns: Sequence[str] | None = None,
+        types: Mapping[str, CimType] | None = None,
+        batch_size: int = 256,
+    ) -> "WBEMSnapshot":
+        """クエリを実行してスナップショットを作成します。
+
+        Args:
+            services (WBEMServices): クエリを実行する名前空間。
+            wql (str): WQLクエリ。columnsを指定した場合、"SELECT * FROM"は取得する列のみを選択するクエリに書き換えます。
+            key (str, optional): 行を識別するプロパティ名。値がNULLの行は無視します。
+            columns (Sequence[str] | None, optional): 保持する列。省略時は最初のオブジェクトの非システムプロパティ全てです。
+            types (Mapping[str, CimType] | None, optional): 列のCIM型（ :attr:`WBEMClassSchema.types` など）。
+                省略時は最初のオブジェクトから取得します。
+            batch_size (int, optional): 列挙子の1回のNextで取得するオブジェクト数。
+
+        Raises:
+            OSError: クエリが失敗した。
+        """
+        if columns is not None:
+            selected = {name.casefold() for name in columns}
+            wql = _project(wql, columns if key.casefold() in selected else (*columns, key))
+        names = tuple(columns) if columns is not None else None
+        coltypes: tuple[CimType, ...] | None = None
+        keytype = CimType.STRING
+        keyindex = -1
+        rows: dict[Any, tuple[Any, ...]] = {}
+        hashes: dict[Any, int] = {}
+        v = Variant()
+        t = c_int32()
+
+        def read(o: Any, name: str, type: CimType) -> Any:
+            hr = o.Get(name, 0, byref(v), None, None)
+            if hr < 0:
+                if hr == WBEM_E_NOT_FOUND:
+                    return None
+                check_hresult(hr)
+            try:
+                return _snapshot_value(v, type)
+            finally:
+                v.clear()
+
+        def typeof(o: Any, name: str) -> CimType:
+            type = types.get(name) if types is not None else None
+            if type is None:
+                check_hresult(o.Get(name, 0, None, byref(t), None))
+                type = CimType(t.value)
+            return type
+
+        for objs in services.exec_query(wql, batch_size=batch_size, semisync=True).iter_batches():
+            for obj in objs:
+                o = obj.wrapped_obj
+                if coltypes is None:
+                    if names is None:
+                        names = obj.propnames_nonsystem
+                    coltypes = tuple(typeof(o, name) for name in names)
+                    folded = [name.casefold() for name in names]
+                    keyindex = folded.index(key.casefold()) if key.casefold() in folded else -1
+                    keytype = coltypes[keyindex] if keyindex >= 0 else typeof(o, key)
+                values = tuple(read(o, name, type) for name, type in zip(names, coltypes))
+                keyvalue = values[keyindex] if keyindex >= 0 else read(o, key, keytype)
+                if keyvalue is None:
+                    continue
+                rows[keyvalue] = values
+                hashes[keyvalue] = _row_hash(values)
+        return WBEMSnapshot(key, names or (), coltypes or (), rows, hashes, time())
+
+    @property
+    def key(self) -> str:
+        return self.__key
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self.__columns
+
+    @property
+    def types(self) -> tuple[CimType, ...]:
+        return self.__types
+
+    @property
+    def rows(self) -> Mapping[Any, tuple[Any, ...]]:
+        """キーの値から列の値のタプルへのMapping（読み取り専用）。"""
+        return MappingProxyType(self.__rows)
+
+    @property
+    def hashes(self) -> Mapping[Any, int]:
+        """キーの値から行の内容のハッシュへのMapping（読み取り専用）。"""
+        return MappingProxyType(self.__hashes)
+
+    @property
+    def captured(self) -> float:
+        """作成時刻（time.time()）。"""
+        return self.__captured
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def row(self, key: Any) -> dict[str, Any]:
+        """行を列名から値への辞書で返します。
+
+        Raises:
+            KeyError: 行が存在しない。
+        """
+        return dict(zip(self.__columns, self.__rows[key]))
+
+    def diff(self, previous: "WBEMSnapshot") -> WBEMSnapshotDiff:
+        """previousからの差分を返します。
+
+        Raises:
+            ValueError: 列が一致しない。結果が0行で列が決まらなかったスナップショットとは比較できます。
+        """
+        if (
+            previous.columns
+            and self.__columns
+            and [c.casefold() for c in previous.columns] != [c.casefold() for c in self.__columns]
+        ):
+            raise ValueError("列が一致しないスナップショットは比較できません。")
+        prev_rows = previous.rows
+        prev_hashes = previous.hashes
+        added = {}
+        changed = {}
+        for k, h in self.__hashes.items():
+            prev_hash = prev_hashes.get(k)
+            if prev_hash is None:
+                added[k] = self.__rows[k]
+            elif prev_hash != h:
+                old = prev_rows[k]
+                new = self.__rows[k]
+                names = tuple(name for name, a, b in zip(self.__columns, old, new) if a != b)
+                # ハッシュが異なっても値が等しい場合（-0.0と0.0等）は変更なしとします。
+                if names:
+                    changed[k] = WBEMSnapshotChange(old, new, names)
+        removed = {k: row for k, row in prev_rows.items() if k not in self.__hashes}
+        return WBEMSnapshotDiff(self.__columns, added, removed, changed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONに変換できる辞書を返します。キーと値はJSONで表現できる必要があります。"""
+        return {
+            "version": _FORMAT_VERSION,
+            "key": self.__key,
+            "columns": list(self.__columns),
+            "types": [int(t) for t in self.__types],
+            "rows": [[k, list(row), self.__hashes[k]] for k, row in self.__rows.items()],
+            "captured": self.__captured,
+        }
+
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> "WBEMSnapshot":
+        """:meth:`to_dict` の辞書からスナップショットを作成します。
+
+        Raises:
+            ValueError: 形式のバージョンが異なる。
+        """
+        if d.get("version") != _FORMAT_VERSION:
+            raise ValueError("スナップショットの形式が異なります。")
+        rows = {}
+        hashes = {}
+        for k, row, h in d["rows"]:
+            k = _from_json(k)
+            rows[k] = _from_json(row)
+            hashes[k] = h
+        return WBEMSnapshot(
+            d["key"],
+            tuple(d["columns"]),
+            tuple(CimType(t) for t in d["types"]),
+            rows,
+            hashes,
+            d["captured"],
+        )
@@ -0,0 +1,176 @@
+"""WQLクエリの結果の列形式での取得と、VARIANTからPythonの値への変換。 :meth:`WBEMServices.query_table` で使用します。"""
+
+import re
+from array import array
+from collections.abc import Mapping
+from ctypes import byref, c_int32
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+
+from powc.core import check_hresult
+from powc.variant import VARENUM, Variant
+
+from . import _IDENTIFIER, CimType, WBEMClassObject, WBEMServices
+from .refresher import _SNAPSHOT_TYPECODES
+from .wbemstatus import WBEM_E_NOT_FOUND
+
+
+class WBEMTable(NamedTuple):
+    """:meth:`WBEMServices.query_table` の結果です。
+
+    数値の列は ``array.array`` です。バッファプロトコルに対応しているため、
+    ``numpy.frombuffer`` や ``pyarrow.py_buffer`` でコピーせずに参照できます。
+    文字列・論理値の列はリスト（NULLはNone）、配列・オブジェクトの列はVariantのリストです。
+    """
+
+    columns: dict[str, Any]
+    types: dict[str, CimType]
+    nulls: dict[str, bytearray]
+    """数値の列のNULLマスク。NULLの行は1で、columnsの値は0です。"""
+    rowcount: int
+
+
+# 列のCIM型に関わらず、実際のVARIANTの型で値を取り出します（例: UINT32はVT_I4、UINT64はVT_BSTR）。
+_VARIANT_GETTERS = {
+    VARENUM.VT_I1: Variant.get_int8,
+    VARENUM.VT_UI1: Variant.get_uint8,
+    VARENUM.VT_I2: Variant.get_int16,
+    VARENUM.VT_UI2: Variant.get_uint16,
+    VARENUM.VT_I4: Variant.get_int32,
+    VARENUM.VT_UI4: Variant.get_uint32,
+    VARENUM.VT_I8: Variant.get_int64,
+    VARENUM.VT_UI8: Variant.get_uint64,
+    VARENUM.VT_R4: Variant.get_float,
+    VARENUM.VT_R8: Variant.get_double,
+    VARENUM.VT_BOOL: Variant.get_bool,
+    VARENUM.VT_BSTR: Variant.get_bstr,
+}
+
+
+def _python_converter(type: CimType) -> Callable[[Any], Any] | None:
+    """数値のCIM型について、VARIANTから取り出した値をその型の値に変換する関数を返します。"""
+    typecode = _SNAPSHOT_TYPECODES.get(type)
+    if typecode is None:
+        return None
+    if typecode in "fd":
+        return float
+    if typecode.isupper():
+        # 符号なしの型は符号付きのVARIANTで返されるため、ビット幅で切り詰めます。
+        mask = (1 << (array(typecode).itemsize * 8)) - 1
+        return lambda x: int(x) & mask
+    return int
+
+
+def _variant_to_python(v: Variant, type: CimType) -> Any:
+    """Getで取得したVARIANTをCIM型に応じたPythonの値に変換します。配列はタプルに変換します。"""
+    if v.is_array and v.vartype_elem in _VARIANT_GETTERS:
+        elemtype = CimType(type & ~CimType.ARRAY)
+        return tuple(_variant_to_python(v.get_elem(i), elemtype) for i in range(v.elemcount))
+    getter = _VARIANT_GETTERS.get(v.vt)
+    if getter is None:
+        return None if v.vt == VARENUM.VT_NULL or v.vt == VARENUM.VT_EMPTY else v
+    convert = _python_converter(type)
+    return convert(getter(v)) if convert is not None else getter(v)
+
+
+def _property_to_python(prop: WBEMClassObject.Property) -> Any:
+    return _variant_to_python(prop.value, prop.type)
+
+
+class _WBEMColumnBuilder:
+    """query_tableの1列分の値を蓄積します。"""
+
+    __slots__ = ("name", "type", "values", "nulls", "__convert")
+    name: str
+    type: CimType
+    values: Any
+    nulls: bytearray | None
+    __convert: Callable[[Any], Any] | None
+
+    def __init__(self, name: str, type: CimType) -> None:
+        self.name = name
+        self.type = type
+        self.__convert = _python_converter(type)
+        if self.__convert is None:
+            self.values = []
+            self.nulls = None
+        else:
+            self.values = array(_SNAPSHOT_TYPECODES[type])
+            self.nulls = bytearray()
+
+    def append(self, v: Variant) -> None:
+        getter = _VARIANT_GETTERS.get(v.vt)
+        if self.__convert is not None:
+            if getter is None:
+                self.values.append(0)
+                self.nulls.append(1)  # type: ignore
+            else:
+                self.values.append(self.__convert(getter(v)))
+                self.nulls.append(0)  # type: ignore
+        elif getter is not None:
+            self.values.append(getter(v))
+        elif v.vt == VARENUM.VT_NULL or v.vt == VARENUM.VT_EMPTY:
+            self.values.append(None)
+        else:
+            self.values.append(v.clone())
+
+
+_SELECT_ALL = re.compile(r"^\s*SELECT\s+\*\s+FROM\b", re.IGNORECASE)
+
+
+def _project(query: str, columns: Iterable[str]) -> str:
+    """SELECT * FROMのクエリを、指定したプロパティのみを選択するクエリに書き換えます。"""
+    names = tuple(columns)
+    if not names or not all(_IDENTIFIER.fullmatch(name) for name in names):
+        return query
+    return _SELECT_ALL.sub(lambda _: f"SELECT {', '.join(names)} FROM", query, 1)
+
+
+def _query_table(
+    services: WBEMServices,
+    query: str,
+    columns: Sequence[str] | None = None,
+    batch_size: int = 256,
+    types: Mapping[str, CimType] | None = None,
+) -> WBEMTable:
+    """WQLクエリの結果を列形式で取得します。 :meth:`WBEMServices.query_table` と同じです。"""
+    if columns is not None:
+        query = _project(query, columns)
+    builders: list[_WBEMColumnBuilder] | None = None
+    v = Variant()
+    t = c_int32()
+    rowcount = 0
+    for objs in services.exec_query(query, batch_size=batch_size, semisync=True).iter_batches():
+        for obj in objs:
+            o = obj.wrapped_obj
+            if builders is None:
+                names = tuple(columns) if columns is not None else obj.propnames_nonsystem
+                builders = []
+                for name in names:
+                    type = types.get(name) if types is not None else None
+                    if type is None:
+                        check_hresult(o.Get(name, 0, None, byref(t), None))
+                        type = CimType(t.value)
+                    builders.append(_WBEMColumnBuilder(name, type))
+            for b in builders:
+                hr = o.Get(b.name, 0, byref(v), None, None)
+                if hr < 0 and hr != WBEM_E_NOT_FOUND:
+                    check_hresult(hr)
+                b.append(v)
+                v.clear()
+            rowcount += 1
+    if builders is None:
+        # 結果が空の場合も、typesで型が分かる列は結果がある場合と同じ型（数値はarray.array）の空の列にします。
+        names = tuple(columns) if columns is not None else tuple(types or ())
+        typed = {name: _WBEMColumnBuilder(name, types[name]) for name in names if types is not None and name in types}
+        return WBEMTable(
+            {name: typed[name].values if name in typed else [] for name in names},
+            {b.name: b.type for b in typed.values()},
+            {b.name: b.nulls for b in typed.values() if b.nulls is not None},
+            0,
+        )
+    return WBEMTable(
+        {b.name: b.values for b in builders},
+        {b.name: b.type for b in builders},
+        {b.name: b.nulls for b in builders if b.nulls is not None},
+        rowcount,
+    )
@@ -0,0 +1,239 @@
+"""WQLクエリの作成。
+
+:class:`WQLQuery` は取得するプロパティを明示したSELECT文と、正しくエスケープしたWHERE句を作成します。
+"SELECT *"のクエリでは、プロバイダーは全てのプロパティを計算し、オブジェクト全体がDCOMで転送されます。
+クラスのスキーマを渡すと、クラス名とプロパティ名を検証して、スキーマ上の表記に揃えます。
+
+Examples:
+    >>> cache = WBEMSchemaCache(services, "ROOT\\\\CIMV2")
+    >>> q = WQLQuery.from_cache(cache, "Win32_Service").where("State", "=", "Running")
+    >>> q = q.where_in("StartMode", ("Auto", "Manual"))
+    >>> str(q.select("Name", "ProcessId"))
+    'SELECT Name, ProcessId FROM Win32_Service WHERE State = "Running" AND (StartMode = "Auto" OR StartMode = "Manual")'
+    >>> t = q.table(services, ("Name", "ProcessId"))
+    >>> for row in q.rows(services, ("Name", "PathName")):
+    >>>     print(row["Name"], row["PathName"])
+"""
+
+import re
+from typing import Any, Iterable, Iterator
+
+from . import WBEMServices, WBEMTable
+from .schema import WBEMClassSchema, WBEMSchemaCache
+
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+_OPERATORS = frozenset(("=", "<>", "!=", "<", "<=", ">", ">=", "LIKE", "ISA"))
+
+
+def quote(value: Any) -> str:
+    """Pythonの値をWQLのリテラルに変換します。文字列は二重引用符で囲み、バックスラッシュと二重引用符をエスケープします。
+
+    Raises:
+        TypeError: WQLのリテラルにできない型。
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    raise TypeError(f"WQLのリテラルにできない型です: {type(value).__name__}")
+
+
+class WQLQuery:
+    """WQLのSELECT文の作成です。変更不可で、各メソッドは新しいクエリを返します。"""
+
+    __slots__ = ("__classname", "__schema", "__columns", "__conditions")
+    __classname: str
+    __schema: WBEMClassSchema | None
+    __columns: tuple[str, ...]
+    __conditions: tuple[str, ...]
+
+    def __init__(
+        self,
+        classname: str,
+        schema: WBEMClassSchema | None = None,
+        columns: Iterable[str] = (),
+        conditions: Iterable[str] = (),
+    ) -> None:
+        """
+        Args:
+            classname (str): クラス名。
+            schema (WBEMClassSchema | None, optional): 名前の検証に使用するクラスのスキーマ。
+            columns (Iterable[str], optional): 取得するプロパティ名。
+            conditions (Iterable[str], optional): ANDで結合する条件式（作成済みのWQL）。
+
+        Raises:
+            ValueError: クラス名またはプロパティ名が正しくない。
+        """
+        if not _IDENTIFIER.fullmatch(classname):
+            raise ValueError(f"クラス名が正しくありません: {classname!r}")
+        if schema is not None:
+            if schema.classname.casefold() != classname.casefold():
+                raise ValueError(f"スキーマのクラス（{schema.classname}）と一致しません: {classname!r}")
+            classname = schema.classname
+        self.__classname = classname
+        self.__schema = schema
+        self.__columns = ()
+        self.__conditions = tuple(conditions)
+        self.__columns = self.__names(columns)
+
+    @staticmethod
+    def from_cache(cache: WBEMSchemaCache, classname: str) -> "WQLQuery":
+        """スキーマのキャッシュからクラスのスキーマを取得してクエリを作成します。
+
+        Raises:
+            OSError: クラスが存在しない。
+        """
+        return WQLQuery(classname, cache.get(classname))
+
+    @property
+    def classname(self) -> str:
+        return self.__classname
+
+    @property
+    def schema(self) -> WBEMClassSchema | None:
+        return self.__schema
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """取得するプロパティ名。空の場合は :meth:`build` で指定します。"""
+        return self.__columns
+
+    @property
+    def conditions(self) -> tuple[str, ...]:
+        return self.__conditions
+
+    def __name(self, name: str) -> str:
+        """プロパティ名を検証して、スキーマ上の表記で返します。"""
+        if not _IDENTIFIER.fullmatch(name):
+            raise ValueError(f"プロパティ名が正しくありません: {name!r}")
+        # システムプロパティはスキーマに含まれません。
+        if self.__schema is None or name.startswith("__"):
+            return name
+        try:
+            return self.__schema.property(name).name
+        except KeyError:
+            raise ValueError(f"{self.__classname}にプロパティ{name!r}はありません。") from None
+
+    def __names(self, names: Iterable[str]) -> tuple[str, ...]:
+        result = list(self.__columns)
+        folded = {name.casefold() for name in result}
+        for name in names:
+            name = self.__name(name)
+            if name.casefold() not in folded:
+                folded.add(name.casefold())
+                result.append(name)
+        return tuple(result)
+
+    def __derive(self, columns: tuple[str, ...], conditions: tuple[str, ...]) -> "WQLQuery":
+        q = WQLQuery.__new__(WQLQuery)
+        q.__classname = self.__classname
+        q.__schema = self.__schema
+        q.__columns = columns
+        q.__conditions = conditions
+        return q
+
+    def select(self, *names: str) -> "WQLQuery":
+        """取得するプロパティを追加します。
+
+        Raises:
+            ValueError: プロパティ名が正しくない。
+        """
+        return self.__derive(self.__names(names), self.__conditions)
+
+    def where(self, name: str, op: str, value: Any) -> "WQLQuery":
+        """条件を追加します。複数の条件はANDで結合します。
+
+        Args:
+            name (str): プロパティ名。
+            op (str): 演算子（=、<>、!=、<、<=、>、>=、LIKE、ISA）。
+            value (Any): 値。Noneの場合、=はIS NULL、<>と!=はIS NOT NULLになります。
+
+        Raises:
+            ValueError: プロパティ名または演算子が正しくない。
+            TypeError: WQLのリテラルにできない値。
+        """
+        name = self.__name(name)
+        op = op.upper()
+        if op not in _OPERATORS:
+            raise ValueError(f"演算子が正しくありません: {op!r}")
+        if value is None:
+            if op == "=":
+                condition = f"{name} IS NULL"
+            elif op == "<>" or op == "!=":
+                condition = f"{name} IS NOT NULL"
+            else:
+                raise ValueError(f"NULLと比較できない演算子です: {op!r}")
+        else:
+            condition = f"{name} {op} {quote(value)}"
+        return self.__derive(self.__columns, self.__conditions + (condition,))
+
+    def where_eq(self, **values: Any) -> "WQLQuery":
+        """プロパティ名=値の条件を追加します。"""
+        q = self
+        for name, value in values.items():
+            q = q.where(name, "=", value)
+        return q
+
+    def where_in(self, name: str, values: Iterable[Any]) -> "WQLQuery":
+        """プロパティの値がいずれかに一致する条件を追加します。WQLにはINが無いため、ORで結合します。
+
+        Raises:
+            ValueError: プロパティ名が正しくないか、値が空。
+        """
+        name = self.__name(name)
+        terms = [f"{name} IS NULL" if value is None else f"{name} = {quote(value)}" for value in values]
+        if not terms:
+            raise ValueError("値が1つ以上必要です。")
+        condition = terms[0] if len(terms) == 1 else "(" + " OR ".join(terms) + ")"
+        return self.__derive(self.__columns, self.__conditions + (condition,))
+
+    def build(self, columns: Iterable[str] | None = None) -> str:
+        """WQLを作成します。
+
+        Args:
+            columns (Iterable[str] | None, optional): 取得するプロパティ名。 :attr:`columns` に追加されます。
+                どちらも空の場合は"SELECT *"になります。
+
+        Raises:
+            ValueError: プロパティ名が正しくない。
+        """
+        names = self.__names(columns) if columns is not None else self.__columns
+        query = f"SELECT {', '.join(names) if names else '*'} FROM {self.__classname}"
+        if self.__conditions:
+            query += " WHERE " + " AND ".join(self.__conditions)
+        return query
+
+    def __str__(self) -> str:
+        return self.build()
+
+    def __repr__(self) -> str:
+        return f"WQLQuery({self.build()!r})"
+
+    def table(self, services: WBEMServices, columns: Iterable[str] | None = None, batch_size: int = 256) -> WBEMTable:
+        """クエリを実行して、結果を列形式で取得します（ :meth:`WBEMServices.query_table` ）。
+
+        取得するプロパティのみを選択し、スキーマがある場合は列の型にスキーマの型を使用します。
+        """
+        names = self.__names(columns) if columns is not None else self.__columns
+        if not names:
+            raise ValueError("取得するプロパティを指定してください。")
+        return services.query_table(
+            self.build(names), names, batch_size, self.__schema.types if self.__schema is not None else None
+        )
+
+    def rows(
+        self, services: WBEMServices, columns: Iterable[str] | None = None, batch_size: int = 256
+    ) -> Iterator[dict[str, Any]]:
+        """クエリを実行して、行ごとに取得したプロパティの値（CIM型に応じたPythonの値）の辞書を返します。"""
+        names = self.__names(columns) if columns is not None else self.__columns
+        if not names:
+            raise ValueError("取得するプロパティを指定してください。")
+        for obj in services.exec_query(self.build(names), batch_size=batch_size, semisync=True):
+            yield obj.props.select(names, typed=True)
@@ -0,0 +1,16 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+if importlib.util.find_spec("powcwmi") is None:
+    sys.path.insert(0, str(_SRC))
+
+if importlib.util.find_spec("comtypes") is None and "powcwmi" not in sys.modules:
+    # comtypesが無い環境（Windows以外）では、パッケージの__init__（COMのラッパー）を実行せずに、
+    # COMを使用しないモジュール（cimtype、moftext）のみを読み込めるようにします。
+    package = ModuleType("powcwmi")
+    package.__path__ = [str(_SRC / "powcwmi")]
+    sys.modules["powcwmi"] = package
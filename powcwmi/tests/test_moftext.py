@@ -0,0 +1,120 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from powcwmi.cimtype import CimType
+from powcwmi.moftext import WBEMTextInstance, WBEMTextSyntaxError, iter_mof, iter_xml, parse_mof, parse_xml
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _read(name: str) -> str:
+    return (_FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _schemas(**classes: dict[str, CimType]) -> Any:
+    """クラス名から、:class:`WBEMClassSchema` と同じ属性を持つスキーマを返す関数を作成します。"""
+
+    def get(classname: str) -> Any:
+        types = classes[classname]
+        return SimpleNamespace(
+            propnames=tuple(types),
+            properties=tuple(SimpleNamespace(name=name, type=type) for name, type in types.items()),
+        )
+
+    return get
+
+
+def test_iter_mof_reads_all_instances() -> None:
+    insts = list(iter_mof(_read("win32_service.mof")))
+    assert [inst.classname for inst in insts] == ["Win32_Service", "Win32_Service"]
+    audio = insts[0].properties
+    assert audio["Name"] == "Audiosrv"
+    assert audio["AcceptPause"] is False
+    assert audio["AcceptStop"] is True
+    assert audio["ProcessId"] == 2468
+    assert audio["Description"] == (
+        "Manages audio for Windows-based programs. "
+        "If this service is stopped, audio devices will not function properly."
+    )
+    assert audio["PathName"] == r"C:\WINDOWS\System32\svchost.exe -k LocalServiceNetworkRestricted -p"
+    assert insts[1].properties["State"] == "Stopped"
+
+
+def test_iter_mof_reads_arrays_and_embedded_objects() -> None:
+    disk, event = iter_mof(_read("win32_logicaldisk.mof"))
+    assert disk.properties["Capabilities"] == (3, 4, 10)
+    # MOFテキストでは64ビット整数は文字列です。
+    assert disk.properties["Size"] == "511101161472"
+    target = event.properties["TargetInstance"]
+    assert target == WBEMTextInstance("Win32_LogicalDisk", {"DeviceID": "D:", "FreeSpace": "0"})
+    assert event.properties["TIME_CREATED"] == "133435627180000000"
+
+
+def test_iter_mof_applies_schema_types() -> None:
+    schemas = _schemas(
+        Win32_LogicalDisk={
+            "DeviceID": CimType.STRING,
+            "FreeSpace": CimType.UINT64,
+            "Size": CimType.UINT64,
+            "Capabilities": CimType.UINT16 | CimType.ARRAY,
+            "ProviderName": CimType.STRING,
+        },
+        __InstanceModificationEvent={
+            "TIME_CREATED": CimType.UINT64,
+            "TargetInstance": CimType.OBJECT,
+            "SECURITY_DESCRIPTOR": CimType.UINT8 | CimType.ARRAY,
+        },
+    )
+    disk, event = iter_mof(_read("win32_logicaldisk.mof"), schemas)
+    assert disk.properties["Size"] == 511101161472
+    assert disk.properties["FreeSpace"] == 120394752000
+    # テキストで省略されたNULLのプロパティも返します。
+    assert disk.properties["ProviderName"] is None
+    assert event.properties["TIME_CREATED"] == 133435627180000000
+
+
+def test_parse_mof_unescapes_strings_and_chars() -> None:
+    inst = parse_mof(r'instance of X { S = "a\"b\\c\x41\n"; C = ' + "'\\t'; H = 0x1F; R = -1.5e2; N = NULL; };")
+    assert inst.properties == {"S": 'a"b\\cA\n', "C": "\t", "H": 0x1F, "R": -150.0, "N": None}
+
+
+def test_parse_mof_rejects_class_definitions() -> None:
+    with pytest.raises(WBEMTextSyntaxError):
+        parse_mof("class Win32_Service : Win32_BaseService { };")
+
+
+def test_parse_mof_reports_position_of_syntax_error() -> None:
+    text = "instance of X { A = 1 }"
+    with pytest.raises(WBEMTextSyntaxError) as e:
+        parse_mof(text)
+    assert e.value.pos == text.index("}")
+
+
+def test_parse_mof_without_instance() -> None:
+    with pytest.raises(WBEMTextSyntaxError):
+        parse_mof("// コメントのみ\n")
+
+
+def test_iter_xml_strips_every_declaration() -> None:
+    insts = list(iter_xml(_read("win32_process.xml")))
+    assert [inst.properties["Caption"] for inst in insts] == ["explorer.exe", "svchost.exe"]
+    assert insts[0].properties["KernelModeTime"] == 2371250000
+    assert insts[0].properties["ProcessId"] == 5812
+    assert insts[0].properties["CommandLine"] is None
+    assert insts[1].properties["CommandLine"] == r"C:\WINDOWS\system32\svchost.exe -k netsvcs -p"
+
+
+def test_parse_xml_reads_references_and_arrays() -> None:
+    inst = parse_xml(_read("win32_diskpartition_assoc.xml"))
+    assert inst.classname == "Win32_DiskDriveToDiskPartition"
+    assert inst.properties["Antecedent"] == r'\\HOST01\root\cimv2:Win32_DiskDrive.DeviceID="\\\\.\\PHYSICALDRIVE0"'
+    assert inst.properties["Dependent"] == r'root\cimv2:Win32_DiskPartition.DeviceID="Disk #0, Partition #1"'
+    assert inst.properties["Flags"] == (1, None, 3)
+
+
+def test_parse_xml_without_instance() -> None:
+    with pytest.raises(ValueError):
+        parse_xml('<?xml version="1.0"?><VALUE>1</VALUE>')
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("comtypes")
+
+from powcwmi.cimtype import CimType  # noqa: E402
+from powcwmi.replay import WBEMRecorder, WBEMReplay  # noqa: E402
+from powcwmi.wbemstatus import WBEM_E_CALL_CANCELLED  # noqa: E402
+
+_QUERY = "SELECT * FROM Win32_Service"
+
+_SERVICES = (("Audiosrv", 2468, True), ("AxInstSV", 0, False))
+
+
+def _mof(name: str, pid: int, started: bool) -> str:
+    return (
+        f'\ninstance of Win32_Service\n{{\n\tName = "{name}";\n\tProcessId = {pid};\n'
+        f"\tStarted = {'TRUE' if started else 'FALSE'};\n}};\n"
+    )
+
+
+def _write_source(path: Path) -> None:
+    """WMIに接続せずに記録を作成するため、WBEMRecorderと同じ形式の記録を直接書き込みます。"""
+    records: list[dict[str, Any]] = [
+        {"version": 1},
+        {
+            "schema": "Win32_Service",
+            "system": [["__CLASS", int(CimType.STRING)], ["__RELPATH", int(CimType.STRING)]],
+            "props": [
+                ["Name", int(CimType.STRING)],
+                ["ProcessId", int(CimType.UINT32)],
+                ["Started", int(CimType.BOOLEAN)],
+            ],
+            "keys": ["Name"],
+        },
+        {"call": "exec_query", "arg": _QUERY},
+    ]
+    for name, pid, started in _SERVICES:
+        records.append(
+            {
+                "class": "Win32_Service",
+                "mof": _mof(name, pid, started),
+                "sys": ["Win32_Service", f'Win32_Service.Name="{name}"'],
+            }
+        )
+    records.append({"end": 0})
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> WBEMReplay:
+    path = tmp_path / "source.jsonl"
+    _write_source(path)
+    return WBEMReplay.load(str(path))
+
+
+def test_record_and_replay_round_trip(source: WBEMReplay, tmp_path: Path) -> None:
+    path = str(tmp_path / "recorded.jsonl.gz")
+    with WBEMRecorder(source.services(), path) as recorder:
+        recorded = [obj.objtext for obj in recorder.exec_query(_QUERY)]
+    assert recorded == [_mof(*x) for x in _SERVICES]
+
+    replay = WBEMReplay.load(path)
+    assert replay.calls == (("exec_query", _QUERY),)
+    assert replay.incomplete_calls == ()
+    services = replay.services()
+
+    objs = list(services.exec_query(_QUERY, batch_size=16, semisync=True))
+    assert [obj.objtext for obj in objs] == recorded
+    assert [obj.get("Name").value.get_bstr() for obj in objs] == [name for name, _, _ in _SERVICES]
+
+    t = services.query_table(_QUERY)
+    assert t.rowcount == len(_SERVICES)
+    assert t.types == {"Name": CimType.STRING, "ProcessId": CimType.UINT32, "Started": CimType.BOOLEAN}
+    assert list(t.columns["Name"]) == [name for name, _, _ in _SERVICES]
+    assert list(t.columns["ProcessId"]) == [pid for _, pid, _ in _SERVICES]
+    assert list(t.columns["Started"]) == [started for _, _, started in _SERVICES]
+
+    assert [inst.properties["Name"] for inst in replay.instances("exec_query", _QUERY)] == [
+        name for name, _, _ in _SERVICES
+    ]
+
+
+def test_abandoned_enumeration_is_not_replayed(source: WBEMReplay, tmp_path: Path) -> None:
+    path = str(tmp_path / "recorded.jsonl")
+    with WBEMRecorder(source.services(), path) as recorder:
+        it = recorder.exec_query(_QUERY, batch_size=1)
+        next(it)
+        it.close()
+
+    replay = WBEMReplay.load(path)
+    assert replay.incomplete_calls == (("exec_query", _QUERY),)
+    with pytest.raises(ValueError):
+        replay.instances("exec_query", _QUERY)
+    with pytest.raises(OSError) as e:
+        replay.services().exec_query(_QUERY)
+    assert e.value.winerror == WBEM_E_CALL_CANCELLED
+
+
+def test_complete_recording_is_kept_over_incomplete(source: WBEMReplay, tmp_path: Path) -> None:
+    path = str(tmp_path / "recorded.jsonl")
+    with WBEMRecorder(source.services(), path) as recorder:
+        for _ in recorder.exec_query(_QUERY):
+            pass
+        for _ in recorder.exec_query(_QUERY):
+            break
+
+    replay = WBEMReplay.load(path)
+    assert replay.incomplete_calls == ()
+    assert len(list(replay.services().exec_query(_QUERY))) == len(_SERVICES)
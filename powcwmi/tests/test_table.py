@@ -0,0 +1,41 @@
+from array import array
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("comtypes")
+
+from powcwmi.cimtype import CimType  # noqa: E402
+from powcwmi.table import _query_table  # noqa: E402
+
+
+def _empty_services() -> Any:
+    """結果が0件のクエリを返す、:class:`WBEMServices` の代わりのオブジェクトです。"""
+    enum = SimpleNamespace(iter_batches=lambda: iter(()))
+    return SimpleNamespace(exec_query=lambda query, batch_size, semisync: enum)
+
+
+def test_empty_result_has_typed_columns() -> None:
+    types = {"Name": CimType.STRING, "Size": CimType.UINT64, "Capacity": CimType.REAL64}
+    t = _query_table(_empty_services(), "SELECT * FROM Win32_LogicalDisk", ("Name", "Size", "Other"), types=types)
+    assert t.rowcount == 0
+    assert list(t.columns) == ["Name", "Size", "Other"]
+    assert t.columns["Name"] == []
+    assert isinstance(t.columns["Size"], array) and t.columns["Size"].typecode == "Q"
+    assert t.columns["Other"] == []
+    assert t.types == {"Name": CimType.STRING, "Size": CimType.UINT64}
+    assert t.nulls == {"Size": bytearray()}
+
+
+def test_empty_result_uses_all_types_without_columns() -> None:
+    types = {"Name": CimType.STRING, "ProcessId": CimType.UINT32}
+    t = _query_table(_empty_services(), "SELECT * FROM Win32_Process", types=types)
+    assert list(t.columns) == ["Name", "ProcessId"]
+    assert isinstance(t.columns["ProcessId"], array) and len(t.columns["ProcessId"]) == 0
+    assert t.types == types
+
+
+def test_empty_result_without_types() -> None:
+    t = _query_table(_empty_services(), "SELECT * FROM Win32_Process", ("Name",))
+    assert t == ({"Name": []}, {}, {}, 0)